@@ -0,0 +1,3 @@
+from .broker import PsqlBroker
+
+__all__ = ('PsqlBroker',)
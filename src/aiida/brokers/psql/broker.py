@@ -0,0 +1,96 @@
+"""Implementation of the message broker interface on top of the PostgreSQL database of the storage backend."""
+
+from __future__ import annotations
+
+import typing as t
+
+from aiida.brokers.broker import Broker
+from aiida.common.exceptions import ConfigurationError
+from aiida.manage.configuration import get_config_option
+
+if t.TYPE_CHECKING:
+    from aiida.manage.configuration.profile import Profile
+
+    from .communicator import PsqlCommunicator
+
+__all__ = ('PsqlBroker',)
+
+
+class PsqlBroker(Broker):
+    """Implementation of the message broker interface on top of the PostgreSQL database of the storage backend.
+
+    This broker does not require a separate message broker service, such as RabbitMQ. Tasks are stored in a table of
+    the database of the profile, and broadcasts and RPC messages are sent with PostgreSQL's ``LISTEN/NOTIFY``. See
+    :mod:`aiida.brokers.psql.communicator` for details. It therefore requires a profile with the ``core.psql_dos``
+    storage backend.
+    """
+
+    def __init__(self, profile: Profile) -> None:
+        """Construct a new instance.
+
+        :param profile: The profile.
+        :raises ConfigurationError: If the storage backend of the profile is not ``core.psql_dos``.
+        """
+        if profile.storage_backend != 'core.psql_dos':
+            raise ConfigurationError(
+                f'the `core.psql` broker requires the `core.psql_dos` storage backend, but profile `{profile.name}` '
+                f'uses `{profile.storage_backend}`.'
+            )
+
+        self._profile = profile
+        self._communicator: PsqlCommunicator | None = None
+        self._prefix = f'aiida-{self._profile.uuid}'
+
+    def __str__(self):
+        return f'PostgreSQL @ {self.get_url()}'
+
+    def close(self):
+        """Close the broker."""
+        if self._communicator is not None:
+            self._communicator.close()
+            self._communicator = None
+
+    def iterate_tasks(self):
+        """Return an iterator over the tasks in the launch queue."""
+        yield from self.get_communicator().iterate_tasks()
+
+    def get_communicator(self) -> PsqlCommunicator:
+        """Return the communicator, creating a new one if it does not exist yet or if it closed itself.
+
+        The communicator closes itself if it lost its connection to the database and could not reconnect.
+        """
+        if self._communicator is None or self._communicator.is_closed():
+            self._communicator = self._create_communicator()
+
+        return self._communicator
+
+    def _create_communicator(self) -> PsqlCommunicator:
+        """Return an instance of :class:`kiwipy.Communicator`."""
+        from aiida.orm.utils import serialize
+
+        from .communicator import PsqlCommunicator
+
+        return PsqlCommunicator(
+            self.get_connection_params(),
+            encoder=serialize.serialize,
+            decoder=serialize.deserialize_unsafe,
+            prefix=self._prefix,
+            task_prefetch_count=get_config_option('daemon.worker_process_slots'),
+        )
+
+    def get_connection_params(self) -> dict[str, t.Any]:
+        """Return the parameters to connect to the database of the storage backend of the profile."""
+        config = self._profile.storage_config
+        return {
+            'host': config['database_hostname'] or None,
+            'port': config['database_port'] or None,
+            'user': config['database_username'],
+            'password': config['database_password'],
+            'dbname': config['database_name'],
+        }
+
+    def get_url(self) -> str:
+        """Return the URL of the database without the password."""
+        params = self.get_connection_params()
+        port = f":{params['port']}" if params['port'] else ''
+        return f"postgresql://{params['user']}@{params['host'] or ''}{port}/{params['dbname']}"
@@ -0,0 +1,825 @@
+"""Implementation of a ``kiwipy`` communicator on top of a PostgreSQL database.
+
+Tasks are stored in a table, such that they survive the communicator and the process that sent them. Each communicator
+that subscribes to tasks claims pending rows with ``SELECT ... FOR UPDATE SKIP LOCKED`` and marks them with the identity
+of its database session. A task is only removed from the table once it has been processed. When the session of a
+communicator ends, for example because its process died, the rows it claimed automatically become available again.
+
+Broadcasts, RPC messages and the replies to tasks and RPC messages are not persistent and are sent with PostgreSQL's
+``LISTEN/NOTIFY``. A background thread listens for notifications and calls the subscribers of the communicator.
+
+If a connection to the database is lost, the communicator reconnects and restores its state in the database under the
+identity of the new session. Notifications that were sent while the communicator was disconnected are lost. If no new
+connection can be established, the communicator closes itself.
+
+The tables are part of the schema of the ``core.psql_dos`` storage backend, see
+:mod:`aiida.storage.psql_dos.models.broker`.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import select
+import socket
+import threading
+import time
+import typing as t
+import uuid
+
+import kiwipy
+from kiwipy.communications import CommunicatorHelper
+
+from aiida.common.log import AIIDA_LOGGER
+
+if t.TYPE_CHECKING:
+    from psycopg2.extensions import connection
+
+LOGGER = AIIDA_LOGGER.getChild('broker.psql')
+
+__all__ = ('PsqlCommunicator', 'PsqlIncomingTask')
+
+TABLE_TASK = 'aiida_broker_task'
+TABLE_RPC = 'aiida_broker_rpc'
+
+#: Maximum size in bytes of the payload of a notification, as imposed by PostgreSQL.
+MAX_PAYLOAD_SIZE = 7999
+
+#: Interval in seconds at which pending tasks are checked in absence of notifications, for example to pick up tasks of
+#: communicators that died while processing them.
+DEFAULT_POLL_INTERVAL = 5.0
+
+#: Number of attempts to reconnect to the database after a connection was lost, before the communicator is closed. The
+#: attempts are separated by the poll interval.
+DEFAULT_RECONNECT_ATTEMPTS = 5
+
+# Condition that is true if the session that claimed the task is no longer alive. The start time of the backend is
+# compared as well, since the process identifier of a backend can be reused by the operating system.
+SQL_CLAIM_EXPIRED = """(
+    task.claimed_pid IS NULL OR NOT EXISTS (
+        SELECT 1 FROM pg_stat_activity AS activity
+        WHERE activity.pid = task.claimed_pid AND activity.backend_start = task.claimed_start
+    )
+)"""
+
+SQL_CLAIM_TASKS = f"""
+UPDATE {TABLE_TASK} SET claimed_pid = %(pid)s, claimed_start = %(start)s
+WHERE id IN (
+    SELECT id FROM {TABLE_TASK} AS task
+    WHERE task.queue = %(queue)s AND task.id > %(after)s AND task.id <> ALL(%(exclude)s) AND {SQL_CLAIM_EXPIRED}
+    ORDER BY task.id
+    LIMIT %(limit)s
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING id, body, no_reply, reply_to, correlation_id
+"""
+
+# Registers an RPC subscriber again after a reconnect, unless the identifier has meanwhile been taken over by another
+# communicator that is still alive.
+SQL_REREGISTER_RPC = f"""
+INSERT INTO {TABLE_RPC} AS rpc (queue, identifier, channel, pid, backend_start) VALUES (%s, %s, %s, %s, %s)
+ON CONFLICT (queue, identifier) DO UPDATE
+SET channel = EXCLUDED.channel, pid = EXCLUDED.pid, backend_start = EXCLUDED.backend_start
+WHERE rpc.channel = EXCLUDED.channel OR NOT EXISTS (
+    SELECT 1 FROM pg_stat_activity AS activity
+    WHERE activity.pid = rpc.pid AND activity.backend_start = rpc.backend_start
+)
+"""
+
+
+class PsqlIncomingTask:
+    """A task that has been claimed from the task queue."""
+
+    def __init__(
+        self,
+        communicator: PsqlCommunicator,
+        pk: int,
+        body: t.Any,
+        *,
+        no_reply: bool,
+        reply_to: str | None,
+        correlation_id: str | None,
+    ):
+        self._communicator = communicator
+        self._pk = pk
+        self._body = body
+        self._no_reply = no_reply
+        self._reply_to = reply_to
+        self._correlation_id = correlation_id
+        self._done = False
+
+    @property
+    def pk(self) -> int:
+        """Return the primary key of the row of the task."""
+        return self._pk
+
+    @property
+    def body(self) -> t.Any:
+        """Return the body of the task."""
+        return self._body
+
+    @property
+    def no_reply(self) -> bool:
+        """Return whether the sender of the task does not expect a reply."""
+        return self._no_reply
+
+    @property
+    def reply_to(self) -> str | None:
+        """Return the channel of the sender to which the reply should be sent."""
+        return self._reply_to
+
+    @property
+    def correlation_id(self) -> str | None:
+        """Return the identifier with which the sender correlates the reply to the task."""
+        return self._correlation_id
+
+    @contextlib.contextmanager
+    def processing(self) -> t.Iterator[kiwipy.Future]:
+        """Context manager to process the task.
+
+        The yielded future should be resolved with the outcome of the task. If it is resolved when the context exits,
+        the task is removed from the queue and the outcome is sent to the sender if it expects a reply. Otherwise, the
+        task is put back in the queue.
+        """
+        outcome = kiwipy.Future()
+        try:
+            yield outcome
+        except Exception as exception:
+            if not outcome.done():
+                outcome.set_exception(exception)
+            raise
+        finally:
+            if outcome.done() and not outcome.cancelled():
+                self.finish(self._communicator._future_to_response(outcome))
+            else:
+                self.requeue()
+
+    def finish(self, response: dict[str, t.Any]) -> None:
+        """Remove the task from the queue and send the response to the sender, if it expects a reply.
+
+        :param response: the response to send to the sender.
+        """
+        if not self._done:
+            self._done = True
+            self._communicator._finish_task(self, response)
+
+    def requeue(self) -> None:
+        """Release the claim on the task such that it can be processed again."""
+        if not self._done:
+            self._done = True
+            self._communicator._release_tasks([self._pk])
+
+
+class PsqlCommunicator(CommunicatorHelper):
+    """Implementation of :class:`kiwipy.Communicator` on top of a PostgreSQL database."""
+
+    def __init__(
+        self,
+        connection_params: dict[str, t.Any],
+        *,
+        encoder: t.Callable[[t.Any], str],
+        decoder: t.Callable[[str], t.Any],
+        prefix: str = 'aiida',
+        task_prefetch_count: int = 0,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        reconnect_attempts: int = DEFAULT_RECONNECT_ATTEMPTS,
+    ):
+        """Construct a new instance, connect to the database and start listening for notifications.
+
+        :param connection_params: keyword arguments passed to :func:`psycopg2.connect`.
+        :param encoder: function to encode messages into strings.
+        :param decoder: function to decode strings into messages.
+        :param prefix: prefix of the queue and channels, such that multiple communicators can share a database.
+        :param task_prefetch_count: maximum number of tasks that are processed concurrently, ``0`` means unlimited.
+        :param poll_interval: interval in seconds at which pending tasks are checked in absence of notifications.
+        :param reconnect_attempts: number of attempts to reconnect after a connection to the database was lost.
+        """
+        super().__init__()
+        self._encode = encoder
+        self._decode = decoder
+        self._queue = prefix
+        self._channel_tasks = f'{prefix}.tasks'
+        self._channel_broadcast = f'{prefix}.broadcast'
+        self._channel_inbox = f'aiida.{uuid.uuid4().hex}'
+        self._task_prefetch_count = task_prefetch_count
+        self._poll_interval = poll_interval
+        self._connection_params = connection_params
+        self._reconnect_attempts = reconnect_attempts
+
+        self._pending: dict[str, kiwipy.Future] = {}
+        self._in_flight: set[int] = set()
+        # Tasks rejected by all subscribers, mapped onto the time until which they are not claimed again
+        self._rejected: dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._closing = threading.Event()
+        self._reconnect_lock = threading.Lock()
+
+        self._connection = self._connect(connection_params)
+        self._listen_connection = self._connect(connection_params)
+        self._pid, self._backend_start = self._get_session(self._connection)
+        self._listen_channels(self._listen_connection)
+
+        self._wakeup_receive, self._wakeup_send = socket.socketpair()
+        self._thread = threading.Thread(target=self._listen, name=f'PsqlCommunicator-{self._pid}', daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _connect(connection_params: dict[str, t.Any]) -> 'connection':
+        """Return a new connection to the database in autocommit mode."""
+        import psycopg2
+
+        connection = psycopg2.connect(**connection_params)
+        connection.autocommit = True
+        return connection
+
+    @staticmethod
+    def _get_session(connection: 'connection') -> tuple[int, t.Any]:
+        """Return the process identifier and start time of the backend of the session of the connection.
+
+        Together they identify the session, which is used to determine whether the claims on tasks and the registrations
+        of RPC subscribers are still valid.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pid, backend_start FROM pg_stat_activity WHERE pid = pg_backend_pid()')
+            return cursor.fetchone()
+
+    def _listen_channels(self, connection: 'connection') -> None:
+        """Listen on the channels of the communicator with the given connection."""
+        from psycopg2 import sql
+
+        with connection.cursor() as cursor:
+            for channel in (self._channel_tasks, self._channel_broadcast, self._channel_inbox):
+                cursor.execute(sql.SQL('LISTEN {}').format(sql.Identifier(channel)))
+
+    def _connect_with_retries(self) -> 'connection' | None:
+        """Return a new connection to the database, retrying up to the configured number of reconnect attempts.
+
+        :returns: the connection, or ``None`` if no connection could be established or the communicator is closing.
+        """
+        for attempt in range(1, self._reconnect_attempts + 1):
+            if self._closing.is_set():
+                return None
+
+            try:
+                return self._connect(self._connection_params)
+            except Exception as exception:
+                LOGGER.warning(f'reconnect attempt {attempt}/{self._reconnect_attempts} failed: {exception}')
+                self._closing.wait(self._poll_interval)
+
+        return None
+
+    def _reconnect(self, failed: 'connection') -> bool:
+        """Replace the lost connection of the communicator and restore its state in the database.
+
+        The new connection has a different session, so the tasks that are being processed are claimed again and the
+        RPC subscribers are registered again under the new session. Tasks and RPC identifiers that were taken over by
+        another communicator in the meantime are left alone. If no new connection can be established, the communicator
+        is closed.
+
+        :param failed: the connection that was lost, nothing is done if it has already been replaced by another thread.
+        :returns: whether the communicator has a working connection.
+        """
+        with self._reconnect_lock:
+            if self._connection is not failed:
+                return not self._closing.is_set()
+
+            LOGGER.warning('lost the connection to the database, reconnecting')
+            connection = self._connect_with_retries()
+
+            if connection is not None:
+                try:
+                    self._restore(connection)
+                except Exception:
+                    LOGGER.exception('failed to restore the state of the communicator after reconnecting')
+                    connection.close()
+                    connection = None
+
+            if connection is not None:
+                self._connection = connection
+                with contextlib.suppress(Exception):
+                    failed.close()
+
+        if connection is None:
+            if not self._closing.is_set():
+                LOGGER.error('could not reconnect to the database, closing the communicator')
+                self.close()
+            return False
+
+        return True
+
+    def _restore(self, connection: 'connection') -> None:
+        """Claim the tasks that are being processed and register the RPC subscribers with the session of ``connection``.
+
+        The identity of the communicator is only updated once its state has been restored.
+        """
+        pid, backend_start = self._get_session(connection)
+
+        with self._lock:
+            in_flight = list(self._in_flight)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {TABLE_TASK} SET claimed_pid = %s, claimed_start = %s
+                WHERE id = ANY(%s) AND claimed_pid = %s AND claimed_start = %s
+                """,
+                (pid, backend_start, in_flight, self._pid, self._backend_start),
+            )
+            for identifier in list(self._rpc_subscribers):
+                cursor.execute(SQL_REREGISTER_RPC, (self._queue, identifier, self._channel_inbox, pid, backend_start))
+
+        self._pid, self._backend_start = pid, backend_start
+
+    def close(self) -> None:
+        """Close the communicator.
+
+        Tasks that are still being processed are released such that other communicators can pick them up and futures
+        of messages that are still awaiting a reply are cancelled.
+        """
+        if self.is_closed():
+            return
+
+        self._closing.set()
+        self._wakeup()
+
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+        try:
+            with self._lock:
+                in_flight = list(self._in_flight)
+                self._in_flight.clear()
+            self._release_tasks(in_flight)
+            self._execute(f'DELETE FROM {TABLE_RPC} WHERE channel = %s', (self._channel_inbox,))
+        except Exception:
+            LOGGER.exception('failed to release the resources of the communicator')
+
+        self._connection.close()
+        self._listen_connection.close()
+        self._wakeup_receive.close()
+        self._wakeup_send.close()
+
+        for future in self._pending.values():
+            future.cancel()
+
+        self._pending.clear()
+        super().close()
+
+    def add_rpc_subscriber(self, subscriber, identifier=None) -> t.Any:
+        """Register an RPC subscriber.
+
+        :param subscriber: the RPC callback function.
+        :param identifier: the identifier of the subscriber that senders use as recipient.
+        :returns: the identifier of the subscriber.
+        """
+        identifier = super().add_rpc_subscriber(subscriber, None if identifier is None else str(identifier))
+        self._execute(
+            f"""
+            INSERT INTO {TABLE_RPC} (queue, identifier, channel, pid, backend_start) VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (queue, identifier) DO UPDATE
+            SET channel = EXCLUDED.channel, pid = EXCLUDED.pid, backend_start = EXCLUDED.backend_start
+            """,
+            (self._queue, identifier, self._channel_inbox, self._pid, self._backend_start),
+        )
+        return identifier
+
+    def remove_rpc_subscriber(self, identifier) -> None:
+        """Remove an RPC subscriber.
+
+        :param identifier: the identifier of the subscriber.
+        :raises ValueError: if the identifier does not correspond to a known subscriber.
+        """
+        identifier = str(identifier)
+        super().remove_rpc_subscriber(identifier)
+        self._execute(
+            f'DELETE FROM {TABLE_RPC} WHERE queue = %s AND identifier = %s AND channel = %s',
+            (self._queue, identifier, self._channel_inbox),
+        )
+
+    def add_task_subscriber(self, subscriber, identifier=None) -> t.Any:
+        """Register a task subscriber and start consuming tasks from the queue.
+
+        :param subscriber: the task callback function.
+        :param identifier: the identifier of the subscriber.
+        :returns: the identifier of the subscriber.
+        """
+        identifier = super().add_task_subscriber(subscriber, identifier)
+        self._wakeup()
+        return identifier
+
+    def task_send(self, task, no_reply: bool = False) -> kiwipy.Future | None:
+        """Send a task to the queue.
+
+        :param task: the task message.
+        :param no_reply: if ``True`` the task is fire-and-forget and no future is returned.
+        :returns: a future that resolves to the result of the task, or ``None`` if ``no_reply`` is ``True``.
+        """
+        self._ensure_open()
+        future, correlation_id = None, None
+
+        if not no_reply:
+            future, correlation_id = self._create_pending()
+
+        self._execute(
+            f"""
+            INSERT INTO {TABLE_TASK} (queue, body, no_reply, reply_to, correlation_id) VALUES (%s, %s, %s, %s, %s);
+            SELECT pg_notify(%s, '');
+            """,
+            (
+                self._queue,
+                self._encode(task),
+                no_reply,
+                None if no_reply else self._channel_inbox,
+                correlation_id,
+                self._channel_tasks,
+            ),
+        )
+
+        return future
+
+    def rpc_send(self, recipient_id, msg) -> kiwipy.Future:
+        """Send an RPC message to the subscriber with the given identifier.
+
+        :param recipient_id: the identifier of the RPC subscriber.
+        :param msg: the message.
+        :returns: a future that resolves to the response of the subscriber.
+        :raises kiwipy.UnroutableError: if no communicator that is alive has a subscriber with the given identifier.
+        """
+        self._ensure_open()
+        result = self._execute(
+            f"""
+            SELECT rpc.channel FROM {TABLE_RPC} AS rpc JOIN pg_stat_activity AS activity
+            ON activity.pid = rpc.pid AND activity.backend_start = rpc.backend_start
+            WHERE rpc.queue = %s AND rpc.identifier = %s
+            """,
+            (self._queue, str(recipient_id)),
+            fetch=True,
+        )
+
+        if not result:
+            raise kiwipy.UnroutableError(f'Unknown rpc recipient `{recipient_id}`')
+
+        future, correlation_id = self._create_pending()
+        message = {
+            'rpc': str(recipient_id),
+            'body': msg,
+            'reply_to': self._channel_inbox,
+            'correlation_id': correlation_id,
+        }
+
+        try:
+            self._notify(result[0][0], message)
+        except Exception:
+            self._pending.pop(correlation_id, None)
+            raise
+
+        return future
+
+    def broadcast_send(self, body, sender=None, subject=None, correlation_id=None) -> bool:
+        """Broadcast a message to all broadcast subscribers of all communicators.
+
+        :returns: ``True`` once the message has been sent.
+        """
+        self._ensure_open()
+        message = {'body': body, 'sender': sender, 'subject': subject, 'correlation_id': correlation_id}
+        self._notify(self._channel_broadcast, message)
+        return True
+
+    def iterate_tasks(self) -> t.Iterator[PsqlIncomingTask]:
+        """Return an iterator over the tasks in the queue that are not being processed.
+
+        Each task is claimed while it is yielded. Unless it is processed, it is put back in the queue before the next
+        task is yielded.
+        """
+        self._ensure_open()
+        after = 0
+
+        while True:
+            tasks = self._claim_tasks(after=after, limit=1, exclude=[])
+
+            if not tasks:
+                return
+
+            task = tasks[0]
+            after = task.pk
+
+            try:
+                yield task
+            finally:
+                task.requeue()
+
+    def _execute(self, query: str, parameters: t.Any = None, fetch: bool = False) -> list[tuple] | None:
+        """Execute a query on the connection of the communicator.
+
+        If the connection was lost, the communicator reconnects and executes the query once more. Since the connection
+        may have been lost after the query was committed, it can be executed twice. This is consistent with the
+        at-least-once delivery of tasks.
+
+        :param fetch: whether to fetch and return the rows of the result.
+        """
+        import psycopg2
+
+        connection = self._connection
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(query, parameters)
+                return cursor.fetchall() if fetch else None
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            if not connection.closed or self._closing.is_set() or not self._reconnect(connection):
+                raise
+
+        with self._connection.cursor() as cursor:
+            cursor.execute(query, parameters)
+            return cursor.fetchall() if fetch else None
+
+    def _notify(self, channel: str, message: dict[str, t.Any]) -> None:
+        """Send a message to the given channel.
+
+        :raises ValueError: if the encoded message exceeds the maximum size of the payload of a notification.
+        """
+        payload = self._encode(message)
+
+        if len(payload.encode('utf-8')) > MAX_PAYLOAD_SIZE:
+            raise ValueError(f'the encoded message exceeds the maximum size of {MAX_PAYLOAD_SIZE} bytes.')
+
+        self._execute('SELECT pg_notify(%s, %s)', (channel, payload))
+
+    def _wakeup(self) -> None:
+        """Wake up the listening thread such that it checks the task queue."""
+        with contextlib.suppress(OSError):
+            self._wakeup_send.send(b'\0')
+
+    def _create_pending(self) -> tuple[kiwipy.Future, str]:
+        """Return a future and the correlation identifier of the reply that will resolve it."""
+        future = kiwipy.Future()
+        correlation_id = uuid.uuid4().hex
+        self._pending[correlation_id] = future
+        return future, correlation_id
+
+    def _listen(self) -> None:
+        """Listen for notifications and dispatch them to the subscribers until the communicator is closed."""
+        connection = self._listen_connection
+
+        while not self._closing.is_set():
+            try:
+                readable, _, _ = select.select([connection, self._wakeup_receive], [], [], self._poll_interval)
+                consume = not readable
+
+                if self._wakeup_receive in readable:
+                    self._wakeup_receive.recv(4096)
+                    consume = True
+
+                connection.poll()
+                notifies, connection.notifies[:] = list(connection.notifies), []
+
+                for notify in notifies:
+                    if notify.channel == self._channel_tasks:
+                        consume = True
+                    elif not self._closing.is_set():
+                        self._on_message(notify.channel, self._decode(notify.payload))
+
+                if consume and not self._closing.is_set():
+                    self._consume_tasks()
+            except Exception:
+                if self._closing.is_set():
+                    return
+                if connection.closed:
+                    connection = self._reconnect_listen(connection)
+                    if connection is None:
+                        return
+                    continue
+                LOGGER.exception('exception in the listening thread of the communicator')
+                self._closing.wait(self._poll_interval)
+
+    def _reconnect_listen(self, failed: 'connection') -> 'connection' | None:
+        """Replace the lost connection on which the communicator listens for notifications.
+
+        Since notifications that were sent while the communicator was disconnected are lost, the listening thread is
+        woken up to check the task queue. If no new connection can be established, the communicator is closed.
+
+        :param failed: the connection that was lost.
+        :returns: the new connection, or ``None`` if the communicator was closed.
+        """
+        LOGGER.warning('lost the connection to the database on which notifications are received, reconnecting')
+        connection = self._connect_with_retries()
+
+        if connection is not None:
+            try:
+                self._listen_channels(connection)
+            except Exception:
+                LOGGER.exception('failed to listen for notifications after reconnecting')
+                connection.close()
+                connection = None
+
+        with contextlib.suppress(Exception):
+            failed.close()
+
+        if connection is None:
+            if not self._closing.is_set():
+                LOGGER.error('could not reconnect to the database, closing the communicator')
+                self.close()
+            return None
+
+        self._listen_connection = connection
+        self._wakeup()
+        return connection
+
+    def _on_message(self, channel: str, message: dict[str, t.Any]) -> None:
+        """Handle a message that was received on the broadcast channel or the inbox of the communicator."""
+        if channel == self._channel_broadcast:
+            for subscriber in list(self._broadcast_subscribers.values()):
+                try:
+                    subscriber(self, message['body'], message['sender'], message['subject'], message['correlation_id'])
+                except Exception:
+                    LOGGER.exception('exception in broadcast subscriber')
+        elif 'rpc' in message:
+            self._on_rpc(message)
+        else:
+            future = self._pending.pop(message.pop('correlation_id'), None)
+            if future is not None and not future.done():
+                self._response_to_future(message, future)
+
+    def _on_rpc(self, message: dict[str, t.Any]) -> None:
+        """Call the subscriber of an RPC message and send its response to the sender."""
+
+        try:
+            subscriber = self._rpc_subscribers[message['rpc']]
+        except KeyError:
+            response = {'exception': f"Unknown rpc recipient `{message['rpc']}`"}
+            self._reply(message['reply_to'], message['correlation_id'], response)
+            return
+
+        try:
+            result = subscriber(self, message['body'])
+        except Exception as exception:
+            self._reply(message['reply_to'], message['correlation_id'], {'exception': str(exception)})
+        else:
+            self._resolve(
+                result,
+                lambda future: self._reply(
+                    message['reply_to'], message['correlation_id'], self._future_to_response(future)
+                ),
+            )
+
+    def _reply(self, channel: str, correlation_id: str, response: dict[str, t.Any]) -> None:
+        """Send the response to a task or RPC message to the inbox of its sender."""
+        if self.is_closed():
+            return
+
+        response['correlation_id'] = correlation_id
+
+        try:
+            self._notify(channel, response)
+        except ValueError as exception:
+            self._notify(channel, {'correlation_id': correlation_id, 'exception': str(exception)})
+
+    def _claim_tasks(self, after: int, limit: int, exclude: list[int]) -> list[PsqlIncomingTask]:
+        """Claim pending tasks from the queue.
+
+        :param after: only claim tasks with a primary key larger than this value.
+        :param limit: the maximum number of tasks to claim.
+        :param exclude: primary keys of tasks that should not be claimed.
+        """
+        parameters = {
+            'pid': self._pid,
+            'start': self._backend_start,
+            'queue': self._queue,
+            'after': after,
+            'exclude': exclude,
+            'limit': limit,
+        }
+        rows = self._execute(SQL_CLAIM_TASKS, parameters, fetch=True) or []
+        return [
+            PsqlIncomingTask(
+                self, pk, self._decode(body), no_reply=no_reply, reply_to=reply_to, correlation_id=correlation_id
+            )
+            for pk, body, no_reply, reply_to, correlation_id in sorted(rows)
+        ]
+
+    def _consume_tasks(self) -> None:
+        """Claim pending tasks from the queue for as long as there are subscribers with available slots."""
+        while self._task_subscribers and not self._closing.is_set():
+            with self._lock:
+                if self._task_prefetch_count:
+                    limit = self._task_prefetch_count - len(self._in_flight)
+                else:
+                    limit = 100
+
+            if limit <= 0:
+                return
+
+            now = time.monotonic()
+            self._rejected = {pk: expiry for pk, expiry in self._rejected.items() if expiry > now}
+            tasks = self._claim_tasks(after=0, limit=limit, exclude=list(self._rejected))
+
+            for task in tasks:
+                with self._lock:
+                    self._in_flight.add(task.pk)
+                self._process_task(task)
+
+            if len(tasks) < limit:
+                return
+
+    def _process_task(self, task: PsqlIncomingTask) -> None:
+        """Pass the task to the task subscribers until one of them accepts it."""
+        for subscriber in list(self._task_subscribers.values()):
+            try:
+                result = subscriber(self, task.body)
+            except kiwipy.TaskRejected:
+                continue
+            except Exception as exception:
+                LOGGER.exception('exception occurred while processing task')
+                self._finish_task(task, {'exception': str(exception)})
+            else:
+                self._resolve(result, lambda future: self._on_task_done(task, future))
+            return
+
+        # None of the subscribers accepted the task: put it back in the queue for other communicators to pick it up. It
+        # is only offered to the subscribers of this communicator again after the poll interval, by which time the
+        # entry has expired, such that the entries of tasks that were meanwhile completed elsewhere do not accumulate.
+        self._rejected[task.pk] = time.monotonic() + self._poll_interval
+        self._release_tasks([task.pk])
+
+    def _on_task_done(self, task: PsqlIncomingTask, future: concurrent.futures.Future) -> None:
+        """Finish the task if the future resolved, or release it if it was cancelled."""
+        if future.cancelled():
+            self._release_tasks([task.pk])
+        else:
+            self._finish_task(task, self._future_to_response(future))
+
+    def _finish_task(self, task: PsqlIncomingTask, response: dict[str, t.Any]) -> None:
+        """Remove the task from the queue and send the response to the sender, if it expects a reply."""
+        if self.is_closed():
+            return
+
+        with self._lock:
+            self._in_flight.discard(task.pk)
+
+        self._execute(f'DELETE FROM {TABLE_TASK} WHERE id = %s', (task.pk,))
+
+        if not task.no_reply and task.reply_to is not None:
+            self._reply(task.reply_to, task.correlation_id, response)
+
+        self._wakeup()
+
+    def _release_tasks(self, pks: list[int]) -> None:
+        """Release the claim on the given tasks such that they can be picked up again."""
+        if self.is_closed() or not pks:
+            return
+
+        with self._lock:
+            self._in_flight.difference_update(pks)
+
+        self._execute(
+            f"""
+            UPDATE {TABLE_TASK} SET claimed_pid = NULL, claimed_start = NULL
+            WHERE id = ANY(%s) AND claimed_pid = %s AND claimed_start = %s;
+            SELECT pg_notify(%s, '');
+            """,
+            (pks, self._pid, self._backend_start, self._channel_tasks),
+        )
+
+    @staticmethod
+    def _resolve(result: t.Any, callback: t.Callable[[concurrent.futures.Future], None]) -> None:
+        """Call the callback with a resolved future once the result, which can be a chain of futures, is resolved."""
+        if not isinstance(result, concurrent.futures.Future):
+            future: concurrent.futures.Future = kiwipy.Future()
+            future.set_result(result)
+            callback(future)
+            return
+
+        def done(future: concurrent.futures.Future) -> None:
+            if (
+                not future.cancelled()
+                and future.exception() is None
+                and isinstance(future.result(), concurrent.futures.Future)
+            ):
+                PsqlCommunicator._resolve(future.result(), callback)
+            else:
+                callback(future)
+
+        result.add_done_callback(done)
+
+    @staticmethod
+    def _future_to_response(future: concurrent.futures.Future) -> dict[str, t.Any]:
+        """Return the response for a resolved future."""
+        if future.cancelled():
+            return {'cancelled': True}
+
+        exception = future.exception()
+
+        if exception is not None:
+            return {'exception': str(exception)}
+
+        return {'result': future.result()}
+
+    @staticmethod
+    def _response_to_future(response: dict[str, t.Any], future: kiwipy.Future) -> None:
+        """Resolve the future with the response."""
+        if 'cancelled' in response:
+            future.cancel()
+        elif 'exception' in response:
+            future.set_exception(kiwipy.RemoteException(response['exception']))
+        else:
+            future.set_result(response['result'])
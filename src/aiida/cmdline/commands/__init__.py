@@ -6,34 +6,8 @@
 # For further information on the license, see the LICENSE.txt file        #
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
-# ruff: noqa: F401, E402
 """Sub commands of the ``verdi`` command line interface.
 
-The commands need to be imported here for them to be registered with the top-level command group.
+The commands are loaded lazily: the module of a command is only imported when the command is requested, which registers
+it with the top-level command group. The modules are declared in :mod:`aiida.cmdline.commands.cmd_verdi`.
 """
-
-from aiida.cmdline.commands import (
-    cmd_archive,
-    cmd_calcjob,
-    cmd_code,
-    cmd_computer,
-    cmd_config,
-    cmd_daemon,
-    cmd_data,
-    cmd_database,
-    cmd_devel,
-    cmd_group,
-    cmd_help,
-    cmd_node,
-    cmd_plugin,
-    cmd_process,
-    cmd_profile,
-    cmd_rabbitmq,
-    cmd_restapi,
-    cmd_run,
-    cmd_setup,
-    cmd_shell,
-    cmd_status,
-    cmd_storage,
-    cmd_user,
-)
@@ -19,7 +19,7 @@ from aiida.cmdline.utils import decorators, echo
 from aiida.common import exceptions
 
 
-@verdi.group('devel')
+@verdi.group('devel', lazy_commands={'rabbitmq': 'aiida.cmdline.commands.cmd_rabbitmq'})
 def verdi_devel():
     """Commands for developers."""
 
@@ -66,11 +66,15 @@ def devel_check_undesired_imports():
     loaded_modules = 0
 
     for modulename in [
+        'alembic',
         'asyncio',
         'requests',
+        'kiwipy',
+        'numpy',
         'plumpy',
         'disk_objectstore',
         'paramiko',
+        'sqlalchemy',
         'seekpath',
         'CifFile',
         'ase',
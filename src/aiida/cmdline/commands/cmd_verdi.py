@@ -15,9 +15,38 @@ from aiida import __version__
 from ..groups import VerdiCommandGroup
 from ..params import options, types
 
+# The modules defining the sub commands are only imported when the command is requested, see ``VerdiCommandGroup``
+VERDI_COMMANDS = {
+    'archive': 'aiida.cmdline.commands.cmd_archive',
+    'calcjob': 'aiida.cmdline.commands.cmd_calcjob',
+    'code': 'aiida.cmdline.commands.cmd_code',
+    'computer': 'aiida.cmdline.commands.cmd_computer',
+    'config': 'aiida.cmdline.commands.cmd_config',
+    'daemon': 'aiida.cmdline.commands.cmd_daemon',
+    'data': 'aiida.cmdline.commands.cmd_data',
+    'database': 'aiida.cmdline.commands.cmd_database',
+    'devel': 'aiida.cmdline.commands.cmd_devel',
+    'group': 'aiida.cmdline.commands.cmd_group',
+    'help': 'aiida.cmdline.commands.cmd_help',
+    'node': 'aiida.cmdline.commands.cmd_node',
+    'plugin': 'aiida.cmdline.commands.cmd_plugin',
+    'process': 'aiida.cmdline.commands.cmd_process',
+    'profile': 'aiida.cmdline.commands.cmd_profile',
+    'quicksetup': 'aiida.cmdline.commands.cmd_setup',
+    'restapi': 'aiida.cmdline.commands.cmd_restapi',
+    'run': 'aiida.cmdline.commands.cmd_run',
+    'setup': 'aiida.cmdline.commands.cmd_setup',
+    'shell': 'aiida.cmdline.commands.cmd_shell',
+    'status': 'aiida.cmdline.commands.cmd_status',
+    'storage': 'aiida.cmdline.commands.cmd_storage',
+    'user': 'aiida.cmdline.commands.cmd_user',
+}
+
 
 # Pass the version explicitly to ``version_option`` otherwise editable installs can show the wrong version number
-@click.group(cls=VerdiCommandGroup, context_settings={'help_option_names': ['--help', '-h']})
+@click.group(
+    cls=VerdiCommandGroup, lazy_commands=VERDI_COMMANDS, context_settings={'help_option_names': ['--help', '-h']}
+)
 @options.PROFILE(type=types.ProfileParamType(load_profile=True), expose_value=False)
 @options.VERBOSITY()
 @click.version_option(__version__, package_name='aiida_core', message='AiiDA version %(version)s')
@@ -63,6 +63,9 @@ class DynamicEntryPointCommandGroup(VerdiCommandGroup):
     def list_commands(self, ctx: click.Context) -> list[str]:
         """Return the sorted list of subcommands for this group.
 
+        The entry points are not loaded, such that listing the commands, for example for tab-completion, remains fast.
+        Commands of entry points that are not exposed on the command line are hidden when they are created instead.
+
         :param ctx: The :class:`click.Context`.
         """
         commands = super().list_commands(ctx)
@@ -71,7 +74,6 @@ class DynamicEntryPointCommandGroup(VerdiCommandGroup):
                 entry_point
                 for entry_point in get_entry_point_names(self.entry_point_group)
                 if re.match(self.entry_point_name_filter, entry_point)
-                and getattr(self.factory(entry_point), 'cli_exposed', True)
             ]
         )
         return sorted(commands)
@@ -119,7 +121,8 @@ class DynamicEntryPointCommandGroup(VerdiCommandGroup):
         cls = self.factory(entry_point)
         command = functools.partial(self.call_command, ctx, cls)
         command.__doc__ = cls.__doc__
-        return click.command(entry_point)(self.create_options(entry_point)(command))
+        hidden = not getattr(cls, 'cli_exposed', True)
+        return click.command(entry_point, hidden=hidden)(self.create_options(entry_point)(command))
 
     def create_options(self, entry_point: str) -> t.Callable:
         """Create the option decorators for the command function for the given entry point.
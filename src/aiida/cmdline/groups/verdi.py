@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 import difflib
 import gzip
+import importlib
 import typing as t
 
 import click
@@ -84,10 +85,22 @@ class VerdiCommandGroup(click.Group):
 
     The class automatically adds the verbosity option to all commands in the interface. It also adds some functionality
     to provide suggestions of commands in case the user provided command name does not exist.
+
+    Subcommands can be loaded lazily by passing ``lazy_commands``, a mapping of command names onto the module that
+    defines them. The module is only imported once the command is requested, which is what registers the command with
+    the group. This keeps the load time of ``verdi`` minimal, which is important for example for tab-completion.
     """
 
     context_class = VerdiContext
 
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return the sorted list of subcommands for this group, including those that have not yet been loaded."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
     @staticmethod
     def add_verbosity_option(cmd: click.Command) -> click.Command:
         """Apply the ``verbosity`` option to the command, which is common to all ``verdi`` commands."""
@@ -118,6 +131,7 @@ class VerdiCommandGroup(click.Group):
 
         This method is overridden from the base class in order to two functionalities:
 
+            * If the command is loaded lazily and was not yet loaded, import the module that defines it.
             * If the command is found, automatically add the verbosity option.
             * If the command is not found, attempt to provide a list of suggestions with existing commands that resemble
               the requested command name.
@@ -129,6 +143,9 @@ class VerdiCommandGroup(click.Group):
             click.echo(gzip.decompress(base64.b85decode(GIU.encode('utf-8'))).decode('utf-8'))
             return None
 
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            importlib.import_module(self.lazy_commands[cmd_name])
+
         cmd = super().get_command(ctx, cmd_name)
 
         if cmd is not None:
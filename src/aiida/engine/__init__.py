@@ -38,6 +38,7 @@ __all__ = (
     'InterruptableFuture',
     'JobManager',
     'JobsList',
+    'MonitorsList',
     'ObjectLoader',
     'OutputPort',
     'PORT_NAMESPACE_SEPARATOR',
@@ -56,6 +57,7 @@ __all__ = (
     'WithSerialize',
     'WorkChain',
     'append_',
+    'as_completed',
     'assign_',
     'await_processes',
     'calcfunction',
@@ -71,6 +73,7 @@ __all__ = (
     'run_get_node',
     'run_get_pk',
     'submit',
+    'submit_many',
     'while_',
     'workfunction',
 )
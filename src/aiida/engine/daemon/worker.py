@@ -20,6 +20,9 @@ from aiida.manage import get_config_option, get_manager
 
 LOGGER = logging.getLogger(__name__)
 
+#: Interval in seconds at which the daemon worker checks whether its communicator is still open.
+COMMUNICATOR_CHECK_INTERVAL = 5.0
+
 
 async def shutdown_worker(runner: Runner) -> None:
     """Cleanup tasks tied to the service's shutdown."""
@@ -37,6 +40,19 @@ async def shutdown_worker(runner: Runner) -> None:
     LOGGER.info('Daemon worker stopped')
 
 
+async def check_communicator(runner: Runner, interval: float = COMMUNICATOR_CHECK_INTERVAL) -> None:
+    """Shut down the daemon worker once the communicator of its runner is closed.
+
+    A communicator can close itself when it permanently loses the connection to the broker, after which the worker can
+    no longer receive tasks. Shutting it down allows the daemon to start a new worker in its place.
+    """
+    while not runner.communicator.is_closed():
+        await asyncio.sleep(interval)
+
+    LOGGER.error('The communicator of the daemon worker was closed, shutting down the daemon worker')
+    await shutdown_worker(runner)
+
+
 def start_daemon_worker(foreground: bool = False) -> None:
     """Start a daemon worker for the currently configured profile.
 
@@ -62,6 +78,8 @@ def start_daemon_worker(foreground: bool = False) -> None:
     for s in signals:
         runner.loop.add_signal_handler(s, lambda s=s: asyncio.create_task(shutdown_worker(runner)))
 
+    runner.loop.create_task(check_communicator(runner))
+
     try:
         LOGGER.info('Starting a daemon worker')
         runner.start()
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import time
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 from aiida.common import InvalidOperation
 from aiida.common.lang import type_check
@@ -25,7 +26,7 @@ from .processes.process import Process
 from .runners import ResultAndPk
 from .utils import instantiate_process, is_process_scoped, prepare_inputs
 
-__all__ = ('run', 'run_get_pk', 'run_get_node', 'submit', 'await_processes')
+__all__ = ('run', 'run_get_pk', 'run_get_node', 'submit', 'submit_many', 'await_processes', 'as_completed')
 
 TYPE_RUN_PROCESS = t.Union[Process, t.Type[Process], ProcessBuilder]
 # run can also be process function, but it is not clear what type this should be
@@ -146,26 +147,263 @@ def submit(
     return node
 
 
+def submit_many(
+    process: t.Union[t.Type[Process], ProcessBuilder],
+    inputs: t.Sequence[dict[str, t.Any]],
+    *,
+    batch_size: int = 100,
+    max_workers: int = 16,
+) -> list[ProcessNode]:
+    """Submit many instances of the same process to the daemon, one for each dictionary of inputs.
+
+    This is equivalent to calling :func:`submit` for each dictionary of inputs, but considerably faster for large
+    numbers of processes. All inputs are validated before anything is created, such that either all processes are
+    submitted or none at all if any of the inputs are invalid. The process nodes, their input links and checkpoints are
+    then created in a single transaction per batch of ``batch_size`` processes. Once a batch is committed, its continue
+    tasks are sent to the broker concurrently by a pool of threads, such that many tasks are awaiting the confirmation
+    of the broker at the same time instead of one round trip per process. This happens while the next batch is created.
+
+    .. warning: this should not be used within another process. Instead, there one should use the ``submit`` method of
+        the wrapping process itself, i.e. use ``self.submit``.
+
+    .. warning: submission of processes requires ``store_provenance=True``. Dry runs and imports of completed
+        calculations through the ``remote_folder`` input are not supported, use :func:`submit` instead.
+
+    :param process: the process class or builder to submit. For a builder, its inputs take precedence over those
+        defined in ``inputs``.
+    :param inputs: sequence of input dictionaries, one for each process to submit.
+    :param batch_size: the number of processes whose nodes are created in a single transaction.
+    :param max_workers: the maximum number of continue tasks that are sent to the broker at the same time.
+    :return: the process nodes in the same order as ``inputs``.
+    :raises ValueError: if any of the inputs are invalid, in which case no process is submitted.
+    :raises `~aiida.common.exceptions.InvalidOperation`: if called from within another process or if any of the inputs
+        request a dry run, define a ``remote_folder`` or disable ``store_provenance``.
+    """
+    if isinstance(process, Process):
+        raise TypeError('`process` should be a process class or builder, a process instance can only be submitted once')
+
+    if batch_size < 1:
+        raise ValueError(f'`batch_size` should be a positive integer, got: {batch_size}')
+
+    if is_process_scoped() and not isinstance(Process.current(), FunctionProcess):
+        raise InvalidOperation('Cannot use top-level `submit_many` from within another process, use `self.submit`')
+
+    inputs = [prepare_inputs(process_inputs) for process_inputs in inputs]
+
+    for index, process_inputs in enumerate(inputs):
+        _validate_submit_inputs(process, process_inputs, index)
+
+    runner = manager.get_manager().get_runner()
+    assert runner.persister is not None, 'runner does not have a persister'
+    assert runner.controller is not None, 'runner does not have a controller'
+
+    storage = manager.get_manager().get_profile_storage()
+    nodes = []
+
+    def continue_process(pid: int) -> None:
+        runner.controller.continue_process(pid, nowait=False, no_reply=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+
+        for start in range(0, len(inputs), batch_size):
+            batch = []
+
+            with storage.transaction():
+                for process_inputs in inputs[start : start + batch_size]:
+                    process_inited = instantiate_process(runner, process, **process_inputs)
+                    runner.persister.save_checkpoint(process_inited)
+                    process_inited.close()
+                    batch.append(process_inited)
+
+            # The tasks can only be sent once the transaction is committed, otherwise a daemon worker that picks up the
+            # task may not yet find the process node and its checkpoint.
+            futures.extend(executor.submit(continue_process, process_inited.pid) for process_inited in batch)
+            nodes.extend(process_inited.node for process_inited in batch)
+
+    for future in futures:
+        future.result()
+
+    return nodes
+
+
+def _validate_submit_inputs(
+    process: t.Union[t.Type[Process], ProcessBuilder], inputs: dict[str, t.Any], index: int
+) -> None:
+    """Validate the inputs of a process that is to be submitted through :func:`submit_many`.
+
+    The inputs are pre-processed and validated against the input namespace of the process specification in the same way
+    as when the process is instantiated, but without creating the process or storing anything.
+
+    :param process: the process class or builder.
+    :param inputs: the inputs for the process.
+    :param index: the index of the inputs, used for the error message.
+    :raises ValueError: if the inputs are invalid.
+    :raises `~aiida.common.exceptions.InvalidOperation`: if the inputs cannot be submitted.
+    """
+    if isinstance(process, ProcessBuilder):
+        process_class = process.process_class
+        inputs = {**inputs, **process._inputs(prune=True)}
+    elif isinstance(process, type) and issubclass(process, Process):
+        process_class = process
+    else:
+        raise ValueError(f'invalid process {type(process)}, needs to be Process or ProcessBuilder')
+
+    def copy_dictionaries(value: t.Any) -> t.Any:
+        if isinstance(value, dict):
+            return {key: copy_dictionaries(subvalue) for key, subvalue in value.items()}
+        return value
+
+    spec_inputs = process_class.spec().inputs
+    parsed = spec_inputs.pre_process(copy_dictionaries(inputs))
+    result = spec_inputs.validate(parsed)
+
+    if result is not None:
+        raise ValueError(f'the inputs at index {index} are invalid: {result}')
+
+    metadata = parsed.get('metadata', {})
+
+    if metadata.get('dry_run', False) or 'remote_folder' in parsed:
+        raise InvalidOperation(f'the inputs at index {index} define a dry run or `remote_folder`, use `submit` instead')
+
+    if not metadata.get('store_provenance', True):
+        raise InvalidOperation(f'the inputs at index {index} set `store_provenance=False`, which cannot be submitted')
+
+
 def await_processes(nodes: t.Sequence[ProcessNode], wait_interval: int = 1) -> None:
     """Run a loop until all processes are terminated.
 
     :param nodes: Sequence of nodes that represent the processes to await.
     :param wait_interval: The interval between each iteration of checking the status of all processes.
     """
+    _check_process_nodes(nodes)
+    start_time = time.time()
+    terminated = 0
+
+    for batch in _iterate_terminated(nodes, wait_interval):
+        terminated += len(batch)
+        seconds_passed = time.time() - start_time
+        LOGGER.report(f'{terminated} out of {len(nodes)} processes terminated. [{round(seconds_passed)} s]')
+
+
+def as_completed(
+    nodes: t.Sequence[ProcessNode], wait_interval: float = 1, timeout: float | None = None
+) -> t.Iterator[ProcessNode]:
+    """Return an iterator that yields the given process nodes as their processes terminate.
+
+    If the profile defines a broker, the state change broadcasts of the processes are used to yield nodes as soon as
+    they terminate. As a fail-safe, and if there is no broker, the state of all processes that have not yet terminated
+    is checked with a single query every ``wait_interval`` seconds.
+
+    :param nodes: Sequence of nodes that represent the processes to await.
+    :param wait_interval: The interval in seconds between checks of the state of all processes.
+    :param timeout: Optional maximum number of seconds to wait for all processes to terminate.
+    :raises TimeoutError: If not all processes have terminated within ``timeout`` seconds.
+    """
+    _check_process_nodes(nodes)
+    return (node for batch in _iterate_terminated(nodes, wait_interval, timeout) for node in batch)
+
+
+def _check_process_nodes(nodes: t.Sequence[ProcessNode]) -> None:
+    """Check that the nodes are a list or tuple of process nodes.
+
+    :raises TypeError: If ``nodes`` is not a list or tuple of ``ProcessNode`` instances.
+    """
     type_check(nodes, (list, tuple))
 
     if any(not isinstance(node, ProcessNode) for node in nodes):
         raise TypeError(f'`nodes` should be a list of `ProcessNode`s but got: {nodes}')
 
-    start_time = time.time()
-    terminated = False
 
-    while not terminated:
-        running = [not node.is_terminated for node in nodes]
-        terminated = not any(running)
-        seconds_passed = time.time() - start_time
-        LOGGER.report(f'{running.count(False)} out of {len(nodes)} processes terminated. [{round(seconds_passed)} s]')
-        time.sleep(wait_interval)
+def _iterate_terminated(
+    nodes: t.Sequence[ProcessNode], wait_interval: float, timeout: float | None = None
+) -> t.Iterator[list[ProcessNode]]:
+    """Return an iterator over batches of the given process nodes whose processes have terminated.
+
+    A batch is yielded after each check of the process states, even if it is empty, until all processes are terminated.
+
+    :param nodes: Sequence of nodes that represent the processes to await.
+    :param wait_interval: The interval in seconds between checks of the state of all processes.
+    :param timeout: Optional maximum number of seconds to wait for all processes to terminate.
+    :raises TimeoutError: If not all processes have terminated within ``timeout`` seconds.
+    """
+    import queue
+
+    from .processes.futures import get_terminated_pks
+
+    pending = {node.pk: node for node in nodes}
+    terminated: queue.Queue = queue.Queue()
+    communicator, identifier = _subscribe_terminated(frozenset(pending), terminated)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    candidates = set(pending)
+    last_poll = time.monotonic()
+
+    try:
+        while pending:
+            if candidates:
+                pks = get_terminated_pks(candidates)
+                yield [pending.pop(pk) for pk in list(pending) if pk in pks]
+
+            if not pending:
+                return
+
+            now = time.monotonic()
+
+            if deadline is not None and now >= deadline:
+                raise TimeoutError(f'{len(pending)} out of {len(nodes)} processes did not terminate within {timeout} s')
+
+            # The next check of all processes is due ``wait_interval`` after the last one, regardless of the broadcasts
+            # that are received in the meantime, since broadcasts can be missed.
+            next_poll = last_poll + wait_interval if deadline is None else min(last_poll + wait_interval, deadline)
+            candidates = set()
+
+            try:
+                candidates.add(terminated.get(timeout=max(next_poll - now, 0)))
+            except queue.Empty:
+                pass
+
+            # Drain all broadcasts that were received in the meantime to check them in a single query
+            while not terminated.empty():
+                candidates.add(terminated.get_nowait())
+
+            now = time.monotonic()
+
+            if now >= next_poll:
+                candidates = set(pending)
+                last_poll = now
+            else:
+                candidates.intersection_update(pending)
+    finally:
+        if communicator is not None:
+            communicator.remove_broadcast_subscriber(identifier)
+
+
+def _subscribe_terminated(pks: frozenset[int], terminated: t.Any) -> tuple[t.Any, str | None]:
+    """Subscribe to the broadcasts of the given processes terminating, if the profile defines a broker.
+
+    :param pks: The primary keys of the process nodes.
+    :param terminated: Queue to which the primary keys of processes are put when they broadcast their termination.
+    :returns: Tuple of the communicator and the identifier of the subscriber, or ``None`` for both if the broadcasts
+        cannot be subscribed to.
+    """
+    import kiwipy
+
+    from .processes.process import ProcessState
+
+    def subscriber(_, body, sender, subject, correlation_id):
+        if sender in pks:
+            terminated.put(sender)
+
+    broadcast_filter = kiwipy.BroadcastFilter(subscriber)
+    for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
+        broadcast_filter.add_subject_filter(f'state_changed.*.{state.value}')
+
+    try:
+        communicator = manager.get_manager().get_communicator()
+        return communicator, communicator.add_broadcast_subscriber(broadcast_filter)
+    except Exception as exception:
+        LOGGER.debug(f'Not subscribing to broadcasts of processes, falling back to polling: {exception}')
+        return None, None
 
 
 # Allow one to also use run.get_node and run.get_pk as a shortcut, without having to import the functions themselves
@@ -37,6 +37,7 @@ __all__ = (
     'InputPort',
     'JobManager',
     'JobsList',
+    'MonitorsList',
     'OutputPort',
     'PORT_NAMESPACE_SEPARATOR',
     'PortNamespace',
@@ -21,6 +21,7 @@ __all__ = (
     'CalcJobImporter',
     'JobManager',
     'JobsList',
+    'MonitorsList',
 )
 
 # fmt: on
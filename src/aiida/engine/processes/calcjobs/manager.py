@@ -12,17 +12,28 @@ import asyncio
 import contextlib
 import contextvars
 import logging
+import posixpath
 import time
-from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional, Tuple
 
 from aiida.common import lang
 from aiida.orm import AuthInfo
 
+from .monitors import MonitorTransport, read_remote_files
+
 if TYPE_CHECKING:
     from aiida.engine.transports import TransportQueue
+    from aiida.orm import CalcJobNode
+    from aiida.schedulers import Scheduler
     from aiida.schedulers.datastructures import JobInfo
 
-__all__ = ('JobsList', 'JobManager')
+    from .monitors import CalcJobMonitorResult, CalcJobMonitors
+
+__all__ = ('JobsList', 'JobManager', 'MonitorsList')
+
+#: Margin in seconds that is added to the interval for which job state changes are requested from the scheduler in an
+#: incremental update, to account for delays in the scheduler registering state changes.
+INCREMENTAL_UPDATE_MARGIN = 60.0
 
 
 class JobsList:
@@ -39,6 +50,10 @@ class JobsList:
     and the limiting of number of calls per unit time, through the minimum polling interval, is only applicable for jobs
     launched with that particular authinfo. If multiple authinfo instances with the same computer, have active jobs
     these limitations are not respected between them, since there is no communication between ``JobsList`` instances.
+
+    If the computer defines a full job poll interval and the scheduler supports it, the list is only fully updated once
+    per that interval. In between, only the jobs whose state may have changed since the last update are requested from
+    the scheduler, and the other jobs keep their last known state.
     See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
     """
 
@@ -60,6 +75,7 @@ class JobsList:
         self._jobs_cache: Dict[Hashable, 'JobInfo'] = {}
         self._job_update_requests: Dict[Hashable, asyncio.Future] = {}  # Mapping: {job_id: Future}
         self._last_updated = last_updated
+        self._last_full_update: Optional[float] = None
         self._update_handle: Optional[asyncio.TimerHandle] = None
 
     @property
@@ -78,6 +94,13 @@ class JobsList:
         """
         return self._authinfo.computer.get_minimum_job_poll_interval()
 
+    def get_full_update_interval(self) -> Optional[float]:
+        """Get the interval between full updates of the list, in between which the list is updated incrementally.
+
+        :return: the interval, or ``None`` if the list is never updated incrementally
+        """
+        return self._authinfo.computer.get_full_job_poll_interval()
+
     @property
     def last_updated(self) -> Optional[float]:
         """Get the timestamp of when the list was last updated as produced by `time.time()`
@@ -106,18 +129,54 @@ class JobsList:
             else:
                 kwargs['jobs'] = self._get_jobs_with_scheduler()
 
-            scheduler_response = scheduler.get_jobs(**kwargs)
+            if self._can_update_incrementally(scheduler):
+                assert self._last_updated is not None
+                interval = time.time() - self._last_updated + INCREMENTAL_UPDATE_MARGIN
+                scheduler_response = scheduler.get_job_changes(interval, **kwargs)
 
-            # Update the last update time and clear the jobs cache
-            self._last_updated = time.time()
-            jobs_cache = {}
-            self.logger.info(f'AuthInfo<{self._authinfo.pk}>: successfully retrieved status of active jobs')
+                # Update the last update time and the jobs whose state may have changed in the jobs cache
+                self._last_updated = time.time()
+                jobs_cache = dict(self._jobs_cache)
+                self.logger.info(f'AuthInfo<{self._authinfo.pk}>: successfully retrieved changes of active jobs')
+            else:
+                # When querying by user, also pass the tracked jobs, such that the scheduler can skip parsing the others
+                if 'user' in kwargs:
+                    kwargs['jobs'] = self._get_jobs_with_scheduler()
+                scheduler_response = scheduler.get_jobs(**kwargs)
+
+                # Update the last update time and clear the jobs cache
+                self._last_updated = self._last_full_update = time.time()
+                jobs_cache = {}
+                self.logger.info(f'AuthInfo<{self._authinfo.pk}>: successfully retrieved status of active jobs')
 
             for job_id, job_info in scheduler_response.items():
                 jobs_cache[job_id] = job_info
 
             return jobs_cache
 
+    def _can_update_incrementally(self, scheduler: 'Scheduler') -> bool:
+        """Return whether the jobs list can be updated by only requesting the changes since the last update.
+
+        :param scheduler: the scheduler of the computer of the authinfo.
+        """
+        full_update_interval = self.get_full_update_interval()
+
+        if full_update_interval is None or self._last_full_update is None:
+            return False
+
+        if time.time() - self._last_full_update >= full_update_interval:
+            return False
+
+        try:
+            if not scheduler.get_feature('can_query_changes'):
+                return False
+        except NotImplementedError:
+            return False
+
+        # A job that was not yet known at the last update is only reported by an incremental update once its state
+        # changes, so its current state has to be requested through a full update.
+        return all(job_id in self._jobs_cache for job_id in self._job_update_requests)
+
     async def _update_job_info(self) -> None:
         """Update all of the job information objects.
 
@@ -244,6 +303,149 @@ class JobsList:
         return [str(job_id) for job_id, _ in self._job_update_requests.items()]
 
 
+class MonitorsList:
+    """Manager of the monitors of calculation jobs submitted with a specific ``AuthInfo``.
+
+    Monitors of calculation jobs typically inspect files in the remote working directory of the job. Instead of having
+    each job request its own transport and read its files separately, this container bundles the processing of the
+    monitors of all jobs that request it while the transport is being opened, into a single pass over that transport.
+    Before the monitors are called, the files that the due monitors of all jobs declare to read are read with a single
+    remote command, and the monitors are passed a :py:class:`~aiida.engine.processes.calcjobs.monitors.MonitorTransport`
+    that serves reads of these files from the content that was read.
+
+    See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
+    """
+
+    def __init__(self, authinfo: AuthInfo, transport_queue: 'TransportQueue'):
+        """Construct an instance for the given authinfo and transport queue.
+
+        :param authinfo: The authinfo used to process the monitors
+        :param transport_queue: A transport queue
+        """
+        self._authinfo = authinfo
+        self._transport_queue = transport_queue
+        self._loop = transport_queue.loop
+        self._logger = logging.getLogger(__name__)
+
+        # Mapping: {node pk: (node, monitors, future)}
+        self._requests: Dict[int, Tuple['CalcJobNode', 'CalcJobMonitors', asyncio.Future]] = {}
+        self._process_handle: Optional[asyncio.Handle] = None
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Return the logger configured for this instance.
+
+        :return: the logger
+        """
+        return self._logger
+
+    @staticmethod
+    def _get_requested_files(node: 'CalcJobNode', monitors: 'CalcJobMonitors') -> Dict[str, str]:
+        """Return the files read by the monitors of a job that are due.
+
+        :return: mapping of the normalized paths of the files relative to the remote working directory of the job onto
+            their absolute paths.
+        """
+        workdir = node.get_remote_workdir()
+        filepaths = {posixpath.normpath(filepath) for filepath in monitors.get_requested_files()}
+        return {filepath: posixpath.join(workdir, filepath) for filepath in filepaths}
+
+    async def _process_monitors(self) -> None:
+        """Process the monitors of all pending requests over a single transport.
+
+        This will set the futures of all pending requests to the result of processing the monitors of the corresponding
+        job. If processing the monitors of a job excepts, only the future of that job is set to the exception.
+        """
+        requests = None
+
+        try:
+            with self._transport_queue.request_transport(self._authinfo) as request:
+                self.logger.info('waiting for transport')
+                transport = await request
+
+                # Requests that come in from here on are processed in the next pass
+                requests, self._requests = self._requests, {}
+                requests = {pk: item for pk, item in requests.items() if not item[2].done()}
+
+                if not requests:
+                    return
+
+                requested = {
+                    pk: self._get_requested_files(node, monitors) for pk, (node, monitors, _) in requests.items()
+                }
+                contents = read_remote_files(
+                    transport, {path for files in requested.values() for path in files.values()}
+                )
+
+                for pk, (node, monitors, future) in requests.items():
+                    if future.done():
+                        continue
+
+                    # The contents are passed by the path relative to the working directory, which is how the monitor
+                    # refers to the files after changing into it, whether or not the transport resolves the directory
+                    files = {filepath: contents[path] for filepath, path in requested[pk].items() if path in contents}
+
+                    try:
+                        workdir = node.get_remote_workdir()
+                        transport.chdir(workdir)
+                        monitor_result = monitors.process(node, MonitorTransport(transport, files, workdir))
+                    except Exception as exception:
+                        future.set_exception(exception)
+                    else:
+                        future.set_result(monitor_result)
+
+                self.logger.info(f'AuthInfo<{self._authinfo.pk}>: processed monitors of {len(requests)} jobs')
+        except Exception as exception:
+            if requests is None:
+                requests, self._requests = self._requests, {}
+
+            for _, _, future in requests.values():
+                if not future.done():
+                    future.set_exception(exception)
+
+    @contextlib.contextmanager
+    def request_monitors_processing(
+        self, node: 'CalcJobNode', monitors: 'CalcJobMonitors'
+    ) -> Iterator['asyncio.Future[Optional[CalcJobMonitorResult]]']:
+        """Request the monitors of a job to be processed in the next pass.
+
+        :param node: the node of the calculation job
+        :param monitors: the monitors of the calculation job
+        :return: future that will resolve to the result of processing the monitors
+        """
+        request: asyncio.Future = asyncio.Future()
+        self._requests[node.pk] = (node, monitors, request)
+
+        try:
+            self._ensure_processing()
+            yield request
+        finally:
+            pass
+
+    def _ensure_processing(self) -> None:
+        """Ensure that a pass that processes the pending requests is scheduled."""
+
+        async def processing():
+            """Do the actual processing, and schedule the next pass if requests came in during this one."""
+            await self._process_monitors()
+
+            if any(not request.done() for _, _, request in self._requests.values()):
+                self._process_handle = self._loop.call_soon(
+                    asyncio.ensure_future,
+                    processing(),
+                    context=contextvars.Context(),  #  type: ignore[call-arg]
+                )
+            else:
+                self._process_handle = None
+
+        if self._process_handle is None:
+            self._process_handle = self._loop.call_soon(
+                asyncio.ensure_future,
+                processing(),
+                context=contextvars.Context(),  #  type: ignore[call-arg]
+            )
+
+
 class JobManager:
     """A manager for :py:class:`~aiida.engine.processes.calcjobs.calcjob.CalcJob` submitted to ``Computer`` instances.
 
@@ -257,11 +459,16 @@ class JobManager:
     its lifetime, the guarantees made by the ``JobsList`` about respecting the minimum polling interval of the scheduler
     will be maintained. Note, however, that since each ``Runner`` will create its own job manager, these guarantees
     only hold per runner.
+
+    In the same way, the ``JobManager`` maintains a mapping of
+    :py:class:`~aiida.engine.processes.calcjobs.manager.MonitorsList` instances for each authinfo, which bundle the
+    processing of the monitors of the calculation jobs that share that authinfo.
     """
 
     def __init__(self, transport_queue: 'TransportQueue') -> None:
         self._transport_queue = transport_queue
         self._job_lists: Dict[Hashable, 'JobInfo'] = {}
+        self._monitors_lists: Dict[Hashable, MonitorsList] = {}
 
     def get_jobs_list(self, authinfo: AuthInfo) -> JobsList:
         """Get or create a new `JobLists` instance for the given authinfo.
@@ -287,3 +494,30 @@ class JobManager:
             finally:
                 if not request.done():
                     request.cancel()
+
+    def get_monitors_list(self, authinfo: AuthInfo) -> MonitorsList:
+        """Get or create a new `MonitorsList` instance for the given authinfo.
+
+        :param authinfo: the `AuthInfo`
+        :return: a `MonitorsList` instance
+        """
+        if authinfo.pk not in self._monitors_lists:
+            self._monitors_lists[authinfo.pk] = MonitorsList(authinfo, self._transport_queue)
+
+        return self._monitors_lists[authinfo.pk]
+
+    @contextlib.contextmanager
+    def request_monitors_processing(
+        self, authinfo: AuthInfo, node: 'CalcJobNode', monitors: 'CalcJobMonitors'
+    ) -> Iterator['asyncio.Future[Optional[CalcJobMonitorResult]]']:
+        """Get a future that will resolve to the result of processing the monitors of a given job.
+
+        This is a context manager so that if the user leaves the context the request is automatically cancelled.
+
+        """
+        with self.get_monitors_list(authinfo).request_monitors_processing(node, monitors) as request:
+            try:
+                yield request
+            finally:
+                if not request.done():
+                    request.cancel()
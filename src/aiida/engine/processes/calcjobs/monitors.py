@@ -6,9 +6,13 @@ import collections
 import dataclasses
 import enum
 import inspect
+import pathlib
+import posixpath
 import typing as t
+import uuid
 from datetime import datetime, timedelta
 
+from aiida.common.escaping import escape_for_bash
 from aiida.common.lang import type_check
 from aiida.common.log import AIIDA_LOGGER
 from aiida.orm import CalcJobNode, Dict
@@ -19,6 +23,15 @@ if t.TYPE_CHECKING:
 
 LOGGER = AIIDA_LOGGER.getChild(__name__)
 
+#: Maximum number of files that are read with a single remote command, to stay well below the maximum command length.
+READ_FILES_BATCH_SIZE = 200
+
+#: Maximum size in bytes of a file that is read in a batch, larger files are read by the monitor through the transport.
+READ_FILES_MAX_SIZE = 1024**2
+
+#: Maximum total size in bytes of the files that are read in batches, further files are read by the monitors themselves.
+READ_FILES_MAX_TOTAL_SIZE = 64 * 1024**2
+
 
 class CalcJobMonitorAction(enum.Enum):
     """The action a engine should undertake as a result of a monitor."""
@@ -96,6 +109,12 @@ class CalcJobMonitor:
     disabled: bool = False
     """If this attribute is set to ``True`` the monitor should not be called when monitors are processed."""
 
+    files: list[str] = dataclasses.field(default_factory=list)
+    """Optional list of files, relative to the remote working directory, that are read by the monitor.
+
+    The content of these files is read for all monitored jobs of the same computer in a single remote command before
+    the monitors are called, and calls of ``transport.getfile`` for these files are served from that content."""
+
     def __post_init__(self):
         """Validate the attributes."""
         self.validate()
@@ -113,6 +132,10 @@ class CalcJobMonitor:
         type_check(self.priority, int)
         type_check(self.minimum_poll_interval, int, allow_none=True)
         type_check(self.disabled, bool)
+        type_check(self.files, list)
+
+        if any(not isinstance(filepath, str) for filepath in self.files):
+            raise TypeError('The `files` should be a list of strings.')
 
         if self.minimum_poll_interval is not None and self.minimum_poll_interval <= 0:
             raise ValueError('The `minimum_poll_interval` must be a positive integer greater than zero.')
@@ -139,6 +162,16 @@ class CalcJobMonitor:
         """
         return BaseFactory('aiida.calculations.monitors', self.entry_point)
 
+    def is_due(self) -> bool:
+        """Return whether the monitor should be called, i.e., it is not disabled and its poll interval has expired."""
+        if self.disabled:
+            return False
+
+        if self.minimum_poll_interval and self.call_timestamp:
+            return datetime.now() - self.call_timestamp >= timedelta(seconds=self.minimum_poll_interval)
+
+        return True
+
 
 class CalcJobMonitors:
     """Collection of ``CalcJobMonitor`` instances.
@@ -173,6 +206,13 @@ class CalcJobMonitors:
         """
         return self._monitors
 
+    def get_requested_files(self) -> set[str]:
+        """Return the files that are read by the monitors that are due to be called.
+
+        :returns: Set of file paths relative to the remote working directory.
+        """
+        return {filepath for monitor in self.monitors.values() if monitor.is_due() for filepath in monitor.files}
+
     def process(
         self,
         node: CalcJobNode,
@@ -189,11 +229,7 @@ class CalcJobMonitors:
                 LOGGER.debug(f'monitor`{key}` is disabled, skipping')
                 continue
 
-            if (
-                monitor.minimum_poll_interval
-                and monitor.call_timestamp
-                and datetime.now() - monitor.call_timestamp < timedelta(seconds=monitor.minimum_poll_interval)
-            ):
+            if not monitor.is_due():
                 LOGGER.debug(f'skipping monitor `{key}` because minimum poll interval has not expired yet.')
                 continue
 
@@ -212,3 +248,105 @@ class CalcJobMonitors:
             if monitor_result:
                 LOGGER.info(f'Monitor `{key}` returned: {monitor_result}')
                 return monitor_result
+
+
+class MonitorTransport:
+    """Proxy of a ``Transport`` that serves reads of files whose content was already read in a batch.
+
+    Calls of :meth:`getfile` for a file whose content is known are written directly to the local path, all other
+    attribute access and method calls are forwarded to the wrapped transport.
+    """
+
+    def __init__(self, transport: Transport, contents: dict[str, bytes], workdir: str):
+        """Construct a new instance.
+
+        The wrapped transport should have its current working directory set to ``workdir``.
+
+        :param transport: The transport to wrap.
+        :param contents: Mapping of the normalized paths of files, relative to ``workdir``, onto their content.
+        :param workdir: The remote working directory of the calculation job.
+        """
+        self._transport = transport
+        self._contents = contents
+        self._workdir = posixpath.normpath(workdir)
+        # The working directory as returned by the transport may differ from ``workdir``, as it can be resolved
+        self._cwd = transport.getcwd()
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._transport, name)
+
+    def _get_content(self, remotepath: str) -> bytes | None:
+        """Return the content of the file if it was read in a batch, or ``None`` otherwise.
+
+        :param remotepath: Absolute path of the remote file or a path relative to the current working directory.
+        """
+        remotepath = posixpath.normpath(remotepath)
+
+        if not posixpath.isabs(remotepath):
+            # A relative path only refers to the working directory of the job as long as that is the current one
+            return self._contents.get(remotepath) if self._transport.getcwd() == self._cwd else None
+
+        for root in (self._workdir, self._cwd):
+            if root is not None and remotepath.startswith(f'{root.rstrip("/")}/'):
+                return self._contents.get(posixpath.relpath(remotepath, root))
+
+        return None
+
+    def getfile(self, remotepath, localpath, *args, **kwargs):
+        """Get a file from the remote, using the content that was read in a batch if available."""
+        content = self._get_content(str(remotepath))
+
+        if content is None:
+            return self._transport.getfile(remotepath, localpath, *args, **kwargs)
+
+        pathlib.Path(localpath).write_bytes(content)
+
+
+def read_remote_files(
+    transport: Transport,
+    filepaths: t.Iterable[str],
+    max_size: int = READ_FILES_MAX_SIZE,
+    max_total_size: int = READ_FILES_MAX_TOTAL_SIZE,
+) -> dict[str, bytes]:
+    """Read the content of a number of remote files with as few remote commands as possible.
+
+    Files that are bigger than ``max_size``, or that would make the total size of the files that are read exceed
+    ``max_total_size``, are skipped, such that the content that is kept in memory is bounded.
+
+    :param transport: An open transport.
+    :param filepaths: Absolute paths of the remote files to read.
+    :param max_size: Maximum size in bytes of a single file that is read.
+    :param max_total_size: Maximum total size in bytes of all the files that are read.
+    :returns: Mapping of the paths of the files that exist and were read onto their content.
+    :raises OSError: If the remote command fails.
+    """
+    paths = sorted(set(filepaths))
+    contents: dict[str, bytes] = {}
+    remaining = max_total_size
+
+    for start in range(0, len(paths), READ_FILES_BATCH_SIZE):
+        if remaining <= 0:
+            break
+
+        batch = paths[start : start + READ_FILES_BATCH_SIZE]
+        marker = f'__aiida_monitor_{uuid.uuid4().hex}__'
+        # Each file that exists, is readable and fits in the size limits is preceded by a line with the marker and its
+        # index in the batch. The size is normalized with an arithmetic expansion, since ``wc`` may pad it with spaces.
+        command = 'total=0; ' + '; '.join(
+            f'if [ -f {path} ] && [ -r {path} ]; then size=$(($(wc -c < {path}))); '
+            f'if [ $size -le {max_size} ] && [ $((total + size)) -le {remaining} ]; then total=$((total + size)); '
+            f"printf '{marker}:{index}:\\n'; cat {path}; fi; fi"
+            for index, path in enumerate(escape_for_bash(filepath) for filepath in batch)
+        )
+
+        retval, stdout, stderr = transport.exec_command_wait_bytes(command)
+
+        if retval != 0:
+            raise OSError(f'reading the files of the monitors failed with exit code {retval}: {stderr!r}')
+
+        for chunk in stdout.split(marker.encode())[1:]:
+            header, _, content = chunk.partition(b'\n')
+            contents[batch[int(header.strip(b':'))]] = content
+            remaining -= len(content)
+
+    return contents
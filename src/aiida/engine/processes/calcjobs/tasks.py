@@ -224,18 +224,17 @@ async def task_update_job(node: CalcJobNode, job_manager, cancellable: Interrupt
         return job_done
 
 
-async def task_monitor_job(
-    node: CalcJobNode, transport_queue: TransportQueue, cancellable: InterruptableFuture, monitors: CalcJobMonitors
-):
+async def task_monitor_job(node: CalcJobNode, job_manager, cancellable: InterruptableFuture, monitors: CalcJobMonitors):
     """Transport task that will monitor the job calculation if any monitors have been defined.
 
-    The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
-    function is called, wrapped in the exponential_backoff_retry coroutine, which, in case of a caught exception, will
-    retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
-    If all retries fail, the task will raise a TransportTaskException
+    The task will request the monitors to be processed from the job manager, which processes the monitors of all jobs
+    of the same authinfo in a single pass over one transport. The request is wrapped in the exponential_backoff_retry
+    coroutine, which, in case of a caught exception, will retry after an interval that increases exponentially with the
+    number of retries, for a maximum number of retries. If all retries fail, the task will raise a
+    TransportTaskException
 
     :param node: the node that represents the job calculation
-    :param transport_queue: the TransportQueue from which to request a Transport
+    :param job_manager: The job manager
     :param cancellable: A cancel flag
     :param monitors: An instance of ``CalcJobMonitors`` holding the collection of monitors to process.
     :return: True if the tasks was successfully completed, False otherwise
@@ -251,10 +250,8 @@ async def task_monitor_job(
     authinfo = node.get_authinfo()
 
     async def do_monitor():
-        with transport_queue.request_transport(authinfo) as request:
-            transport = await cancellable.with_interrupt(request)
-            transport.chdir(node.get_remote_workdir())
-            return monitors.process(node, transport)
+        with job_manager.request_monitors_processing(authinfo, node, monitors) as request:
+            return await cancellable.with_interrupt(request)
 
     try:
         logger.info(f'scheduled request to monitor CalcJob<{node.pk}>')
@@ -525,7 +522,7 @@ class Waiting(plumpy.process_states.Waiting):
                     process_status = f'Monitoring scheduler: job state {scheduler_state_string}'
                     node.set_process_status(process_status)
                     job_done = await self._launch_task(task_update_job, node, self.process.runner.job_manager)
-                    monitor_result = await self._monitor_job(node, transport_queue, self.monitors)
+                    monitor_result = await self._monitor_job(node, self.process.runner.job_manager, self.monitors)
 
                     if monitor_result and monitor_result.action is CalcJobMonitorAction.KILL:
                         await self._kill_job(node, transport_queue)
@@ -584,7 +581,7 @@ class Waiting(plumpy.process_states.Waiting):
             if self._killing and not self._killing.done():
                 self._killing.set_result(False)
 
-    async def _monitor_job(self, node, transport_queue, monitors) -> CalcJobMonitorResult | None:
+    async def _monitor_job(self, node, job_manager, monitors) -> CalcJobMonitorResult | None:
         """Process job monitors if any were specified as inputs."""
         if monitors is None:
             return None
@@ -592,7 +589,7 @@ class Waiting(plumpy.process_states.Waiting):
         if self._monitor_result and self._monitor_result.action == CalcJobMonitorAction.DISABLE_ALL:
             return None
 
-        monitor_result = await self._launch_task(task_monitor_job, node, transport_queue, monitors=monitors)
+        monitor_result = await self._launch_task(task_monitor_job, node, job_manager, monitors=monitors)
 
         if monitor_result and monitor_result.outputs:
             for label, output in monitor_result.outputs.items():
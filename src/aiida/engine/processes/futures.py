@@ -9,19 +9,123 @@
 """Futures that can poll or receive broadcasted messages while waiting for a task to be completed."""
 
 import asyncio
-from typing import Optional, Union
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
 
 import kiwipy
 
-from aiida.orm import Node, load_node
+from aiida.orm import load_node
 
 __all__ = ('ProcessFuture',)
 
+#: Maximum number of primary keys that are matched in a single query by :func:`get_terminated_pks`.
+QUERY_BATCH_SIZE = 10000
+
+
+def get_terminated_pks(pks: Iterable[int]) -> Set[int]:
+    """Return the subset of the given primary keys of process nodes that have reached a terminal state.
+
+    The process state of all nodes is retrieved in a single query, instead of one query per node.
+
+    :param pks: primary keys of process nodes.
+    :return: the primary keys of the process nodes that are terminated.
+    """
+    from aiida.orm import ProcessNode, QueryBuilder
+
+    from .process import ProcessState
+
+    pks = list(pks)
+    states = [state.value for state in (ProcessState.FINISHED, ProcessState.EXCEPTED, ProcessState.KILLED)]
+    terminated: Set[int] = set()
+
+    for index in range(0, len(pks), QUERY_BATCH_SIZE):
+        filters = {'id': {'in': pks[index : index + QUERY_BATCH_SIZE]}, 'attributes.process_state': {'in': states}}
+        terminated.update(QueryBuilder().append(ProcessNode, filters=filters, project='id').all(flat=True))
+
+    return terminated
+
+
+class ProcessPoller:
+    """Poll whether process nodes have terminated, with a single query for all nodes per interval.
+
+    Instead of each waiter polling the state of its own process node, all waiters that use the same event loop and poll
+    interval register with the same poller, which is obtained through :meth:`ProcessPoller.get`. The pollers only keep a
+    weak reference to their event loop, such that they are discarded together with it.
+    """
+
+    _pollers: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[float, ProcessPoller]]' = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, poll_interval: Union[int, float]):
+        """Construct a new instance.
+
+        :param loop: the event loop in which the callbacks are scheduled.
+        :param poll_interval: the interval in seconds between queries.
+        """
+        self._loop = weakref.ref(loop)
+        self._poll_interval = poll_interval
+        self._callbacks: Dict[int, List[Callable[[], Any]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def get(cls, loop: asyncio.AbstractEventLoop, poll_interval: Union[int, float]) -> 'ProcessPoller':
+        """Return the poller for the given event loop and poll interval.
+
+        :param loop: the event loop in which the callbacks are scheduled.
+        :param poll_interval: the interval in seconds between queries.
+        """
+        pollers = cls._pollers.setdefault(loop, {})
+
+        if poll_interval not in pollers:
+            pollers[poll_interval] = cls(loop, poll_interval)
+
+        return pollers[poll_interval]
+
+    def add(self, pk: int, callback: Callable[[], Any]) -> None:
+        """Schedule the callback once the process node with the given primary key is found to be terminated.
+
+        :param pk: the primary key of the process node.
+        :param callback: the function to call without arguments.
+        """
+        self._callbacks.setdefault(pk, []).append(callback)
+
+        if self._task is None or self._task.done():
+            loop = self._loop()
+            assert loop is not None, 'the event loop of the poller no longer exists'
+            self._task = loop.create_task(self._poll())
+
+    def remove(self, pk: int, callback: Callable[[], Any]) -> None:
+        """Remove a callback that was added for the process node with the given primary key, if it still exists.
+
+        :param pk: the primary key of the process node.
+        :param callback: the callback that was added.
+        """
+        callbacks = self._callbacks.get(pk, [])
+
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+        if not callbacks:
+            self._callbacks.pop(pk, None)
+
+    async def _poll(self) -> None:
+        """Query the state of all process nodes with callbacks every interval, until there are no callbacks left."""
+        loop = asyncio.get_running_loop()
+
+        while self._callbacks:
+            await asyncio.sleep(self._poll_interval)
+
+            for pk in get_terminated_pks(list(self._callbacks)):
+                for callback in self._callbacks.pop(pk, []):
+                    loop.call_soon(callback)
+
 
 class ProcessFuture(asyncio.Future):
     """Future that waits for a process to complete using both polling and listening for broadcast events if possible."""
 
     _filtered = None
+    _poller: Optional[ProcessPoller] = None
 
     def __init__(
         self,
@@ -49,6 +153,7 @@ class ProcessFuture(asyncio.Future):
         assert not (poll_interval is None and communicator is None), 'Must poll or have a communicator to use'
 
         node = load_node(pk=pk)
+        self._pk = pk
 
         if node.is_terminated:
             self.set_result(node)
@@ -70,7 +175,14 @@ class ProcessFuture(asyncio.Future):
 
             # Start polling
             if poll_interval is not None:
-                loop.create_task(self._poll_process(node, poll_interval))
+
+                def _poll_callback():
+                    if not self.done():
+                        self.set_result(node)
+
+                self._poller = ProcessPoller.get(loop, poll_interval)
+                self._poll_callback = _poll_callback
+                self._poller.add(pk, _poll_callback)
 
     def cleanup(self) -> None:
         """Clean up the future by removing broadcast subscribers from the communicator if it still exists."""
@@ -79,11 +191,7 @@ class ProcessFuture(asyncio.Future):
             self._communicator = None
             self._broadcast_identifier = None
 
-    async def _poll_process(self, node: Node, poll_interval: Union[int, float]) -> None:
-        """Poll whether the process node has reached a terminal state."""
-        print('polling', node)
-        while not self.done() and not node.is_terminated:
-            await asyncio.sleep(poll_interval)
-
-        if not self.done():
-            self.set_result(node)
+        if self._poller is not None:
+            self._poller.remove(self._pk, self._poll_callback)
+            self._poller = None
+            self._poll_callback = None
@@ -308,14 +308,21 @@ class Runner:
 
         This method will add a broadcast subscriber that will listen for state changes of the target process to be
         terminated. As a fail-safe, a polling-mechanism is used to check the state of the process, should the broadcast
-        message be missed by the subscriber, in order to prevent the caller to wait indefinitely.
+        message be missed by the subscriber, in order to prevent the caller to wait indefinitely. The polling is shared
+        with all other processes that are awaited by this runner, such that their states are checked in a single query.
 
         :param pk: pk of the process
         :param callback: function to be called upon process termination
         """
         node = load_node(pk=pk)
+
+        if node.is_terminated:
+            self._loop.call_soon(callback)
+            return
+
         subscriber_identifier = str(uuid.uuid4())
         event = threading.Event()
+        poller = futures.ProcessPoller.get(self._loop, self._poll_interval)
 
         def inline_callback(event, *args, **kwargs):
             """Callback to wrap the actual callback, that will always remove the subscriber that will be registered.
@@ -330,9 +337,14 @@ class Runner:
                 callback()
             finally:
                 event.set()
+                poller.remove(pk, poll_callback)
                 if self.communicator:
                     self.communicator.remove_broadcast_subscriber(subscriber_identifier)
 
+        def poll_callback():
+            LOGGER.info('%s<%d> confirmed to be terminated by backup polling mechanism', node.__class__.__name__, pk)
+            inline_callback(event)
+
         broadcast_filter = kiwipy.BroadcastFilter(functools.partial(inline_callback, event), sender=pk)
         for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
             broadcast_filter.add_subject_filter(f'state_changed.*.{state.value}')
@@ -340,7 +352,7 @@ class Runner:
         if self.communicator:
             LOGGER.info('adding subscriber for broadcasts of %d', pk)
             self.communicator.add_broadcast_subscriber(broadcast_filter, subscriber_identifier)
-        self._poll_process(node, functools.partial(inline_callback, event))
+        poller.add(pk, poll_callback)
 
     def get_process_future(self, pk: int) -> futures.ProcessFuture:
         """Return a future for a process.
@@ -350,16 +362,3 @@ class Runner:
         :return: A future representing the completion of the process node
         """
         return futures.ProcessFuture(pk, self._loop, self._poll_interval, self._communicator)
-
-    def _poll_process(self, node, callback):
-        """Check whether the process state of the node is terminated and call the callback or reschedule it.
-
-        :param node: the process node
-        :param callback: callback to be called when process is terminated
-        """
-        if node.is_terminated:
-            args = [node.__class__.__name__, node.pk]
-            LOGGER.info('%s<%d> confirmed to be terminated by backup polling mechanism', *args)
-            self._loop.call_soon(callback)
-        else:
-            self._loop.call_later(self._poll_interval, self._poll_process, node, callback)
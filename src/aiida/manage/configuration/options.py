@@ -8,6 +8,7 @@
 ###########################################################################
 """Definition of known configuration options and methods to parse and get option values."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 from aiida.common.exceptions import ConfigurationError
@@ -100,7 +101,18 @@ def get_option(name: str) -> Option:
     option_name = name.replace('.', '__')
     if option_name not in options:
         raise ConfigurationError(f'the option {name} does not exist')
-    return Option(name, GlobalOptionsSchema.model_json_schema()['properties'][option_name], options[option_name])
+    return Option(name, get_options_schema()['properties'][option_name], options[option_name])
+
+
+@lru_cache(maxsize=1)
+def get_options_schema() -> Dict[str, Any]:
+    """Return the JSON schema of the configuration options.
+
+    Generating the schema is expensive and the options are defined statically, so the schema is only generated once.
+    """
+    from .config import GlobalOptionsSchema
+
+    return GlobalOptionsSchema.model_json_schema()
 
 
 def parse_option(option_name: str, option_value: Any) -> Tuple[Option, Any]:
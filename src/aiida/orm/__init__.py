@@ -117,6 +117,7 @@ __all__ = (
     'pycifrw_from_cif',
     'to_aiida_type',
     'validate_link',
+    'validate_links',
 )
 
 # fmt: on
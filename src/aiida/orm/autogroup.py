@@ -11,12 +11,17 @@
 from __future__ import annotations
 
 import re
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
 
 from aiida.common import exceptions, timezone
 from aiida.common.escaping import escape_for_sql_like, get_regex_pattern_from_sql
 from aiida.orm import AutoGroup, QueryBuilder
 from aiida.plugins.entry_point import get_entry_point_string_from_class
 
+if TYPE_CHECKING:
+    from aiida.orm import Node
+
 
 class AutogroupManager:
     """Class to automatically add all newly stored ``Node``s to an ``AutoGroup`` (whilst enabled).
@@ -38,8 +43,15 @@ class AutogroupManager:
 
     Only one of the two (between exclude and include) can be set.
     If none of the two is set, everything is included.
+
+    Nodes that are stored within a storage transaction are not added to the group one by one: their memberships are
+    buffered and written in bulk when the outermost transaction is about to be committed, or as soon as the buffer of
+    the outermost transaction contains ``BUFFER_SIZE`` nodes. Memberships of nodes stored within a transaction that is
+    rolled back are discarded.
     """
 
+    BUFFER_SIZE = 1000
+
     def __init__(self, backend):
         """Initialize the manager for the storage backend."""
         self._backend = backend
@@ -50,6 +62,8 @@ class AutogroupManager:
 
         self._group_label_prefix = f"Verdi autogroup on {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}"
         self._group_label = None  # Actual group label, set by `get_or_create_group`
+        self._buffer: list[Node] = []
+        self._buffer_depth = 0
 
     @property
     def is_enabled(self) -> bool:
@@ -182,6 +196,56 @@ class AutogroupManager:
         # soon as any of the filters matches)
         return not any(self._matches(entry_point_string, filter_string) for filter_string in (exclude or []))
 
+    def add_node(self, node: Node) -> None:
+        """Add a stored node to the current ``AutoGroup``.
+
+        If called within a :meth:`buffer_memberships` context, the membership is buffered instead and written when the
+        outermost context is exited.
+
+        :param node: the stored node to add.
+        """
+        if self._buffer_depth == 0:
+            self.get_or_create_group().add_nodes(node)
+            return
+
+        self._buffer.append(node)
+
+        # The buffer is only flushed early in the outermost context: within a nested transaction, the flushed
+        # memberships of nodes stored in the enclosing transactions would be lost if the nested one were rolled back.
+        if self._buffer_depth == 1 and len(self._buffer) >= self.BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Add all buffered nodes to the current ``AutoGroup`` and empty the buffer."""
+        if not self._buffer:
+            return
+
+        nodes, self._buffer = self._buffer, []
+        self.get_or_create_group().add_nodes(nodes)
+
+    @contextmanager
+    def buffer_memberships(self) -> Iterator[None]:
+        """Context manager that buffers the memberships added through :meth:`add_node` until it is exited.
+
+        The context is entered by the storage backends for each, possibly nested, transaction. The buffer is flushed
+        when the outermost context exits normally, such that the memberships are committed together with the nodes. If
+        an exception is raised, the memberships buffered within the context are discarded, since the corresponding
+        nodes are rolled back with the transaction.
+        """
+        start = len(self._buffer)
+        self._buffer_depth += 1
+
+        try:
+            yield
+        except BaseException:
+            del self._buffer[start:]
+            raise
+        finally:
+            self._buffer_depth -= 1
+
+        if self._buffer_depth == 0:
+            self.flush()
+
     def get_or_create_group(self) -> AutoGroup:
         """Return the current `AutoGroup`, or create one if None has been set yet.
 
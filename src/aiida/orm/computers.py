@@ -68,6 +68,7 @@ class Computer(entities.Entity['BackendComputer', ComputerCollection]):
 
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL = 'minimum_scheduler_poll_interval'
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT = 10.0
+    PROPERTY_FULL_SCHEDULER_POLL_INTERVAL = 'full_scheduler_poll_interval'
     PROPERTY_WORKDIR = 'workdir'
     PROPERTY_SHEBANG = 'shebang'
 
@@ -545,6 +546,24 @@ class Computer(entities.Entity['BackendComputer', ComputerCollection]):
         """
         self.set_property(self.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL, interval)
 
+    def get_full_job_poll_interval(self) -> Optional[float]:
+        """Get the interval between subsequent requests to poll the scheduler for the status of all jobs.
+
+        If set, and the scheduler supports it, the status of jobs is updated in between by only requesting the changes
+        since the last update, which is typically cheaper for the scheduler. See the ``can_query_changes`` feature of
+        :class:`aiida.schedulers.Scheduler`. If not set, the status of all jobs is requested at every update.
+
+        :return: The interval (in seconds), or ``None`` if jobs are never updated incrementally.
+        """
+        return self.get_property(self.PROPERTY_FULL_SCHEDULER_POLL_INTERVAL, None)
+
+    def set_full_job_poll_interval(self, interval: Optional[float]) -> None:
+        """Set the interval between subsequent requests to poll the scheduler for the status of all jobs.
+
+        :param interval: The interval in seconds, or ``None`` to never update the jobs incrementally.
+        """
+        self.set_property(self.PROPERTY_FULL_SCHEDULER_POLL_INTERVAL, interval)
+
     def get_workdir(self) -> str:
         """Get the working directory for this computer
         :return: The currently configured working directory
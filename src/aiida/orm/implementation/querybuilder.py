@@ -115,6 +115,16 @@ class BackendQueryBuilder(abc.ABC):
     def iterdict(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[Dict[str, Dict[str, Any]]]:
         """Return an iterator over all the results of a list of dictionaries."""
 
+    @abc.abstractmethod
+    def itercolumns(self, data: QueryDictType, batch_size: int) -> Iterable[Dict[str, Dict[str, List[Any]]]]:
+        """Return an iterator over all the results in batches of columns, as dictionaries: tag -> field -> values.
+
+        Only fields can be projected, and their values are returned as fetched from the database. At least one batch is
+        returned, such that the projected columns are also known for a query without results.
+
+        :param batch_size: the maximum number of rows per batch.
+        """
+
     def as_sql(self, data: QueryDictType, inline: bool = False) -> str:
         """Convert the query to an SQL string representation.
 
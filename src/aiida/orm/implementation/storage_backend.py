@@ -11,7 +11,8 @@
 from __future__ import annotations
 
 import abc
-from typing import TYPE_CHECKING, Any, ContextManager, List, Optional, Sequence, TypeVar, Union
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, Iterable, List, Optional, Sequence, TypeVar, Union
 
 if TYPE_CHECKING:
     from aiida.manage.configuration.profile import Profile
@@ -248,6 +249,75 @@ class StorageBackend(abc.ABC):
         :raises: ``IntegrityError`` if the keys in a row are not a subset of the columns in the table
         """
 
+    def bulk_match(
+        self, entity_type: 'EntityTypes', field: str, values: Iterable[Any], filter_size: int = 999
+    ) -> Dict[Any, int]:
+        """Return the primary keys of the stored entities whose unique ``field`` matches one of the given values.
+
+        This default implementation runs ``QueryBuilder`` queries with an ``in`` filter, batched by ``filter_size``.
+        Backends are encouraged to override it with a more efficient set-based implementation, for example by loading
+        the values into a temporary table and resolving the matches with a single join on the indexed column.
+
+        :param entity_type: The type of the entity
+        :param field: The name of a field with a unique constraint, e.g. ``uuid``
+        :param values: The values of ``field`` to match
+        :param filter_size: Maximum number of parameters allowed in a single query filter
+
+        :returns: mapping of the matched values onto the primary key of the corresponding entity
+        """
+        from aiida import orm
+        from aiida.orm.entities import EntityTypes
+
+        orm_cls = {
+            EntityTypes.AUTHINFO: orm.AuthInfo,
+            EntityTypes.COMMENT: orm.Comment,
+            EntityTypes.COMPUTER: orm.Computer,
+            EntityTypes.GROUP: orm.Group,
+            EntityTypes.LOG: orm.Log,
+            EntityTypes.NODE: orm.Node,
+            EntityTypes.USER: orm.User,
+        }[entity_type]
+
+        values = list(set(values))
+        matched: Dict[Any, int] = {}
+
+        for index in range(0, len(values), filter_size):
+            query = orm.QueryBuilder(backend=self).append(
+                orm_cls, filters={field: {'in': values[index : index + filter_size]}}, project=[field, 'id']
+            )
+            matched.update(query.all())
+
+        return matched
+
+    def bulk_set_extras(
+        self, entity_type: 'EntityTypes', pks: Iterable[int], extras: Dict[str, Any], filter_size: int = 999
+    ) -> None:
+        """Set the given extras on the stored entities with the given primary keys, keeping their other extras.
+
+        This default implementation reads the current extras of the entities with ``QueryBuilder`` queries, batched by
+        ``filter_size``, and writes them back with :meth:`bulk_update` in a single transaction. Backends are encouraged
+        to override it with an update that only sets the given keys in the database.
+
+        :param entity_type: The type of the entity, which should have extras, i.e. a node or a group
+        :param pks: The primary keys of the entities
+        :param extras: Mapping of the keys onto the values of the extras to set
+        :param filter_size: Maximum number of parameters allowed in a single query filter
+        """
+        from aiida import orm
+        from aiida.orm.entities import EntityTypes
+
+        orm_cls = {EntityTypes.GROUP: orm.Group, EntityTypes.NODE: orm.Node}[entity_type]
+        pks = list(set(pks))
+
+        with nullcontext() if self.in_transaction else self.transaction():
+            for index in range(0, len(pks), filter_size):
+                query = orm.QueryBuilder(backend=self).append(
+                    orm_cls, filters={'id': {'in': pks[index : index + filter_size]}}, project=['id', 'extras']
+                )
+                self.bulk_update(
+                    entity_type, [{'id': pk, 'extras': {**current, **extras}} for pk, current in query.all()]
+                )
+
     def delete(self) -> None:
         """Delete the storage and all the data."""
         raise NotImplementedError()
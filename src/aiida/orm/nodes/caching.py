@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import importlib
+import functools
+import importlib.metadata
 import typing as t
 
 from aiida.common import exceptions
@@ -16,6 +17,19 @@ if t.TYPE_CHECKING:
     from .node import Node
 
 
+@functools.lru_cache(maxsize=None)
+def get_package_version(top_level_module: str) -> str:
+    """Return the version of the distribution that provides the given top-level module.
+
+    Resolving the distribution requires scanning the metadata of all installed distributions, which is far too slow to
+    do each time a node is hashed, so the result is cached for the lifetime of the interpreter.
+
+    :param top_level_module: the name of the top-level module, e.g. ``aiida``.
+    :return: the version of the distribution.
+    """
+    return importlib.metadata.version(importlib.metadata.packages_distributions()[top_level_module][0])
+
+
 class NodeCaching:
     """Interface to control caching of a node instance."""
 
@@ -65,9 +79,8 @@ class NodeCaching:
         top_level_module = self._node.__module__.split('.', 1)[0]
 
         try:
-            from importlib.metadata import version, packages_distributions
-            version = version(packages_distributions()[top_level_module][0])
-        except (ImportError, AttributeError, KeyError,IndexError) as exc:
+            version = get_package_version(top_level_module)
+        except (ImportError, AttributeError, KeyError, IndexError) as exc:
             raise exceptions.HashingError("The node's package version could not be determined") from exc
 
         return {
@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+import pathlib
 from typing import Any, Iterator
 
 from numpy import ndarray
@@ -39,6 +40,8 @@ class ArrayData(Data):
         is used thereafter.
         If too much RAM memory is used, you can clear the
         cache with the :py:meth:`.clear_internal_cache` method.
+        To access parts of large arrays without reading them entirely into memory,
+        use ``get_array(name, mmap=True)``, which returns a read-only memory-mapped array.
 
     """
 
@@ -54,6 +57,7 @@ class ArrayData(Data):
 
         super().__init__(**kwargs)
         self._cached_arrays: dict[str, ndarray] = {}
+        self._cached_memmaps: dict[str, ndarray] = {}
 
         arrays = arrays if arrays is not None else {}
 
@@ -72,6 +76,7 @@ class ArrayData(Data):
     def initialize(self):
         super().initialize()
         self._cached_arrays = {}
+        self._cached_memmaps = {}
 
     def delete_array(self, name: str) -> None:
         """Delete an array from the node. Can only be called before storing.
@@ -120,12 +125,16 @@ class ArrayData(Data):
         for name in self.get_arraynames():
             yield (name, self.get_array(name))
 
-    def get_array(self, name: str | None = None) -> ndarray:
+    def get_array(self, name: str | None = None, mmap: bool = False) -> ndarray:
         """Return an array stored in the node
 
         :param name: The name of the array to return. The name can be omitted in case the node contains only a single
             array, which will be returned in that case. If ``name`` is ``None`` and the node contains multiple arrays or
             no arrays at all a ``ValueError`` is raised.
+        :param mmap: If ``True``, return a read-only memory-mapped array instead of reading the entire array into
+            memory, such that only the parts of the array that are actually accessed are read from disk. The array is
+            mapped in place from the file of the repository that contains it, which is a pack file for packed objects.
+            Only objects that are compressed are first copied to a temporary file.
         :raises ValueError: If ``name`` is ``None`` and the node contains more than one arrays or no arrays at all.
         """
         import numpy
@@ -148,6 +157,17 @@ class ArrayData(Data):
             if filename not in self.base.repository.list_object_names():
                 raise KeyError(f'Array with name `{name}` not found in ArrayData<{self.pk}>')
 
+            if mmap:
+                region = self.base.repository.get_object_region(filename)
+                array = _memmap_npy(*region) if region is not None else None
+
+                if array is not None:
+                    return array
+
+                # The mapping remains valid after the temporary file has been removed when the context exits
+                with self.base.repository.as_path(filename) as filepath:
+                    return numpy.load(filepath, mmap_mode='r', allow_pickle=False)
+
             # Open a handle in binary read mode as the arrays are written as binary files as well
             with self.base.repository.open(filename, mode='rb') as handle:
                 return numpy.load(handle, allow_pickle=False)
@@ -156,6 +176,15 @@ class ArrayData(Data):
         if not self.is_stored:
             return get_array_from_file(self, name)
 
+        if mmap:
+            if name in self._cached_arrays:
+                return self._cached_arrays[name]
+
+            if name not in self._cached_memmaps:
+                self._cached_memmaps[name] = get_array_from_file(self, name)
+
+            return self._cached_memmaps[name]
+
         if name not in self._cached_arrays:
             self._cached_arrays[name] = get_array_from_file(self, name)
 
@@ -169,6 +198,7 @@ class ArrayData(Data):
         do not want to waste memory to cache the arrays in RAM.
         """
         self._cached_arrays = {}
+        self._cached_memmaps = {}
 
     def set_array(self, name: str, array: ndarray) -> None:
         """Store a new numpy array inside the node. Possibly overwrite the array
@@ -278,3 +308,39 @@ def clean_array(array: ndarray) -> list:
     )
 
     return output.tolist()
+
+
+def _memmap_npy(filepath: str | pathlib.Path, offset: int, size: int) -> ndarray | None:
+    """Return a read-only memory-mapped array of the content in ``.npy`` format at ``offset`` of the file ``filepath``.
+
+    :param filepath: the path of the file that contains the content.
+    :param offset: the offset in bytes of the start of the content within the file.
+    :param size: the size in bytes of the content.
+    :return: the array, or ``None`` if it cannot be mapped by this function, e.g. because it is empty, contains Python
+        objects or is stored in a version of the format that is not supported. It should then be loaded by
+        :func:`numpy.load`, which raises for content that is invalid.
+    """
+    import numpy
+    from numpy.lib import format as npy_format
+
+    with open(filepath, 'rb') as handle:
+        handle.seek(offset)
+        try:
+            version = npy_format.read_magic(handle)
+            if version == (1, 0):
+                shape, fortran_order, dtype = npy_format.read_array_header_1_0(handle)
+            elif version == (2, 0):
+                shape, fortran_order, dtype = npy_format.read_array_header_2_0(handle)
+            else:
+                return None
+        except ValueError:
+            return None
+        header_size = handle.tell() - offset
+
+    nbytes = dtype.itemsize * int(numpy.prod(shape))
+
+    if dtype.hasobject or nbytes == 0 or header_size + nbytes > size:
+        return None
+
+    order = 'F' if fortran_order else 'C'
+    return numpy.memmap(filepath, dtype=dtype, mode='r', offset=offset + header_size, shape=shape, order=order)
@@ -73,10 +73,8 @@ def find_bandgap(bandsdata, number_electrons=None, fermi_energy=None):
     """
 
     def nint(num):
-        """Stable rounding function"""
-        if num > 0:
-            return int(num + 0.5)
-        return int(num - 0.5)
+        """Stable rounding function, applied element-wise"""
+        return numpy.where(num > 0, num + 0.5, num - 0.5).astype(int)
 
     if fermi_energy and number_electrons:
         raise ValueError('Specify either the number of electrons or the Fermi energy, but not both')
@@ -118,31 +116,26 @@ def find_bandgap(bandsdata, number_electrons=None, fermi_energy=None):
 
             # sort the bands by energy, and reorder the occupations accordingly
             # since after joining the two spins, I might have unsorted stuff
-            bands, occupations = [
-                numpy.array(y)
-                for y in zip(
-                    *[
-                        list(zip(*j))
-                        for j in [
-                            sorted(zip(i[0].tolist(), i[1].tolist()), key=lambda x: x[0])
-                            for i in zip(bands, occupations)
-                        ]
-                    ]
-                )
-            ]
-            number_electrons = int(round(sum(sum(i) for i in occupations) / num_kpoints))
-
-            homo_indexes = [numpy.where(numpy.array([nint(_) for _ in x]) > 0)[0][-1] for x in occupations]
-            if len(set(homo_indexes)) > 1:  # there must be intersections of valence and conduction bands
+            order = numpy.argsort(bands, axis=1, kind='stable')
+            bands = numpy.take_along_axis(bands, order, axis=1)
+            occupations = numpy.take_along_axis(occupations, order, axis=1)
+            number_electrons = int(round(occupations.sum() / num_kpoints))
+
+            # the index of the highest occupied band at every kpoint
+            occupied = nint(occupations) > 0
+            if not occupied.any(axis=1).all():
+                raise ValueError('There are kpoints without any occupied band')
+            homo_indexes = occupied.shape[1] - 1 - numpy.argmax(occupied[:, ::-1], axis=1)
+            if len(set(homo_indexes.tolist())) > 1:  # there must be intersections of valence and conduction bands
                 return False, None
 
-            homo = [_[0][_[1]] for _ in zip(bands, homo_indexes)]
-            try:
-                lumo = [_[0][_[1] + 1] for _ in zip(bands, homo_indexes)]
-            except IndexError:
+            homo_index = homo_indexes[0]
+            if homo_index + 1 >= bands.shape[1]:
                 raise ValueError(
-                    'To understand if it is a metal or insulator, ' 'need more bands than n_band=number_electrons'
+                    'To understand if it is a metal or insulator, need more bands than n_band=number_electrons'
                 )
+            homo = bands[:, homo_index]
+            lumo = bands[:, homo_index + 1]
 
         else:
             bands = numpy.sort(bands)
@@ -152,10 +145,10 @@ def find_bandgap(bandsdata, number_electrons=None, fermi_energy=None):
             # calculation, 2 otherwise)
             number_electrons_per_band = 4 - len(stored_bands.shape)  # 1 or 2
             # gather the energies of the homo band, for every kpoint
-            homo = [i[number_electrons // number_electrons_per_band - 1] for i in bands]  # take the nth level
+            homo = bands[:, number_electrons // number_electrons_per_band - 1]  # take the nth level
             try:
                 # gather the energies of the lumo band, for every kpoint
-                lumo = [i[number_electrons // number_electrons_per_band] for i in bands]  # take the n+1th level
+                lumo = bands[:, number_electrons // number_electrons_per_band]  # take the n+1th level
             except IndexError:
                 raise ValueError(
                     'To understand if it is a metal or insulator, ' 'need more bands than n_band=number_electrons'
@@ -167,7 +160,7 @@ def find_bandgap(bandsdata, number_electrons=None, fermi_energy=None):
             return False, None
 
         # if the nth band crosses the (n+1)th, it is an insulator
-        gap = min(lumo) - max(homo)
+        gap = lumo.min() - homo.max()
         if gap == 0.0:
             return False, 0.0
 
@@ -183,8 +176,9 @@ def find_bandgap(bandsdata, number_electrons=None, fermi_energy=None):
         # I need the bands sorted by energy
         bands.sort()
 
-        levels = bands.transpose()
-        max_mins = [(max(i), min(i)) for i in levels]
+        # the maximum and minimum of every energy level
+        maxs = bands.max(axis=0)
+        mins = bands.min(axis=0)
 
         if fermi_energy > bands.max():
             raise ValueError("The Fermi energy is above all band energies, don't know what to do")
@@ -192,24 +186,35 @@ def find_bandgap(bandsdata, number_electrons=None, fermi_energy=None):
             raise ValueError("The Fermi energy is below all band energies, don't know what to do.")
 
         # one band is crossed by the fermi energy
-        if any(i[1] < fermi_energy and fermi_energy < i[0] for i in max_mins):
+        if numpy.any((mins < fermi_energy) & (fermi_energy < maxs)):
             return False, None
 
         # case of semimetals, fermi energy at the crossing of two bands
         # this will only work if the dirac point is computed!
-        if any(i[0] == fermi_energy for i in max_mins) and any(i[1] == fermi_energy for i in max_mins):
+        if numpy.any(maxs == fermi_energy) and numpy.any(mins == fermi_energy):
             return False, 0.0
 
         # insulating case, take the max of the band maxima below the fermi energy
-        homo = max(i[0] for i in max_mins if i[0] < fermi_energy)
+        homo = maxs[maxs < fermi_energy].max()
         # take the min of the band minima above the fermi energy
-        lumo = min(i[1] for i in max_mins if i[1] > fermi_energy)
+        lumo = mins[mins > fermi_energy].min()
         gap = lumo - homo
         if gap <= 0.0:
             raise RuntimeError('Something wrong has been implemented. Revise the code!')
         return True, gap
 
 
+def _format_floats(values):
+    """Format an array of floats with eight decimals, as used by the text export formats of ``BandsData``.
+
+    Converting the array to a list of Python floats first is much faster than formatting the numpy scalars.
+
+    :param values: array-like of floats of any shape.
+    :return: a flat list of strings, in row-major order of ``values``.
+    """
+    return [f'{value:.8f}' for value in numpy.asarray(values, dtype=float).ravel().tolist()]
+
+
 class BandsData(KpointsData):
     """Class to handle bands data"""
 
@@ -466,13 +471,10 @@ class BandsData(KpointsData):
         # since I can have discontinuous paths, I set on those points the distance to zero
         # as a result, where there are discontinuities in the path,
         # I have two consecutive points with the same x coordinate
-        distances = [
-            numpy.linalg.norm(kpoints[i] - kpoints[i - 1])
-            if not (i in labels_indices and i - 1 in labels_indices)
-            else 0.0
-            for i in range(1, len(kpoints))
-        ]
-        x = [float(sum(distances[:i])) for i in range(len(distances) + 1)]
+        distances = numpy.linalg.norm(numpy.diff(kpoints, axis=0), axis=1)
+        indices = numpy.arange(1, len(kpoints))
+        distances[numpy.isin(indices, labels_indices) & numpy.isin(indices - 1, labels_indices)] = 0.0
+        x = numpy.concatenate(([0.0], numpy.cumsum(distances))).tolist()
 
         # transform the index of the labels in the coordinates of x
         raw_labels = [(x[i[0]], i[1]) for i in labels]
@@ -631,9 +633,12 @@ class BandsData(KpointsData):
         if comments:
             return_text.append(prepare_header_comment(self.uuid, plot_info, comment_char='#'))
 
-        for i in zip(x, bands):
-            line = [f'{i[0]:.8f}'] + [f'{j:.8f}' for j in i[1]]
-            return_text.append('\t'.join(line))
+        num_bands = bands.shape[1]
+        x_strings = _format_floats(x)
+        bands_strings = _format_floats(bands)
+
+        for index, x_string in enumerate(x_strings):
+            return_text.append('\t'.join([x_string, *bands_strings[index * num_bands : (index + 1) * num_bands]]))
 
         return ('\n'.join(return_text) + '\n').encode('utf-8'), {}
 
@@ -654,10 +659,13 @@ class BandsData(KpointsData):
         if comments:
             return_text.append(prepare_header_comment(self.uuid, plot_info, comment_char='#'))
 
-        for band in numpy.transpose(bands):
-            for i in zip(x, band):
-                line = [f'{i[0]:.8f}', f'{i[1]:.8f}']
-                return_text.append('\t'.join(line))
+        num_kpoints = len(x)
+        x_strings = _format_floats(x)
+        bands_strings = _format_floats(numpy.transpose(bands))
+
+        for offset in range(0, len(bands_strings), num_kpoints):
+            band_strings = bands_strings[offset : offset + num_kpoints]
+            return_text.extend(f'{x_string}\t{band_string}' for x_string, band_string in zip(x_strings, band_strings))
             return_text.append('')
             return_text.append('')
 
@@ -1125,40 +1133,43 @@ class BandsData(KpointsData):
         ytick_spacing = 10 ** int(math.log10((y_max_lim - y_min_lim)))
 
         # prepare xticks labels
-        sx1 = ''
-        for i, label in enumerate(labels):
-            sx1 += AGR_SINGLE_XTICK_TEMPLATE.substitute(
-                index=i,
-                coord=label[0],
-                name=label[1],
-            )
+        sx1 = ''.join(
+            AGR_SINGLE_XTICK_TEMPLATE.substitute(index=i, coord=label[0], name=label[1])
+            for i, label in enumerate(labels)
+        )
         xticks = AGR_XTICKS_TEMPLATE.substitute(
             num_labels=num_labels,
             single_xtick_templates=sx1,
         )
 
         # build the arrays with the xy coordinates
+        num_kpoints = len(x)
+        x_strings = _format_floats(x)
+        bands_strings = _format_floats(the_bands)
+
         all_sets = []
-        for band in the_bands:
-            this_set = ''
-            for i in zip(x, band):
-                line = f'{i[0]:.8f}' + '\t' + f'{i[1]:.8f}' + '\n'
-                this_set += line
-            all_sets.append(this_set)
-
-        set_descriptions = ''
+        for offset in range(0, len(bands_strings), num_kpoints):
+            band_strings = bands_strings[offset : offset + num_kpoints]
+            all_sets.append(
+                ''.join(f'{x_string}\t{band_string}\n' for x_string, band_string in zip(x_strings, band_strings))
+            )
+
+        set_descriptions = []
         for i, (this_set, band_type) in enumerate(zip(all_sets, plot_info['band_type_idx'])):
             if band_type % 2 == 0:
                 linecolor = color_number
             else:
                 linecolor = color_number2
             width = str(2.0)
-            set_descriptions += AGR_SET_DESCRIPTION_TEMPLATE.substitute(
-                set_number=i + setnumber_offset,
-                linewidth=width,
-                color_number=linecolor,
-                legend=legend if i == 0 else '',
+            set_descriptions.append(
+                AGR_SET_DESCRIPTION_TEMPLATE.substitute(
+                    set_number=i + setnumber_offset,
+                    linewidth=width,
+                    color_number=linecolor,
+                    legend=legend if i == 0 else '',
+                )
             )
+        set_descriptions = ''.join(set_descriptions)
 
         units = self.units
 
@@ -1214,6 +1225,35 @@ class BandsData(KpointsData):
 
         return json.dumps(json_dict).encode('utf-8'), {}
 
+    @classmethod
+    def export_many(cls, nodes, fileformat, **kwargs):
+        """Export the content of many bands nodes in the same format.
+
+        The format is validated before any node is processed, and the nodes are exported lazily, such that only the
+        content of a single node is kept in memory at any time.
+
+        :param nodes: an iterable of ``BandsData`` nodes.
+        :param fileformat: the export format, one of those returned by ``get_export_formats``.
+        :param kwargs: additional parameters that are passed to the exporter of every node.
+        :return: a generator of tuples ``(node, content, extra_files)``, where ``content`` is the content of the main
+            file as bytes and ``extra_files`` a dictionary of additional files, as returned by ``_exportcontent``.
+        :raises ValueError: if the format is not supported.
+        """
+        if fileformat not in cls.get_export_formats():
+            raise ValueError(
+                f'The format {fileformat} is not implemented for {cls.__name__}. '
+                f'Currently implemented are: {",".join(cls.get_export_formats())}.'
+            )
+
+        def _export():
+            for node in nodes:
+                if not isinstance(node, BandsData):
+                    raise TypeError(f'expected a `BandsData` node, got `{type(node)}`')
+                content, extra_files = node._exportcontent(fileformat, **kwargs)
+                yield node, content, extra_files
+
+        return _export()
+
 
 MAX_NUM_AGR_COLORS = 15
 
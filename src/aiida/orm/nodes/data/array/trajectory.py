@@ -242,30 +242,33 @@ class TrajectoryData(ArrayData):
         except (AttributeError, KeyError, IndexError):
             return 0
 
-    def get_stepids(self):
+    def get_stepids(self, mmap=False):
         """Return the array of steps, if it has already been set.
 
+        :param mmap: if ``True``, return a read-only memory-mapped array, see :meth:`~.ArrayData.get_array`.
         :raises KeyError: if the trajectory has not been set yet.
         """
-        return self.get_array('steps')
+        return self.get_array('steps', mmap=mmap)
 
-    def get_times(self):
+    def get_times(self, mmap=False):
         """Return the array of times (in ps), if it has already been set.
 
+        :param mmap: if ``True``, return a read-only memory-mapped array, see :meth:`~.ArrayData.get_array`.
         :raises KeyError: if the trajectory has not been set yet.
         """
         try:
-            return self.get_array('times')
+            return self.get_array('times', mmap=mmap)
         except (AttributeError, KeyError):
             return None
 
-    def get_cells(self):
+    def get_cells(self, mmap=False):
         """Return the array of cells, if it has already been set.
 
+        :param mmap: if ``True``, return a read-only memory-mapped array, see :meth:`~.ArrayData.get_array`.
         :raises KeyError: if the trajectory has not been set yet.
         """
         try:
-            return self.get_array('cells')
+            return self.get_array('cells', mmap=mmap)
         except (AttributeError, KeyError):
             return None
 
@@ -277,23 +280,26 @@ class TrajectoryData(ArrayData):
         """
         return self.base.attributes.get('symbols')
 
-    def get_positions(self):
+    def get_positions(self, mmap=False):
         """Return the array of positions, if it has already been set.
 
+        :param mmap: if ``True``, return a read-only memory-mapped array, see :meth:`~.ArrayData.get_array`.
         :raises KeyError: if the trajectory has not been set yet.
         """
-        return self.get_array('positions')
+        return self.get_array('positions', mmap=mmap)
 
-    def get_velocities(self):
+    def get_velocities(self, mmap=False):
         """Return the array of velocities, if it has already been set.
 
         .. note :: This function (differently from all other ``get_*``
           functions, will not raise an exception if the velocities are not
           set, but rather return ``None`` (both if no trajectory was not set yet,
           and if it the trajectory was set but no velocities were specified).
+
+        :param mmap: if ``True``, return a read-only memory-mapped array, see :meth:`~.ArrayData.get_array`.
         """
         try:
-            return self.get_array('velocities')
+            return self.get_array('velocities', mmap=mmap)
         except (AttributeError, KeyError):
             return None
 
@@ -337,21 +343,26 @@ class TrajectoryData(ArrayData):
         :raises IndexError: if you require an index beyond the limits.
         :raises KeyError: if you did not store the trajectory yet.
         """
+        import numpy
+
         if index >= self.numsteps:
             raise IndexError(f'You have only {self.numsteps} steps, but you are looking beyond (index={index})')
 
-        vel = self.get_velocities()
-        if vel is not None:
-            vel = vel[index, :, :]
-        time = self.get_times()
-        if time is not None:
-            time = time[index]
-        cells = self.get_cells()
-        if cells is not None:
-            cell = cells[index, :, :]
-        else:
-            cell = None
-        return (self.get_stepids()[index], time, cell, self.symbols, self.get_positions()[index, :, :], vel)
+        def get_step(array):
+            """Return a copy of the given step of a memory-mapped array, such that only that step is read from disk."""
+            if array is None:
+                return None
+            value = array[index]
+            return numpy.array(value) if isinstance(value, numpy.ndarray) else value
+
+        return (
+            get_step(self.get_stepids(mmap=True)),
+            get_step(self.get_times(mmap=True)),
+            get_step(self.get_cells(mmap=True)),
+            self.symbols,
+            get_step(self.get_positions(mmap=True)),
+            get_step(self.get_velocities(mmap=True)),
+        )
 
     def get_step_structure(self, index, custom_kinds=None):
         """Return an AiiDA :py:class:`aiida.orm.nodes.data.structure.StructureData` node
@@ -424,10 +435,10 @@ class TrajectoryData(ArrayData):
         structure = self.get_step_structure(index=0)
         if structure.is_alloy or structure.has_vacancies:
             raise NotImplementedError('XSF for alloys or systems with vacancies not implemented.')
-        cells = self.get_cells()
+        cells = self.get_cells(mmap=True)
         if cells is None:
             raise ValueError('No cell parameters have been supplied for TrajectoryData')
-        positions = self.get_positions()
+        positions = self.get_positions(mmap=True)
         symbols = self.symbols
         atomic_numbers_list = [_atomic_numbers[s] for s in symbols]
         nat = len(symbols)
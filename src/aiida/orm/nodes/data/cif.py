@@ -14,7 +14,7 @@ from typing import List
 from aiida.common.utils import Capturing
 from aiida.orm.fields import add_field
 
-from .singlefile import SinglefileData
+from .singlefile import Md5LookupMixin, SinglefileData
 
 __all__ = ('CifData', 'cif_from_ase', 'has_pycifrw', 'pycifrw_from_cif')
 
@@ -232,7 +232,7 @@ def parse_formula(formula):
 
 
 # Note:  Method 'query' is abstract in class 'Node' but is not overridden
-class CifData(SinglefileData):
+class CifData(Md5LookupMixin, SinglefileData):
     """Wrapper for Crystallographic Interchange File (CIF)
 
     .. note:: the file (physical) is held as the authoritative source of
@@ -97,15 +97,17 @@ class FolderData(Data):
             yield handle
 
     @contextlib.contextmanager
-    def as_path(self, path: FilePath | None = None) -> t.Iterator[pathlib.Path]:
+    def as_path(self, path: FilePath | None = None, zero_copy: bool = False) -> t.Iterator[pathlib.Path]:
         """Make the contents of the repository available as a normal filepath on the local file system.
 
         :param path: optional relative path of the object within the repository.
+        :param zero_copy: if ``True``, link the files to the objects in the repository where possible instead of copying
+            their content. The files are then read-only.
         :return: the filepath of the content of the repository or object if ``path`` is specified.
         :raises TypeError: if the path is not a string or ``Path``, or is an absolute path.
         :raises FileNotFoundError: if no object exists for the given path.
         """
-        with self.base.repository.as_path(path) as filepath:
+        with self.base.repository.as_path(path, zero_copy=zero_copy) as filepath:
             yield filepath
 
     def get_object(self, path: FilePath | None = None) -> File:
@@ -20,11 +20,112 @@ from aiida.common import exceptions
 
 from .data import Data
 
+if t.TYPE_CHECKING:
+    from aiida.orm.implementation import StorageBackend
+
 __all__ = ('SinglefileData',)
 
 FilePath = t.Union[str, pathlib.PurePosixPath]
 
 
+class Md5LookupMixin:
+    """Mixin for subclasses of :class:`SinglefileData` that store the md5 hash of their file in the ``md5`` attribute.
+
+    It adds class methods to look up many nodes by the md5 of their file at once, used by ``UpfData`` and ``CifData``.
+    """
+
+    @classmethod
+    def from_md5s(
+        cls, md5s: t.Iterable[str], backend: StorageBackend | None = None, filter_size: int = 999
+    ) -> dict[str, list[SinglefileData]]:
+        """Return the nodes of this class that match any of the given md5 hashes, with one query per batch of hashes.
+
+        :param md5s: an iterable of md5 hashes.
+        :param backend: the storage backend to query, defaults to that of the loaded profile.
+        :param filter_size: the maximum number of hashes in the filter of a single query.
+        :return: dictionary mapping each of the given hashes onto the list of nodes with that hash, ordered by their pk.
+            The list is empty if there is no such node.
+        """
+        from aiida.orm.querybuilder import QueryBuilder
+
+        md5s = list(dict.fromkeys(md5s))
+        nodes: dict[str, list[SinglefileData]] = {md5: [] for md5 in md5s}
+
+        for index in range(0, len(md5s), filter_size):
+            builder = QueryBuilder(backend=backend)
+            builder.append(
+                cls,
+                filters={'attributes.md5': {'in': md5s[index : index + filter_size]}},
+                project=['attributes.md5', '*'],
+            )
+            builder.order_by({cls: 'id'})
+            for md5, node in builder.iterall():
+                nodes[md5].append(node)
+
+        return nodes
+
+    @classmethod
+    def get_or_create_many(
+        cls,
+        filepaths: t.Iterable[str | pathlib.Path],
+        use_first: bool = False,
+        store: bool = True,
+        backend: StorageBackend | None = None,
+    ) -> list[tuple[SinglefileData, bool]]:
+        """Get the node with the same md5 for each of the given files, creating those that do not yet exist.
+
+        The existing nodes are looked up for all files at once with :meth:`from_md5s`. Files that have the same md5 as
+        another of the given files are mapped onto the same node, and the created nodes are stored in one transaction.
+
+        :param filepaths: the absolute filepaths of the files on disk.
+        :param use_first: if ``False``, raise if more than one node exists with the md5 of a file. If ``True``, use the
+            first of those nodes instead.
+        :param store: whether to store the nodes that are created.
+        :param backend: the storage backend to use, defaults to that of the loaded profile.
+        :return: a list of tuples of the node and a boolean indicating whether it was created, in the order of the
+            files. The boolean is ``False`` for a file with the same md5 as a preceding file.
+        :raises ValueError: if a filepath is not absolute or if more than one node exists for a file and ``use_first``
+            is ``False``.
+        """
+        from aiida.common.files import md5_file
+        from aiida.manage import get_manager
+
+        filepaths = list(filepaths)
+
+        for filepath in filepaths:
+            if not os.path.isabs(filepath):
+                raise ValueError('filepath must be an absolute path')
+
+        md5s = [md5_file(filepath) for filepath in filepaths]
+        existing = cls.from_md5s(md5s, backend=backend)
+
+        for nodes in existing.values():
+            if len(nodes) > 1 and not use_first:
+                pks = ','.join([str(node.pk) for node in nodes])
+                raise ValueError(
+                    f'More than one copy of a `{cls.__name__}` with the same MD5 found in the DB. pks={pks}'
+                )
+
+        results: list[tuple[SinglefileData, bool]] = []
+        created: dict[str, SinglefileData] = {}
+
+        for filepath, md5 in zip(filepaths, md5s):
+            if existing[md5]:
+                results.append((existing[md5][0], False))
+            elif md5 in created:
+                results.append((created[md5], False))
+            else:
+                created[md5] = cls(file=filepath, backend=backend)
+                results.append((created[md5], True))
+
+        if store and created:
+            with (backend or get_manager().get_profile_storage()).transaction():
+                for node in created.values():
+                    node.store()
+
+        return results
+
+
 class SinglefileData(Data):
     """Data class that can be used to store a single file in its repository."""
 
@@ -96,15 +197,16 @@ class SinglefileData(Data):
             yield handle
 
     @contextlib.contextmanager
-    def as_path(self) -> t.Iterator[pathlib.Path]:
+    def as_path(self, zero_copy: bool = False) -> t.Iterator[pathlib.Path]:
         """Make the contents of the file available as a normal filepath on the local file system.
 
-        :param path: optional relative path of the object within the repository.
+        :param zero_copy: if ``True``, link the file to the object in the repository where possible instead of copying
+            its content. The file is then read-only.
         :return: the filepath of the content of the repository or object if ``path`` is specified.
         :raises TypeError: if the path is not a string or ``Path``, or is an absolute path.
         :raises FileNotFoundError: if no object exists for the given path.
         """
-        with self.base.repository.as_path(self.filename) as filepath:
+        with self.base.repository.as_path(self.filename, zero_copy=zero_copy) as filepath:
             yield filepath
 
     def get_content(self, mode: str = 'r') -> str | bytes:
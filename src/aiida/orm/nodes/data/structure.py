@@ -934,16 +934,22 @@ class StructureData(Data):
                 raise ValidationError(f"Kind with name '{count}' appears {counts[count]} times instead of only one")
 
         try:
-            # This will try to create the sites objects
-            sites = self.sites
+            # The sites are validated in bulk on the raw attribute, rather than creating a ``Site`` for each of them
+            site_kind_names = self.get_site_kindnames()
+            self.get_site_positions()
         except ValueError as exc:
             raise ValidationError(f'Unable to validate the sites: {exc}')
 
-        for site in sites:
-            if site.kind_name not in [k.name for k in kinds]:
-                raise ValidationError(f'A site has kind {site.kind_name}, but no specie with that name exists')
+        kind_names = set(counts)
+        site_kind_names = set(site_kind_names)
 
-        kinds_without_sites = set(k.name for k in kinds) - set(s.kind_name for s in sites)
+        sites_without_kinds = site_kind_names - kind_names
+        if sites_without_kinds:
+            raise ValidationError(
+                f'A site has kind {sorted(sites_without_kinds)[0]}, but no specie with that name exists'
+            )
+
+        kinds_without_sites = kind_names - site_kind_names
         if kinds_without_sites:
             raise ValidationError(
                 f'The following kinds are defined, but there are no sites with that kind: {list(kinds_without_sites)}'
@@ -1193,7 +1199,7 @@ class StructureData(Data):
             initial order in which the atoms were appended by the user is
             used to group and/or order the symbols in the formula
         """
-        symbol_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
+        symbol_list = self._get_site_symbols_strings()
 
         return get_formula(symbol_list, mode=mode, separator=separator)
 
@@ -1206,8 +1212,42 @@ class StructureData(Data):
             for chemical symbols
 
         :return: a list of strings
+        :raises ValueError: if the raw sites are malformed.
+        """
+        try:
+            return [str(site['kind_name']) for site in self.base.attributes.get('sites', [])]
+        except KeyError as exc:
+            raise ValueError(f'Invalid raw object, it does not contain any key {exc.args[0]}')
+        except TypeError:
+            raise ValueError('Invalid raw object, it is not a dictionary')
+
+    def get_site_positions(self):
+        """Return the positions of all sites as a single array, without creating a ``Site`` object for each site.
+
+        :return: a numpy array of shape ``(N, 3)`` with the positions in angstrom, where ``N`` is the number of sites.
+        :raises ValueError: if the raw sites are malformed.
         """
-        return [this_site.kind_name for this_site in self.sites]
+        try:
+            positions = [site['position'] for site in self.base.attributes.get('sites', [])]
+        except KeyError as exc:
+            raise ValueError(f'Invalid raw object, it does not contain any key {exc.args[0]}')
+        except TypeError:
+            raise ValueError('Invalid raw object, it is not a dictionary')
+
+        return _get_valid_positions(positions)
+
+    def _get_site_symbols_strings(self):
+        """Return the symbols string of the kind of each site, resolving every kind only once.
+
+        :return: a list of strings with the same length as the number of sites.
+        :raises ValueError: if a site refers to a kind that does not exist.
+        """
+        symbols = {kind.name: kind.get_symbols_string() for kind in self.kinds}
+
+        try:
+            return [symbols[kind_name] for kind_name in self.get_site_kindnames()]
+        except KeyError as exc:
+            raise ValueError(f"Kind name '{exc.args[0]}' unknown")
 
     def get_composition(self, mode='full'):
         """Returns the chemical composition of this structure as a dictionary,
@@ -1223,21 +1263,22 @@ class StructureData(Data):
 
         :returns: a dictionary with the composition
         """
+        from collections import Counter
+
         import numpy as np
 
-        symbols_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
-        symbols_set = set(symbols_list)
+        counts = Counter(self._get_site_symbols_strings())
 
         if mode == 'full':
-            return {symbol: symbols_list.count(symbol) for symbol in symbols_set}
+            return dict(counts)
 
         if mode == 'reduced':
-            gcd = np.gcd.reduce([symbols_list.count(symbol) for symbol in symbols_set])
-            return {symbol: (symbols_list.count(symbol) / gcd) for symbol in symbols_set}
+            gcd = np.gcd.reduce(list(counts.values()))
+            return {symbol: (count / gcd) for symbol, count in counts.items()}
 
         if mode == 'fractional':
-            sum_comp = sum(symbols_list.count(symbol) for symbol in symbols_set)
-            return {symbol: symbols_list.count(symbol) / sum_comp for symbol in symbols_set}
+            sum_comp = sum(counts.values())
+            return {symbol: count / sum_comp for symbol, count in counts.items()}
 
         raise ValueError(f'mode `{mode}` is invalid, choose from `full`, `reduced` or `fractional`.')
 
@@ -1319,7 +1360,7 @@ class StructureData(Data):
 
         new_kind = Kind(kind=kind)  # So we make a copy
 
-        if kind.name in [k.name for k in self.kinds]:
+        if kind.name in self.get_kind_names():
             raise ValueError(f'A kind with the same name ({kind.name}) already exists.')
 
         # If here, no exceptions have been raised, so I add the site.
@@ -1343,15 +1384,53 @@ class StructureData(Data):
             raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
 
         new_site = Site(site=site)  # So we make a copy
+        kind_names = self.get_kind_names()
 
-        if site.kind_name not in [kind.name for kind in self.kinds]:
-            raise ValueError(
-                f"No kind with name '{site.kind_name}', available kinds are: {[kind.name for kind in self.kinds]}"
-            )
+        if site.kind_name not in kind_names:
+            raise ValueError(f"No kind with name '{site.kind_name}', available kinds are: {kind_names}")
 
         # If here, no exceptions have been raised, so I add the site.
         self.base.attributes.all.setdefault('sites', []).append(new_site.get_raw())
 
+    def set_sites(self, positions, kind_names):
+        """Replace all the sites of the
+        :py:class:`StructureData <aiida.orm.nodes.data.structure.StructureData>` in a single operation.
+
+        The input is validated as a whole and the sites attribute is set once, which is much faster than calling
+        :py:meth:`append_site` for every site of a large structure.
+
+        :param positions: array-like of shape ``(N, 3)`` with the positions of the sites in angstrom.
+        :param kind_names: sequence of length ``N`` with the kind name of each site. The kinds have to be appended
+            to the structure beforehand, for example with :py:meth:`append_kind`.
+        :raises aiida.common.ModificationNotAllowed: if the node is stored already.
+        :raises ValueError: if the positions are invalid or a kind name does not correspond to any kind.
+        """
+        from aiida.common.exceptions import ModificationNotAllowed
+
+        if self.is_stored:
+            raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
+
+        positions = _get_valid_positions(positions)
+        kind_names = [str(kind_name) for kind_name in kind_names]
+
+        if len(kind_names) != len(positions):
+            raise ValueError(f'Got {len(kind_names)} kind names for {len(positions)} positions.')
+
+        available_kind_names = self.get_kind_names()
+        unknown_kind_names = set(kind_names).difference(available_kind_names)
+
+        if unknown_kind_names:
+            raise ValueError(
+                f'No kind with name {sorted(unknown_kind_names)}, available kinds are: {available_kind_names}'
+            )
+
+        # Same format as ``Site.get_raw``
+        sites = [
+            {'position': tuple(position), 'kind_name': kind_name}
+            for position, kind_name in zip(positions.tolist(), kind_names)
+        ]
+        self.base.attributes.set('sites', sites)
+
     def append_atom(self, **kwargs):
         """Append an atom to the Structure, taking care of creating the
         corresponding kind.
@@ -1529,7 +1608,11 @@ class StructureData(Data):
 
         :return: a list of strings.
         """
-        return [k.name for k in self.kinds]
+        try:
+            return [str(kind['name']) for kind in self.base.attributes.get('kinds', [])]
+        except (KeyError, TypeError):
+            # Let the ``Kind`` constructor raise the appropriate exception for malformed raw kinds
+            return [k.name for k in self.kinds]
 
     @property
     def cell(self) -> List[List[float]]:
@@ -1593,29 +1676,11 @@ class StructureData(Data):
             raise NotImplementedError
         else:
             # test consistency of th enew input
-            n_sites = len(self.sites)
-            if n_sites != len(new_positions) and conserve_particle:
+            kind_names = self.get_site_kindnames()
+            if len(kind_names) != len(new_positions) and conserve_particle:
                 raise ValueError('the new positions should be as many as the previous structure.')
 
-            new_sites = []
-            for i in range(n_sites):
-                try:
-                    this_pos = [float(j) for j in new_positions[i]]
-                except ValueError:
-                    raise ValueError(f'Expecting a list of floats. Found instead {new_positions[i]}')
-
-                if len(this_pos) != 3:
-                    raise ValueError(f'Expecting a list of lists of length 3. found instead {len(this_pos)}')
-
-                # now append this Site to the new_site list.
-                new_site = Site(site=self.sites[i])  # So we make a copy
-                new_site.position = copy.deepcopy(this_pos)
-                new_sites.append(new_site)
-
-            # now clear the old sites, and substitute with the new ones
-            self.clear_sites()
-            for this_new_site in new_sites:
-                self.append_site(this_new_site)
+            self.set_sites(new_positions, kind_names)
 
     @property
     def pbc(self):
@@ -1739,10 +1804,10 @@ class StructureData(Data):
         """
         from phonopy.structure.atoms import PhonopyAtoms
 
-        atoms = PhonopyAtoms(symbols=[_.kind_name for _ in self.sites])
+        atoms = PhonopyAtoms(symbols=self.get_site_kindnames())
         # Phonopy internally uses scaled positions, so you must store cell first!
         atoms.set_cell(self.cell)
-        atoms.set_positions([_.position for _ in self.sites])
+        atoms.set_positions(self.get_site_positions())
 
         return atoms
 
@@ -1755,12 +1820,36 @@ class StructureData(Data):
         """
         import ase
 
-        asecell = ase.Atoms(cell=self.cell, pbc=self.pbc)
-        _kinds = self.kinds
+        kinds = self.kinds
+        kind_names = self.get_site_kindnames()
 
-        for site in self.sites:
-            asecell.append(site.get_ase(kinds=_kinds))
-        return asecell
+        if not kind_names:
+            return ase.Atoms(cell=self.cell, pbc=self.pbc)
+
+        # The properties are resolved once per kind and then broadcast to the sites
+        kinds_properties = {}
+
+        for kind, tag in zip(kinds, _get_ase_tags(kinds)):
+            kinds_properties.setdefault(kind.name, (kind, tag))
+
+        for kind_name in set(kind_names):
+            if kind_name not in kinds_properties:
+                raise ValueError(f"No kind '{kind_name}' has been found in the list of kinds")
+            kind = kinds_properties[kind_name][0]
+            if kind.is_alloy or kind.has_vacancies:
+                raise ValueError('Cannot convert to ASE if the kind represents an alloy or it has vacancies.')
+
+        site_kinds = [kinds_properties[kind_name] for kind_name in kind_names]
+        tags = [tag for _, tag in site_kinds]
+
+        return ase.Atoms(
+            symbols=[str(kind.symbols[0]) for kind, _ in site_kinds],
+            positions=self.get_site_positions(),
+            masses=[kind.mass for kind, _ in site_kinds],
+            tags=None if all(tag is None for tag in tags) else [tag or 0 for tag in tags],
+            cell=self.cell,
+            pbc=self.pbc,
+        )
 
     def _get_object_pymatgen(self, **kwargs):
         """Converts
@@ -1804,8 +1893,8 @@ class StructureData(Data):
         from pymatgen.core.lattice import Lattice
         from pymatgen.core.structure import Structure
 
-        species = []
         additional_kwargs = {}
+        kind_names = self.get_site_kindnames()
 
         lattice = Lattice(matrix=self.cell, pbc=self.pbc)
 
@@ -1814,8 +1903,11 @@ class StructureData(Data):
             from pymatgen.core.periodic_table import Specie
 
             oxidation_state = 0  # now I always set the oxidation_state to zero
-            for site in self.sites:
-                kind = self.get_kind(site.kind_name)
+            species_of_kind = {}
+            for kind_name in kind_names:
+                if kind_name in species_of_kind:
+                    continue
+                kind = self.get_kind(kind_name)
                 if len(kind.symbols) != 1 or (len(kind.weights) != 1 or sum(kind.weights) < 1.0):
                     raise ValueError('Cannot set partial occupancies and spins at the same time')
                 spin = -1 if kind.name.endswith('1') else 1 if kind.name.endswith('2') else 0
@@ -1827,24 +1919,23 @@ class StructureData(Data):
                     # The ``spin`` argument was introduced in v2023.6.28.
                     # See: https://github.com/materialsproject/pymatgen/commit/9f2b3939af45d5129e0778d371d814811924aeb6
                     specie = Specie(kind.symbols[0], oxidation_state, spin=spin)
-                species.append(specie)
+                species_of_kind[kind_name] = specie
+            species = [species_of_kind[kind_name] for kind_name in kind_names]
         else:
             # case when no spin are defined
-            for site in self.sites:
-                kind = self.get_kind(site.kind_name)
-                species.append(dict(zip(kind.symbols, kind.weights)))
+            species = self._get_site_species(kind_names)
             if any(
                 create_automatic_kind_name(self.get_kind(name).symbols, self.get_kind(name).weights) != name
-                for name in self.get_site_kindnames()
+                for name in set(kind_names)
             ):
                 # add "kind_name" as a properties to each site, whenever
                 # the kind_name cannot be automatically obtained from the symbols
-                additional_kwargs['site_properties'] = {'kind_name': self.get_site_kindnames()}
+                additional_kwargs['site_properties'] = {'kind_name': kind_names}
 
         if kwargs:
             raise ValueError(f'Unrecognized parameters passed to pymatgen converter: {kwargs.keys()}')
 
-        positions = [list(x.position) for x in self.sites]
+        positions = self.get_site_positions()
 
         try:
             return Structure(lattice, species, positions, coords_are_cartesian=True, **additional_kwargs)
@@ -1868,14 +1959,23 @@ class StructureData(Data):
         if kwargs:
             raise ValueError(f'Unrecognized parameters passed to pymatgen converter: {kwargs.keys()}')
 
-        species = []
-        for site in self.sites:
-            kind = self.get_kind(site.kind_name)
-            species.append(dict(zip(kind.symbols, kind.weights)))
-
-        positions = [list(site.position) for site in self.sites]
+        species = self._get_site_species(self.get_site_kindnames())
+        positions = self.get_site_positions()
         return Molecule(species, positions)
 
+    def _get_site_species(self, kind_names):
+        """Return the species of each site as a mapping of symbols onto weights, as accepted by pymatgen.
+
+        :param kind_names: the kind names of the sites.
+        :return: a list of dictionaries, one for each site.
+        """
+        species_of_kind = {}
+        for kind_name in set(kind_names):
+            kind = self.get_kind(kind_name)
+            species_of_kind[kind_name] = dict(zip(kind.symbols, kind.weights))
+
+        return [species_of_kind[kind_name] for kind_name in kind_names]
+
 
 class Kind:
     """This class contains the information about the species (kinds) of the system.
@@ -2307,48 +2407,9 @@ class Site:
         .. note:: If any site is an alloy or has vacancies, a ValueError
             is raised (from the site.get_ase() routine).
         """
-        from collections import defaultdict
-
         import ase
 
-        # I create the list of tags
-        tag_list = []
-        used_tags = defaultdict(list)
-        for k in kinds:
-            # Skip alloys and vacancies
-            if k.is_alloy or k.has_vacancies:
-                tag_list.append(None)
-            # If the kind name is equal to the specie name,
-            # then no tag should be set
-            elif str(k.name) == str(k.symbols[0]):
-                tag_list.append(None)
-            else:
-                # Name is not the specie name
-                if k.name.startswith(k.symbols[0]):
-                    try:
-                        new_tag = int(k.name[len(k.symbols[0])])
-                        tag_list.append(new_tag)
-                        used_tags[k.symbols[0]].append(new_tag)
-                        continue
-                    except ValueError:
-                        pass
-                tag_list.append(k.symbols[0])  # I use a string as a placeholder
-
-        for i, _ in enumerate(tag_list):
-            # If it is a string, it is the name of the element,
-            # and I have to generate a new integer for this element
-            # and replace tag_list[i] with this new integer
-            if isinstance(tag_list[i], str):
-                # I get a list of used tags for this element
-                existing_tags = used_tags[tag_list[i]]
-                if existing_tags:
-                    new_tag = max(existing_tags) + 1
-                else:  # empty list
-                    new_tag = 1
-                # I store it also as a used tag!
-                used_tags[tag_list[i]].append(new_tag)
-                # I update the tag
-                tag_list[i] = new_tag
+        tag_list = _get_ase_tags(kinds)
 
         found = False
         for kind_candidate, tag_candidate in zip(kinds, tag_list):
@@ -2409,6 +2470,82 @@ class Site:
         return f"kind name '{self.kind_name}' @ {self.position[0]},{self.position[1]},{self.position[2]}"
 
 
+def _get_valid_positions(positions):
+    """Return the positions of a list of sites as a numpy array, validating them in bulk.
+
+    :param positions: array-like of shape ``(N, 3)``, with ``N`` possibly zero.
+    :return: a numpy float array of shape ``(N, 3)``.
+    :raises ValueError: if the positions cannot be converted to an array of floats of that shape.
+    """
+    import numpy
+
+    try:
+        array = numpy.array(positions, dtype=float)
+    except (ValueError, TypeError):
+        raise ValueError('Wrong format for positions, must be a list of lists of three float numbers.')
+
+    if array.size == 0:
+        return array.reshape((0, 3))
+
+    if array.ndim != 2 or array.shape[1] != 3:
+        raise ValueError('Wrong format for positions, must be a list of lists of three float numbers.')
+
+    return array
+
+
+def _get_ase_tags(kinds):
+    """Return the ASE tag of each kind, in the same order as the kinds.
+
+    The tag is ``None`` if the kind is an alloy, has vacancies or its name is the element symbol. If the name is the
+    symbol followed by a digit, that digit is used, otherwise the next integer not yet used for that element is taken.
+
+    :param kinds: the list of kinds from the StructureData object.
+    :return: a list of tags, either integers or ``None``.
+    """
+    from collections import defaultdict
+
+    # I create the list of tags
+    tag_list = []
+    used_tags = defaultdict(list)
+    for k in kinds:
+        # Skip alloys and vacancies
+        if k.is_alloy or k.has_vacancies:
+            tag_list.append(None)
+        # If the kind name is equal to the specie name,
+        # then no tag should be set
+        elif str(k.name) == str(k.symbols[0]):
+            tag_list.append(None)
+        else:
+            # Name is not the specie name
+            if k.name.startswith(k.symbols[0]):
+                try:
+                    new_tag = int(k.name[len(k.symbols[0])])
+                    tag_list.append(new_tag)
+                    used_tags[k.symbols[0]].append(new_tag)
+                    continue
+                except ValueError:
+                    pass
+            tag_list.append(k.symbols[0])  # I use a string as a placeholder
+
+    for i, _ in enumerate(tag_list):
+        # If it is a string, it is the name of the element,
+        # and I have to generate a new integer for this element
+        # and replace tag_list[i] with this new integer
+        if isinstance(tag_list[i], str):
+            # I get a list of used tags for this element
+            existing_tags = used_tags[tag_list[i]]
+            if existing_tags:
+                new_tag = max(existing_tags) + 1
+            else:  # empty list
+                new_tag = 1
+            # I store it also as a used tag!
+            used_tags[tag_list[i]].append(new_tag)
+            # I update the tag
+            tag_list[i] = new_tag
+
+    return tag_list
+
+
 def _get_dimensionality(pbc, cell):
     """Return the dimensionality of the structure and its length/surface/volume.
 
@@ -15,7 +15,7 @@ from upf_to_json import upf_to_json
 
 from aiida.common.warnings import warn_deprecation
 
-from .singlefile import SinglefileData
+from .singlefile import Md5LookupMixin, SinglefileData
 
 __all__ = ('UpfData',)
 
@@ -105,7 +105,7 @@ def upload_upf_family(folder, group_label, group_description, stop_if_existing=T
     from aiida import orm
     from aiida.common import AIIDA_LOGGER
     from aiida.common.exceptions import UniquenessError
-    from aiida.common.files import md5_file
+    from aiida.manage import get_manager
 
     emit_deprecation()
 
@@ -141,24 +141,13 @@ def upload_upf_family(folder, group_label, group_description, stop_if_existing=T
 
     # NOTE: GROUP SAVED ONLY AFTER CHECKS OF UNICITY
 
-    pseudo_and_created = []
-
-    for filename in filenames:
-        md5sum = md5_file(filename)
-        builder = orm.QueryBuilder(backend=backend)
-        builder.append(UpfData, filters={'attributes.md5': {'==': md5sum}})
-        existing_upf = builder.first(flat=True)
-
-        if existing_upf is None:
-            # return the upfdata instances, not stored
-            pseudo, created = UpfData.get_or_create(filename, use_first=True, store_upf=False, backend=backend)
-            # to check whether only one upf per element exists
-            # NOTE: actually, created has the meaning of "to_be_created"
-            pseudo_and_created.append((pseudo, created))
-        else:
-            if stop_if_existing:
+    # Resolve the md5 of all files with a single query per batch, rather than one query per file
+    pseudo_and_created = UpfData.get_or_create_many(filenames, use_first=True, store=False, backend=backend)
+
+    if stop_if_existing:
+        for filename, (pseudo, _) in zip(filenames, pseudo_and_created):
+            if pseudo.is_stored:
                 raise ValueError(f'A UPF with identical MD5 to  {filename} cannot be added with stop_if_existing')
-            pseudo_and_created.append((existing_upf, False))
 
     # check whether pseudo are unique per element
     elements = [(i[0].element, i[0].md5sum) for i in pseudo_and_created]
@@ -184,14 +173,15 @@ def upload_upf_family(folder, group_label, group_description, stop_if_existing=T
     if group_created:
         group.store()
 
-    # save the upf in the database, and add them to group
-    for pseudo, created in pseudo_and_created:
-        if created:
-            pseudo.store()
+    # save the upf in the database in a single transaction, and add them to group
+    with (backend or get_manager().get_profile_storage()).transaction():
+        for pseudo, created in pseudo_and_created:
+            if created:
+                pseudo.store()
 
-            AIIDA_LOGGER.debug(f'New node {pseudo.uuid} created for file {pseudo.filename}')
-        else:
-            AIIDA_LOGGER.debug(f'Reusing node {pseudo.uuid} for file {pseudo.filename}')
+                AIIDA_LOGGER.debug(f'New node {pseudo.uuid} created for file {pseudo.filename}')
+            else:
+                AIIDA_LOGGER.debug(f'Reusing node {pseudo.uuid} for file {pseudo.filename}')
 
     # Add elements to the group all togetehr
     group.add_nodes([pseudo for pseudo, created in pseudo_and_created])
@@ -274,9 +264,23 @@ def parse_upf(fname, check_filename=True, encoding='utf-8'):
     return parsed_data
 
 
-class UpfData(SinglefileData):
+class UpfData(Md5LookupMixin, SinglefileData):
     """`Data` sub class to represent a pseudopotential single file in UPF format."""
 
+    @classmethod
+    def get_or_create_many(cls, filepaths, use_first=False, store=True, backend=None):
+        """Get the `UpfData` with the same md5 for each of the given files, creating those that do not yet exist.
+
+        :param filepaths: a list of absolute filepaths on disk
+        :param use_first: if False (default), raise an exception if more than one potential is found for a file.
+            If it is True, instead, use the first available pseudopotential.
+        :param store: boolean, if false, the `UpfData` that are created will not be stored.
+        :return: list of tuples of `UpfData` and boolean indicating whether it was created, in the order of the files.
+        """
+        emit_deprecation()
+
+        return super().get_or_create_many(filepaths, use_first=use_first, store=store, backend=backend)
+
     @classmethod
     def get_or_create(cls, filepath, use_first=False, store_upf=True, backend=None):
         """Get the `UpfData` with the same md5 of the given file, or create it if it does not yet exist.
@@ -14,6 +14,7 @@ from ..querybuilder import QueryBuilder
 from ..utils.links import LinkManager, LinkTriple
 
 if t.TYPE_CHECKING:
+    from ..implementation import StorageBackend
     from .node import Node
 
 
@@ -40,7 +41,12 @@ class NodeLinks:
 
         link_triple = LinkTriple(source, link_type, link_label)
 
-        if link_triple in self.incoming_cache:
+        # Compare the nodes by their UUID, because nodes that define ``__eq__``, such as ``BaseType``, compare by value,
+        # which would not only be incorrect here but also requires loading the attributes of each cached node.
+        if any(
+            (cached.node.uuid, cached.link_type, cached.link_label) == (source.uuid, link_type, link_label)
+            for cached in self.incoming_cache
+        ):
             raise exceptions.UniquenessError(f'the link triple {link_triple} is already present in the cache')
 
         self.incoming_cache.append(link_triple)
@@ -56,7 +62,53 @@ class NodeLinks:
         """
         self.validate_incoming(source, link_type, link_label)
         source.base.links.validate_outgoing(self._node, link_type, link_label)
+        self._add_incoming(source, link_type, link_label)
 
+    def add_incoming_many(self, link_triples: t.Sequence[LinkTriple]) -> None:
+        """Add links of the given types from the given nodes to ourself.
+
+        This is equivalent to calling :meth:`add_incoming` for each link triple in turn, except that all links are
+        validated at once by :meth:`validate_incoming_many` before any of them is added.
+
+        :param link_triples: the link triples of the node from which the link is coming, the link type and link label
+        :raise TypeError: if a `source` is not a Node instance or a `link_type` is not a `LinkType` enum
+        :raise ValueError: if any of the proposed links is invalid, in which case none of the links is added
+        """
+        self.validate_incoming_many(link_triples)
+
+        for source, link_type, link_label in link_triples:
+            source.base.links.validate_outgoing(self._node, link_type, link_label)
+
+        for source, link_type, link_label in link_triples:
+            self._add_incoming(source, link_type, link_label)
+
+    def add_outgoing_many(self, link_triples: t.Sequence[LinkTriple]) -> None:
+        """Add links of the given types from ourself to the given nodes.
+
+        This is the counterpart of :meth:`add_incoming_many` for links to many different target nodes, for example the
+        outputs of a process. Each link is validated by :meth:`validate_outgoing`, after which all links are validated
+        at once with :func:`aiida.orm.utils.links.validate_links` before any of them is added.
+
+        .. note:: unlike :meth:`add_incoming`, this does not call the ``validate_incoming`` method of the target nodes.
+
+        :param link_triples: the link triples of the node to which the link is going, the link type and link label
+        :raise TypeError: if a `target` is not a Node instance or a `link_type` is not a `LinkType` enum
+        :raise ValueError: if any of the proposed links is invalid, in which case none of the links is added
+        """
+        from aiida.orm.utils.links import validate_links
+
+        for target, link_type, link_label in link_triples:
+            self.validate_outgoing(target, link_type, link_label)
+
+        links = [(self._node, target, link_type, link_label) for target, link_type, link_label in link_triples]
+        validate_links(links, backend=self._node.backend)
+        _validate_acyclic(links, backend=self._node.backend)
+
+        for target, link_type, link_label in link_triples:
+            target.base.links._add_incoming(self._node, link_type, link_label)
+
+    def _add_incoming(self, source: 'Node', link_type: LinkType, link_label: str) -> None:
+        """Add a link that has already been validated, either to the database or to the cache if a node is unstored."""
         if self._node.is_stored and source.is_stored:
             self._node.backend_entity.add_incoming(source.backend_entity, link_type, link_label)
         else:
@@ -79,19 +131,25 @@ class NodeLinks:
         """
         from aiida.orm.utils.links import validate_link
 
-        from .node import Node
-
         validate_link(source, self._node, link_type, link_label, backend=self._node.backend)
+        _validate_acyclic([(source, self._node, link_type, link_label)], backend=self._node.backend)
 
-        # Check if the proposed link would introduce a cycle in the graph following ancestor/descendant rules
-        if link_type in [LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK]:
-            builder = (
-                QueryBuilder(backend=self._node.backend)
-                .append(Node, filters={'id': self._node.pk}, tag='parent')
-                .append(Node, filters={'id': source.pk}, tag='child', with_ancestors='parent')
-            )
-            if builder.count() > 0:
-                raise ValueError('the link you are attempting to create would generate a cycle in the graph')
+    def validate_incoming_many(self, link_triples: t.Sequence[LinkTriple]) -> None:
+        """Validate adding links of the given types from the given nodes to ourself.
+
+        This performs the same validation as :meth:`validate_incoming` for each link triple, where each link is
+        validated as if the links before it had already been added. Instead of a few queries per link, all links are
+        validated with a fixed number of queries through :func:`aiida.orm.utils.links.validate_links`.
+
+        :param link_triples: the link triples of the node from which the link is coming, the link type and link label
+        :raise TypeError: if a `source` is not a Node instance or a `link_type` is not a `LinkType` enum
+        :raise ValueError: if any of the proposed links is invalid
+        """
+        from aiida.orm.utils.links import validate_links
+
+        links = [(source, self._node, link_type, link_label) for source, link_type, link_label in link_triples]
+        validate_links(links, backend=self._node.backend)
+        _validate_acyclic(links, backend=self._node.backend)
 
     def validate_outgoing(self, target: 'Node', link_type: LinkType, link_label: str) -> None:
         """Validate adding a link of the given type from ourself to a given node.
@@ -240,3 +298,42 @@ class NodeLinks:
         """
         link_triples = self.get_stored_link_triples(node_class, link_type, link_label_filter, 'outgoing', only_uuid)
         return LinkManager(link_triples)
+
+
+def _validate_acyclic(links: t.Sequence[tuple['Node', 'Node', LinkType, str]], backend: 'StorageBackend') -> None:
+    """Validate that none of the given links would introduce a cycle in the graph following ancestor/descendant rules.
+
+    A link would introduce a cycle if its source node is a descendant of its target node. Since an unstored node cannot
+    have any stored descendants, only links between stored nodes need to be checked, which is done with a single query.
+
+    :param links: sequence of tuples of the source node, target node, link type and link label of each link
+    :param backend: the storage backend
+    :raise ValueError: if any of the links would introduce a cycle
+    """
+    from .node import Node
+
+    pairs = {
+        (target.pk, source.pk)
+        for source, target, link_type, _ in links
+        if link_type in (LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK)
+        and source.pk is not None
+        and target.pk is not None
+    }
+
+    if not pairs:
+        return
+
+    builder = (
+        QueryBuilder(backend=backend)
+        .append(Node, filters={'id': {'in': sorted({pair[0] for pair in pairs})}}, tag='parent', project='id')
+        .append(
+            Node,
+            filters={'id': {'in': sorted({pair[1] for pair in pairs})}},
+            tag='child',
+            with_ancestors='parent',
+            project='id',
+        )
+    )
+
+    if any(tuple(pair) in pairs for pair in builder.iterall()):
+        raise ValueError('the link you are attempting to create would generate a cycle in the graph')
@@ -536,8 +536,7 @@ class Node(Entity['BackendNode', NodeCollection], metaclass=AbstractNodeMeta):
                 self._store(clean=True)
 
             if self.backend.autogroup.is_to_be_grouped(self):
-                group = self.backend.autogroup.get_or_create_group()
-                group.add_nodes(self)
+                self.backend.autogroup.add_node(self)
 
         return self
 
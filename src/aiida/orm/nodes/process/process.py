@@ -9,7 +9,7 @@
 """Module with `Node` sub class for processes."""
 
 import enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from plumpy.process_states import ProcessState
 
@@ -25,6 +25,7 @@ from ..node import Node, NodeLinks
 if TYPE_CHECKING:
     from aiida.engine.processes import ExitCode, Process
     from aiida.engine.processes.builder import ProcessBuilder
+    from aiida.orm.utils.links import LinkTriple
 
 __all__ = ('ProcessNode',)
 
@@ -114,14 +115,31 @@ class ProcessNodeLinks(NodeLinks):
         :raise TypeError: if `source` is not a Node instance or `link_type` is not a `LinkType` enum
         :raise ValueError: if the proposed link is invalid
         """
+        self._validate_incoming_allowed()
+        super().validate_incoming(source, link_type, link_label)
+
+    def validate_incoming_many(self, link_triples: Sequence['LinkTriple']) -> None:
+        """Validate adding links of the given types from the given nodes to ourself.
+
+        :param link_triples: the link triples of the node from which the link is coming, the link type and link label
+        :raise TypeError: if a `source` is not a Node instance or a `link_type` is not a `LinkType` enum
+        :raise ValueError: if any of the proposed links is invalid
+        """
+        self._validate_incoming_allowed()
+        super().validate_incoming_many(link_triples)
+
+    def _validate_incoming_allowed(self) -> None:
+        """Validate that input links can still be added to the node, which is only the case as long as it is unstored.
+
+        :raise aiida.common.ModificationNotAllowed: if the node is sealed
+        :raise ValueError: if the node is stored
+        """
         if self._node.is_sealed:
             raise exceptions.ModificationNotAllowed('Cannot add a link to a sealed node')
 
         if self._node.is_stored:
             raise ValueError('attempted to add an input link after the process node was already stored.')
 
-        super().validate_incoming(source, link_type, link_label)
-
     def validate_outgoing(self, target, link_type, link_label):
         """Validate adding a link of the given type from ourself to a given node.
 
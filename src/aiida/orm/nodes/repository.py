@@ -196,10 +196,16 @@ class NodeRepository:
                 yield handle
 
     @contextlib.contextmanager
-    def as_path(self, path: FilePath | None = None) -> t.Iterator[pathlib.Path]:
+    def as_path(self, path: FilePath | None = None, zero_copy: bool = False) -> t.Iterator[pathlib.Path]:
         """Make the contents of the repository available as a normal filepath on the local file system.
 
+        By default the contents are copied to a temporary directory. With ``zero_copy=True``, the files in the temporary
+        directory are linked to the objects of the repository instead, where the repository backend supports it, which
+        avoids copying the content of large files. In that case the write permissions of the files are removed, since
+        modifying them would corrupt the repository.
+
         :param path: optional relative path of the object within the repository.
+        :param zero_copy: if ``True``, avoid copying the content of the files where possible.
         :return: the filepath of the content of the repository or object if ``path`` is specified.
         :raises TypeError: if the path is not a string or ``Path``, or is an absolute path.
         :raises FileNotFoundError: if no object exists for the given path.
@@ -210,14 +216,17 @@ class NodeRepository:
             dirpath = pathlib.Path(tmp_path)
 
             if obj.is_dir():
-                self.copy_tree(dirpath, path)
+                self.copy_tree(dirpath, path, zero_copy=zero_copy)
                 yield dirpath
             else:
                 filepath = dirpath / obj.name
                 assert path is not None
-                with self.open(path, mode='rb') as source:
-                    with filepath.open('wb') as target:
-                        shutil.copyfileobj(source, target)
+                if zero_copy:
+                    self._repository.link_object(path, filepath)
+                else:
+                    with self.open(path, mode='rb') as source:
+                        with filepath.open('wb') as target:
+                            shutil.copyfileobj(source, target)
                 yield filepath
 
     def get_object(self, path: FilePath | None = None) -> File:
@@ -253,6 +262,20 @@ class NodeRepository:
 
         return self._repository.get_object_content(path)
 
+    def get_object_region(self, path: FilePath) -> tuple[pathlib.Path, int, int] | None:
+        """Return the file on the local file system that contains the content of an object as is, and its region.
+
+        This allows to read or memory-map the content of the object in place, without copying it to a temporary file.
+
+        :param path: the relative path of the object within the repository.
+        :return: the path of the file and the offset and size in bytes of the content of the object within that file, or
+            ``None`` if the content is not stored as is in a file on the local file system, e.g. if it is compressed.
+        :raises TypeError: if the path is not a string and relative path.
+        :raises FileNotFoundError: if the file does not exist.
+        :raises IsADirectoryError: if the object is a directory and not a file.
+        """
+        return self._repository.get_object_region(path)
+
     def put_object_from_bytes(self, content: bytes, path: str) -> None:
         """Store the given content in the repository at the given path.
 
@@ -332,13 +355,15 @@ class NodeRepository:
             for filename in filenames:
                 yield dirpath / filename
 
-    def copy_tree(self, target: str | pathlib.Path, path: FilePath | None = None) -> None:
+    def copy_tree(self, target: str | pathlib.Path, path: FilePath | None = None, zero_copy: bool = False) -> None:
         """Copy the contents of the entire node repository to another location on the local file system.
 
         :param target: absolute path of the directory where to copy the contents to.
         :param path: optional relative path whose contents to copy.
+        :param zero_copy: if ``True``, link the files to the objects of the repository where possible instead of copying
+            their content. The files are then read-only.
         """
-        self._repository.copy_tree(target, path)
+        self._repository.copy_tree(target, path, zero_copy=zero_copy)
 
     def delete_object(self, path: str):
         """Delete the object from the repository.
@@ -55,6 +55,10 @@ from aiida.orm.implementation.querybuilder import (
 from . import authinfos, comments, computers, convert, entities, fields, groups, logs, nodes, users
 
 if TYPE_CHECKING:
+    import numpy
+    import pandas
+    import pyarrow
+
     from aiida.engine import Process
     from aiida.orm.implementation import StorageBackend
 
@@ -169,9 +173,7 @@ class QueryBuilder:
         else:
             debug = False
 
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            self.set_debug(debug)
+        self._set_debug(debug)
 
         # Validate & add the query path
         if not isinstance(path, (list, tuple)):
@@ -887,12 +889,19 @@ class QueryBuilder:
         warn_deprecation(
             '`QueryBuilder.set_debug` is deprecated. Configure the log level of the AiiDA logger instead.', version=3
         )
+        self._set_debug(debug)
+
+        return self
+
+    def _set_debug(self, debug: bool) -> None:
+        """Set the debug mode, without the deprecation warning of :meth:`set_debug`.
+
+        :param debug: Turn debug on or off
+        """
         if not isinstance(debug, bool):
             raise TypeError('I expect a boolean')
         self._debug = debug
 
-        return self
-
     def debug(self, msg: str, *objects: Any) -> None:
         """Log debug message.
 
@@ -1193,6 +1202,117 @@ class QueryBuilder:
         """
         return list(self.iterdict(batch_size=batch_size))
 
+    def itercolumns(self, batch_size: int = 10000) -> Iterable[Dict[str, 'numpy.ndarray']]:
+        """Return a generator over all results in batches of columns, with a numpy array per projection.
+
+        This is meant for queries that project many values of fields, for example attributes, for analysis. The values
+        are fetched in batches and, unlike :meth:`.iterall`, are not converted row by row. Entities cannot be projected.
+
+        The columns are named after the projections, as the keys of the dictionaries returned by :meth:`.dict`. If
+        the same projection is made for multiple tags, the name is prefixed by the tag, e.g. ``calc.attributes.energy``.
+        Numeric and boolean columns have the corresponding numpy data type, other columns are arrays of objects.
+
+        Usage::
+
+            qb = QueryBuilder().append(Dict, project=['id', 'attributes.energy'])
+            for columns in qb.itercolumns():
+                columns['attributes.energy'].mean()
+
+        :param batch_size: the maximum number of rows per batch, which bounds the memory used by the iteration.
+        :returns: a generator of dictionaries of column name to array. At least one batch is returned, such that the
+            columns are also known for a query without results.
+        """
+        for batch in self._itercolumns(batch_size):
+            yield {name: _get_column_array(values) for name, values in batch.items()}
+
+    def as_numpy(self, batch_size: int = 10000) -> Dict[str, 'numpy.ndarray']:
+        """Return all results as columns, with a numpy array per projection.
+
+        See :meth:`.itercolumns` for the names and data types of the columns.
+
+        :param batch_size: the maximum number of rows per batch fetched from the database.
+        :returns: a dictionary of column name to array.
+        """
+        import numpy
+
+        batches = list(self.itercolumns(batch_size))
+
+        return {name: numpy.concatenate([batch[name] for batch in batches]) for name in batches[0]}
+
+    def as_dataframe(self, batch_size: int = 10000) -> 'pandas.DataFrame':
+        """Return all results as a ``pandas.DataFrame``, with a column per projection.
+
+        See :meth:`.itercolumns` for the names and data types of the columns. Requires ``pandas`` to be installed.
+
+        :param batch_size: the maximum number of rows per batch fetched from the database.
+        :returns: the data frame.
+        """
+        import pandas
+
+        return pandas.DataFrame(self.as_numpy(batch_size))
+
+    def as_arrow(self, batch_size: int = 10000) -> 'pyarrow.Table':
+        """Return all results as a ``pyarrow.Table``, with a column per projection.
+
+        See :meth:`.itercolumns` for the names of the columns. The types of the columns are inferred by ``pyarrow`` from
+        the values, which therefore need to be of a single type per column. Requires ``pyarrow`` to be installed.
+
+        :param batch_size: the maximum number of rows per batch fetched from the database.
+        :returns: the table.
+        """
+        import pyarrow
+
+        columns: Dict[str, List[Any]] = {}
+
+        for batch in self._itercolumns(batch_size):
+            for name, values in batch.items():
+                columns.setdefault(name, []).extend(values)
+
+        return pyarrow.table(columns)
+
+    def _itercolumns(self, batch_size: int) -> Iterable[Dict[str, List[Any]]]:
+        """Return a generator over all results in batches of columns, as dictionaries of column name to list of values.
+
+        :param batch_size: the maximum number of rows per batch.
+        """
+        for batch in self._impl.itercolumns(self.as_dict(), batch_size):
+            keys = [key for projections in batch.values() for key in projections]
+            yield {
+                key if keys.count(key) == 1 else f'{tag}.{key}': values
+                for tag, projections in batch.items()
+                for key, values in projections.items()
+            }
+
+
+def _get_column_array(values: List[Any]) -> 'numpy.ndarray':
+    """Return the values of a column as a numpy array.
+
+    Numeric and boolean values are converted to the corresponding numpy data type. All other columns, including those
+    with ``None`` values, are returned as one-dimensional arrays of objects.
+
+    :param values: the values of the column.
+    """
+    import numpy
+
+    if not values or isinstance(values[0], (bool, int, float)):
+        try:
+            array = numpy.array(values)
+        except ValueError:
+            pass
+        else:
+            if array.ndim == 1 and array.dtype.kind in 'biuf':
+                return array
+
+    array = numpy.empty(len(values), dtype=object)
+
+    try:
+        array[:] = values
+    except ValueError:
+        for index, value in enumerate(values):
+            array[index] = value
+
+    return array
+
 
 def _get_ormclass(
     cls: Union[None, EntityClsType, Sequence[EntityClsType]], entity_type: Union[None, str, Sequence[str]]
@@ -42,6 +42,7 @@ __all__ = (
     'load_node',
     'load_node_class',
     'validate_link',
+    'validate_links',
 )
 
 # fmt: on
@@ -10,7 +10,7 @@
 
 from collections import OrderedDict
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Generator, Iterator, List, NamedTuple, Optional
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 from aiida.common import exceptions
 from aiida.common.lang import type_check
@@ -20,7 +20,7 @@ if TYPE_CHECKING:
     from aiida.orm import Node
     from aiida.orm.implementation.storage_backend import StorageBackend
 
-__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link')
+__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link', 'validate_links')
 
 
 class LinkPair(NamedTuple):
@@ -137,6 +137,140 @@ def validate_link(
     :raise TypeError: if `source` or `target` is not a Node instance, or `link_type` is not a `LinkType` enum
     :raise ValueError: if the proposed link is invalid
     """
+    validate_links([(source, target, link_type, link_label)], backend)
+
+
+def validate_links(
+    links: Sequence[Tuple['Node', 'Node', 'LinkType', str]], backend: Optional['StorageBackend'] = None
+) -> None:
+    """Validate adding the given links, in the given order.
+
+    This is equivalent to calling :func:`validate_link` for each link, where each link is validated as if all links
+    before it had already been added. However, instead of querying the existing links of the source and target node of
+    each link separately, the existing links of all source and target nodes are retrieved with at most two queries,
+    regardless of the number of links.
+
+    :param links: sequence of tuples of the source node, target node, link type and link label of each link
+    :param backend: the storage backend, by default the backend of the nodes
+    :raise TypeError: if a `source` or `target` is not a Node instance, or a `link_type` is not a `LinkType` enum
+    :raise ValueError: if any of the proposed links is invalid
+    """
+    from aiida.orm import Node, QueryBuilder
+
+    degrees = [get_link_degrees(*link) for link in links]
+
+    # For each link type, only the existing links that can conflict with a proposed link need to be retrieved, i.e. all
+    # links of that type if the degree is `unique`, indicated by `None`, and only those with the same labels otherwise.
+    outgoing_labels: Dict[str, Optional[Set[str]]] = {}
+    incoming_labels: Dict[str, Optional[Set[str]]] = {}
+
+    for (_, _, link_type, link_label), (outdegree, indegree) in zip(links, degrees):
+        for labels, degree in ((outgoing_labels, outdegree), (incoming_labels, indegree)):
+            if degree == 'unique' or (link_type.value in labels and labels[link_type.value] is None):
+                labels[link_type.value] = None
+            else:
+                labels.setdefault(link_type.value, set()).add(link_label)  # type: ignore[union-attr]
+
+    source_ids = {source.pk for source, _, _, _ in links if source.pk is not None}
+    target_ids = {target.pk for _, target, _, _ in links if target.pk is not None}
+    stored: Set[Tuple[str, str, str, str]] = set()
+
+    for tag, node_ids, labels in (('source', source_ids, outgoing_labels), ('target', target_ids, incoming_labels)):
+        if not node_ids:
+            continue
+
+        edge_filters: List[Dict[str, Any]] = []
+        for link_type_value, link_labels in labels.items():
+            if link_labels is None:
+                edge_filters.append({'type': link_type_value})
+            else:
+                edge_filters.append({'type': link_type_value, 'label': {'in': sorted(link_labels)}})
+
+        node_filters = {tag: {'id': {'in': sorted(node_ids)}}}
+
+        builder = QueryBuilder(backend=backend)
+        builder.append(Node, tag='source', project='uuid', filters=node_filters.get('source'))
+        builder.append(
+            Node,
+            tag='target',
+            with_incoming='source',
+            project='uuid',
+            filters=node_filters.get('target'),
+            edge_filters={'or': edge_filters},
+            edge_project=['type', 'label'],
+        )
+        for source_uuid, target_uuid, link_type_value, link_label in builder.iterall():
+            stored.add((str(source_uuid), str(target_uuid), link_type_value, link_label))
+
+    # Links into unstored target nodes are not yet stored but kept in the cache of the target node. Like for a single
+    # link, these are only considered for the indegree and for the uniqueness of the link triple.
+    cached: Set[Tuple[str, str, str, str]] = set()
+    for target in {target.uuid: target for _, target, _, _ in links}.values():
+        for node, link_type, link_label in target.base.links.incoming_cache:
+            cached.add((node.uuid, target.uuid, link_type.value, link_label))
+
+    outgoing_unique = {(source, link_type) for source, _, link_type, _ in stored}
+    outgoing_pairs = {(source, link_type, label) for source, _, link_type, label in stored}
+    incoming_unique = {(target, link_type) for _, target, link_type, _ in stored | cached}
+    incoming_pairs = {(target, link_type, label) for _, target, link_type, label in stored | cached}
+    triples = stored | cached
+
+    for (source, target, link_type, link_label), (outdegree, indegree) in zip(links, degrees):
+        triple = (source.uuid, target.uuid, link_type.value, link_label)
+
+        # If the outdegree is `unique` there cannot already be any other outgoing link of that type
+        if outdegree == 'unique' and (source.uuid, link_type.value) in outgoing_unique:
+            raise ValueError(f'node<{source.uuid}> already has an outgoing {link_type} link')
+
+        # If the outdegree is `unique_pair`, then the link labels for outgoing links of this type should be unique
+        elif outdegree == 'unique_pair' and (source.uuid, link_type.value, link_label) in outgoing_pairs:
+            raise ValueError(f'node<{source.uuid}> already has an outgoing {link_type} link with label "{link_label}"')
+
+        # If the outdegree is `unique_triple`, then the triples of link type, link label and target should be unique
+        elif outdegree == 'unique_triple' and triple in triples:
+            raise ValueError(
+                'node<{}> already has an outgoing {} link with label "{}" from node<{}>'.format(
+                    source.uuid, link_type, link_label, target.uuid
+                )
+            )
+
+        # If the indegree is `unique` there cannot already be any other incoming links of that type
+        if indegree == 'unique' and (target.uuid, link_type.value) in incoming_unique:
+            raise ValueError(f'node<{target.uuid}> already has an incoming {link_type} link')
+
+        # If the indegree is `unique_pair`, then the link labels for incoming links of this type should be unique
+        elif indegree == 'unique_pair' and (target.uuid, link_type.value, link_label) in incoming_pairs:
+            raise ValueError(f'node<{target.uuid}> already has an incoming {link_type} link with label "{link_label}"')
+
+        # If the indegree is `unique_triple`, then the triples of link type, link label and source should be unique
+        elif indegree == 'unique_triple' and triple in triples:
+            raise ValueError(
+                'node<{}> already has an incoming {} link with label "{}" from node<{}>'.format(
+                    target.uuid, link_type, link_label, source.uuid
+                )
+            )
+
+        # The link is valid, so it has to be taken into account for the validation of the links that follow it
+        outgoing_unique.add((source.uuid, link_type.value))
+        outgoing_pairs.add((source.uuid, link_type.value, link_label))
+        incoming_unique.add((target.uuid, link_type.value))
+        incoming_pairs.add((target.uuid, link_type.value, link_label))
+        triples.add(triple)
+
+
+def get_link_degrees(source: 'Node', target: 'Node', link_type: 'LinkType', link_label: str) -> Tuple[str, str]:
+    """Validate the types of the nodes and the label of a proposed link and return the degree character of its type.
+
+    This performs all validation of :func:`validate_link` that does not require to query the existing links.
+
+    :param source: the node from which the link is coming
+    :param target: the node to which the link is going
+    :param link_type: the type of link
+    :param link_label: link label
+    :return: tuple of the outdegree and indegree character of the link type
+    :raise TypeError: if `source` or `target` is not a Node instance, or `link_type` is not a `LinkType` enum
+    :raise ValueError: if the proposed link is invalid
+    """
     from aiida.common.links import LinkType, validate_link_label
     from aiida.orm import CalculationNode, Data, Node, WorkflowNode
 
@@ -179,48 +313,7 @@ def validate_link(
     if not isinstance(source, type_source) or not isinstance(target, type_target):
         raise ValueError(f'cannot add a {link_type} link from {type(source)} to {type(target)}')
 
-    if outdegree == 'unique_triple' or indegree == 'unique_triple':
-        # For a `unique_triple` degree we just have to check if an identical triple already exist, either in the cache
-        # or stored, in which case, the new proposed link is a duplicate and thus illegal
-        duplicate_link_triple = link_triple_exists(source, target, link_type, link_label, backend)
-
-    # If the outdegree is `unique` there cannot already be any other outgoing link of that type
-    if outdegree == 'unique' and source.base.links.get_outgoing(link_type=link_type, only_uuid=True).all():
-        raise ValueError(f'node<{source.uuid}> already has an outgoing {link_type} link')
-
-    # If the outdegree is `unique_pair`, then the link labels for outgoing links of this type should be unique
-    elif (
-        outdegree == 'unique_pair'
-        and source.base.links.get_outgoing(link_type=link_type, only_uuid=True, link_label_filter=link_label).all()
-    ):
-        raise ValueError(f'node<{source.uuid}> already has an outgoing {link_type} link with label "{link_label}"')
-
-    # If the outdegree is `unique_triple`, then the link triples of link type, link label and target should be unique
-    elif outdegree == 'unique_triple' and duplicate_link_triple:
-        raise ValueError(
-            'node<{}> already has an outgoing {} link with label "{}" from node<{}>'.format(
-                source.uuid, link_type, link_label, target.uuid
-            )
-        )
-
-    # If the indegree is `unique` there cannot already be any other incoming links of that type
-    if indegree == 'unique' and target.base.links.get_incoming(link_type=link_type, only_uuid=True).all():
-        raise ValueError(f'node<{target.uuid}> already has an incoming {link_type} link')
-
-    # If the indegree is `unique_pair`, then the link labels for incoming links of this type should be unique
-    elif (
-        indegree == 'unique_pair'
-        and target.base.links.get_incoming(link_type=link_type, link_label_filter=link_label, only_uuid=True).all()
-    ):
-        raise ValueError(f'node<{target.uuid}> already has an incoming {link_type} link with label "{link_label}"')
-
-    # If the indegree is `unique_triple`, then the link triples of link type, link label and source should be unique
-    elif indegree == 'unique_triple' and duplicate_link_triple:
-        raise ValueError(
-            'node<{}> already has an incoming {} link with label "{}" from node<{}>'.format(
-                target.uuid, link_type, link_label, source.uuid
-            )
-        )
+    return outdegree, indegree
 
 
 class LinkManager:
@@ -12,6 +12,9 @@ import os
 
 from aiida.orm.nodes.data.remote.base import RemoteData
 
+#: Maximum length of a single batched ``rm`` command, well below the ``ARG_MAX`` of common operating systems.
+CLEAN_COMMAND_MAX_LENGTH = 65536
+
 
 def clean_remote(transport, path):
     """Recursively remove a remote folder, with the given absolute path, and all its contents. The path should be
@@ -38,6 +41,130 @@ def clean_remote(transport, path):
         pass
 
 
+def clean_remote_paths(transport, paths, max_command_length=CLEAN_COMMAND_MAX_LENGTH):
+    """Recursively remove many remote folders, with the given absolute paths, and all their contents.
+
+    The folders are removed by a few ``rm -rf`` commands, each one removing as many folders as fit in a command of
+    ``max_command_length`` characters, instead of one recursive removal through the transport per folder. If one of the
+    commands fails, the folders of that command are removed one by one with :func:`clean_remote` instead, and only those
+    that no longer exist afterwards are considered removed.
+
+    :param transport: an open Transport channel
+    :param paths: a list of absolute paths on the remote made available through the transport
+    :param max_command_length: the maximum length of a single command
+    :return: the list of the paths that were removed, in the order in which they were given.
+    """
+    from aiida.common.escaping import escape_for_bash
+
+    for path in paths:
+        if not isinstance(path, str):
+            raise ValueError('the path has to be a string type')
+
+        if not os.path.isabs(path):
+            raise ValueError('the path should be absolute')
+
+        if os.path.normpath(path) == os.path.normpath('/'):
+            raise ValueError('refusing to remove the root directory')
+
+    if not transport.is_open:
+        raise ValueError('the transport should already be open')
+
+    prefix = 'rm -rf --'
+    batch = []
+    length = len(prefix)
+    removed = []
+
+    def remove(batch):
+        command = ' '.join([prefix] + [escape_for_bash(path) for path in batch])
+        retval, _, _ = transport.exec_command_wait(command)
+        if retval == 0:
+            removed.extend(batch)
+            return
+        for path in batch:
+            clean_remote(transport, path)
+            try:
+                if not transport.path_exists(path):
+                    removed.append(path)
+            except OSError:
+                pass
+
+    for path in paths:
+        argument_length = len(escape_for_bash(path)) + 1
+        if batch and length + argument_length > max_command_length:
+            remove(batch)
+            batch = []
+            length = len(prefix)
+        batch.append(path)
+        length += argument_length
+
+    if batch:
+        remove(batch)
+
+    return removed
+
+
+def clean_mapping_remote_paths(path_mapping, max_workers=None, backend=None):
+    """Clean the remote folders of many ``RemoteData`` nodes, grouped by the computer they are on.
+
+    The folders of each computer are removed with :func:`clean_remote_paths` through a single transport, and the
+    computers are processed in parallel threads. The nodes whose folder was removed are then marked by setting the extra
+    ``RemoteData.KEY_EXTRA_CLEANED``, with a single bulk update that leaves their other extras untouched.
+
+    :param path_mapping: mapping of computer uuid onto the list of ``RemoteData`` nodes to clean, as returned by
+        :func:`get_calcjob_remote_paths`.
+    :param max_workers: the maximum number of computers that are cleaned at the same time, by default all of them.
+    :param backend: the storage backend, by default the storage of the loaded profile.
+    :return: mapping of the label of each computer onto the number of remote folders that were removed on it.
+    :raises Exception: the first exception raised while cleaning the folders of a computer, after all other computers
+        were processed and their nodes were marked as cleaned.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from aiida import orm
+    from aiida.manage import get_manager
+    from aiida.orm.entities import EntityTypes
+
+    backend = backend or get_manager().get_profile_storage()
+    user = orm.User.get_collection(backend).get_default()
+
+    # Everything that needs the database is resolved here, such that the threads only operate the transports
+    jobs = []
+    for computer_uuid, remote_folders in path_mapping.items():
+        computer = orm.Computer.get_collection(backend).get(uuid=computer_uuid)
+        transport = computer.get_authinfo(user).get_transport()
+        paths = [remote_folder.get_remote_path() for remote_folder in remote_folders]
+        jobs.append((computer, transport, paths, remote_folders))
+
+    if not jobs:
+        return {}
+
+    def clean(transport, paths):
+        with transport:
+            return clean_remote_paths(transport, paths)
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(jobs)) as executor:
+        futures = [executor.submit(clean, transport, paths) for _, transport, paths, _ in jobs]
+
+    counts = {}
+    cleaned = []
+    exception = None
+
+    for (computer, _, paths, remote_folders), future in zip(jobs, futures):
+        if future.exception() is not None:
+            exception = exception or future.exception()
+            continue
+        removed = set(future.result())
+        counts[computer.label] = len(removed)
+        cleaned.extend(node for node, path in zip(remote_folders, paths) if path in removed)
+
+    backend.bulk_set_extras(EntityTypes.NODE, [node.pk for node in cleaned], {RemoteData.KEY_EXTRA_CLEANED: True})
+
+    if exception is not None:
+        raise exception
+
+    return counts
+
+
 def get_calcjob_remote_paths(
     pks=None,
     past_days=None,
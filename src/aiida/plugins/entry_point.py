@@ -12,7 +12,6 @@ from __future__ import annotations
 
 import enum
 import functools
-import traceback
 from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Set, Tuple
 
 from aiida.common.exceptions import LoadingEntryPointError, MissingEntryPointError, MultipleEntryPointError
@@ -273,6 +272,8 @@ def load_entry_point(group: str, name: str) -> Any:
     :raises aiida.common.MultipleEntryPointError: entry point could not be uniquely resolved
     :raises aiida.common.LoadingEntryPointError: entry point could not be loaded
     """
+    import traceback
+
     entry_point = get_entry_point(group, name)
 
     try:
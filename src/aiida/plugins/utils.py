@@ -11,7 +11,6 @@
 from __future__ import annotations
 
 import typing as t
-from importlib.metadata import version, packages_distributions
 from logging import Logger
 from types import FunctionType
 
@@ -54,6 +53,7 @@ class PluginVersionProvider:
         :raises TypeError: If ``plugin`` (or the resource pointed to it in the case of an entry point) is not a class
             or a function.
         """
+        from importlib.metadata import packages_distributions, version
         from inspect import isclass, isfunction
 
         from aiida import __version__ as version_core
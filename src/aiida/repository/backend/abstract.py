@@ -9,7 +9,10 @@ import abc
 import contextlib
 import hashlib
 import io
+import os
 import pathlib
+import shutil
+import stat
 from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
 from aiida.common.hashing import chunked_file_hash
 
@@ -170,6 +173,66 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
         if not self.has_object(key):
             raise FileNotFoundError(f'object with key `{key}` does not exist.')
 
+    def link_object(self, key: str, filepath: Union[str, pathlib.Path]) -> None:
+        """Make the content of an object available as a read-only file at ``filepath``, avoiding a copy where possible.
+
+        The file may share its storage with the object in the repository, so its write permissions are removed, such
+        that it cannot be modified by accident, which would corrupt the repository.
+
+        The base implementation copies the content of the object. Backends that store objects as plain files on the
+        local file system should override this method to link the file instead.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :param filepath: the filepath where to make the content available, it should not yet exist.
+        :raise FileNotFoundError: if the file does not exist.
+        :raise OSError: if the file could not be created.
+        """
+        with self.open(key) as source, open(filepath, 'xb') as target:
+            shutil.copyfileobj(source, target)
+
+        self._make_read_only(filepath)
+
+    def get_object_region(self, key: str) -> Optional[Tuple[pathlib.Path, int, int]]:
+        """Return the file on the local file system that contains the content of an object as is, and its region.
+
+        This allows to read or memory-map the content of the object in place. The base implementation returns ``None``.
+        Backends that store objects uncompressed in files on the local file system should override this method.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :return: the path of the file and the offset and size in bytes of the content of the object within that file, or
+            ``None`` if the content is not stored as is in a file on the local file system.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        if not self.has_object(key):
+            raise FileNotFoundError(f'object with key `{key}` does not exist.')
+
+        return None
+
+    @classmethod
+    def _link_file(cls, source: Union[str, pathlib.Path], filepath: Union[str, pathlib.Path]) -> None:
+        """Link the file at ``filepath`` to the file ``source`` and make it read-only.
+
+        A hard link is preferred, as it remains valid even if the source is removed, for example when the object is
+        packed by the maintenance of the repository. If the two paths are on different file systems, a symbolic link is
+        created instead.
+        """
+        try:
+            os.link(source, filepath)
+        except OSError:
+            os.symlink(source, filepath)
+
+        cls._make_read_only(filepath)
+
+    @staticmethod
+    def _make_read_only(filepath: Union[str, pathlib.Path]) -> None:
+        """Remove the write permissions of the file at ``filepath``.
+
+        If the file is linked to an object of the repository, this also applies to the object, whose content never
+        changes, since it is identified by its content.
+        """
+        mode = stat.S_IMODE(os.stat(filepath).st_mode)
+        os.chmod(filepath, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
     def get_object_content(self, key: str) -> bytes:
         """Return the content of a object identified by key.
 
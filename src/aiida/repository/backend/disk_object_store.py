@@ -2,6 +2,8 @@
 
 import contextlib
 import dataclasses
+import os
+import pathlib
 import shutil
 import typing as t
 
@@ -118,6 +120,88 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
             with container.get_object_stream(key) as handle:
                 yield handle  # type: ignore[misc]
 
+    def link_object(self, key: str, filepath: t.Union[str, pathlib.Path]) -> None:
+        """Make the content of an object available as a read-only file at ``filepath``, avoiding a copy where possible.
+
+        Loose objects are stored as a plain file in the container and are linked. Packed objects that are not compressed
+        are copied with ``os.copy_file_range``, which lets the kernel copy the data without passing it through user
+        space, or even share the blocks on file systems that support reflinks. Compressed objects are decompressed.
+        Since a linked file is the object in the container, the write permissions of the file are removed.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :param filepath: the filepath where to make the content available, it should not yet exist.
+        :raise FileNotFoundError: if the file does not exist.
+        :raise OSError: if the file could not be created.
+        """
+        from disk_objectstore.container import ObjectType
+        from disk_objectstore.exceptions import NotExistent
+
+        with self._container as container:
+            try:
+                meta = container.get_object_meta(key)
+            except NotExistent as exception:
+                raise FileNotFoundError(f'object with key `{key}` does not exist.') from exception
+
+            if meta.type == ObjectType.LOOSE:
+                self._link_file(container._get_loose_path_from_hashkey(key), filepath)
+                return
+
+            pack_path = container._get_pack_path_from_pack_id(meta.pack_id)  # type: ignore[arg-type]
+
+        if meta.pack_compressed or not hasattr(os, 'copy_file_range'):
+            super().link_object(key, filepath)
+            return
+
+        with open(pack_path, 'rb') as source, open(filepath, 'xb') as target:
+            offset, remaining = meta.pack_offset, meta.size
+            assert offset is not None and remaining is not None
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(source.fileno(), target.fileno(), remaining, offset)
+                    if copied == 0:
+                        raise OSError(f'unexpected end of the pack file `{pack_path}`.')
+                    offset += copied
+                    remaining -= copied
+            except OSError:
+                # The system call is not supported for these file systems: fall back to a copy through user space
+                target.seek(0)
+                target.truncate()
+                with self.open(key) as handle:
+                    shutil.copyfileobj(handle, target)
+
+        self._make_read_only(filepath)
+
+    def get_object_region(self, key: str) -> t.Optional[t.Tuple[pathlib.Path, int, int]]:
+        """Return the file on the local file system that contains the content of an object as is, and its region.
+
+        Loose objects are stored in a file of their own. Packed objects are stored at an offset of their pack file, as
+        is if they are not compressed. Compressed objects have no such region.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :return: the path of the file and the offset and size in bytes of the content of the object within that file, or
+            ``None`` if the object is compressed.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        from disk_objectstore.container import ObjectType
+        from disk_objectstore.exceptions import NotExistent
+
+        with self._container as container:
+            try:
+                meta = container.get_object_meta(key)
+            except NotExistent as exception:
+                raise FileNotFoundError(f'object with key `{key}` does not exist.') from exception
+
+            assert meta.size is not None
+
+            if meta.type == ObjectType.LOOSE:
+                return container._get_loose_path_from_hashkey(key), 0, meta.size
+
+            if meta.pack_compressed:
+                return None
+
+            assert meta.pack_offset is not None
+            return container._get_pack_path_from_pack_id(meta.pack_id), meta.pack_offset, meta.size  # type: ignore[arg-type]
+
     def iter_object_streams(self, keys: t.List[str]) -> t.Iterator[t.Tuple[str, t.BinaryIO]]:
         with self._container.get_objects_stream_and_meta(keys) as triplets:
             for key, stream, _ in triplets:
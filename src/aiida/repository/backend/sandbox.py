@@ -116,6 +116,19 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         with self.sandbox.open(key, mode='rb') as handle:
             yield handle
 
+    def link_object(self, key: str, filepath: str | pathlib.Path) -> None:
+        if not self.has_object(key):
+            raise FileNotFoundError(f'object with key `{key}` does not exist.')
+
+        self._link_file(os.path.join(self.sandbox.abspath, key), filepath)
+
+    def get_object_region(self, key: str) -> tuple[pathlib.Path, int, int]:
+        if not self.has_object(key):
+            raise FileNotFoundError(f'object with key `{key}` does not exist.')
+
+        filepath = pathlib.Path(self.sandbox.abspath) / key
+        return filepath, 0, filepath.stat().st_size
+
     def iter_object_streams(self, keys: list[str]) -> t.Iterator[tuple[str, t.BinaryIO]]:
         for key in keys:
             with self.open(key) as handle:
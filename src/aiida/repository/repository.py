@@ -394,6 +394,36 @@ class Repository:
         with self.backend.open(key) as handle:
             yield handle
 
+    def link_object(self, path: FilePath, filepath: Union[str, pathlib.Path]) -> None:
+        """Make the content of an object available as a read-only file at ``filepath``, avoiding a copy where possible.
+
+        The file may share its storage with the object in the repository, so its write permissions are removed.
+
+        :param path: the relative path of the object within the repository.
+        :param filepath: the filepath where to make the content available, it should not yet exist.
+        :raises TypeError: if the path is not a string or ``Path``, or is an absolute path.
+        :raises FileNotFoundError: if the file does not exist.
+        :raises IsADirectoryError: if the object is a directory and not a file.
+        :raises OSError: if the file could not be created.
+        """
+        key = self.get_file(path).key
+        assert key is not None, 'Expected FileType.File to have a key'
+        self.backend.link_object(key, filepath)
+
+    def get_object_region(self, path: FilePath) -> Optional[Tuple[pathlib.Path, int, int]]:
+        """Return the file on the local file system that contains the content of an object as is, and its region.
+
+        :param path: the relative path of the object within the repository.
+        :return: the path of the file and the offset and size in bytes of the content of the object within that file, or
+            ``None`` if the backend does not store the content as is in a file on the local file system.
+        :raises TypeError: if the path is not a string or ``Path``, or is an absolute path.
+        :raises FileNotFoundError: if the file does not exist.
+        :raises IsADirectoryError: if the object is a directory and not a file.
+        """
+        key = self.get_file(path).key
+        assert key is not None, 'Expected FileType.File to have a key'
+        return self.backend.get_object_region(key)
+
     def get_object_content(self, path: FilePath) -> bytes:
         """Return the content of a object identified by path.
 
@@ -480,7 +510,9 @@ class Repository:
 
         yield path, dirnames, filenames
 
-    def copy_tree(self, target: Union[str, pathlib.Path], path: Optional[FilePath] = None) -> None:
+    def copy_tree(
+        self, target: Union[str, pathlib.Path], path: Optional[FilePath] = None, zero_copy: bool = False
+    ) -> None:
         """Copy the contents of the entire node repository to another location on the local file system.
 
         .. note:: If ``path`` is specified, only its contents are copied, and the relative path with respect to the
@@ -489,6 +521,8 @@ class Repository:
 
         :param target: absolute path of the directory where to copy the contents to.
         :param path: optional relative path whose contents to copy.
+        :param zero_copy: if ``True``, the files are created with :meth:`link_object`, which avoids copying their
+            content where the backend supports it. The files are then read-only.
         :raises TypeError: if ``target`` is of incorrect type or not absolute.
         :raises NotADirectoryError: if ``path`` does not reference a directory.
         """
@@ -518,6 +552,10 @@ class Repository:
 
                 dirpath.mkdir(parents=True, exist_ok=True)
 
+                if zero_copy:
+                    self.link_object(root / filename, filepath)
+                    continue
+
                 with self.open(root / filename) as handle:
                     filepath.write_bytes(handle.read())
 
@@ -84,6 +84,7 @@ class AiidaApi(Api):
         :param kwargs: parameters to be passed to the resources for
           configuration and PREFIX
         """
+        from aiida.restapi.common.cache import ResponseCache
         from aiida.restapi.common.config import CLI_DEFAULTS
         from aiida.restapi.resources import (
             CalcJobNode,
@@ -102,6 +103,10 @@ class AiidaApi(Api):
 
         posting = kwargs.pop('posting', CLI_DEFAULTS['POSTING'])
 
+        # The resources are instantiated for each request, so the response cache is shared through their kwargs
+        self.response_cache = ResponseCache(maxsize=kwargs.get('CACHE_SIZE', 0), timeout=kwargs.get('CACHE_TIMEOUT', 0))
+        kwargs['response_cache'] = self.response_cache
+
         self.add_resource(
             ServerInfo,
             '/',
@@ -153,6 +158,7 @@ class AiidaApi(Api):
             '/nodes/<id>/links/outgoing/page/',
             '/nodes/<id>/links/outgoing/page/<int:page>/',
             '/nodes/<id>/links/tree/',
+            '/nodes/<id>/links/provenance/',
             '/nodes/<id>/contents/attributes/',
             '/nodes/<id>/contents/extras/',
             '/nodes/<id>/contents/derived_properties/',
@@ -0,0 +1,112 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""In-process cache for the responses and total counts of the REST API."""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from flask import g
+
+CacheEntry = namedtuple('CacheEntry', ['token', 'time', 'value'])
+
+
+class ResponseCache:
+    """Thread-safe least-recently-used cache of REST API results.
+
+    Every entry is stored together with a validity token, a cheap fingerprint of the state of the storage as returned by
+    :func:`get_storage_token`. An entry is discarded as soon as the token changes or once it is older than ``timeout``
+    seconds. The timeout bounds the staleness of the changes of nodes that the token does not capture, for example
+    deletions. Since the token does not capture any change of other entities, such as groups, computers, users and
+    comments, the responses about those entities should not be cached.
+    """
+
+    def __init__(self, maxsize=256, timeout=10):
+        """Construct the cache.
+
+        :param maxsize: maximum number of entries, the least recently used entry is evicted first. Zero disables the
+            cache.
+        :param timeout: maximum age of an entry in seconds.
+        """
+        self._maxsize = maxsize
+        self._timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def enabled(self):
+        """Return whether the cache stores any entry."""
+        return self._maxsize > 0
+
+    def get(self, key, token):
+        """Return the value cached for ``key``, or ``None`` if it is missing, expired or was stored for another token.
+
+        :param key: hashable key of the entry.
+        :param token: the current validity token.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry.token != token or time.monotonic() - entry.time > self._timeout:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def set(self, key, token, value):
+        """Store ``value`` for ``key``, evicting the least recently used entries if the cache is full.
+
+        :param key: hashable key of the entry.
+        :param token: the current validity token.
+        :param value: the value to cache.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = CacheEntry(token, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+def get_storage_token():
+    """Return a cheap fingerprint of the state of the storage of the loaded profile.
+
+    The fingerprint consists of the profile name, the largest node ``id`` and the most recent node ``mtime``. Both are
+    resolved through an index of the nodes table, so computing it costs two single-row lookups instead of running the
+    actual query. The token is computed once per request and then stored on the request context.
+
+    :return: hashable token that changes whenever a node is created or modified, but not when any other entity is.
+    """
+    from aiida.manage import get_manager
+    from aiida.orm import Node, QueryBuilder
+
+    if 'aiida_storage_token' not in g:
+        max_id = QueryBuilder().append(Node, project='id').order_by({Node: {'id': 'desc'}}).limit(1).first()
+        max_mtime = QueryBuilder().append(Node, project='mtime').order_by({Node: {'mtime': 'desc'}}).limit(1).first()
+        g.aiida_storage_token = (
+            get_manager().get_profile().name,
+            max_id[0] if max_id else None,
+            max_mtime[0] if max_mtime else None,
+        )
+
+    return g.aiida_storage_token
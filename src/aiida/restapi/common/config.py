@@ -15,6 +15,9 @@ API_CONFIG = {
     'PERPAGE_DEFAULT': 20,  # default records per page
     'PREFIX': '/api/v4',  # prefix for all URLs
     'VERSION': '4.1.0',
+    'CACHE_SIZE': 256,  # maximum number of responses of node endpoints kept in the in-process cache, 0 disables it
+    'CACHE_TIMEOUT': 10,  # seconds after which a cached response is recomputed even if the nodes did not change
+    'STREAM_BATCH_SIZE': 1000,  # rows fetched from the database at once for streamed responses
 }
 
 APP_CONFIG = {
@@ -36,7 +39,9 @@ CACHING_TIMEOUTS = {  # Caching timeouts in seconds
 }
 
 # IO tree
-MAX_TREE_DEPTH = 5
+MAX_TREE_DEPTH = 5  # maximum number of hops of the provenance endpoint
+MAX_TREE_FAN_OUT = 100  # maximum number of incoming or outgoing links followed per node by the provenance endpoint
+MAX_TREE_NODES = 1000  # maximum number of nodes returned by the provenance endpoint
 
 CLI_DEFAULTS = {
     'HOST_NAME': '127.0.0.1',
@@ -11,7 +11,7 @@
 import urllib.parse
 from datetime import datetime, timedelta
 
-from flask import jsonify
+from flask import Response, current_app, jsonify, request, stream_with_context
 from flask.json.provider import DefaultJSONProvider
 from wrapt import decorator
 
@@ -24,6 +24,8 @@ from aiida.restapi.common.exceptions import RestInputValidationError, RestValida
 PK_DBSYNONYM = 'id'
 # Example uuid (version 4)
 UUID_REF = 'd55082b6-76dc-426b-af89-0e08b59524d2'
+# Media type of streamed responses, with one JSON document per line
+NDJSON_MIMETYPE = 'application/x-ndjson'
 
 
 ########################## Classes #####################
@@ -214,7 +216,15 @@ class Utils:
         return (resource_type, page, node_id, query_type)
 
     def validate_request(
-        self, limit=None, offset=None, perpage=None, page=None, query_type=None, is_querystring_defined=False
+        self,
+        limit=None,
+        offset=None,
+        perpage=None,
+        page=None,
+        query_type=None,
+        is_querystring_defined=False,
+        cursor=None,
+        orderby=None,
     ):
         """Performs various checks on the consistency of the request.
         Add here all the checks that you want to do, except validity of the page
@@ -236,6 +246,17 @@ class Utils:
         # 4. No querystring if query type = projectable_properties'
         if query_type in ('projectable_properties',) and is_querystring_defined:
             raise RestInputValidationError('projectable_properties requests do not allow specifying a query string')
+        # 5. cursor incompatible with offset and pages
+        if cursor is not None and (offset is not None or page is not None):
+            raise RestValidationError('cursor key is incompatible with offset and page')
+        # 6. cursor only for lists of entities or links
+        if cursor is not None and query_type not in ('default', 'incoming', 'outgoing'):
+            raise RestValidationError(f'cursor key is not supported for {query_type} requests')
+        # 7. cursor requires the results to be ordered by id only, since the cursor is the id of the last result
+        if cursor is not None and [order.lstrip('+-') for order in orderby or []] not in (['id'], ['pk']):
+            raise RestValidationError(
+                'cursor pagination requires the results to be ordered by id only, i.e. orderby=+id or orderby=-id'
+            )
 
     def paginate(self, page, perpage, total_count):
         """Calculates limit and offset for the reults of a query,
@@ -301,12 +322,13 @@ class Utils:
 
         return (limit, offset, rel_pages)
 
-    def build_headers(self, rel_pages=None, url=None, total_count=None):
+    def build_headers(self, rel_pages=None, url=None, total_count=None, next_cursor=None):
         """Construct the header dictionary for an HTTP response. It includes related
         pages, total count of results (before pagination).
 
         :param rel_pages: a dictionary defining related pages (first, prev, next, last)
         :param url: (string) the full url, i.e. the url that the client uses to get Rest resources
+        :param next_cursor: the value of the cursor to request the next page of results, if any
         """
         ## Type validation
         # mandatory parameters
@@ -369,6 +391,11 @@ class Utils:
             else:
                 pass
 
+        # set the cursor of the next page
+        if next_cursor is not None:
+            headers['X-Next-Cursor'] = next_cursor
+            expose_header.append('X-Next-Cursor')
+
         # to expose header access in cross-domain requests
         headers['Access-Control-Expose-Headers'] = ','.join(expose_header)
 
@@ -410,6 +437,46 @@ class Utils:
 
         return response
 
+    @staticmethod
+    def is_stream_requested():
+        """Return whether the client requested the results to be streamed.
+
+        Streaming is opt-in through content negotiation: the ``Accept`` header of the request has to prefer
+        ``application/x-ndjson`` over ``application/json``.
+        """
+        return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+    @staticmethod
+    def build_stream_response(rows, headers=None):
+        """Build a response that streams the rows as newline delimited JSON, one JSON object per line.
+
+        The rows are only consumed while the response is sent, such that the memory needed does not depend on the
+        number of rows if they are lazily fetched from the database.
+
+        :param rows: an iterable of dictionaries
+        :param headers: dictionary for additional header k,v pairs
+        :return: a Flask response object
+        """
+        if headers is not None and not isinstance(headers, dict):
+            raise InputValidationError('header must be a dictionary')
+
+        def generate():
+            try:
+                for row in rows:
+                    yield f'{current_app.json.dumps(row)}\n'
+            finally:
+                # The rows are fetched after the view has returned, and so after ``close_thread_connection`` has
+                # closed the storage connection, which therefore has to be closed again.
+                get_manager().get_profile_storage().get_session().close()
+
+        response = Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+        if headers is not None:
+            for key, val in headers.items():
+                response.headers[key] = val
+
+        return response
+
     @staticmethod
     def build_datetime_filter(dtobj):
         """This function constructs a filter for a datetime object to be in a
@@ -469,11 +536,13 @@ class Utils:
         extras = None
         extras_filter = None
         full_type = None
+        cursor = None
         profile = None
 
         # io tree limit parameters
         tree_in_limit = None
         tree_out_limit = None
+        tree_depth = None
 
         ## Count how many time a key has been used for the filters
         # and check if reserved keyword have been used twice
@@ -513,6 +582,8 @@ class Utils:
             raise RestInputValidationError('You cannot specify in_limit more than once')
         if 'out_limit' in field_counts and field_counts['out_limit'] > 1:
             raise RestInputValidationError('You cannot specify out_limit more than once')
+        if 'depth' in field_counts and field_counts['depth'] > 1:
+            raise RestInputValidationError('You cannot specify depth more than once')
         if 'attributes' in field_counts and field_counts['attributes'] > 1:
             raise RestInputValidationError('You cannot specify attributes more than once')
         if 'attributes_filter' in field_counts and field_counts['attributes_filter'] > 1:
@@ -523,6 +594,8 @@ class Utils:
             raise RestInputValidationError('You cannot specify extras_filter more than once')
         if 'full_type' in field_counts and field_counts['full_type'] > 1:
             raise RestInputValidationError('You cannot specify full_type more than once')
+        if 'cursor' in field_counts and field_counts['cursor'] > 1:
+            raise RestInputValidationError('You cannot specify cursor more than once')
         if 'profile' in field_counts and field_counts['profile'] > 1:
             raise RestInputValidationError('You cannot specify profile more than once')
 
@@ -548,6 +621,11 @@ class Utils:
                     perpage = field[2]
                 else:
                     raise RestInputValidationError("only assignment operator '=' is permitted after 'perpage'")
+            elif field[0] == 'cursor':
+                if field[1] == '=':
+                    cursor = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'cursor'")
 
             elif field[0] == 'orderby':
                 if field[1] == '=':
@@ -596,6 +674,12 @@ class Utils:
                 else:
                     raise RestInputValidationError("only assignment operator '=' is permitted after 'out_limit'")
 
+            elif field[0] == 'depth':
+                if field[1] == '=':
+                    tree_depth = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'depth'")
+
             elif field[0] == 'attributes':
                 if field[1] == '=':
                     attributes = field[2]
@@ -656,11 +740,13 @@ class Utils:
             filename,
             tree_in_limit,
             tree_out_limit,
+            tree_depth,
             attributes,
             attributes_filter,
             extras,
             extras_filter,
             full_type,
+            cursor,
             profile,
         )
 
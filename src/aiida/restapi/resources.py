@@ -96,15 +96,17 @@ class BaseResource(Resource):
 
     _translator_class = BaseTranslator
     _parse_pk_uuid = None  # Flag to tell the path parser whether to expect a pk or a uuid pattern
+    _cache_responses = False  # Flag to cache the responses, only if the validity token of the cache captures changes
 
     method_decorators = [close_thread_connection]  # Close the thread's storage connection after any method call
 
-    ## TODO add the caching support. I cache total count, results, and possibly
-
     def __init__(self, profile, **kwargs):
         """Construct the resource."""
-        self.trans = self._translator_class(**kwargs)
+        # The validity token of the response cache only captures changes of nodes, see ``get_storage_token``
+        self.cache = kwargs.get('response_cache', None) if self._cache_responses else None
+        self.trans = self._translator_class(**{**kwargs, 'response_cache': self.cache})
         self.profile = profile
+        self.stream_batch_size = kwargs.get('STREAM_BATCH_SIZE', 100)
 
         # Configure utils
         utils_conf_keys = ('PREFIX', 'PERPAGE_DEFAULT', 'LIMIT_DEFAULT')
@@ -150,6 +152,46 @@ class BaseResource(Resource):
 
         return node
 
+    def get_cached_response(self):
+        """Return the cached response to the current request, if the storage did not change since it was cached.
+
+        The response is conditional, i.e., if the ``If-None-Match`` header of the request matches its ``ETag``, an empty
+        response with status 304 is returned instead.
+
+        :return: the response or ``None`` if it is not cached.
+        """
+        from aiida.restapi.common.cache import get_storage_token
+
+        if self.cache is None or not self.cache.enabled or self.utils.is_stream_requested():
+            return None
+
+        cached = self.cache.get(('response', request.url), get_storage_token())
+
+        if cached is None:
+            return None
+
+        body, headers = cached
+        return make_response(body, 200, headers).make_conditional(request)
+
+    def build_cached_response(self, headers, data):
+        """Build the response, tag it with an ``ETag`` and store it in the response cache.
+
+        :param headers: dictionary with the headers of the response.
+        :param data: dictionary with the data of the response.
+        :return: the response, which is conditional on the ``If-None-Match`` header of the request.
+        """
+        from aiida.restapi.common.cache import get_storage_token
+
+        response = self.utils.build_response(status=200, headers=headers, data=data)
+        response.add_etag()
+
+        if self.cache is not None and self.cache.enabled:
+            self.cache.set(
+                ('response', request.url), get_storage_token(), (response.get_data(), list(response.headers))
+            )
+
+        return response.make_conditional(request)
+
     def load_profile(self, profile=None):
         """Load the required profile.
 
@@ -177,6 +219,7 @@ class BaseResource(Resource):
         perpage = parameters[2]
         orderby = parameters[3]
         filters = parameters[4]
+        cursor = parameters[-2]
         profile = parameters[-1]
 
         try:
@@ -204,8 +247,14 @@ class BaseResource(Resource):
             page=page,
             query_type=query_type,
             is_querystring_defined=(bool(query_string)),
+            cursor=cursor,
+            orderby=orderby,
         )
 
+        response = self.get_cached_response()
+        if response is not None:
+            return response
+
         ## Treat the projectable_properties case which does not imply access to the DataBase
         if query_type == 'projectable_properties':
             ## Retrieve the projectable properties
@@ -218,6 +267,13 @@ class BaseResource(Resource):
             ## Set the query, and initialize qb object
             self.trans.set_query(filters=filters, orders=orderby, node_id=node_id)
 
+            ## Stream the results (if requested)
+            if page is None and self.utils.is_stream_requested():
+                if cursor is not None:
+                    self.trans.set_cursor(cursor)
+                self.trans.set_limit_offset(limit=limit, offset=offset, streaming=True)
+                return self.utils.build_stream_response(self.trans.iter_results(batch_size=self.stream_batch_size))
+
             ## Count results
             total_count = self.trans.get_total_count()
 
@@ -226,12 +282,20 @@ class BaseResource(Resource):
                 (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count)
                 self.trans.set_limit_offset(limit=limit, offset=offset)
                 headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
+
+                ## Retrieve results
+                results = self.trans.get_results()
             else:
+                if cursor is not None:
+                    self.trans.set_cursor(cursor)
                 self.trans.set_limit_offset(limit=limit, offset=offset)
-                headers = self.utils.build_headers(url=request.url, total_count=total_count)
 
-            ## Retrieve results
-            results = self.trans.get_results()
+                ## Retrieve results
+                results = self.trans.get_results()
+
+                headers = self.utils.build_headers(
+                    url=request.url, total_count=total_count, next_cursor=self.trans.get_next_cursor(results)
+                )
 
         ## Build response and return it
         data = dict(
@@ -245,7 +309,7 @@ class BaseResource(Resource):
             data=results,
         )
 
-        return self.utils.build_response(status=200, headers=headers, data=data)
+        return self.build_cached_response(headers=headers, data=data)
 
 
 class QueryBuilder(BaseResource):
@@ -352,6 +416,22 @@ class QueryBuilder(BaseResource):
 
         self.trans.init_qb()
 
+        if self.utils.is_stream_requested():
+            if empty_projections_counter == number_projections:
+                tags = [self.trans.__label__]
+            else:
+                tags = [tag for tag in self.trans._query_help['project'] if tag not in skip_tags]
+
+            def iter_rows():
+                for row in self.trans.iter_formatted_result(tags, batch_size=self.stream_batch_size):
+                    # Remove 'full_type's when they're `None`
+                    for entity in row.values():
+                        if entity.get('full_type') is None:
+                            entity.pop('full_type', None)
+                    yield row
+
+            return self.utils.build_stream_response(iter_rows())
+
         data = {}
         if self.trans.get_total_count():
             if empty_projections_counter == number_projections:
@@ -399,6 +479,24 @@ class Node(BaseResource):
 
     _translator_class = NodeTranslator
     _parse_pk_uuid = 'uuid'  # Parse a uuid pattern in the URL path (not a pk)
+    _cache_responses = True
+
+    @staticmethod
+    def nest_filtered_projections(node, attributes_filter=None, extras_filter=None):
+        """Nest the ``attributes.<name>`` and ``extras.<name>`` projections of a node under a single key.
+
+        :param node: dictionary with the projections of a node, which is modified in place
+        :param attributes_filter: name or list of names of the projected attributes
+        :param extras_filter: name or list of names of the projected extras
+        """
+        for key, names in (('attributes', attributes_filter), ('extras', extras_filter)):
+            if names is None:
+                continue
+            if not isinstance(names, list):
+                names = [names]  # noqa: PLW2901
+            node[key] = {}
+            for name in names:
+                node[key][str(name)] = node.pop(f'{key}.{name!s}')
 
     def get(self, id=None, page=None):
         """Get method for the Node resource.
@@ -420,11 +518,13 @@ class Node(BaseResource):
             filename,
             tree_in_limit,
             tree_out_limit,
+            tree_depth,
             attributes,
             attributes_filter,
             extras,
             extras_filter,
             full_type,
+            cursor,
             profile,
         ) = self.parse_query_string(query_string)
 
@@ -453,8 +553,18 @@ class Node(BaseResource):
             page=page,
             query_type=query_type,
             is_querystring_defined=(bool(query_string)),
+            cursor=cursor,
+            orderby=orderby,
         )
 
+        # Comments are not nodes, so their changes are not captured by the validity token of the response cache
+        if query_type == 'comments':
+            self.cache = self.trans.cache = None
+
+        response = self.get_cached_response()
+        if response is not None:
+            return response
+
         ## Treat the projectable properties case which does not imply access to the DataBase
         if query_type == 'projectable_properties':
             ## Retrieve the projectable properties
@@ -490,6 +600,10 @@ class Node(BaseResource):
             headers = self.utils.build_headers(url=request.url, total_count=0)
             results = self.trans.get_io_tree(node_id, tree_in_limit, tree_out_limit)
 
+        elif query_type == 'provenance':
+            headers = self.utils.build_headers(url=request.url, total_count=0)
+            results = self.trans.get_provenance(node_id, tree_depth, tree_in_limit, tree_out_limit)
+
         elif node_id is None and query_type == 'download_formats':
             headers = self.utils.build_headers(url=request.url, total_count=0)
             results = self.trans.get_all_download_formats(full_type)
@@ -511,6 +625,24 @@ class Node(BaseResource):
                 full_type=full_type,
             )
 
+            ## Stream the results (if requested)
+            if page is None and query_type in ('default', 'incoming', 'outgoing') and self.utils.is_stream_requested():
+                if cursor is not None:
+                    self.trans.set_cursor(cursor)
+                self.trans.set_limit_offset(limit=limit, offset=offset, streaming=True)
+
+                def iter_nodes():
+                    for row in self.trans.iter_results(batch_size=self.stream_batch_size):
+                        if 'nodes' in row:
+                            self.nest_filtered_projections(
+                                row['nodes'],
+                                attributes_filter=attributes_filter if attributes else None,
+                                extras_filter=extras_filter if extras else None,
+                            )
+                        yield row
+
+                return self.utils.build_stream_response(iter_nodes())
+
             ## Count results
             total_count = self.trans.get_total_count()
 
@@ -524,6 +656,8 @@ class Node(BaseResource):
 
                 headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
             else:
+                if cursor is not None:
+                    self.trans.set_cursor(cursor)
                 self.trans.set_limit_offset(limit=limit, offset=offset)
                 ## Retrieve results
                 results = self.trans.get_results()
@@ -546,25 +680,17 @@ class Node(BaseResource):
 
                     results = results['download']['data']
 
-                headers = self.utils.build_headers(url=request.url, total_count=total_count)
+                headers = self.utils.build_headers(
+                    url=request.url, total_count=total_count, next_cursor=self.trans.get_next_cursor(results)
+                )
 
-            if attributes_filter is not None and attributes:
+            if (attributes_filter is not None and attributes) or (extras_filter is not None and extras):
                 for node in results['nodes']:
-                    node['attributes'] = {}
-                    if not isinstance(attributes_filter, list):
-                        attributes_filter = [attributes_filter]
-                    for attr in attributes_filter:
-                        node['attributes'][str(attr)] = node[f'attributes.{attr!s}']
-                        del node[f'attributes.{attr!s}']
-
-            if extras_filter is not None and extras:
-                for node in results['nodes']:
-                    node['extras'] = {}
-                    if not isinstance(extras_filter, list):
-                        extras_filter = [extras_filter]
-                    for extra in extras_filter:
-                        node['extras'][str(extra)] = node[f'extras.{extra!s}']
-                        del node[f'extras.{extra!s}']
+                    self.nest_filtered_projections(
+                        node,
+                        attributes_filter=attributes_filter if attributes else None,
+                        extras_filter=extras_filter if extras else None,
+                    )
 
         ## Build response
         data = dict(
@@ -578,7 +704,7 @@ class Node(BaseResource):
             data=results,
         )
 
-        return self.utils.build_response(status=200, headers=headers, data=data)
+        return self.build_cached_response(headers=headers, data=data)
 
 
 class Computer(BaseResource):
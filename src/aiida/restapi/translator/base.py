@@ -36,6 +36,8 @@ class BaseTranslator:
     _is_qb_initialized = False
     _is_id_query = None
     _total_count = None
+    _limit = None
+    _offset = None
 
     def __init__(self, **kwargs):
         """Initialise the parameters.
@@ -64,6 +66,9 @@ class BaseTranslator:
         self.limit_default = kwargs['LIMIT_DEFAULT']
         self.schema = None
 
+        # in-process cache shared by all the resources of the API, used to reuse the total counts of the queries
+        self.cache = kwargs.get('response_cache', None)
+
     def __repr__(self):
         """This function is required for the caching system to be able to compare
         two NodeTranslator objects. Comparison is done on the value returned by __repr__
@@ -89,24 +94,31 @@ class BaseTranslator:
         self._is_qb_initialized = True
 
     def count(self):
-        """Count the number of rows returned by the query and set total_count"""
-        if self._is_qb_initialized:
-            self._total_count = self.qbobj.count()
-        else:
+        """Count the number of rows returned by the query and set total_count
+
+        If a response cache is configured, the count is reused as long as the storage has not changed, since a
+        ``COUNT`` has to visit every row matched by the query.
+        """
+        if not self._is_qb_initialized:
             raise InvalidOperation('query builder object has not been initialized.')
 
-            # def caching_method(self):
-            #     """
-            #     class method for caching. It is a wrapper of the
-            # flask_cache memoize
-            #     method. To be used as a decorator
-            #     :return: the flask_cache memoize method with the timeout kwarg
-            #     corrispondent to the class
-            #     """
-            #     return cache.memoize()
-            #
+        if self.cache is None or not self.cache.enabled:
+            self._total_count = self.qbobj.count()
+            return
+
+        import json
+
+        from aiida.restapi.common.cache import get_storage_token
+
+        key = ('count', json.dumps(self.qbobj.as_dict(), sort_keys=True, default=str))
+        token = get_storage_token()
+        total_count = self.cache.get(key, token)
+
+        if total_count is None:
+            total_count = self.qbobj.count()
+            self.cache.set(key, token, total_count)
 
-            #    @cache.memoize(timeout=CACHING_TIMEOUTS[self.__label__])
+        self._total_count = total_count
 
     def get_total_count(self):
         """Returns the number of rows of the query.
@@ -329,11 +341,13 @@ class BaseTranslator:
         """:return: return QB json dictionary"""
         return self._query_help
 
-    def set_limit_offset(self, limit=None, offset=None):
+    def set_limit_offset(self, limit=None, offset=None, streaming=False):
         """Sets limits and offset directly to the query_builder object
 
         :param limit:
         :param offset:
+        :param streaming: if True, the results are streamed and therefore neither limited by default nor is the limit
+            bounded by the default limit
         :return:
         """
         ## mandatory params
@@ -345,9 +359,9 @@ class BaseTranslator:
                 limit = int(limit)
             except ValueError:
                 raise InputValidationError('Limit value must be an integer')
-            if limit > self.limit_default:
+            if limit > self.limit_default and not streaming:
                 raise RestValidationError(f'Limit and perpage cannot be bigger than {self.limit_default}')
-        else:
+        elif not streaming:
             limit = self.limit_default
 
         if offset is not None:
@@ -356,6 +370,9 @@ class BaseTranslator:
             except ValueError:
                 raise InputValidationError('Offset value must be an integer')
 
+        self._limit = limit
+        self._offset = offset
+
         if self._is_qb_initialized:
             if limit is not None:
                 self.qbobj.limit(limit)
@@ -368,6 +385,98 @@ class BaseTranslator:
         else:
             raise InvalidOperation('query builder object has not been initialized.')
 
+    def get_keyset_order(self):
+        """Return the direction of the keyset order of the results, if they are ordered by ``id`` only.
+
+        :return: 'asc' or 'desc', or ``None`` if the results are ordered by any other property.
+        """
+        order = self._query_help['order_by'].get(self._result_type, {})
+
+        if list(order) != [PK_DBSYNONYM]:
+            return None
+
+        # the query builder normalises the specification of the order in place to ``{'order': 'asc'}``
+        direction = order[PK_DBSYNONYM]
+        return direction['order'] if isinstance(direction, dict) else direction
+
+    def set_cursor(self, cursor):
+        """Restrict the query to the rows that follow ``cursor`` in the order of the results.
+
+        Contrary to an offset, which requires the database to walk through and discard all the preceding rows, the
+        cursor is resolved through the primary key index, such that the cost of a page does not depend on its depth.
+        It requires the results to be ordered by ``id`` only.
+
+        :param cursor: the ``id`` of the last row of the previous page.
+        """
+        try:
+            cursor = int(cursor)
+        except ValueError:
+            raise InputValidationError('cursor value must be an integer')
+
+        order = self.get_keyset_order()
+
+        if order is None:
+            raise RestValidationError('cursor pagination requires the results to be ordered by id only')
+
+        cursor_filter = {'>': cursor} if order == 'asc' else {'<': cursor}
+        tag_filters = self._query_help['filters'].setdefault(self._result_type, {})
+
+        if PK_DBSYNONYM in tag_filters:
+            tag_filters[PK_DBSYNONYM] = {'and': [tag_filters[PK_DBSYNONYM], cursor_filter]}
+        else:
+            tag_filters[PK_DBSYNONYM] = cursor_filter
+
+        self.init_qb()
+
+    def get_next_cursor(self, results):
+        """Return the cursor of the page that follows ``results``.
+
+        :param results: the formatted results as returned by :meth:`get_results`.
+        :return: the ``id`` of the last row, or ``None`` if there are no further rows or the results are not paginated
+            by cursor, i.e. they are not ordered by ``id`` only or an offset was specified.
+        """
+        if self._limit is None or self._offset is not None or self.get_keyset_order() is None:
+            return None
+
+        if not isinstance(results, dict) or len(results) != 1:
+            return None
+
+        rows = next(iter(results.values()))
+
+        if not isinstance(rows, list) or not rows or len(rows) < self._limit:
+            return None
+
+        return rows[-1].get(PK_DBSYNONYM, None)
+
+    def get_result_name(self):
+        """Return the key under which the results are returned.
+
+        :return: 'incoming' or 'outgoing' for the links of a node, the label of the translator otherwise
+        """
+        # TODO think how to make it less hardcoded
+        if self._result_type == 'with_outgoing':
+            return 'incoming'
+        if self._result_type == 'with_incoming':
+            return 'outgoing'
+        return self.__label__
+
+    def format_result_row(self, row, label):
+        """Extract and format the entity tagged as "label" from a row of the query results.
+
+        :param row: a row of the query results, as returned by ``QueryBuilder.dict``
+        :param label: the tag of the entity to be extracted out of the row
+        :return: dictionary with the projections of the entity
+        """
+        result = row[label]
+
+        # Note: In code cleanup and design change, remove this node dependant part
+        # from base class and move it to node translator.
+        if self._result_type in ['with_outgoing', 'with_incoming']:
+            result['link_type'] = row[f'{self.__label__}--{label}']['type']
+            result['link_label'] = row[f'{self.__label__}--{label}']['label']
+
+        return result
+
     def get_formatted_result(self, label):
         """Runs the query and retrieves results tagged as "label".
 
@@ -382,24 +491,25 @@ class BaseTranslator:
         results = []
         if self._total_count > 0:
             for res in self.qbobj.dict():
-                tmp = res[label]
+                results.append(self.format_result_row(res, label))
 
-                # Note: In code cleanup and design change, remove this node dependant part
-                # from base class and move it to node translator.
-                if self._result_type in ['with_outgoing', 'with_incoming']:
-                    tmp['link_type'] = res[f'{self.__label__}--{label}']['type']
-                    tmp['link_label'] = res[f'{self.__label__}--{label}']['label']
-                results.append(tmp)
+        return {self.get_result_name(): results}
 
-        # TODO think how to make it less hardcoded
-        if self._result_type == 'with_outgoing':
-            result = {'incoming': results}
-        elif self._result_type == 'with_incoming':
-            result = {'outgoing': results}
-        else:
-            result = {self.__label__: results}
+    def iter_formatted_result(self, labels, batch_size=None):
+        """Runs the query and yields the results tagged as "labels" one row at a time.
 
-        return result
+        Contrary to :meth:`get_formatted_result`, the rows are fetched from the database in batches while iterating,
+        such that the memory needed does not depend on the number of results.
+
+        :param labels: the tags of the entities to be extracted out of the query rows
+        :param batch_size: the number of rows fetched from the database at once
+        :return: a generator of dictionaries with the formatted entity for each tag
+        """
+        if not self._is_qb_initialized:
+            raise InvalidOperation('query builder object has not been initialized.')
+
+        for row in self.qbobj.iterdict(batch_size=batch_size):
+            yield {label: self.format_result_row(row, label) for label in labels}
 
     def get_results(self):
         """Returns either list of nodes or details of single node from database.
@@ -419,6 +529,18 @@ class BaseTranslator:
         data = self.get_formatted_result(self._result_type)
         return data
 
+    def iter_results(self, batch_size=None):
+        """Returns a generator over the results, fetching them from the database in batches.
+
+        :param batch_size: the number of rows fetched from the database at once
+        :return: a generator of dictionaries, each one formatted as the return value of :meth:`get_results` for a
+            single row
+        """
+        result_name = self.get_result_name()
+
+        for row in self.iter_formatted_result([self._result_type], batch_size=batch_size):
+            yield {result_name: row[self._result_type]}
+
     def _check_id_validity(self, node_id):
         """Checks whether id corresponds to an object of the expected type,
         whenever type is a valid column of the database (ex. for nodes,
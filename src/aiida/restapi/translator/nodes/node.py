@@ -540,32 +540,23 @@ class NodeTranslator(BaseTranslator):
 
         return super().get_results()
 
-    def get_formatted_result(self, label):
-        """Runs the query and retrieves results tagged as "label".
+    def format_result_row(self, row, label):
+        """Extract and format the node tagged as "label" from a row of the query results.
 
-        :param label: the tag of the results to be extracted out of
-          the query rows.
-        :type label: str
-        :return: a list of the query results
+        :param row: a row of the query results, as returned by ``QueryBuilder.dict``
+        :param label: the tag of the node to be extracted out of the row
+        :return: dictionary with the projections of the node
         """
-        results = super().get_formatted_result(label)
+        node_entry = super().format_result_row(row, label)
 
-        if self._result_type == 'with_outgoing':
-            result_name = 'incoming'
-        elif self._result_type == 'with_incoming':
-            result_name = 'outgoing'
-        else:
-            result_name = self.__label__
-
-        for node_entry in results[result_name]:
-            # construct full_type and add it to every node
-            node_entry['full_type'] = (
-                construct_full_type(node_entry.get('node_type'), node_entry.get('process_type'))
-                if node_entry.get('node_type') or node_entry.get('process_type')
-                else None
-            )
+        # construct full_type and add it to every node
+        node_entry['full_type'] = (
+            construct_full_type(node_entry.get('node_type'), node_entry.get('process_type'))
+            if node_entry.get('node_type') or node_entry.get('process_type')
+            else None
+        )
 
-        return results
+        return node_entry
 
     def get_statistics(self, user_pk=None):
         """Return statistics for a given node"""
@@ -725,6 +716,116 @@ class NodeTranslator(BaseTranslator):
 
         return {'nodes': nodes, 'metadata': metadata}
 
+    def get_provenance(self, uuid_pattern, depth=None, in_limit=None, out_limit=None):
+        """Return the provenance graph within ``depth`` hops of a node.
+
+        The ancestors are followed through the incoming links and the descendants through the outgoing links. Each hop
+        in each direction is resolved by a query for the links of all the nodes reached by the previous hop, which only
+        projects the ids of the linked nodes, and a query for the columns of the nodes that are newly reached, such that
+        the number of queries depends on ``depth`` only. The links are ordered by the ids of the linked nodes, and are
+        capped per node while iterating over them. The size of the graph is bounded by the ``MAX_TREE_DEPTH``,
+        ``MAX_TREE_FAN_OUT`` and ``MAX_TREE_NODES`` settings of the configuration.
+
+        :param uuid_pattern: main node uuid
+        :param depth: number of hops, 1 by default
+        :param in_limit: maximum number of incoming links followed per node
+        :param out_limit: maximum number of outgoing links followed per node
+        :return: dictionary with the list of the nodes, where ``depth`` is negative for ancestors and positive for
+            descendants, the list of the links and metadata on the limits that were applied
+        """
+        from collections import Counter
+
+        from aiida.restapi.common.config import MAX_TREE_DEPTH, MAX_TREE_FAN_OUT, MAX_TREE_NODES
+
+        def validate_limit(value, name, default, maximum):
+            """Validate a limit of the query string against its maximum value."""
+            if value is None:
+                return default
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise RestInputValidationError(f'{name} has to be a positive integer')
+            if value > maximum:
+                raise RestValidationError(f'{name} cannot be bigger than {maximum}')
+            return value
+
+        depth = validate_limit(depth, 'depth', 1, MAX_TREE_DEPTH)
+        in_limit = validate_limit(in_limit, 'in_limit', MAX_TREE_FAN_OUT, MAX_TREE_FAN_OUT)
+        out_limit = validate_limit(out_limit, 'out_limit', MAX_TREE_FAN_OUT, MAX_TREE_FAN_OUT)
+
+        # Check whether uuid_pattern identifies a unique node
+        self._check_id_validity(uuid_pattern)
+
+        projections = ['id', 'uuid', 'node_type', 'process_type', 'label', 'ctime', 'mtime']
+
+        def format_node(node, node_depth):
+            """Add the full type and the depth to the projections of a node."""
+            node['full_type'] = construct_full_type(node['node_type'], node['process_type'])
+            node['depth'] = node_depth
+            return node
+
+        builder = orm.QueryBuilder().append(Node, tag='main', project=projections, filters=self._id_filter)
+        main_node = format_node(builder.dict()[0]['main'], 0)
+        nodes = {main_node['id']: main_node}
+        links = []
+        truncated = False
+
+        for direction, relationship, fan_out in (
+            ('incoming', 'with_outgoing', in_limit),
+            ('outgoing', 'with_incoming', out_limit),
+        ):
+            frontier = [main_node['id']]
+
+            for hop in range(1, depth + 1):
+                if not frontier:
+                    break
+
+                builder = orm.QueryBuilder()
+                builder.append(Node, tag='main', project=['id'], filters={'id': {'in': frontier}})
+                builder.append(
+                    Node, tag='neighbour', project=['id'], edge_project=['label', 'type'], **{relationship: 'main'}
+                )
+                builder.order_by([{'main': 'id'}, {'neighbour': 'id'}])
+
+                frontier = []
+                reached = set()
+                links_per_node = Counter()
+
+                for row in builder.iterdict():
+                    main_pk = row['main']['id']
+                    neighbour_pk = row['neighbour']['id']
+
+                    if links_per_node[main_pk] == fan_out:
+                        truncated = True
+                        continue
+
+                    if neighbour_pk not in nodes and neighbour_pk not in reached:
+                        if len(nodes) + len(reached) == MAX_TREE_NODES:
+                            truncated = True
+                            continue
+                        frontier.append(neighbour_pk)
+                        reached.add(neighbour_pk)
+
+                    links_per_node[main_pk] += 1
+                    link = (neighbour_pk, main_pk) if direction == 'incoming' else (main_pk, neighbour_pk)
+                    links.append(
+                        {
+                            'source': link[0],
+                            'target': link[1],
+                            'link_label': row['main--neighbour']['label'],
+                            'link_type': row['main--neighbour']['type'],
+                        }
+                    )
+
+                if frontier:
+                    builder = orm.QueryBuilder()
+                    builder.append(Node, tag='neighbour', project=projections, filters={'id': {'in': frontier}})
+                    neighbours = {row['neighbour']['id']: row['neighbour'] for row in builder.iterdict()}
+                    for pk in frontier:
+                        nodes[pk] = format_node(neighbours[pk], -hop if direction == 'incoming' else hop)
+
+        metadata = {'depth': depth, 'in_limit': in_limit, 'out_limit': out_limit, 'truncated': truncated}
+
+        return {'nodes': list(nodes.values()), 'links': links, 'metadata': metadata}
+
     def get_projectable_properties(self):
         """Get projectable properties specific for Node
         :return: dict of projectable properties and column_order list
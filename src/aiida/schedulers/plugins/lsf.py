@@ -10,6 +10,8 @@
 This has been tested on the CERN lxplus cluster (LSF 9.1.3)
 """
 
+import functools
+
 import aiida.schedulers
 from aiida.common.escaping import escape_for_bash
 from aiida.common.extendeddicts import AttributeDict
@@ -479,7 +481,10 @@ fi
 
         return submit_command
 
-    def _parse_joblist_output(self, retval, stdout, stderr):
+    def _parse_joblist_output_for_jobs(self, retval, stdout, stderr, job_ids):
+        return self._parse_joblist_output(retval, stdout, stderr, job_ids=job_ids)
+
+    def _parse_joblist_output(self, retval, stdout, stderr, job_ids=None):
         """Parse the queue output string, as returned by executing the
         command returned by _get_joblist_command command,
         that is here implemented as a list of lines, one for each
@@ -494,6 +499,8 @@ fi
             This function will only return one element for each job find
             in the qstat output; missing jobs (for whatever reason) simply
             will not appear here.
+
+        :param job_ids: optional set of job ids, the other jobs are skipped before their fields are parsed.
         """
         num_fields = len(self._joblist_fields)
 
@@ -514,6 +521,9 @@ fi
             line.split(_FIELD_SEPARATOR, num_fields) for line in stdout.splitlines() if _FIELD_SEPARATOR in line
         ]
 
+        # The same time strings typically occur for many jobs, so their conversion is cached for this output
+        parse_time_string = functools.lru_cache(maxsize=None)(self._parse_time_string)
+
         # Create dictionary and parse specific fields
         job_list = []
         for job in jobdata_raw:
@@ -524,6 +534,9 @@ fi
                 self.logger.error(f"Wrong line length in squeue output! '{job}'")
                 continue
 
+            if job_ids is not None and job[0] not in job_ids:
+                continue
+
             this_job = JobInfo()
             this_job.job_id = job[0]
             this_job.annotation = job[2]
@@ -563,19 +576,25 @@ fi
             ) = job
 
             this_job.job_owner = username
-            try:
-                this_job.num_machines = int(number_nodes)
-            except ValueError:
-                self.logger.warning(
-                    f'The number of allocated nodes is not an integer ({number_nodes}) for job id {this_job.job_id}!'
-                )
 
-            try:
-                this_job.num_mpiprocs = int(number_cpus)
-            except ValueError:
-                self.logger.warning(
-                    f'The number of allocated cores is not an integer ({number_cpus}) for job id {this_job.job_id}!'
-                )
+            # A dash means that the value is not available, e.g. because the job is not yet running
+            if number_nodes != '-':
+                try:
+                    this_job.num_machines = int(number_nodes)
+                except ValueError:
+                    self.logger.warning(
+                        f'The number of allocated nodes is not an integer ({number_nodes}) '
+                        f'for job id {this_job.job_id}!'
+                    )
+
+            if number_cpus != '-':
+                try:
+                    this_job.num_mpiprocs = int(number_cpus)
+                except ValueError:
+                    self.logger.warning(
+                        f'The number of allocated cores is not an integer ({number_cpus}) '
+                        f'for job id {this_job.job_id}!'
+                    )
 
             # ALLOCATED NODES HERE
             # string may be in the format
@@ -588,9 +607,9 @@ fi
 
             this_job.queue_name = partition
 
-            psd_finish_time = self._parse_time_string(finish_time, fmt='%b %d %H:%M')
-            psd_start_time = self._parse_time_string(start_time, fmt='%b %d %H:%M')
-            psd_submission_time = self._parse_time_string(submission_time, fmt='%b %d %H:%M')
+            psd_finish_time = parse_time_string(finish_time, fmt='%b %d %H:%M')
+            psd_start_time = parse_time_string(start_time, fmt='%b %d %H:%M')
+            psd_submission_time = parse_time_string(submission_time, fmt='%b %d %H:%M')
 
             # Now get the time in seconds which has been used
             # Only if it is RUNNING; otherwise it is not meaningful,
@@ -8,6 +8,7 @@
 ###########################################################################
 """Base classes for PBSPro and PBS/Torque plugins."""
 
+import functools
 import logging
 
 from aiida.common.escaping import escape_for_bash
@@ -311,7 +312,10 @@ class PbsBaseClass(Scheduler):
 
         return submit_command
 
-    def _parse_joblist_output(self, retval, stdout, stderr):
+    def _parse_joblist_output_for_jobs(self, retval, stdout, stderr, job_ids):
+        return self._parse_joblist_output(retval, stdout, stderr, job_ids=job_ids)
+
+    def _parse_joblist_output(self, retval, stdout, stderr, job_ids=None):
         """Parse the queue output string, as returned by executing the
         command returned by _get_joblist_command command (qstat -f).
 
@@ -323,6 +327,8 @@ class PbsBaseClass(Scheduler):
             This function will only return one element for each job find
             in the qstat output; missing jobs (for whatever reason) simply
             will not appear here.
+
+        :param job_ids: optional set of job ids, the other jobs are skipped before their fields are parsed.
         """
         # I don't raise because if I pass a list of jobs, I get a non-zero status
         # if one of the job is not in the list anymore
@@ -390,9 +396,16 @@ class PbsBaseClass(Scheduler):
                     jobdata_raw[-1]['lines'][-1] += f'\n{line}'
                     jobdata_raw[-1]['warning_lines_idx'].append(len(jobdata_raw[-1]['lines']) - 1)
 
+        # The same time strings typically occur for many jobs, so their conversion is cached for this output
+        convert_time = functools.lru_cache(maxsize=None)(self._convert_time)
+        parse_time_string = functools.lru_cache(maxsize=None)(self._parse_time_string)
+
         # Create dictionary and parse specific fields
         job_list = []
         for job in jobdata_raw:
+            if job_ids is not None and job['id'] not in job_ids:
+                continue
+
             this_job = JobInfo()
             this_job.job_id = job['id']
 
@@ -404,9 +417,7 @@ class PbsBaseClass(Scheduler):
                 _LOGGER.error(f'There are lines without equals sign! {lines_without_equals_sign}')
                 raise SchedulerParsingError('There are lines without equals sign.')
 
-            raw_data = {
-                i.split('=', 1)[0].strip().lower(): i.split('=', 1)[1].lstrip() for i in job['lines'] if '=' in i
-            }
+            raw_data = {key.strip().lower(): value.lstrip() for key, value in (i.split('=', 1) for i in job['lines'])}
 
             ## I ignore the errors for the time being - this seems to be
             ## a problem if there are \n in the content of some variables?
@@ -550,14 +561,14 @@ class PbsBaseClass(Scheduler):
                 _LOGGER.debug(f"No 'queue' field for job id {this_job.job_id}")
 
             try:
-                this_job.requested_wallclock_time = self._convert_time(raw_data['resource_list.walltime'])
+                this_job.requested_wallclock_time = convert_time(raw_data['resource_list.walltime'])
             except KeyError:
                 _LOGGER.debug(f"No 'resource_list.walltime' field for job id {this_job.job_id}")
             except ValueError:
                 _LOGGER.warning(f"Error parsing 'resource_list.walltime' for job id {this_job.job_id}")
 
             try:
-                this_job.wallclock_time_seconds = self._convert_time(raw_data['resources_used.walltime'])
+                this_job.wallclock_time_seconds = convert_time(raw_data['resources_used.walltime'])
             except KeyError:
                 # May not have started yet
                 pass
@@ -565,7 +576,7 @@ class PbsBaseClass(Scheduler):
                 _LOGGER.warning(f"Error parsing 'resources_used.walltime' for job id {this_job.job_id}")
 
             try:
-                this_job.cpu_time = self._convert_time(raw_data['resources_used.cput'])
+                this_job.cpu_time = convert_time(raw_data['resources_used.cput'])
             except KeyError:
                 # May not have started yet
                 pass
@@ -582,14 +593,14 @@ class PbsBaseClass(Scheduler):
             #        queued state while residing in an execution queue.
 
             try:
-                this_job.submission_time = self._parse_time_string(raw_data['ctime'])
+                this_job.submission_time = parse_time_string(raw_data['ctime'])
             except KeyError:
                 _LOGGER.debug(f"No 'ctime' field for job id {this_job.job_id}")
             except ValueError:
                 _LOGGER.warning(f"Error parsing 'ctime' for job id {this_job.job_id}")
 
             try:
-                this_job.dispatch_time = self._parse_time_string(raw_data['stime'])
+                this_job.dispatch_time = parse_time_string(raw_data['stime'])
             except KeyError:
                 # The job may not have been started yet
                 pass
@@ -276,7 +276,14 @@ class SgeScheduler(aiida.schedulers.Scheduler):
 
         return submit_command
 
-    def _parse_joblist_output(self, retval, stdout, stderr):
+    def _parse_joblist_output_for_jobs(self, retval, stdout, stderr, job_ids):
+        return self._parse_joblist_output(retval, stdout, stderr, job_ids=job_ids)
+
+    def _parse_joblist_output(self, retval, stdout, stderr, job_ids=None):
+        """Parse the XML output of ``qstat``.
+
+        :param job_ids: optional set of job ids, the other jobs are skipped before their fields are parsed.
+        """
         if retval != 0:
             self.logger.error(f'Error in _parse_joblist_output: retval={retval}; stdout={stdout}; stderr={stderr}')
             raise SchedulerError(f'Error during joblist retrieval, retval={retval}')
@@ -325,13 +332,16 @@ class SgeScheduler(aiida.schedulers.Scheduler):
         for job in jobs:
             this_job = JobInfo()
 
-            # In case the user needs more information the xml-data for
-            # each job is stored:
-            this_job.raw_data = job.toxml()
+            # Index the child elements of the job by tag name in a single pass, instead of searching for each field
+            elements = {}
+            for element in job.childNodes:
+                if element.nodeType == element.ELEMENT_NODE:
+                    elements.setdefault(element.tagName, []).append(element)
 
             try:
-                job_element = job.getElementsByTagName('JB_job_number').pop(0)
-                element_child = job_element.childNodes.pop(0)
+                job_element = elements.get('JB_job_number', []).pop(0)
+                # Do not pop the child, such that it is still included in the ``raw_data`` that is stored below
+                element_child = job_element.childNodes[0]
                 this_job.job_id = str(element_child.data).strip()
                 if not this_job.job_id:
                     raise SchedulerError
@@ -342,8 +352,15 @@ class SgeScheduler(aiida.schedulers.Scheduler):
                 self.logger.error(f"No 'job_number' given for job index {jobs.index(job)} in job list, stdout={stdout}")
                 raise IndexError('Error in sge._parse_joblist_output: no job id is given')
 
+            if job_ids is not None and this_job.job_id not in job_ids:
+                continue
+
+            # In case the user needs more information the xml-data for
+            # each job is stored:
+            this_job.raw_data = job.toxml()
+
             try:
-                job_element = job.getElementsByTagName('state').pop(0)
+                job_element = elements.get('state', []).pop(0)
                 element_child = job_element.childNodes.pop(0)
                 job_state_string = str(element_child.data).strip()
                 try:
@@ -356,21 +373,21 @@ class SgeScheduler(aiida.schedulers.Scheduler):
                 this_job.job_state = JobState.UNDETERMINED
 
             try:
-                job_element = job.getElementsByTagName('JB_owner').pop(0)
+                job_element = elements.get('JB_owner', []).pop(0)
                 element_child = job_element.childNodes.pop(0)
                 this_job.job_owner = str(element_child.data).strip()
             except IndexError:
                 self.logger.warning(f"No 'job_owner' field for job id {this_job.job_id}")
 
             try:
-                job_element = job.getElementsByTagName('JB_name').pop(0)
+                job_element = elements.get('JB_name', []).pop(0)
                 element_child = job_element.childNodes.pop(0)
                 this_job.title = str(element_child.data).strip()
             except IndexError:
                 self.logger.warning(f"No 'title' field for job id {this_job.job_id}")
 
             try:
-                job_element = job.getElementsByTagName('queue_name').pop(0)
+                job_element = elements.get('queue_name', []).pop(0)
                 element_child = job_element.childNodes.pop(0)
                 this_job.queue_name = str(element_child.data).strip()
             except IndexError:
@@ -378,7 +395,7 @@ class SgeScheduler(aiida.schedulers.Scheduler):
                     self.logger.warning(f"No 'queue_name' field for job id {this_job.job_id}")
 
             try:
-                job_element = job.getElementsByTagName('JB_submission_time').pop(0)
+                job_element = elements.get('JB_submission_time', []).pop(0)
                 element_child = job_element.childNodes.pop(0)
                 time_string = str(element_child.data).strip()
                 try:
@@ -389,7 +406,7 @@ class SgeScheduler(aiida.schedulers.Scheduler):
                     )
             except IndexError:
                 try:
-                    job_element = job.getElementsByTagName('JAT_start_time').pop(0)
+                    job_element = elements.get('JAT_start_time', []).pop(0)
                     element_child = job_element.childNodes.pop(0)
                     time_string = str(element_child.data).strip()
                     try:
@@ -406,7 +423,7 @@ class SgeScheduler(aiida.schedulers.Scheduler):
             # There is also cpu_usage, mem_usage, io_usage information available:
             if this_job.job_state == JobState.RUNNING:
                 try:
-                    job_element = job.getElementsByTagName('slots').pop(0)
+                    job_element = elements.get('slots', []).pop(0)
                     element_child = job_element.childNodes.pop(0)
                     this_job.num_mpiprocs = str(element_child.data).strip()
                 except IndexError:
@@ -443,6 +460,13 @@ class SgeScheduler(aiida.schedulers.Scheduler):
         import datetime
         import time
 
+        # Fast path for the standard format, which is considerably cheaper than ``time.strptime``
+        if fmt == '%Y-%m-%dT%H:%M:%S' and len(string) == 19 and string[10] == 'T':
+            try:
+                return datetime.datetime.fromisoformat(string)
+            except ValueError:
+                pass
+
         try:
             time_struct = time.strptime(string, fmt)
         except Exception as exc:
@@ -10,6 +10,7 @@
 This has been tested on SLURM 14.03.7 on the CSCS.ch machines.
 """
 
+import functools
 import re
 
 from aiida.common.lang import type_check
@@ -52,6 +53,27 @@ _MAP_STATUS_SLURM = {
     'TO': JobState.DONE,
 }
 
+# This maps the job states reported by ``sacct`` (in their long form) to our own status list. Since ``sacct`` also
+# reports jobs that have terminated, all terminal states map to ``JobState.DONE``.
+_MAP_STATUS_SACCT = {
+    'BOOT_FAIL': JobState.DONE,
+    'CANCELLED': JobState.DONE,
+    'COMPLETED': JobState.DONE,
+    'COMPLETING': JobState.RUNNING,
+    'DEADLINE': JobState.DONE,
+    'FAILED': JobState.DONE,
+    'NODE_FAIL': JobState.DONE,
+    'OUT_OF_MEMORY': JobState.DONE,
+    'PENDING': JobState.QUEUED,
+    'PREEMPTED': JobState.DONE,
+    'REQUEUED': JobState.QUEUED,
+    'RESIZING': JobState.RUNNING,
+    'REVOKED': JobState.DONE,
+    'RUNNING': JobState.RUNNING,
+    'SUSPENDED': JobState.SUSPENDED,
+    'TIMEOUT': JobState.DONE,
+}
+
 # From the manual,
 # possible lines are:
 # salloc: Granted job allocation 65537
@@ -149,6 +171,7 @@ class SlurmScheduler(Scheduler):
     # Query only by list of jobs and not by user
     _features = {
         'can_query_by_user': False,
+        'can_query_changes': True,
     }
 
     # The class to be used for the job resource.
@@ -175,6 +198,23 @@ class SlurmScheduler(Scheduler):
         # 14.03.7 and later
     ]
 
+    # Fields to query or to parse with ``sacct`` for the incremental job list. The job name should be the last field,
+    # since it is the only one that can contain the separator.
+    sacct_fields = [
+        'JobIDRaw',  # job id
+        'State',  # job state, followed by additional information, e.g. ``CANCELLED by 1000``
+        'User',  # username
+        'NNodes',  # number of nodes allocated, or requested if still pending
+        'NCPUS',  # number of allocated cores, or requested if still pending
+        'NodeList',  # list of allocated nodes, or ``None assigned`` if still pending
+        'Partition',  # partition (queue) of the job
+        'Timelimit',  # time limit in days-hours:minutes:seconds
+        'Elapsed',  # time used by the job in days-hours:minutes:seconds
+        'Start',  # actual or expected dispatch time (start time)
+        'Submit',  # submission time
+        'JobName',  # job name (title)
+    ]
+
     def _get_joblist_command(self, jobs=None, user=None):
         """The command to report full information on existing jobs.
 
@@ -228,6 +268,45 @@ class SlurmScheduler(Scheduler):
         self.logger.debug(f'squeue command: {comm}')
         return comm
 
+    def _get_joblist_changes_command(self, interval, jobs=None, user=None):
+        """Return the command to report the jobs whose state may have changed in the last ``interval`` seconds.
+
+        This queries the accounting database with ``sacct`` instead of the controller with ``squeue``, and selects the
+        jobs that have been eligible, running or terminated since ``interval`` seconds before the current time of the
+        remote machine. Job steps are excluded through ``--allocations``.
+        """
+        import math
+
+        from aiida.common.exceptions import FeatureNotAvailable
+
+        if user and jobs:
+            raise FeatureNotAvailable('Cannot query by user and job(s) in SLURM')
+
+        command = [
+            "SLURM_TIME_FORMAT='standard'",
+            'sacct',
+            '--noheader',
+            '--parsable2',
+            '--allocations',
+            f'--starttime=now-{math.ceil(interval)}',
+            f"--format={','.join(self.sacct_fields)}",
+        ]
+
+        if user:
+            command.append(f'--user={user}')
+
+        if jobs:
+            if isinstance(jobs, str):
+                jobs = [jobs]
+            elif not isinstance(jobs, (tuple, list)):
+                raise TypeError("If provided, the 'jobs' variable must be a string or a list of strings")
+
+            command.append(f"--jobs={','.join(jobs)}")
+
+        comm = ' '.join(command)
+        self.logger.debug(f'sacct command: {comm}')
+        return comm
+
     def _get_detailed_job_info_command(self, job_id):
         """Return the command to run to get the detailed information on a job,
         even after the job has finished.
@@ -477,10 +556,15 @@ stderr='{stderr.strip()}'"""
             line.split(_FIELD_SEPARATOR, num_fields) for line in stdout.splitlines() if _FIELD_SEPARATOR in line
         ]
 
+        # The same time strings typically occur for many jobs, so their conversion is cached for this output
+        convert_time = functools.lru_cache(maxsize=None)(self._convert_time)
+        parse_time_string = functools.lru_cache(maxsize=None)(self._parse_time_string)
+        field_names = [field[1] for field in self.fields]
+
         # Create dictionary and parse specific fields
         job_list = []
         for job in jobdata_raw:
-            thisjob_dict = {k[1]: v for k, v in zip(self.fields, job)}
+            thisjob_dict = dict(zip(field_names, job))
 
             this_job = JobInfo()
             try:
@@ -567,32 +651,32 @@ stderr='{stderr.strip()}'"""
             # therefore it requires some parsing, that is unnecessary now.
             # I just store is as a raw string for the moment, and I leave
             # this_job.allocated_machines undefined
-            if this_job.job_state == JobState.RUNNING:
+            if job_state_string == JobState.RUNNING:
                 this_job.allocated_machines_raw = thisjob_dict['allocated_machines']
 
             this_job.queue_name = thisjob_dict['partition']
 
             try:
-                walltime = self._convert_time(thisjob_dict['time_limit'])
+                walltime = convert_time(thisjob_dict['time_limit'])
                 this_job.requested_wallclock_time_seconds = walltime
             except ValueError:
                 self.logger.warning(f'Error parsing the time limit for job id {this_job.job_id}')
 
             # Only if it is RUNNING; otherwise it is not meaningful,
             # and may be not set (in my test, it is set to zero)
-            if this_job.job_state == JobState.RUNNING:
+            if job_state_string == JobState.RUNNING:
                 try:
-                    this_job.wallclock_time_seconds = self._convert_time(thisjob_dict['time_used'])
+                    this_job.wallclock_time_seconds = convert_time(thisjob_dict['time_used'])
                 except ValueError:
                     self.logger.warning(f'Error parsing time_used for job id {this_job.job_id}')
 
                 try:
-                    this_job.dispatch_time = self._parse_time_string(thisjob_dict['dispatch_time'])
+                    this_job.dispatch_time = parse_time_string(thisjob_dict['dispatch_time'])
                 except ValueError:
                     self.logger.warning(f'Error parsing dispatch_time for job id {this_job.job_id}')
 
             try:
-                this_job.submission_time = self._parse_time_string(thisjob_dict['submission_time'])
+                this_job.submission_time = parse_time_string(thisjob_dict['submission_time'])
             except ValueError:
                 self.logger.warning(f'Error parsing submission_time for job id {this_job.job_id}')
 
@@ -601,22 +685,95 @@ stderr='{stderr.strip()}'"""
             # Everything goes here anyway for debugging purposes
             this_job.raw_data = job
 
-            # Double check of redundant info
-            # Not really useful now, allocated_machines in this
-            # version of the plugin is never set
-            if this_job.allocated_machines is not None and this_job.num_machines is not None:
-                if len(this_job.allocated_machines) != this_job.num_machines:
-                    self.logger.error(
-                        'The length of the list of allocated '
-                        'nodes ({}) is different from the '
-                        'expected number of nodes ({})!'.format(len(this_job.allocated_machines), this_job.num_machines)
-                    )
+            # The allocated machines are never set by this plugin, so there is no need to check that their number
+            # corresponds to the number of nodes, as is done by other plugins.
 
             # I append to the list of jobs to return
             job_list.append(this_job)
 
         return job_list
 
+    def _parse_joblist_changes_output(self, retval, stdout, stderr):
+        """Parse the output of the command returned by `_get_joblist_changes_command`.
+
+        Each line contains the fields of `sacct_fields` separated by a pipe. Jobs that have terminated are returned with
+        the state `JobState.DONE`.
+        """
+        if retval != 0:
+            raise SchedulerError(
+                f"""sacct returned exit code {retval} (_parse_joblist_changes_output function)
+stdout='{stdout.strip()}'
+stderr='{stderr.strip()}'"""
+            )
+        if stderr.strip():
+            self.logger.warning(
+                'sacct returned exit code 0 (_parse_joblist_changes_output function) but non-empty '
+                f"stderr='{stderr.strip()}'"
+            )
+
+        num_fields = len(self.sacct_fields)
+        convert_time = functools.lru_cache(maxsize=None)(self._convert_time)
+        parse_time_string = functools.lru_cache(maxsize=None)(self._parse_time_string)
+        job_list = []
+
+        for line in stdout.splitlines():
+            job = line.split('|', num_fields - 1)
+
+            if len(job) < num_fields:
+                self.logger.error(f"Wrong line length in sacct output! '{line}'")
+                continue
+
+            thisjob_dict = dict(zip(self.sacct_fields, job))
+
+            this_job = JobInfo()
+            this_job.job_id = thisjob_dict['JobIDRaw']
+
+            # The state can be followed by additional information, e.g. ``CANCELLED by 1000``
+            job_state_raw = thisjob_dict['State'].split(' ', 1)[0]
+            try:
+                this_job.job_state = _MAP_STATUS_SACCT[job_state_raw]
+            except KeyError:
+                self.logger.warning(f"Unrecognized job_state '{job_state_raw}' for job id {this_job.job_id}")
+                this_job.job_state = JobState.UNDETERMINED
+
+            this_job.job_owner = thisjob_dict['User']
+            this_job.queue_name = thisjob_dict['Partition']
+            this_job.title = thisjob_dict['JobName']
+
+            try:
+                this_job.num_machines = int(thisjob_dict['NNodes'])
+                this_job.num_mpiprocs = int(thisjob_dict['NCPUS'])
+            except ValueError:
+                self.logger.warning(f'Error parsing the number of nodes or cores for job id {this_job.job_id}')
+
+            try:
+                this_job.requested_wallclock_time_seconds = convert_time(thisjob_dict['Timelimit'])
+            except ValueError:
+                self.logger.warning(f'Error parsing the time limit for job id {this_job.job_id}')
+
+            if this_job.job_state == JobState.RUNNING:
+                this_job.allocated_machines_raw = thisjob_dict['NodeList']
+
+                try:
+                    this_job.wallclock_time_seconds = convert_time(thisjob_dict['Elapsed'])
+                except ValueError:
+                    self.logger.warning(f'Error parsing time_used for job id {this_job.job_id}')
+
+                try:
+                    this_job.dispatch_time = parse_time_string(thisjob_dict['Start'])
+                except ValueError:
+                    self.logger.warning(f'Error parsing dispatch_time for job id {this_job.job_id}')
+
+            try:
+                this_job.submission_time = parse_time_string(thisjob_dict['Submit'])
+            except ValueError:
+                self.logger.warning(f'Error parsing submission_time for job id {this_job.job_id}')
+
+            this_job.raw_data = job
+            job_list.append(this_job)
+
+        return job_list
+
     def _convert_time(self, string):
         """Convert a string in the format DD-HH:MM:SS to a number of seconds."""
         if string == 'UNLIMITED':
@@ -646,6 +803,13 @@ stderr='{stderr.strip()}'"""
         import datetime
         import time
 
+        # Fast path for the standard format, which is considerably cheaper than ``time.strptime``
+        if fmt == '%Y-%m-%dT%H:%M:%S' and len(string) == 19 and string[10] == 'T':
+            try:
+                return datetime.datetime.fromisoformat(string)
+            except ValueError:
+                pass
+
         try:
             time_struct = time.strptime(string, fmt)
         except Exception as exc:
@@ -44,6 +44,8 @@ class Scheduler(metaclass=abc.ABCMeta):
     # 'can_query_by_user': True if I can pass the 'user' argument to
     # get_joblist_command (and in this case, no 'jobs' should be given).
     # Otherwise, if False, a list of jobs is passed, and no 'user' is given.
+    # 'can_query_changes': True if the plugin implements `_get_joblist_changes_command` and
+    # `_parse_joblist_changes_output`, such that `get_job_changes` can be used. This feature is optional.
     _features: dict[str, bool] = {}
 
     # The class to be used for the job resource.
@@ -339,6 +341,18 @@ class Scheduler(metaclass=abc.ABCMeta):
         :return: list of `JobInfo` objects, one of each job each with at least its default params implemented.
         """
 
+    def _parse_joblist_output_for_jobs(self, retval: int, stdout: str, stderr: str, job_ids: set[str]) -> list[JobInfo]:
+        """Parse the joblist output like `_parse_joblist_output`, but only return the jobs whose id is in ``job_ids``.
+
+        This default implementation filters the jobs returned by `_parse_joblist_output`. Plugins whose output can
+        contain many other jobs, because they are queried by user, can override it to skip those jobs before parsing
+        their fields.
+
+        :param job_ids: the ids of the jobs to return.
+        :return: list of `JobInfo` objects, one for each job in ``job_ids`` that is found in the output.
+        """
+        return [job for job in self._parse_joblist_output(retval, stdout, stderr) if job.job_id in job_ids]
+
     def get_jobs(
         self,
         jobs: list[str] | None = None,
@@ -348,6 +362,7 @@ class Scheduler(metaclass=abc.ABCMeta):
         """Return the list of currently active jobs.
 
         .. note:: typically, only either jobs or user can be specified. See also comments in `_get_joblist_command`.
+            If both are specified, the jobs of the user are queried and only those in ``jobs`` are returned.
 
         :param list jobs: a list of jobs to check; only these are checked
         :param str user: a string with a user: only jobs of this user are checked
@@ -355,10 +370,77 @@ class Scheduler(metaclass=abc.ABCMeta):
             returned, having as key the job_id and as value the JobInfo object.
         :return: list of active jobs
         """
+        if jobs and user:
+            command = self._get_joblist_command(user=user)
+        else:
+            command = self._get_joblist_command(jobs=jobs, user=user)
+
         with self.transport:
-            retval, stdout, stderr = self.transport.exec_command_wait(self._get_joblist_command(jobs=jobs, user=user))
+            retval, stdout, stderr = self.transport.exec_command_wait(command)
+
+        if jobs and user:
+            job_ids = {jobs} if isinstance(jobs, str) else set(jobs)
+            joblist = self._parse_joblist_output_for_jobs(retval, stdout, stderr, job_ids)
+        else:
+            joblist = self._parse_joblist_output(retval, stdout, stderr)
+        if as_dict:
+            jobdict = {job.job_id: job for job in joblist}
+            if None in jobdict:
+                raise SchedulerError('Found at least one job without jobid')
+            return jobdict
+
+        return joblist
+
+    def _get_joblist_changes_command(
+        self, interval: float, jobs: list[str] | None = None, user: str | None = None
+    ) -> str:
+        """Return the command to get a description of the jobs whose state may have changed in the last ``interval``.
+
+        Contrary to the command returned by `_get_joblist_command`, the output should include jobs that have terminated
+        in that interval, and it may omit jobs whose state has not changed. Whether jobs or user can be passed is
+        determined by `self.get_feature('can_query_by_user')`, as for `_get_joblist_command`.
+
+        :param interval: the number of seconds before now since which state changes should be reported.
+        :param jobs: either None to get a list of all jobs in the machine, or a list of jobs.
+        :param user: either None, or a string with the username (to show only jobs of the specific user).
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable`
+        """
+        raise exceptions.FeatureNotAvailable('Cannot query job state changes')
+
+    def _parse_joblist_changes_output(self, retval: int, stdout: str, stderr: str) -> list[JobInfo]:
+        """Parse the output of the command returned by `_get_joblist_changes_command`.
+
+        :return: list of `JobInfo` objects, one for each job whose state may have changed.
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable`
+        """
+        raise exceptions.FeatureNotAvailable('Cannot query job state changes')
+
+    def get_job_changes(
+        self,
+        interval: float,
+        jobs: list[str] | None = None,
+        user: str | None = None,
+        as_dict: bool = False,
+    ) -> list[JobInfo] | dict[str, JobInfo]:
+        """Return the jobs whose state may have changed in the last ``interval`` seconds, including terminated jobs.
+
+        This is only available if `self.get_feature('can_query_changes')` is True. It allows to update a list of jobs
+        obtained through `get_jobs` incrementally: a job that is not returned has not changed state. Terminated jobs
+        are returned with the state `JobState.DONE`, instead of being omitted as by `get_jobs`.
+
+        :param interval: the number of seconds before now since which state changes should be reported.
+        :param list jobs: a list of jobs to check; only these are checked
+        :param str user: a string with a user: only jobs of this user are checked
+        :param list as_dict: if False (default), a list of JobInfo objects is returned. If True, a dictionary is
+            returned, having as key the job_id and as value the JobInfo object.
+        :return: list of jobs whose state may have changed
+        """
+        command = self._get_joblist_changes_command(interval, jobs=jobs, user=user)
+
+        with self.transport:
+            retval, stdout, stderr = self.transport.exec_command_wait(command)
 
-        joblist = self._parse_joblist_output(retval, stdout, stderr)
+        joblist = self._parse_joblist_changes_output(retval, stdout, stderr)
         if as_dict:
             jobdict = {job.job_id: job for job in joblist}
             if None in jobdict:
@@ -10,14 +10,20 @@
 
 # AUTO-GENERATED
 
-# fmt: off
+__all__ = ()
 
-from .sqlite_dos import *
+# END AUTO-GENERATED
 
-__all__ = (
-    'SqliteDosStorage',
-)
+# The storage implementations import heavy dependencies, such as ``sqlalchemy``, so they are imported lazily. This way,
+# modules of this package that do not need them, such as ``aiida.storage.log``, can be imported cheaply.
+__all__ += ('SqliteDosStorage',)
 
-# fmt: on
 
-# END AUTO-GENERATED
+def __getattr__(name: str):
+    """Lazily import the storage implementations that are exposed at the package level."""
+    if name == 'SqliteDosStorage':
+        from .sqlite_dos import SqliteDosStorage
+
+        return SqliteDosStorage
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
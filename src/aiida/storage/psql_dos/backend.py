@@ -12,7 +12,7 @@ import functools
 import gc
 import pathlib
 from contextlib import contextmanager, nullcontext
-from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Union
 
 from pydantic import BaseModel, Field
 from sqlalchemy import column, insert, update
@@ -269,13 +269,15 @@ class PsqlDosBackend(StorageBackend):
         session = self.get_session()
         if session.in_transaction():
             with session.begin_nested() as savepoint:
-                yield session
+                with self.autogroup.buffer_memberships():
+                    yield session
                 savepoint.commit()
             session.commit()
         else:
             with session.begin():
                 with session.begin_nested() as savepoint:
-                    yield session
+                    with self.autogroup.buffer_memberships():
+                        yield session
                     savepoint.commit()
 
     @property
@@ -350,6 +352,28 @@ class PsqlDosBackend(StorageBackend):
         with nullcontext() if self.in_transaction else self.transaction():
             session.execute(update(mapper), rows)
 
+    def bulk_match(
+        self, entity_type: EntityTypes, field: str, values: Iterable[Any], filter_size: int = 999
+    ) -> Dict[Any, int]:
+        from aiida.storage.psql_dos.utils import bulk_match_unique_field
+
+        mapper, keys = self._get_mapper_from_entity(entity_type, True)
+        if field not in keys:
+            raise ValueError(f'Unknown field for {entity_type}: {field!r}')
+        session = self.get_session()
+        with nullcontext() if self.in_transaction else self.transaction():
+            return bulk_match_unique_field(session, mapper, field, values)
+
+    def bulk_set_extras(
+        self, entity_type: EntityTypes, pks: Iterable[int], extras: Dict[str, Any], filter_size: int = 999
+    ) -> None:
+        from aiida.storage.psql_dos.utils import bulk_set_json_keys
+
+        mapper, _ = self._get_mapper_from_entity(entity_type, True)
+        session = self.get_session()
+        with nullcontext() if self.in_transaction else self.transaction():
+            bulk_set_json_keys(session, mapper, 'extras', pks, extras, filter_size)
+
     def delete(self, delete_database_user: bool = False) -> None:
         """Delete the storage and all the data.
 
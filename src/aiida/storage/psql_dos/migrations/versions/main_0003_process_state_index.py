@@ -0,0 +1,43 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Add a partial expression index on the process state attribute of nodes.
+
+The index only contains the rows of nodes that define the ``process_state`` attribute, i.e. process nodes, such that
+queries for active processes no longer have to scan all the nodes.
+
+Revision ID: main_0003
+Revises: main_0002
+Create Date: 2026-10-19
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'main_0003'
+down_revision = 'main_0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index(
+        'ix_db_dbnode_process_state',
+        'db_dbnode',
+        [sa.text("(attributes #>> '{process_state}'::text[])")],
+        unique=False,
+        postgresql_using='btree',
+        postgresql_where=sa.text("(attributes #>> '{process_state}'::text[]) IS NOT NULL"),
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index('ix_db_dbnode_process_state', table_name='db_dbnode')
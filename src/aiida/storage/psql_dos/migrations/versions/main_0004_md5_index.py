@@ -0,0 +1,43 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Add a partial expression index on the md5 attribute of nodes.
+
+The index only contains the rows of nodes that define the ``md5`` attribute, e.g. ``UpfData`` and ``CifData`` nodes,
+such that looking up existing files by their checksum no longer has to scan all the nodes.
+
+Revision ID: main_0004
+Revises: main_0003
+Create Date: 2026-10-19
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'main_0004'
+down_revision = 'main_0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index(
+        'ix_db_dbnode_md5',
+        'db_dbnode',
+        [sa.text("(attributes #>> '{md5}'::text[])")],
+        unique=False,
+        postgresql_using='btree',
+        postgresql_where=sa.text("(attributes #>> '{md5}'::text[]) IS NOT NULL"),
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index('ix_db_dbnode_md5', table_name='db_dbnode')
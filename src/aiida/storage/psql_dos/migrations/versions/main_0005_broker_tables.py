@@ -0,0 +1,60 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Add the tables of the message broker that is implemented on top of the database.
+
+The ``aiida_broker_task`` table stores the tasks of the queue and the ``aiida_broker_rpc`` table the subscribers of RPC
+messages, see :mod:`aiida.brokers.psql`.
+
+Revision ID: main_0005
+Revises: main_0004
+Create Date: 2026-10-19
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'main_0005'
+down_revision = 'main_0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_table(
+        'aiida_broker_task',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('queue', sa.Text(), nullable=False),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('no_reply', sa.Boolean(), nullable=False),
+        sa.Column('reply_to', sa.Text(), nullable=True),
+        sa.Column('correlation_id', sa.Text(), nullable=True),
+        sa.Column('claimed_pid', sa.Integer(), nullable=True),
+        sa.Column('claimed_start', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('ctime', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='aiida_broker_task_pkey'),
+    )
+    op.create_index('aiida_broker_task_queue_id', 'aiida_broker_task', ['queue', 'id'], unique=False)
+    op.create_table(
+        'aiida_broker_rpc',
+        sa.Column('queue', sa.Text(), nullable=False),
+        sa.Column('identifier', sa.Text(), nullable=False),
+        sa.Column('channel', sa.Text(), nullable=False),
+        sa.Column('pid', sa.Integer(), nullable=False),
+        sa.Column('backend_start', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('queue', 'identifier', name='aiida_broker_rpc_pkey'),
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_table('aiida_broker_rpc')
+    op.drop_index('aiida_broker_task_queue_id', table_name='aiida_broker_task')
+    op.drop_table('aiida_broker_task')
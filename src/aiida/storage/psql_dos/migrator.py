@@ -291,12 +291,14 @@ class PsqlDosMigrator:
         This assumes that the database has no schema whatsoever and so the initial schema is created directly from the
         models at the current head version without migrating through all of them one by one.
         """
+        from aiida.storage.psql_dos.models import broker
         from aiida.storage.psql_dos.models.base import get_orm_metadata
 
         # setup the database
         # see: https://alembic.sqlalchemy.org/en/latest/cookbook.html#building-an-up-to-date-database-from-scratch
         MIGRATE_LOGGER.report('initialising empty storage schema')
         get_orm_metadata().create_all(self._engine)
+        broker.metadata.create_all(self._engine)
 
         repository_uuid = self.get_repository_uuid()
 
@@ -0,0 +1,56 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tables of the message broker that is implemented on top of the database, see :mod:`aiida.brokers.psql`.
+
+The tables do not store entities of the ORM, so they are defined on their own metadata rather than on that of the ORM
+models. This keeps them out of the schema of the SQLite storage backends, which is derived from the ORM models.
+"""
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    PrimaryKeyConstraint,
+    Table,
+    Text,
+)
+from sqlalchemy.sql import func
+
+metadata = MetaData()
+
+DbBrokerTask = Table(
+    'aiida_broker_task',
+    metadata,
+    Column('id', BigInteger, autoincrement=True),
+    Column('queue', Text, nullable=False),
+    Column('body', Text, nullable=False),
+    Column('no_reply', Boolean, nullable=False),
+    Column('reply_to', Text),
+    Column('correlation_id', Text),
+    Column('claimed_pid', Integer),
+    Column('claimed_start', DateTime(timezone=True)),
+    Column('ctime', DateTime(timezone=True), nullable=False, server_default=func.now()),
+    PrimaryKeyConstraint('id', name='aiida_broker_task_pkey'),
+    Index('aiida_broker_task_queue_id', 'queue', 'id'),
+)
+
+DbBrokerRpc = Table(
+    'aiida_broker_rpc',
+    metadata,
+    Column('queue', Text, nullable=False),
+    Column('identifier', Text, nullable=False),
+    Column('channel', Text, nullable=False),
+    Column('pid', Integer, nullable=False),
+    Column('backend_start', DateTime(timezone=True), nullable=False),
+    PrimaryKeyConstraint('queue', 'identifier', name='aiida_broker_rpc_pkey'),
+)
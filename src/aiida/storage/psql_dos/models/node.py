@@ -11,6 +11,7 @@
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import backref, relationship
 from sqlalchemy.schema import Column
+from sqlalchemy.sql.expression import text
 from sqlalchemy.sql.schema import ForeignKey, Index
 from sqlalchemy.types import DateTime, Integer, String, Text
 
@@ -104,6 +105,23 @@ class DbNode(Base):
             postgresql_using='btree',
             postgresql_ops={'process_type': 'varchar_pattern_ops'},
         ),
+        # Partial expression index on the process state attribute, which only contains the rows of process nodes. It
+        # serves the queries for active processes, e.g. ``verdi process list``, without scanning all the nodes. Like the
+        # other partial expression indexes, it is specific to PostgreSQL and has no counterpart in the sqlite schemas.
+        Index(
+            'ix_db_dbnode_process_state',
+            text("(attributes #>> '{process_state}'::text[])"),
+            postgresql_using='btree',
+            postgresql_where=text("(attributes #>> '{process_state}'::text[]) IS NOT NULL"),
+        ),
+        # Partial expression index on the md5 attribute, which only contains the rows of nodes representing a file with
+        # a checksum, e.g. ``UpfData`` and ``CifData``. It serves the lookup of existing files by their checksum.
+        Index(
+            'ix_db_dbnode_md5',
+            text("(attributes #>> '{md5}'::text[])"),
+            postgresql_using='btree',
+            postgresql_where=text("(attributes #>> '{md5}'::text[]) IS NOT NULL"),
+        ),
     )
 
     @property
@@ -31,6 +31,7 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], ExtrasMixin, BackendGroup):
     USER_CLASS = users.SqlaUser
     NODE_CLASS = SqlaNode
     GROUP_NODE_CLASS = DbGroupNode
+    ADD_NODES_BATCH_SIZE = 5000
 
     def __init__(self, backend, label, user, description='', type_string=''):
         """Construct a new SQLA group
@@ -164,20 +165,23 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], ExtrasMixin, BackendGroup):
     def add_nodes(self, nodes, **kwargs):
         """Add a node or a set of nodes to the group.
 
+        The memberships are written with bulk ``INSERT ... ON CONFLICT DO NOTHING`` statements on the group-node
+        relationship table, such that nodes that are already part of the group are skipped by the database without
+        loading the current members of the group or opening a savepoint per node.
+
         :note: all the nodes *and* the group itself have to be stored.
 
         :param nodes: a list of `BackendNode` instance to be added to this group
 
         :param kwargs:
-            skip_orm: When the flag is on, the SQLA ORM is skipped and SQLA is used
-            to create a direct SQL INSERT statement to the group-node relationship
-            table (to improve speed).
+            skip_orm: deprecated and ignored, the direct SQL INSERT statement is always used.
+            batch_size: the number of memberships written per statement, defaults to ``ADD_NODES_BATCH_SIZE``.
         """
-        from sqlalchemy.dialects.postgresql import insert
-        from sqlalchemy.exc import IntegrityError
-
         super().add_nodes(nodes)
-        skip_orm = kwargs.get('skip_orm', False)
+        batch_size = kwargs.get('batch_size', self.ADD_NODES_BATCH_SIZE)
+
+        if batch_size < 1:
+            raise ValueError(f'batch_size should be a positive integer, got {batch_size}')
 
         def check_node(given_node):
             """Check if given node is of correct type and stored"""
@@ -187,32 +191,24 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], ExtrasMixin, BackendGroup):
             if not given_node.is_stored:
                 raise ValueError('At least one of the provided nodes is unstored, stopping...')
 
-        with utils.disable_expire_on_commit(self.backend.get_session()) as session:
-            if not skip_orm:
-                # Get dbnodes here ONCE, otherwise each call to dbnodes will re-read the current value in the database
-                dbnodes = self.model.dbnodes
-
-                for node in nodes:
-                    check_node(node)
+        rows = []
+        for node in nodes:
+            check_node(node)
+            rows.append({'dbnode_id': node.id, 'dbgroup_id': self.id})
 
-                    # Use pattern as suggested here:
-                    # http://docs.sqlalchemy.org/en/latest/orm/session_transaction.html#using-savepoint
-                    try:
-                        with session.begin_nested():
-                            dbnodes.append(node.bare_model)
-                            session.flush()
-                    except IntegrityError:
-                        # Duplicate entry, skip
-                        pass
+        with utils.disable_expire_on_commit(self.backend.get_session()) as session:
+            if session.get_bind().dialect.name == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
             else:
-                ins_dict = []
-                for node in nodes:
-                    check_node(node)
-                    ins_dict.append({'dbnode_id': node.id, 'dbgroup_id': self.id})
+                from sqlalchemy.dialects.postgresql import insert
 
-                table = self.GROUP_NODE_CLASS.__table__
-                ins = insert(table).values(ins_dict)
-                session.execute(ins.on_conflict_do_nothing(index_elements=['dbnode_id', 'dbgroup_id']))
+            table = self.GROUP_NODE_CLASS.__table__
+            statement = insert(table).on_conflict_do_nothing(index_elements=['dbnode_id', 'dbgroup_id'])
+
+            # The rows are passed as parameters of a single-row statement, which the dialects execute as an
+            # ``executemany``: this is not bound by the maximum number of variables of a single SQL statement
+            for index in range(0, len(rows), batch_size):
+                session.execute(statement, rows[index : index + batch_size])
 
             # Commit everything as up till now we've just flushed
             if not session.in_nested_transaction():
@@ -9,13 +9,15 @@
 # ruff: noqa: N802
 """Sqla query builder implementation"""
 
+import threading
 import uuid
 import warnings
+from collections import OrderedDict
 from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from sqlalchemy import and_, not_, or_
+from sqlalchemy import and_, bindparam, not_, or_
 from sqlalchemy import func as sa_func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine import Row
@@ -25,10 +27,19 @@ from sqlalchemy.orm.attributes import InstrumentedAttribute, QueryableAttribute
 from sqlalchemy.orm.query import Query
 from sqlalchemy.orm.session import Session
 from sqlalchemy.orm.util import AliasedClass
+from sqlalchemy.sql import visitors
 from sqlalchemy.sql.compiler import SQLCompiler
-from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList, Cast, ColumnClause, ColumnElement, Label
+from sqlalchemy.sql.elements import (
+    BinaryExpression,
+    BindParameter,
+    BooleanClauseList,
+    Cast,
+    ColumnClause,
+    ColumnElement,
+    Label,
+)
 from sqlalchemy.sql.expression import case, text
-from sqlalchemy.types import Boolean, DateTime, Float, Integer, String
+from sqlalchemy.types import Boolean, DateTime, Float, Integer, NullType, String
 
 from aiida.common.exceptions import NotExistent
 from aiida.orm.entities import EntityTypes
@@ -70,6 +81,25 @@ PROJECT_MAP = {
     },
 }
 
+# Operators whose value is passed to the database as a bound parameter of the statement
+BOUND_OPERATORS = (
+    '==',
+    '>',
+    '<',
+    '>=',
+    '=>',
+    '<=',
+    '=<',
+    'like',
+    'ilike',
+    'in',
+    'contains',
+    'has_key',
+    'of_length',
+    'longer',
+    'shorter',
+)
+
 
 @dataclass
 class BuiltQuery:
@@ -80,11 +110,60 @@ class BuiltQuery:
     tag_to_projected: Dict[str, Dict[str, int]]
 
 
+class StatementCache:
+    """Thread-safe least-recently-used cache of built queries, keyed on the structure of the query.
+
+    The values of the filters are not part of the key, since they are passed to the database as bound parameters, see
+    :func:`parametrize_query`. Queries that only differ in the values of their filters therefore share a single built
+    query, which also means that SQLAlchemy can reuse its compiled form.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """Construct the cache.
+
+        :param maxsize: maximum number of entries, the least recently used entry is evicted first. Zero disables the
+            cache.
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[BuiltQuery]:
+        """Return the query cached for ``key``, or ``None`` if it is missing."""
+        with self._lock:
+            built = self._entries.get(key)
+            if built is not None:
+                self._entries.move_to_end(key)
+            return built
+
+    def set(self, key: tuple, built: BuiltQuery) -> None:
+        """Store the query for ``key``, evicting the least recently used entries if the cache is full."""
+        if self._maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = built
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
 class SqlaQueryBuilder(BackendQueryBuilder):
     """QueryBuilder to use with SQLAlchemy-backend and
     schema defined in backends.sqlalchemy.models
     """
 
+    # Built queries shared by all instances, set to ``None`` to only reuse the last query built by an instance
+    _statement_cache: Optional[StatementCache] = StatementCache()
+
     def __init__(self, backend):
         super().__init__(backend)
 
@@ -117,7 +196,7 @@ class SqlaQueryBuilder(BackendQueryBuilder):
 
         # Hashing the internal query representation avoids rebuilding a query
         self._query_cache: Optional[BuiltQuery] = None
-        self._query_hash: Optional[str] = None
+        self._query_hash: Optional[Union[str, Tuple[tuple, Dict[str, Any]]]] = None
 
     @property
     def Node(self):
@@ -242,22 +321,84 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                             yield_result[tag][key] = self.to_backend(row[project_index])
                     yield yield_result
 
+    def itercolumns(self, data: QueryDictType, batch_size: int) -> Iterable[Dict[str, Dict[str, List[Any]]]]:
+        """Return an iterator over all the results in batches of columns, as dictionaries: tag -> field -> values.
+
+        The rows are fetched in batches and transposed into columns, without converting the values to backend entities,
+        except for UUIDs which are converted to strings.
+        """
+        with self.query_session(data) as build:
+            columns: List[Tuple[str, str, int]] = []
+            for tag, projected_entities_dict in build.tag_to_projected.items():
+                alias = build.tag_to_alias.get(tag)
+                if alias is None:
+                    raise ValueError(f'No alias found for tag {tag}')
+                for attrkey, project_index in projected_entities_dict.items():
+                    if attrkey == '*':
+                        raise ValueError(f'Cannot return entities of {tag!r} as columns, project their fields instead')
+                    field_name = get_corresponding_property(get_table_name(alias), attrkey, self.inner_to_outer_schema)
+                    key = data['project_map'].get(tag, {}).get(field_name, field_name)
+                    columns.append((tag, key, project_index))
+
+            stmt = build.query.statement.execution_options(yield_per=batch_size)
+            session = self.get_session()
+
+            # See ``iterall`` for why a session transaction is opened
+            with nullcontext() if session.in_nested_transaction() else self._backend.transaction():  # type: ignore[attr-defined]
+                is_empty = True
+                for rows in session.execute(stmt).partitions():
+                    is_empty = False
+                    yield get_columns_batch(columns, list(zip(*rows)))
+                if is_empty:
+                    yield get_columns_batch(columns, [])
+
     def get_query(self, data: QueryDictType) -> BuiltQuery:
         """Return the built query.
 
-        To avoid unnecessary re-builds of the query, the hashed dictionary representation of this instance
-        is compared to the last query returned, which is cached by its hash.
+        Queries are looked up by their structure in the statement cache shared by all instances, and the values of their
+        filters are bound to the cached query as parameters. In addition, the structure and parameters, or the hashed
+        dictionary representation if the query cannot be looked up, are compared to the last query returned.
         """
         from aiida.common.hashing import make_hash
 
-        query_hash = make_hash(data)
+        key, bound_data, parameters = None, data, {}
+
+        if self._statement_cache is not None:
+            key, bound_data, parameters = parametrize_query(data)
+
+        query_hash = make_hash(data) if key is None else (key, parameters)
 
         if not (self._query_cache and self._query_hash and self._query_hash == query_hash):
-            self._query_cache = self._build(data)
+            self._query_cache = self._build(data) if key is None else self._get_cached(key, bound_data, parameters)
             self._query_hash = query_hash
 
         return self._query_cache
 
+    def _get_cached(self, key: tuple, data: QueryDictType, parameters: Dict[str, Any]) -> BuiltQuery:
+        """Return the query from the statement cache, building it if necessary, with the parameters bound to it.
+
+        :param key: the key of the structure of the query, see :func:`parametrize_query`
+        :param data: the query dictionary with the bound parameters
+        :param parameters: the values of the bound parameters
+        """
+        assert self._statement_cache is not None
+        built = self._statement_cache.get(key)
+
+        if built is None:
+            built = self._build(data)
+            # The session is only set on the queries returned by this method, and the values of the filters are always
+            # passed with ``Query.params`` below, so the cached query does not need to keep them alive
+            built.query = built.query.with_session(None)  # type: ignore[arg-type]
+            clear_bound_values(built.query, parameters)
+            self._statement_cache.set(key, built)
+
+        query = built.query.with_session(self.get_session())
+
+        if parameters:
+            query = query.params(parameters)
+
+        return BuiltQuery(query, built.tag_to_alias, built.tag_to_projected)
+
     @contextmanager
     def query_session(self, data: QueryDictType) -> Iterator[BuiltQuery]:
         """Yield the built query, ensuring the session is closed on an exception."""
@@ -546,22 +687,23 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             operator = operator.lstrip('!')
         else:
             negation = False
+        bound_value = get_bound_value(value)
         if operator in ('longer', 'shorter', 'of_length'):
-            if not isinstance(value, int):
+            if not isinstance(bound_value, int):
                 raise TypeError('You have to give an integer when comparing to a length')
         elif operator in ('like', 'ilike'):
-            if not isinstance(value, str):
-                raise TypeError(f'Value for operator {operator} has to be a string (you gave {value})')
+            if not isinstance(bound_value, str):
+                raise TypeError(f'Value for operator {operator} has to be a string (you gave {bound_value})')
 
         elif operator == 'in':
             try:
-                value_type_set = set(type(i) for i in value)
+                value_type_set = set(type(i) for i in bound_value)
             except TypeError:
                 raise TypeError('Value for operator `in` could not be iterated')
             if not value_type_set:
                 raise ValueError('Value for operator `in` is an empty list')
             if len(value_type_set) > 1:
-                raise ValueError(f'Value for operator `in` contains more than one type: {value}')
+                raise ValueError(f'Value for operator `in` contains more than one type: {bound_value}')
         elif operator in ('and', 'or'):
             expressions_for_this_path = []
             for filter_operation_dict in value:
@@ -612,7 +754,11 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         column_name=None,
         alias=None,
     ):
-        """Return a filter expression"""
+        """Return a filter expression
+
+        The ``value`` can be a bound parameter, in which case the comparisons are made with the parameter and its value
+        only determines the type of the comparison.
+        """
 
         def cast_according_to_type(path_in_json, value):
             """Cast the value according to the type"""
@@ -641,22 +787,36 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         if column is None:
             column = get_column(column_name, alias)
 
+        def index_compatible(value, expr, comparison):
+            """Prepend a comparison of the text value to the expression, if the value is a string.
+
+            The planner cannot use an expression index on ``column #>> path``, like the one on the process state, to
+            evaluate the ``CASE`` expression. For string values the text comparison can be added as a conjunct, without
+            changing the result: the expression is ``false`` whenever the comparison is ``false`` or ``null``, and since
+            ``null AND false`` is ``false`` the result never becomes ``null``, even when it is negated.
+            """
+            if isinstance(value, str):
+                return and_(comparison, expr)
+            return expr
+
         database_entity = column[tuple(attr_key)]
+        bound_value = get_bound_value(value)
         expr: Any
         if operator == '==':
-            type_filter, casted_entity = cast_according_to_type(database_entity, value)
+            type_filter, casted_entity = cast_according_to_type(database_entity, bound_value)
             expr = case((type_filter, casted_entity == value), else_=False)
+            expr = index_compatible(bound_value, expr, casted_entity == value)
         elif operator == '>':
-            type_filter, casted_entity = cast_according_to_type(database_entity, value)
+            type_filter, casted_entity = cast_according_to_type(database_entity, bound_value)
             expr = case((type_filter, casted_entity > value), else_=False)
         elif operator == '<':
-            type_filter, casted_entity = cast_according_to_type(database_entity, value)
+            type_filter, casted_entity = cast_according_to_type(database_entity, bound_value)
             expr = case((type_filter, casted_entity < value), else_=False)
         elif operator in ('>=', '=>'):
-            type_filter, casted_entity = cast_according_to_type(database_entity, value)
+            type_filter, casted_entity = cast_according_to_type(database_entity, bound_value)
             expr = case((type_filter, casted_entity >= value), else_=False)
         elif operator in ('<=', '=<'):
-            type_filter, casted_entity = cast_according_to_type(database_entity, value)
+            type_filter, casted_entity = cast_according_to_type(database_entity, bound_value)
             expr = case((type_filter, casted_entity <= value), else_=False)
         elif operator == 'of_type':
             # http://www.postgresql.org/docs/9.5/static/functions-json.html
@@ -666,14 +826,15 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                 raise ValueError(f'value {value} for of_type is not among valid types\n{valid_types}')
             expr = jsonb_typeof(database_entity) == value
         elif operator == 'like':
-            type_filter, casted_entity = cast_according_to_type(database_entity, value)
+            type_filter, casted_entity = cast_according_to_type(database_entity, bound_value)
             expr = case((type_filter, casted_entity.like(value)), else_=False)
         elif operator == 'ilike':
-            type_filter, casted_entity = cast_according_to_type(database_entity, value)
+            type_filter, casted_entity = cast_according_to_type(database_entity, bound_value)
             expr = case((type_filter, casted_entity.ilike(value)), else_=False)
         elif operator == 'in':
-            type_filter, casted_entity = cast_according_to_type(database_entity, value[0])
+            type_filter, casted_entity = cast_according_to_type(database_entity, bound_value[0])
             expr = case((type_filter, casted_entity.in_(value)), else_=False)
+            expr = index_compatible(bound_value[0], expr, casted_entity.in_(value))
         elif operator == 'contains':
             expr = database_entity.cast(JSONB).contains(value)
         elif operator == 'has_key':
@@ -926,6 +1087,166 @@ def compile_query(query: Query, literal_binds: bool = False) -> SQLCompiler:
     return _Compiler(dialect, query.statement, compile_kwargs=dict(literal_binds=literal_binds))
 
 
+def get_columns_batch(
+    columns: List[Tuple[str, str, int]], values: List[Tuple[Any, ...]]
+) -> Dict[str, Dict[str, List[Any]]]:
+    """Return a batch of columns as a dictionary of lists: tag -> field -> values.
+
+    :param columns: the tag, the field name and the index of the projection of each column.
+    :param values: the values of each projection, which is empty if there are no rows.
+    """
+    batch: Dict[str, Dict[str, List[Any]]] = {}
+
+    for tag, key, project_index in columns:
+        column = list(values[project_index]) if values else []
+        if isinstance(next((value for value in column if value is not None), None), uuid.UUID):
+            column = [None if value is None else str(value) for value in column]
+        batch.setdefault(tag, {})[key] = column
+
+    return batch
+
+
+def get_bound_value(value: Any) -> Any:
+    """Return the value of a bound parameter, or the value itself if it is not a bound parameter."""
+    if isinstance(value, BindParameter):
+        return value.value
+    return value
+
+
+def parametrize_query(data: QueryDictType) -> Tuple[Optional[tuple], QueryDictType, Dict[str, Any]]:
+    """Split the query into its structure and the values of its filters.
+
+    The filter values that can be passed to the database as bound parameters are replaced by named ``BindParameter``
+    instances, such that the query built from the returned query dictionary can be executed for other values of the
+    filters. The type of each value is part of the key, since it determines the comparison that is built for it.
+
+    :param data: the query dictionary
+    :return: a tuple of the hashable key of the structure of the query, which is ``None`` if the query contains values
+        that cannot be hashed, the query dictionary with the bound parameters and the values of the bound parameters.
+    """
+    parameters: Dict[str, Any] = {}
+    filters = {}
+    filters_key = []
+
+    for tag, filter_spec in data['filters'].items():
+        filters[tag], filter_key = _parametrize_filters(filter_spec, parameters)
+        filters_key.append((tag, filter_key))
+
+    key = (
+        tuple(filters_key),
+        *(_freeze(value) for name, value in data.items() if name != 'filters'),
+    )
+
+    try:
+        hash(key)
+    except TypeError:
+        return None, data, {}
+
+    return key, {**data, 'filters': filters}, parameters
+
+
+def clear_bound_values(query: Query, parameters: Dict[str, Any]) -> None:
+    """Remove the values of the named bound parameters of the query in place.
+
+    The query keeps the values with which its bound parameters were created, which for the ``in`` operator can be long
+    lists. Once cleared, the values have to be passed with ``Query.params`` each time the query is executed.
+
+    :param query: the query
+    :param parameters: the bound parameters whose values to remove, keyed by their name
+    """
+    for element in visitors.iterate(query.statement):
+        if isinstance(element, BindParameter) and element.key in parameters:
+            element.value = None
+
+
+def _parametrize_filters(filter_spec: Dict[str, Any], parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], tuple]:
+    """Return the filter specification with the bindable values replaced by bound parameters and its key.
+
+    :param filter_spec: the specification of the filter, see :meth:`SqlaQueryBuilder.build_filters`
+    :param parameters: the values of the bound parameters, to which the values of new parameters are added
+    """
+    bound_spec: Dict[str, Any] = {}
+    key = []
+
+    for path_spec, filter_operation_dict in filter_spec.items():
+        if path_spec in ('and', 'or', '~or', '~and', '!and', '!or') and isinstance(filter_operation_dict, list):
+            sub_specs = [_parametrize_filters(sub_filter_spec, parameters) for sub_filter_spec in filter_operation_dict]
+            bound_spec[path_spec] = [sub_spec for sub_spec, _ in sub_specs]
+            key.append((path_spec, tuple(sub_key for _, sub_key in sub_specs)))
+        elif isinstance(filter_operation_dict, dict):
+            bound_spec[path_spec], operations_key = _parametrize_operations(filter_operation_dict, parameters)
+            key.append((path_spec, operations_key))
+        else:
+            bound_spec[path_spec], operations_key = _parametrize_operations({'==': filter_operation_dict}, parameters)
+            key.append((path_spec, operations_key))
+
+    return bound_spec, tuple(key)
+
+
+def _parametrize_operations(operations: Dict[str, Any], parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], tuple]:
+    """Return the operations on a field with the bindable values replaced by bound parameters and its key.
+
+    :param operations: mapping of operators onto the values they compare with
+    :param parameters: the values of the bound parameters, to which the values of new parameters are added
+    """
+    bound_operations: Dict[str, Any] = {}
+    key = []
+
+    for operator, value in operations.items():
+        base_operator = operator.lstrip('~!')
+
+        if base_operator in ('and', 'or') and isinstance(value, list) and all(isinstance(v, dict) for v in value):
+            sub_operations = [_parametrize_operations(sub_operation, parameters) for sub_operation in value]
+            bound_operations[operator] = [sub_operation for sub_operation, _ in sub_operations]
+            key.append((operator, tuple(sub_key for _, sub_key in sub_operations)))
+        elif base_operator == 'in' and _is_bindable(value, sequence=True):
+            name = f'filter_{len(parameters) + 1}'
+            parameters[name] = list(value)
+            bound_operations[operator] = bindparam(name, parameters[name], type_=NullType(), expanding=True)
+            key.append((operator, BindParameter, type(value[0])))
+        elif base_operator in BOUND_OPERATORS and base_operator != 'in' and _is_bindable(value):
+            name = f'filter_{len(parameters) + 1}'
+            parameters[name] = value
+            # The type of the key of ``has_key`` is not that of the JSONB column it is compared with
+            type_ = None if base_operator == 'has_key' else NullType()
+            bound_operations[operator] = bindparam(name, value, type_=type_)
+            key.append((operator, BindParameter, type(value)))
+        else:
+            bound_operations[operator] = value
+            key.append((operator, _freeze(value)))
+
+    return bound_operations, tuple(key)
+
+
+def _is_bindable(value: Any, sequence: bool = False) -> bool:
+    """Return whether the value can be passed to the database as a bound parameter.
+
+    ``None`` and booleans change the comparison that is built, for example ``IS NULL``, so they are kept in the query.
+
+    :param sequence: whether the value should be a non-empty sequence of values of a single bindable type.
+    """
+    if sequence:
+        return (
+            isinstance(value, (list, tuple))
+            and len(value) > 0
+            and len(set(type(item) for item in value)) == 1
+            and _is_bindable(value[0])
+        )
+    return value is not None and not isinstance(value, bool)
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable representation of a value of the query dictionary.
+
+    The types are part of the representation, since for example ``1 == 1.0 == True``.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    return (type(value), value)
+
+
 def generate_joins(
     data: QueryDictType, aliases: Dict[str, Optional[AliasedClass]], joiner: SqlaJoiner
 ) -> List[JoinReturn]:
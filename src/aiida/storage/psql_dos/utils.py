@@ -9,7 +9,7 @@
 """Utility functions specific to the SqlAlchemy backend."""
 
 import json
-from typing import TypedDict
+from typing import Any, Dict, Iterable, TypedDict
 
 
 class PsqlConfig(TypedDict, total=False):
@@ -83,6 +83,97 @@ def flag_modified(instance, key):
     flag_modified_sqla(instance, key)
 
 
+def bulk_match_unique_field(session, mapper, field: str, values: Iterable[Any]) -> Dict[Any, int]:
+    """Return the mapping of ``values`` onto the primary keys of the rows of ``mapper`` whose ``field`` matches.
+
+    Instead of passing the values as parameters of an ``IN`` clause, which scales poorly and is limited in size by some
+    databases, the values are loaded into a temporary table that is joined with the indexed column of the table. On
+    PostgreSQL with the ``psycopg2`` driver the temporary table is populated with ``COPY``, otherwise a bulk ``INSERT``
+    is used. The temporary table is always dropped before returning, also when matching the values fails.
+
+    :param session: the session to execute the queries in, which should be in a transaction
+    :param mapper: the SQLAlchemy mapper of the table to match against
+    :param field: the name of the column to match, which should have a unique constraint
+    :param values: the values to match
+    :returns: mapping of matched value onto primary key, where keys are the values as they were passed
+    """
+    import csv
+    import io
+    from uuid import UUID, uuid4
+
+    from sqlalchemy import Column, MetaData, Table, Uuid, insert, select
+
+    column = mapper.c[field]
+
+    # Normalise the values to what the column type expects, e.g. ``UUID`` instances for native UUID columns, keeping
+    # track of the original values such that the returned mapping can be keyed on them.
+    if isinstance(column.type, Uuid) and column.type.as_uuid:
+        normalised = {UUID(str(value)): value for value in values}
+    else:
+        normalised = {value: value for value in values}
+
+    if not normalised:
+        return {}
+
+    table = Table(
+        f'tmp_match_{uuid4().hex}', MetaData(), Column('value', column.type, primary_key=True), prefixes=['TEMPORARY']
+    )
+    connection = session.connection()
+    table.create(connection)
+
+    try:
+        if connection.dialect.name == 'postgresql' and connection.dialect.driver == 'psycopg2':
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows((str(value),) for value in normalised)
+            buffer.seek(0)
+            with connection.connection.dbapi_connection.cursor() as cursor:
+                cursor.copy_expert(f'COPY {table.name} (value) FROM STDIN WITH (FORMAT csv)', buffer)
+        else:
+            connection.execute(insert(table), [{'value': value} for value in normalised])
+
+        query = select(column, mapper.c.id).join(table, table.c.value == column)
+        return {normalised[value]: pk for value, pk in connection.execute(query)}
+    finally:
+        table.drop(connection)
+
+
+def bulk_set_json_keys(
+    session, mapper, field: str, pks: Iterable[int], values: Dict[str, Any], filter_size: int = 999
+) -> None:
+    """Set the given keys in the JSON column ``field`` of the rows of ``mapper`` with the given primary keys.
+
+    The keys are set by the database with a single ``UPDATE`` per batch of ``filter_size`` primary keys, leaving the
+    other keys of the column untouched, instead of writing back the complete column as read by the caller.
+
+    :param session: the session to execute the queries in, which should be in a transaction
+    :param mapper: the SQLAlchemy mapper of the table to update
+    :param field: the name of the JSON column to update, e.g. ``extras``
+    :param pks: the primary keys of the rows to update
+    :param values: mapping of the keys onto the values to set in the column
+    :param filter_size: maximum number of parameters allowed in a single query filter
+    """
+    from sqlalchemy import func, type_coerce, update
+    from sqlalchemy.dialects.postgresql import JSONB
+
+    column = mapper.c[field]
+    pks = list(set(pks))
+
+    if not pks or not values:
+        return
+
+    if session.connection().dialect.name == 'postgresql':
+        value = column.op('||', return_type=JSONB)(type_coerce(values, JSONB))
+    else:
+        arguments = []
+        for key, item in values.items():
+            arguments.extend((f'$."{key}"', func.json(json.dumps(item))))
+        value = func.json_set(column, *arguments)
+
+    for index in range(0, len(pks), filter_size):
+        statement = update(mapper).where(mapper.c.id.in_(pks[index : index + filter_size])).values({field: value})
+        session.execute(statement.execution_options(synchronize_session='fetch'))
+
+
 def install_tc(session):
     """Install the transitive closure table with SqlAlchemy."""
     from sqlalchemy import text
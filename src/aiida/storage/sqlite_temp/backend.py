@@ -17,7 +17,7 @@ import shutil
 from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from tempfile import mkdtemp
-from typing import Any, BinaryIO, Iterator, Sequence
+from typing import Any, BinaryIO, Iterable, Iterator, Sequence
 
 from pydantic import BaseModel, Field
 from sqlalchemy import column, insert, update
@@ -159,12 +159,14 @@ class SqliteTempBackend(StorageBackend):
         session = self.get_session()
         if session.in_transaction():
             with session.begin_nested():
-                yield session
+                with self.autogroup.buffer_memberships():
+                    yield session
             session.commit()
         else:
             with session.begin():
                 with session.begin_nested():
-                    yield session
+                    with self.autogroup.buffer_memberships():
+                        yield session
 
     def _clear(self) -> None:
         raise NotImplementedError
@@ -281,6 +283,26 @@ class SqliteTempBackend(StorageBackend):
         with nullcontext() if self.in_transaction else self.transaction():
             session.execute(update(mapper), rows)
 
+    def bulk_match(self, entity_type: EntityTypes, field: str, values: Iterable[Any], filter_size: int = 999) -> dict:
+        from aiida.storage.psql_dos.utils import bulk_match_unique_field
+
+        mapper, keys = self._get_mapper_from_entity(entity_type, True)
+        if field not in keys:
+            raise ValueError(f'Unknown field for {entity_type}: {field!r}')
+        session = self.get_session()
+        with nullcontext() if self.in_transaction else self.transaction():
+            return bulk_match_unique_field(session, mapper, field, values)
+
+    def bulk_set_extras(
+        self, entity_type: EntityTypes, pks: Iterable[int], extras: dict[str, Any], filter_size: int = 999
+    ) -> None:
+        from aiida.storage.psql_dos.utils import bulk_set_json_keys
+
+        mapper, _ = self._get_mapper_from_entity(entity_type, True)
+        session = self.get_session()
+        with nullcontext() if self.in_transaction else self.transaction():
+            bulk_set_json_keys(session, mapper, 'extras', pks, extras, filter_size)
+
     def delete(self) -> None:
         """Delete the storage and all the data."""
         self._repo.erase()
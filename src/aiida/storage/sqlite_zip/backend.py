@@ -12,12 +12,13 @@ from __future__ import annotations
 
 import json
 import shutil
+import sqlite3
 import tempfile
 from contextlib import contextmanager
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
-from typing import BinaryIO, Iterable, Iterator, Optional, Sequence, Tuple, cast
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Sequence, Tuple, cast
 from zipfile import ZipFile, is_zipfile
 
 from archive_path import ZipPath, extract_file_in_zip
@@ -40,7 +41,10 @@ from .utils import (
     REPO_FOLDER,
     ReadOnlyError,
     create_sqla_engine,
+    create_sqla_engine_in_memory,
     extract_metadata,
+    get_zip_stored_region,
+    put_database_in_zip,
     read_version,
 )
 
@@ -151,7 +155,7 @@ class SqliteZipBackend(StorageBackend):
                 filepath_zip, mode='w', compresslevel=metadata['compression'], info_order=(META_FILENAME, DB_FILENAME)
             ) as zip_handle:
                 (zip_handle / META_FILENAME).write_text(json.dumps(metadata))
-                (zip_handle / DB_FILENAME).putfile(filepath_database)
+                put_database_in_zip(zip_handle, filepath_database, metadata['compression'])
 
             shutil.move(filepath_zip, filepath_archive)  # type: ignore[arg-type]
 
@@ -183,6 +187,8 @@ class SqliteZipBackend(StorageBackend):
         """Close the backend"""
         if self._session:
             self._session.close()
+            # dispose of the engine, which releases the memory of a database that is read in place
+            self._session.bind.dispose()
         if self._db_file and self._db_file.exists():
             self._db_file.unlink()
         if self._repo:
@@ -198,6 +204,12 @@ class SqliteZipBackend(StorageBackend):
             raise ClosedStorage(str(self))
         if self._session is None:
             if is_zipfile(self._path):
+                region = get_zip_stored_region(self._path, DB_FILENAME, search_limit=4)
+                if region is not None and hasattr(sqlite3.Connection, 'deserialize'):
+                    # the database is stored uncompressed, so it is loaded into memory directly from the zip file,
+                    # rather than being extracted to disk first
+                    self._session = Session(create_sqla_engine_in_memory(self._path, *region), future=True)
+                    return self._session
                 _, path = tempfile.mkstemp()
                 db_file = self._db_file = Path(path)
                 with db_file.open('wb') as handle:
@@ -286,6 +298,11 @@ class SqliteZipBackend(StorageBackend):
     def bulk_update(self, entity_type: EntityTypes, rows: list[dict]) -> None:
         raise ReadOnlyError()
 
+    def bulk_set_extras(
+        self, entity_type: EntityTypes, pks: Iterable[int], extras: dict[str, Any], filter_size: int = 999
+    ) -> None:
+        raise ReadOnlyError()
+
     def delete(self) -> None:
         """Delete the storage and all the data."""
         filepath = Path(self.profile.storage_config['filepath'])
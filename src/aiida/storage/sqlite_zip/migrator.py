@@ -33,7 +33,15 @@ from aiida.storage.log import MIGRATE_LOGGER
 from .migrations.legacy import FINAL_LEGACY_VERSION, LEGACY_MIGRATE_FUNCTIONS
 from .migrations.legacy_to_main import LEGACY_TO_MAIN_REVISION, perform_v1_migration
 from .migrations.utils import copy_tar_to_zip, copy_zip_to_zip, update_metadata
-from .utils import DB_FILENAME, META_FILENAME, REPO_FOLDER, create_sqla_engine, extract_metadata, read_version
+from .utils import (
+    DB_FILENAME,
+    META_FILENAME,
+    REPO_FOLDER,
+    create_sqla_engine,
+    extract_metadata,
+    put_database_in_zip,
+    read_version,
+)
 
 
 def get_schema_version_head() -> str:
@@ -254,7 +262,7 @@ def migrate(
             MIGRATE_LOGGER.report('Finalising the migration ...')
 
             # write the final database file to the new zip file
-            (new_zip / DB_FILENAME).putfile(db_path)
+            put_database_in_zip(new_zip, db_path, compression)
 
             # write the final metadata.json file to the new zip file
             (new_zip / META_FILENAME).write_text(json.dumps(metadata))
@@ -142,6 +142,9 @@ class SqliteNodeCollection(nodes.SqlaNodeCollection):
 class SqliteQueryBuilder(SqlaQueryBuilder):
     """QueryBuilder to use with SQLAlchemy-backend, adapted for SQLite."""
 
+    # The JSON filters are built from the values of the filters, so these cannot be bound as parameters
+    _statement_cache = None
+
     @property
     def Node(self):
         return models.DbNode
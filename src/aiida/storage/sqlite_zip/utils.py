@@ -9,14 +9,19 @@
 """Utilities for this backend."""
 
 import json
+import mmap
+import shutil
+import sqlite3
+import struct
 import tarfile
 import zipfile
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
-from archive_path import read_file_in_tar, read_file_in_zip
+from archive_path import FilteredZipInfo, ZipFileExtra, ZipPath, read_file_in_tar, read_file_in_zip
 from sqlalchemy import event
 from sqlalchemy.future.engine import Engine, create_engine
+from sqlalchemy.pool import StaticPool
 
 from aiida.common.exceptions import AiidaException, CorruptStorage, UnreachableStorage
 
@@ -50,6 +55,16 @@ def sqlite_case_sensitive_like(dbapi_connection, _):
     cursor.close()
 
 
+def sqlite_query_only(dbapi_connection, _):
+    """Prevent any changes to the database.
+
+    See: https://www.sqlite.org/pragma.html#pragma_query_only
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA query_only=ON;')
+    cursor.close()
+
+
 def create_sqla_engine(path: Union[str, Path], *, enforce_foreign_keys: bool = True, **kwargs) -> Engine:
     """Create a new engine instance."""
     engine = create_engine(f'sqlite:///{path}', json_serializer=json.dumps, json_deserializer=json.loads, **kwargs)
@@ -59,6 +74,92 @@ def create_sqla_engine(path: Union[str, Path], *, enforce_foreign_keys: bool = T
     return engine
 
 
+def create_sqla_engine_in_memory(path: Union[str, Path], offset: int, size: int, **kwargs) -> Engine:
+    """Create a new engine instance for a read-only database that is stored as a contiguous region of a file.
+
+    The region is memory-mapped and deserialized into an in-memory SQLite database, such that no temporary file has to
+    be written to disk. This requires :meth:`sqlite3.Connection.deserialize`, available from Python 3.11.
+
+    .. note:: the whole database is copied into memory, so the memory used is the size of the database. Opening the
+        database in place at an offset of the file would require a custom SQLite VFS, which the ``sqlite3`` module does
+        not provide.
+
+    :param path: the path to the file containing the database, e.g. a zip file with the database stored uncompressed
+    :param offset: the offset in bytes of the start of the database in the file
+    :param size: the size in bytes of the database
+    """
+    with open(path, 'rb') as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as region:
+        connection = sqlite3.connect(':memory:', check_same_thread=False)
+        with memoryview(region) as view:
+            connection.deserialize(view[offset : offset + size])
+
+    engine = create_engine(
+        'sqlite://',
+        creator=lambda: connection,
+        poolclass=StaticPool,
+        json_serializer=json.dumps,
+        json_deserializer=json.loads,
+        **kwargs,
+    )
+    event.listen(engine, 'connect', sqlite_case_sensitive_like)
+    event.listen(engine, 'connect', sqlite_query_only)
+    return engine
+
+
+def get_zip_stored_region(
+    path: Union[str, Path], name: str, *, search_limit: Optional[int] = None
+) -> Optional[Tuple[int, int]]:
+    """Return the region of a file in a zip file, if it is stored without compression.
+
+    The file is located through the central directory of the zip file, which is only read up to the record of the file.
+
+    :param path: the path to the zip file
+    :param name: the relative path of the file within the zip file
+    :param search_limit: the maximum number of records of the central directory to search for the file, by default the
+        whole central directory is searched
+    :returns: the offset and size in bytes of the file content within the zip file, or ``None`` if it is compressed or
+        encrypted, in which case it cannot be read in place.
+    :raises: ``CorruptStorage`` if the file cannot be found in the zip file
+    """
+    try:
+        with ZipFileExtra(path, 'r', name_to_info=FilteredZipInfo({name}, max_infos=search_limit)) as handle:
+            info = handle.getinfo(name)
+            if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+                return None
+            # the content starts after the local file header, whose name and extra field lengths may differ from those
+            # recorded in the central directory
+            handle.fp.seek(info.header_offset)
+            header = handle.fp.read(zipfile.sizeFileHeader)
+    except (KeyError, zipfile.BadZipFile, OSError) as exc:
+        raise CorruptStorage(f'{name} could not be read: {exc}') from exc
+
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        raise CorruptStorage(f'{name} has a bad local file header')
+
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    return info.header_offset + zipfile.sizeFileHeader + name_length + extra_length, info.file_size
+
+
+def put_database_in_zip(zip_path: ZipPath, filepath: Union[str, Path], compression: int) -> None:
+    """Write the database file to a zip file.
+
+    If the compression level is zero, the database is stored without compression, such that it can be read in place,
+    see ``get_zip_stored_region``. Otherwise, it is compressed like the other files of the zip file.
+
+    :param zip_path: the root of the zip file to write to
+    :param filepath: the path of the database file
+    :param compression: the compression level of the zip file
+    """
+    filepath = Path(filepath)
+    with filepath.open('rb') as handle:
+        with (zip_path / DB_FILENAME).open(
+            'wb',
+            compression=zipfile.ZIP_DEFLATED if compression else zipfile.ZIP_STORED,
+            file_size=filepath.stat().st_size,
+        ) as zip_handle:
+            shutil.copyfileobj(handle, zip_handle)
+
+
 def extract_metadata(path: Union[str, Path], *, search_limit: Optional[int] = 10) -> Dict[str, Any]:
     """Extract the metadata dictionary from the archive.
 
@@ -99,7 +99,8 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
             self._conn.close()
         assert self._work_dir is not None
         with (self._work_dir / self.db_name).open('rb') as handle:
-            self._stream_binary(self.db_name, handle)
+            # the database is stored uncompressed, so that it can be read in place without extracting it
+            self._stream_binary(self.db_name, handle, compression=0)
         self._stream_binary(
             self.meta_name,
             BytesIO(json.dumps(self._metadata).encode('utf8')),
@@ -258,7 +259,8 @@ class ArchiveAppenderSqlZip(ArchiveWriterSqlZip):
         assert self._work_dir is not None
         # write the database and metadata to the new archive
         with (self._work_dir / self.db_name).open('rb') as handle:
-            self._stream_binary(self.db_name, handle)
+            # the database is stored uncompressed, so that it can be read in place without extracting it
+            self._stream_binary(self.db_name, handle, compression=0)
         self._stream_binary(
             self.meta_name,
             BytesIO(json.dumps(self._metadata).encode('utf8')),
@@ -231,23 +231,39 @@ def _add_new_entities(
     """Add new entities to the output backend and update the mapping of unique field -> id."""
     IMPORT_LOGGER.report(f'Adding {total} new {etype.value}(s)')
 
-    # collect the unique entities from the input backend to be added to the output backend
-    ufields = []
-    query = QueryBuilder(backend=backend_from).append(entity_type_to_orm[etype], project=unique_field)
-    for (ufield,) in query.distinct().iterall(batch_size=query_params.batch_size):
-        if ufield not in backend_unique_id:
-            ufields.append(ufield)
-
     with get_progress_reporter()(desc=f'Adding new {etype.value}(s)', total=total) as progress:
-        # batch the filtering of rows by filter size, to limit the number of query variables used in any one query,
+        if total > query_params.filter_size:
+            # stream all the rows of the input backend in a single pass, skipping the ones that already exist,
+            # rather than issuing one query per ``filter_size`` batch of new unique fields
+            rows = (
+                row
+                for row in QueryBuilder(backend=backend_from)
+                .append(entity_type_to_orm[etype], project=['**'], tag='entity')
+                .iterdict(batch_size=query_params.batch_size)
+                if row['entity'][unique_field] not in backend_unique_id
+            )
+            for nrows, rows_batch in batch_iter(rows, query_params.batch_size, transform):
+                new_ids = backend_to.bulk_insert(etype, rows_batch)
+                backend_unique_id.update({row[unique_field]: pk for pk, row in zip(new_ids, rows_batch)})
+                progress.update(nrows)
+            return
+
+        # collect the unique entities from the input backend to be added to the output backend
+        ufields = []
+        query = QueryBuilder(backend=backend_from).append(entity_type_to_orm[etype], project=unique_field)
+        for (ufield,) in query.distinct().iterall(batch_size=query_params.batch_size):
+            if ufield not in backend_unique_id:
+                ufields.append(ufield)
+
+        # the number of new entities fits in a single query filter, which limits the number of query variables used,
         # since certain backends have a limit on the number of variables in a query (such as SQLITE_MAX_VARIABLE_NUMBER)
-        for nrows, ufields_batch in batch_iter(ufields, query_params.filter_size):
+        if ufields:
             rows = [
                 transform(row)
                 for row in QueryBuilder(backend=backend_from)
                 .append(
                     entity_type_to_orm[etype],
-                    filters={unique_field: {'in': ufields_batch}},
+                    filters={unique_field: {'in': ufields}},
                     project=['**'],
                     tag='entity',
                 )
@@ -255,7 +271,7 @@ def _add_new_entities(
             ]
             new_ids = backend_to.bulk_insert(etype, rows)
             backend_unique_id.update({row[unique_field]: pk for pk, row in zip(new_ids, rows)})
-            progress.update(nrows)
+            progress.update(len(rows))
 
 
 def _import_users(
@@ -308,13 +324,9 @@ def _import_computers(
     input_id_uuid = dict(qbuilder.append(orm.Computer, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
 
     # get matching uuids from the backend
-    backend_uuid_id: Dict[str, int] = {}
-    if input_id_uuid:
-        backend_uuid_id = dict(
-            orm.QueryBuilder(backend=backend_to)
-            .append(orm.Computer, filters={'uuid': {'in': list(input_id_uuid.values())}}, project=['uuid', 'id'])
-            .all(batch_size=query_params.batch_size)
-        )
+    backend_uuid_id: Dict[str, int] = backend_to.bulk_match(
+        EntityTypes.COMPUTER, 'uuid', input_id_uuid.values(), filter_size=query_params.filter_size
+    )
 
     new_computers = len(input_id_uuid) - len(backend_uuid_id)
     existing_computers = len(backend_uuid_id)
@@ -469,13 +481,9 @@ def _import_nodes(
     input_id_uuid = dict(qbuilder.append(orm.Node, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
 
     # get matching uuids from the backend
-    backend_uuid_id: Dict[str, int] = {}
-    if input_id_uuid:
-        backend_uuid_id = dict(
-            orm.QueryBuilder(backend=backend_to)
-            .append(orm.Node, filters={'uuid': {'in': list(input_id_uuid.values())}}, project=['uuid', 'id'])
-            .all(batch_size=query_params.batch_size)
-        )
+    backend_uuid_id: Dict[str, int] = backend_to.bulk_match(
+        EntityTypes.NODE, 'uuid', input_id_uuid.values(), filter_size=query_params.filter_size
+    )
 
     new_nodes = len(input_id_uuid) - len(backend_uuid_id)
 
@@ -548,13 +556,9 @@ def _import_logs(
     input_id_uuid = dict(qbuilder.append(orm.Log, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
 
     # get matching uuids from the backend
-    backend_uuid_id: Dict[str, int] = {}
-    if input_id_uuid:
-        backend_uuid_id = dict(
-            orm.QueryBuilder(backend=backend_to)
-            .append(orm.Log, filters={'uuid': {'in': list(input_id_uuid.values())}}, project=['uuid', 'id'])
-            .all(batch_size=query_params.batch_size)
-        )
+    backend_uuid_id: Dict[str, int] = backend_to.bulk_match(
+        EntityTypes.LOG, 'uuid', input_id_uuid.values(), filter_size=query_params.filter_size
+    )
 
     new_logs = len(input_id_uuid) - len(backend_uuid_id)
     existing_logs = len(backend_uuid_id)
@@ -751,13 +755,9 @@ def _import_comments(
     input_id_uuid = dict(qbuilder.append(orm.Comment, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
 
     # get matching uuids from the backend
-    backend_uuid_id: Dict[str, int] = {}
-    if input_id_uuid:
-        backend_uuid_id = dict(
-            orm.QueryBuilder(backend=backend)
-            .append(orm.Comment, filters={'uuid': {'in': list(input_id_uuid.values())}}, project=['uuid', 'id'])
-            .all(batch_size=query_params.batch_size)
-        )
+    backend_uuid_id: Dict[str, int] = backend.bulk_match(
+        EntityTypes.COMMENT, 'uuid', input_id_uuid.values(), filter_size=query_params.filter_size
+    )
 
     new_comments = len(input_id_uuid) - len(backend_uuid_id)
     existing_comments = len(backend_uuid_id)
@@ -1015,13 +1015,9 @@ def _import_groups(
     input_id_uuid = dict(qbuilder.append(orm.Group, project=['id', 'uuid']).all(batch_size=query_params.batch_size))
 
     # get matching uuids from the backend
-    backend_uuid_id: Dict[str, int] = {}
-    if input_id_uuid:
-        backend_uuid_id = dict(
-            orm.QueryBuilder(backend=backend_to)
-            .append(orm.Group, filters={'uuid': {'in': list(input_id_uuid.values())}}, project=['uuid', 'id'])
-            .all(batch_size=query_params.batch_size)
-        )
+    backend_uuid_id: Dict[str, int] = backend_to.bulk_match(
+        EntityTypes.GROUP, 'uuid', input_id_uuid.values(), filter_size=query_params.filter_size
+    )
 
     # get all labels
     labels = {
@@ -0,0 +1,832 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Plugin for transport over the system OpenSSH client, multiplexing all operations over one master connection."""
+
+import errno
+import hashlib
+import io
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+from stat import S_ISREG
+
+from aiida.cmdline.params import options
+from aiida.cmdline.params.types.path import AbsolutePathOrEmptyParamType
+from aiida.common.escaping import escape_for_bash
+
+from ..transport import Transport, validate_positive_number
+from .ssh import SshTransport
+
+__all__ = ('OpenSshTransport',)
+
+
+class OpenSshTransport(SshTransport):
+    """Support connection, command execution and data transfer to remote computers via the system OpenSSH client.
+
+    All operations are multiplexed over a single master connection (``ControlMaster``) that is shared by all transports
+    connecting to the same remote with the same options, also across processes. The master connection is kept alive
+    for ``control_persist`` seconds after it was last used, such that opening the transport again does not require a
+    new authentication. Each operation runs in its own ``ssh`` client process, so operations can run concurrently over
+    the same connection. The ``~/.ssh/config`` file is honoured natively by the ``ssh`` client.
+
+    Files are transferred with ``rsync`` if it is available both locally and on the remote, which only sends the
+    differences with existing destination files. Otherwise, files are streamed through ``cat`` and folders through
+    ``tar``. The remote is expected to provide a POSIX shell and the GNU ``coreutils`` and ``findutils``.
+
+    The higher level operations, e.g. copying, globbing and the dispatching of ``put`` and ``get``, are shared with the
+    :class:`~aiida.transports.plugins.ssh.SshTransport`.
+    """
+
+    # The executables are class attributes such that they can be changed, e.g. to use a specific version of the client
+    _ssh_executable = 'ssh'
+    _rsync_executable = 'rsync'
+
+    # Time in seconds that the master connection is kept alive after it was last used
+    _DEFAULT_CONTROL_PERSIST = 60
+
+    _valid_connect_options = [
+        (
+            'username',
+            {
+                'prompt': 'User name',
+                'help': 'Login user name on the remote machine. Leave empty to use the one set in the SSH config.',
+                'non_interactive_default': True,
+            },
+        ),
+        (
+            'port',
+            {
+                'option': options.PORT,
+                'prompt': 'Port number',
+                'non_interactive_default': True,
+            },
+        ),
+        (
+            'key_filename',
+            {
+                'type': AbsolutePathOrEmptyParamType(dir_okay=False, exists=True),
+                'prompt': 'SSH key file',
+                'help': 'Absolute path to your private SSH key. Leave empty to use the path set in the SSH config.',
+                'non_interactive_default': True,
+            },
+        ),
+        (
+            'timeout',
+            {
+                'type': int,
+                'prompt': 'Connection timeout in s',
+                'help': 'Time in seconds to wait for connection before giving up. Leave empty to use default value.',
+                'non_interactive_default': True,
+            },
+        ),
+        (
+            'proxy_jump',
+            {
+                'prompt': 'SSH proxy jump',
+                'help': 'SSH proxy jump for tunneling through other SSH hosts.'
+                ' Use a comma-separated list of hosts of the form [user@]host[:port].'
+                ' Leave empty to use the one set in the SSH config.',
+                'non_interactive_default': True,
+            },
+        ),
+        (
+            'proxy_command',
+            {
+                'prompt': 'SSH proxy command',
+                'help': 'SSH proxy command for tunneling through a proxy server.'
+                ' For tunneling through another SSH host, consider using the "SSH proxy jump" option instead!'
+                ' Leave empty to use the one set in the SSH config.',
+                'non_interactive_default': True,
+            },
+        ),
+    ]
+
+    _valid_connect_params = [i[0] for i in _valid_connect_options]
+
+    _valid_auth_options = _valid_connect_options + [
+        (
+            'control_persist',
+            {
+                'type': int,
+                'prompt': 'Connection persist time in s',
+                'help': 'Time in seconds to keep the master connection open after it was last used, such that it can '
+                'be reused when the transport is opened again. Zero keeps it open indefinitely.',
+                'callback': validate_positive_number,
+                'non_interactive_default': True,
+            },
+        ),
+    ]
+
+    @classmethod
+    def _get_username_suggestion_string(cls, computer):
+        """Return no suggestion, such that the value from the SSH config is used by the ``ssh`` client."""
+        return None
+
+    @classmethod
+    def _get_port_suggestion_string(cls, computer):
+        """Return no suggestion, such that the value from the SSH config is used by the ``ssh`` client."""
+        return None
+
+    @classmethod
+    def _get_key_filename_suggestion_string(cls, computer):
+        """Return no suggestion, such that the value from the SSH config is used by the ``ssh`` client."""
+        return None
+
+    @classmethod
+    def _get_timeout_suggestion_string(cls, computer):
+        """Return no suggestion, such that the value from the SSH config is used by the ``ssh`` client."""
+        return None
+
+    @classmethod
+    def _get_proxy_command_suggestion_string(cls, computer):
+        """Return no suggestion, such that the value from the SSH config is used by the ``ssh`` client."""
+        return None
+
+    @classmethod
+    def _get_control_persist_suggestion_string(cls, computer):
+        """Return a suggestion for the specific field."""
+        return cls._DEFAULT_CONTROL_PERSIST
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the OpenSshTransport class.
+
+        :param machine: the machine to connect to
+        :param control_persist: (optional, default self._DEFAULT_CONTROL_PERSIST)
+           time in seconds to keep the master connection open after it was last used
+
+        Other parameters valid for the connection (see the self._valid_connect_params list) are translated into the
+        corresponding options of the ``ssh`` client. If they are not specified, the SSH config file applies.
+        """
+        # The ``SshTransport`` initializer is skipped on purpose, since it sets up a paramiko client
+        Transport.__init__(self, *args, **kwargs)
+
+        self._machine = kwargs.pop('machine')
+        self._control_persist = int(kwargs.pop('control_persist', self._DEFAULT_CONTROL_PERSIST))
+        self._connect_args = {key: kwargs[key] for key in self._valid_connect_params if kwargs.get(key)}
+        self._cwd = None
+        self._use_rsync = False
+
+        # The path of the socket is derived from the connection options, such that transports connecting in the same
+        # way share the master connection. It is kept short, since the length of socket paths is limited.
+        identifier = repr((self._machine, sorted(self._connect_args.items()))).encode('utf-8')
+        self._control_path = os.path.join(
+            tempfile.gettempdir(), f'aiida-openssh-{os.getuid()}', hashlib.sha256(identifier).hexdigest()[:24]
+        )
+
+    def _get_ssh_command(self):
+        """Return the ``ssh`` command with the options to connect to the machine through the master connection."""
+        command = [self._ssh_executable, '-o', f'ControlPath={self._control_path}', '-o', 'BatchMode=yes']
+
+        if self._connect_args.get('username'):
+            command.extend(['-l', str(self._connect_args['username'])])
+
+        if self._connect_args.get('port'):
+            command.extend(['-p', str(self._connect_args['port'])])
+
+        if self._connect_args.get('key_filename'):
+            command.extend(['-i', str(self._connect_args['key_filename'])])
+
+        if self._connect_args.get('timeout'):
+            command.extend(['-o', f"ConnectTimeout={self._connect_args['timeout']}"])
+
+        if self._connect_args.get('proxy_jump'):
+            command.extend(['-J', str(self._connect_args['proxy_jump'])])
+
+        if self._connect_args.get('proxy_command'):
+            command.extend(['-o', f"ProxyCommand={self._connect_args['proxy_command']}"])
+
+        return command
+
+    def open(self):
+        """Open the transport, starting the master connection to the machine unless one is already running.
+
+        The current working directory is set explicitly to the home folder on the machine, so it is not None.
+
+        :raise aiida.common.InvalidOperation: if the transport is already open
+        :raise ConnectionError: if the master connection could not be established
+        """
+        import fcntl
+
+        from aiida.common.exceptions import InvalidOperation
+
+        if self._is_open:
+            raise InvalidOperation('Cannot open the transport twice')
+
+        if self._connect_args.get('proxy_jump') and self._connect_args.get('proxy_command'):
+            raise ValueError('The SSH proxy jump and SSH proxy command options can not be used together')
+
+        os.makedirs(os.path.dirname(self._control_path), mode=0o700, exist_ok=True)
+
+        # The lock prevents concurrent transports, also of other processes, from each starting a master connection
+        with open(f'{self._control_path}.lock', 'w', encoding='utf8') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+
+            check = subprocess.run(
+                [*self._get_ssh_command(), '-O', 'check', self._machine],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                check=False,
+            )
+
+            if check.returncode != 0:
+                self._start_master()
+
+        self._is_open = True
+
+        result = self._run('pwd -P && { command -v rsync || true; }')
+
+        if result.returncode != 0:
+            self._is_open = False
+            raise ConnectionError(f'Could not open the transport to {self._machine}: {self._decode(result.stderr)}')
+
+        lines = self._decode(result.stdout).splitlines()
+        self._cwd = lines[0]
+        self._use_rsync = len(lines) > 1 and shutil.which(self._rsync_executable) is not None
+
+        return self
+
+    def _start_master(self):
+        """Start the master connection, which goes to the background once authenticated.
+
+        :raise ConnectionError: if the master connection could not be established
+        """
+        master_options = ['-o', 'ControlMaster=yes', '-o', f'ControlPersist={self._control_persist}', '-f', '-N']
+
+        # The stderr is written to a file, since a pipe would be kept open by the master connection in the background
+        with tempfile.TemporaryFile() as stderr:
+            result = subprocess.run(
+                [*self._get_ssh_command(), *master_options, self._machine],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
+                check=False,
+            )
+
+            if result.returncode != 0:
+                stderr.seek(0)
+                raise ConnectionError(f'Could not connect to {self._machine}: {self._decode(stderr.read())}')
+
+    def close(self):
+        """Close the transport.
+
+        The master connection is not closed, such that it can be reused, but exits by itself after ``control_persist``
+        seconds without being used.
+
+        :raise aiida.common.InvalidOperation: if the transport is already closed
+        """
+        from aiida.common.exceptions import InvalidOperation
+
+        if not self._is_open:
+            raise InvalidOperation('Cannot close the transport: it is already closed')
+
+        self._is_open = False
+
+    @property
+    def sshclient(self):
+        raise NotImplementedError('The OpenSshTransport does not use a paramiko client')
+
+    @property
+    def sftp(self):
+        raise NotImplementedError('The OpenSshTransport does not use a paramiko client')
+
+    @staticmethod
+    def _decode(output):
+        """Decode the output of a command, stripping surrounding whitespace."""
+        return output.decode('utf-8', errors='replace').strip()
+
+    def _run(self, command, **kwargs):
+        """Run a command with the POSIX shell of the machine, in the current working directory.
+
+        :param command: the command to run, in which all paths should be escaped with ``escape_for_bash``
+        :param kwargs: keyword arguments passed to ``subprocess.run``. By default, stdout and stderr are captured.
+        :return: the ``subprocess.CompletedProcess``
+        :raise aiida.transports.transport.TransportInternalError: if the transport is not open
+        """
+        from ..transport import TransportInternalError
+
+        if not self._is_open:
+            raise TransportInternalError('Error, ssh method called for OpenSshTransport without opening it first')
+
+        if self._cwd is not None:
+            command = f'cd {escape_for_bash(self._cwd)} && {command}'
+
+        if 'input' not in kwargs:
+            kwargs.setdefault('stdin', subprocess.DEVNULL)
+        kwargs.setdefault('stdout', subprocess.PIPE)
+        kwargs.setdefault('stderr', subprocess.PIPE)
+
+        return subprocess.run(
+            [*self._get_ssh_command(), self._machine, f'sh -c {escape_for_bash(command)}'], check=False, **kwargs
+        )
+
+    def _run_checked(self, command, **kwargs):
+        """Run a command like ``_run``, raising if it fails.
+
+        :return: the stdout of the command as bytes, if captured
+        :raise IOError: if the command returns a non-zero exit code
+        """
+        result = self._run(command, **kwargs)
+
+        if result.returncode != 0:
+            raise IOError(self._decode(result.stderr))
+
+        return result.stdout
+
+    def chdir(self, path):
+        """Change the current working directory, which is prefixed to all commands run on the machine.
+
+        If None is passed, nothing happens and the cwd is unchanged.
+
+        :raise IOError: if the path is not a folder or cannot be entered
+        """
+        if path is not None:
+            self._cwd = self._decode(self._run_checked(f'cd {escape_for_bash(path)} && pwd -P'))
+
+    def normalize(self, path='.'):
+        """Returns the normalized path (removing double slashes, resolving symbolic links, etc...)"""
+        return self._decode(self._run_checked(f'realpath -- {escape_for_bash(path)}'))
+
+    def _stat(self, path, dereference):
+        """Retrieve information about a file on the machine.
+
+        :param path: the filename to stat
+        :param dereference: if True, follow symbolic links
+        :return: a `paramiko.sftp_attr.SFTPAttributes` object, as returned by the ``SshTransport``
+        :raise IOError: with ``errno.ENOENT`` if the path does not exist
+        """
+        import paramiko
+
+        escaped_path = escape_for_bash(path)
+
+        if dereference:
+            exists = f'[ -e {escaped_path} ]'
+            flags = '-L -c'
+        else:
+            exists = f'{{ [ -e {escaped_path} ] || [ -h {escaped_path} ]; }}'
+            flags = '-c'
+
+        result = self._run(f"{exists} || exit 2; stat {flags} '%s %u %g %f %X %Y' -- {escaped_path}")
+
+        if result.returncode == 2:
+            raise IOError(errno.ENOENT, f'No such file or directory: {path}')
+        if result.returncode != 0:
+            raise IOError(self._decode(result.stderr))
+
+        size, uid, gid, mode, atime, mtime = result.stdout.split()
+
+        attributes = paramiko.SFTPAttributes()
+        attributes.st_size = int(size)
+        attributes.st_uid = int(uid)
+        attributes.st_gid = int(gid)
+        attributes.st_mode = int(mode, 16)
+        attributes.st_atime = int(atime)
+        attributes.st_mtime = int(mtime)
+
+        return attributes
+
+    def stat(self, path):
+        """Retrieve information about a file on the remote system.
+
+        The fields supported are: ``st_mode``, ``st_size``, ``st_uid``, ``st_gid``, ``st_atime``, and ``st_mtime``.
+
+        :param str path: the filename to stat
+
+        :return: a `paramiko.sftp_attr.SFTPAttributes` object containing attributes about the given file.
+        """
+        return self._stat(path, dereference=True)
+
+    def lstat(self, path):
+        """Retrieve information about a file on the remote system, without following symbolic links.
+
+        This otherwise behaves exactly the same as `stat`.
+
+        :param str path: the filename to stat
+
+        :return: a `paramiko.sftp_attr.SFTPAttributes` object containing attributes about the given file.
+        """
+        return self._stat(path, dereference=False)
+
+    def getcwd(self):
+        """Return the current working directory, which is set to the home folder when the transport is opened."""
+        return self._cwd
+
+    def makedirs(self, path, ignore_existing=False):
+        """Super-mkdir; create a leaf directory and all intermediate ones.
+
+        :param path: directory to create (string)
+        :param ignore_existing: if set to true, it doesn't give any error
+            if the leaf directory does already exist (bool)
+
+        :raise OSError: If the directory already exists.
+        """
+        escaped_path = escape_for_bash(path)
+        command = f'mkdir -p -- {escaped_path}'
+
+        if not ignore_existing:
+            command = f'if [ -d {escaped_path} ]; then exit 17; fi; {command}'
+
+        result = self._run(command)
+
+        if result.returncode == 17:
+            raise OSError(f"Error during makedirs of '{path}': the directory already exists")
+        if result.returncode != 0:
+            raise OSError(f"Error during makedirs of '{path}': {self._decode(result.stderr)}")
+
+    def mkdir(self, path, ignore_existing=False):
+        """Create a folder (directory) named path.
+
+        :param path: name of the folder to create
+        :param ignore_existing: if True, does not give any error if the directory
+                  already exists
+
+        :raise OSError: If the directory already exists.
+        """
+        escaped_path = escape_for_bash(path)
+        command = f'mkdir -- {escaped_path}'
+
+        if ignore_existing:
+            command = f'[ -d {escaped_path} ] || {command}'
+
+        try:
+            self._run_checked(command)
+        except IOError as exc:
+            raise OSError(
+                "Error during mkdir of '{}' from folder '{}', "
+                "maybe you don't have the permissions to do it, "
+                'or the directory already exists? ({})'.format(path, self.getcwd(), exc)
+            )
+
+    def rmdir(self, path):
+        """Remove the folder named 'path' if empty."""
+        self._run_checked(f'rmdir -- {escape_for_bash(path)}')
+
+    def chmod(self, path, mode):
+        """Change permissions to path
+
+        :param path: path to file
+        :param mode: new permission bits (integer)
+        """
+        if not path:
+            raise IOError('Input path is an empty argument.')
+        self._run_checked(f'chmod {mode:o} -- {escape_for_bash(path)}')
+
+    def _rsync(self, source, destination, recursive=False):
+        """Transfer files with ``rsync`` over the master connection, following symbolic links.
+
+        :param source: the source, prefixed with the machine and a colon if it is remote
+        :param destination: the destination, prefixed with the machine and a colon if it is remote
+        :param recursive: if True, transfer folders recursively
+        :raise IOError: if the transfer failed
+        """
+        command = [self._rsync_executable, '--protect-args', '--copy-links', '-e', shlex.join(self._get_ssh_command())]
+
+        if recursive:
+            command.append('--recursive')
+
+        result = subprocess.run(
+            [*command, source, destination], stdin=subprocess.DEVNULL, capture_output=True, check=False
+        )
+
+        if result.returncode != 0:
+            raise IOError(f'Error while executing rsync. Exit code: {result.returncode}: {self._decode(result.stderr)}')
+
+    def _get_rsync_remote(self, path):
+        """Return the ``rsync`` argument for a path on the machine, relative to the current working directory."""
+        return f'{self._machine}:{os.path.join(self.getcwd(), path)}'
+
+    def _stream_tree(self, localpath, remotepath, upload):
+        """Stream a folder as a ``tar`` archive between the local machine and the remote, following symbolic links.
+
+        :param localpath: an (absolute) local path of an existing folder
+        :param remotepath: a remote path of an existing folder
+        :param upload: if True, copy the contents of the local folder to the remote, otherwise the other way around
+        :raise IOError: if the transfer failed
+        """
+        pack = ['tar', '-C', localpath, '-chf', '-', '.']
+        unpack = ['tar', '-C', localpath, '-xf', '-']
+        remote_pack = f'tar -C {escape_for_bash(remotepath)} -chf - .'
+        remote_unpack = f'tar -C {escape_for_bash(remotepath)} -xf -'
+
+        if upload:
+            with subprocess.Popen(
+                pack, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            ) as tar:
+                result = self._run(remote_unpack, stdin=tar.stdout)
+                tar.stdout.close()
+                local_stderr = tar.stderr.read()
+        else:
+            with subprocess.Popen(
+                unpack, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            ) as tar:
+                result = self._run(remote_pack, stdout=tar.stdin)
+                tar.stdin.close()
+                local_stderr = tar.stderr.read()
+
+        if result.returncode != 0 or tar.returncode != 0:
+            raise IOError(
+                f'Error while streaming the folder with tar: {self._decode(result.stderr)} {self._decode(local_stderr)}'
+            )
+
+    def putfile(self, localpath, remotepath, callback=None, dereference=True, overwrite=True):
+        """Put a file from local to remote.
+
+        :param localpath: an (absolute) local path
+        :param remotepath: a remote path
+        :param callback: if given, called as ``callback(bytes_transferred, total_bytes)`` once the file is transferred
+        :param overwrite: if True overwrites files and folders (boolean).
+            Default = True.
+
+        :raise ValueError: if local path is invalid
+        :raise OSError: if the localpath does not exist,
+                    or unintentionally overwriting
+        """
+        if not dereference:
+            raise NotImplementedError
+
+        if not os.path.isabs(localpath):
+            raise ValueError('The localpath must be an absolute path')
+
+        if not overwrite and self.isfile(remotepath):
+            raise OSError('Destination already exists: not overwriting it')
+
+        if self._use_rsync:
+            if not os.path.isfile(localpath):
+                raise FileNotFoundError(f'The local file {localpath} does not exist')
+            self._rsync(localpath, self._get_rsync_remote(remotepath))
+        else:
+            with open(localpath, 'rb') as handle:
+                self._run_checked(f'cat > {escape_for_bash(remotepath)}', stdin=handle)
+
+        if callback is not None:
+            size = os.path.getsize(localpath)
+            callback(size, size)
+
+    def puttree(self, localpath, remotepath, callback=None, dereference=True, overwrite=True):
+        """Put a folder recursively from local to remote.
+
+        By default, overwrite.
+
+        :param localpath: an (absolute) local path
+        :param remotepath: a remote path
+        :param dereference: follow symbolic links (boolean)
+            Default = True. False is not implemented.
+        :param overwrite: if True overwrites files and folders (boolean).
+            Default = True
+
+        :raise ValueError: if local path is invalid
+        :raise OSError: if the localpath does not exist, or trying to overwrite
+        :raise IOError: if remotepath is invalid
+        """
+        if not dereference:
+            raise NotImplementedError
+
+        if not os.path.isabs(localpath):
+            raise ValueError('The localpath must be an absolute path')
+
+        if not os.path.exists(localpath):
+            raise OSError('The localpath does not exists')
+
+        if not os.path.isdir(localpath):
+            raise ValueError(f'Input localpath is not a folder: {localpath}')
+
+        if not remotepath:
+            raise IOError('remotepath must be a non empty string')
+
+        if self.path_exists(remotepath) and not overwrite:
+            raise OSError("Can't overwrite existing files")
+        if self.isfile(remotepath):
+            raise OSError('Cannot copy a directory into a file')
+
+        if not self.isdir(remotepath):  # in this case copy things in the remotepath directly
+            self.mkdir(remotepath)  # and make a directory at its place
+        else:  # remotepath exists already: copy the folder inside of it!
+            remotepath = os.path.join(remotepath, os.path.split(localpath)[1])
+            self.mkdir(remotepath)  # create a nested folder
+
+        if self._use_rsync:
+            self._rsync(os.path.join(localpath, ''), self._get_rsync_remote(os.path.join(remotepath, '')), True)
+        else:
+            self._stream_tree(localpath, remotepath, upload=True)
+
+    def getfile(self, remotepath, localpath, callback=None, dereference=True, overwrite=True):
+        """Get a file from remote to local.
+
+        :param remotepath: a remote path
+        :param localpath: an (absolute) local path
+        :param callback: if given, called as ``callback(bytes_transferred, total_bytes)`` once the file is transferred
+        :param overwrite: if True overwrites files and folders.
+                Default = False
+
+        :raise ValueError: if local path is invalid
+        :raise OSError: if unintentionally overwriting
+        """
+        if not os.path.isabs(localpath):
+            raise ValueError('localpath must be an absolute path')
+
+        if os.path.isfile(localpath) and not overwrite:
+            raise OSError('Destination already exists: not overwriting it')
+
+        if not dereference:
+            raise NotImplementedError
+
+        if self._use_rsync:
+            self._rsync(self._get_rsync_remote(remotepath), localpath)
+        else:
+            try:
+                with open(localpath, 'wb') as handle:
+                    self._run_checked(f'cat -- {escape_for_bash(remotepath)}', stdout=handle)
+            except IOError:
+                try:
+                    os.remove(localpath)
+                except OSError:
+                    pass
+                raise
+
+        if callback is not None:
+            size = os.path.getsize(localpath)
+            callback(size, size)
+
+    def gettree(self, remotepath, localpath, callback=None, dereference=True, overwrite=True):
+        """Get a folder recursively from remote to local.
+
+        :param remotepath: a remote path
+        :param localpath: an (absolute) local path
+        :param dereference: follow symbolic links.
+            Default = True. False is not implemented.
+        :param overwrite: if True overwrites files and folders.
+            Default = False
+
+        :raise ValueError: if local path is invalid
+        :raise IOError: if the remotepath is not found
+        :raise OSError: if unintentionally overwriting
+        """
+        if not dereference:
+            raise NotImplementedError
+
+        if not remotepath:
+            raise IOError('Remotepath must be a non empty string')
+        if not localpath:
+            raise ValueError('Localpaths must be a non empty string')
+
+        if not os.path.isabs(localpath):
+            raise ValueError('Localpaths must be an absolute path')
+
+        if not self.isdir(remotepath):
+            raise IOError(f'Input remotepath is not a folder: {localpath}')
+
+        if os.path.exists(localpath) and not overwrite:
+            raise OSError("Can't overwrite existing files")
+        if os.path.isfile(localpath):
+            raise OSError('Cannot copy a directory into a file')
+
+        if not os.path.isdir(localpath):  # in this case copy things in the remotepath directly
+            os.makedirs(localpath, exist_ok=True)  # and make a directory at its place
+        else:  # localpath exists already: copy the folder inside of it!
+            localpath = os.path.join(localpath, os.path.split(remotepath)[1])
+            os.mkdir(localpath)  # create a nested folder
+
+        if self._use_rsync:
+            self._rsync(self._get_rsync_remote(os.path.join(remotepath, '')), os.path.join(localpath, ''), True)
+        else:
+            self._stream_tree(localpath, remotepath, upload=False)
+
+    def listdir(self, path='.', pattern=None):
+        """Get the list of files at path.
+
+        :param path: default = '.'
+        :param pattern: returns the list of files matching pattern.
+                             Unix only. (Use to emulate ``ls *`` for example)
+        """
+        if pattern:
+            return super().listdir(path, pattern)
+
+        output = self._run_checked(f"cd {escape_for_bash(path)} && find . -mindepth 1 -maxdepth 1 -printf '%f\\0'")
+        return [name.decode('utf-8') for name in output.split(b'\0') if name]
+
+    def remove(self, path):
+        """Remove a single file at 'path'"""
+        self._run_checked(f'rm -- {escape_for_bash(path)}')
+
+    def rename(self, oldpath, newpath):
+        """Rename a file or folder from oldpath to newpath.
+
+        :param str oldpath: existing name of the file or folder
+        :param str newpath: new name for the file or folder
+
+        :raises IOError: if oldpath/newpath is not found
+        :raises ValueError: if oldpath/newpath is not a valid string
+        """
+        if not oldpath:
+            raise ValueError(f'Source {oldpath} is not a valid string')
+        if not newpath:
+            raise ValueError(f'Destination {newpath} is not a valid string')
+        if not self.path_exists(oldpath):
+            raise IOError(f'Source {oldpath} does not exist')
+        if not self.path_exists(newpath):
+            raise IOError(f'Destination {newpath} does not exist')
+
+        self._run_checked(f'mv -- {escape_for_bash(oldpath)} {escape_for_bash(newpath)}')
+
+    def isfile(self, path):
+        """Return True if the given path is a file, False otherwise.
+        Return False also if the path does not exist.
+        """
+        if not path:
+            return False
+        try:
+            return S_ISREG(self.stat(path).st_mode)
+        except IOError as exc:
+            if getattr(exc, 'errno', None) == errno.ENOENT:
+                return False
+            raise  # Typically if I don't have permissions
+
+    def _exec_command_internal(self, command, combine_stderr=False, bufsize=-1):
+        """Executes the specified command in bash login shell.
+
+        Before the command is executed, changes directory to the current
+        working directory as returned by self.getcwd().
+
+        For executing commands and waiting for them to finish, use
+        exec_command_wait.
+
+        :param  command: the command to execute. The command is assumed to be
+            already escaped using :py:func:`aiida.common.escaping.escape_for_bash`.
+        :param combine_stderr: (default False) if True, combine stdout and
+                stderr on the same buffer (i.e., stdout).
+                Note: If combine_stderr is True, stderr will be None.
+        :param bufsize: same meaning of the one used by ``subprocess.Popen``.
+
+        :return: a tuple with (stdin, stdout, stderr, process),
+            where stdin, stdout and stderr are the pipes of the ``subprocess.Popen`` process of the ``ssh`` client.
+        """
+        from ..transport import TransportInternalError
+
+        if not self._is_open:
+            raise TransportInternalError('Error, ssh method called for OpenSshTransport without opening it first')
+
+        if self.getcwd() is not None:
+            escaped_folder = escape_for_bash(self.getcwd())
+            command_to_execute = f'cd {escaped_folder} && ( {command} )'
+        else:
+            command_to_execute = command
+
+        self.logger.debug(f'Command to be executed: {command_to_execute[:self._MAX_EXEC_COMMAND_LOG_SIZE]}')
+
+        # Note: The default shell will eat one level of escaping, while
+        # 'bash -l -c ...' will eat another. Thus, we need to escape again.
+        bash_command = self._bash_command_str + '-c ' + escape_for_bash(command_to_execute)
+
+        process = subprocess.Popen(
+            [*self._get_ssh_command(), self._machine, bash_command],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if combine_stderr else subprocess.PIPE,
+            bufsize=bufsize,
+        )
+
+        return process.stdin, process.stdout, process.stderr, process
+
+    def exec_command_wait_bytes(self, command, stdin=None, combine_stderr=False, bufsize=-1):
+        """Executes the specified command and waits for it to finish.
+
+        :param command: the command to execute
+        :param stdin: (optional,default=None) can be a string or a
+                   file-like object.
+        :param combine_stderr: (optional, default=False) see docstring of
+                   self._exec_command_internal()
+        :param bufsize: same meaning of ``subprocess.Popen``.
+
+        :return: a tuple with (return_value, stdout, stderr) where stdout and stderr
+            are both bytes and the return_value is an int.
+        """
+        if stdin is None or isinstance(stdin, bytes):
+            stdin_bytes = stdin
+        elif isinstance(stdin, str):
+            stdin_bytes = stdin.encode('utf-8')
+        elif isinstance(stdin, (io.BufferedIOBase, io.TextIOBase)):
+            stdin_bytes = stdin.read()
+            if isinstance(stdin_bytes, str):
+                stdin_bytes = stdin_bytes.encode('utf-8')
+        else:
+            raise ValueError('You can only pass strings, bytes, BytesIO or StringIO objects')
+
+        _, _, _, process = self._exec_command_internal(command, combine_stderr, bufsize=bufsize)
+        stdout, stderr = process.communicate(input=stdin_bytes)
+
+        return (process.returncode, stdout, stderr or b'')
+
+    def _symlink(self, source, dest):
+        """Create a symbolic link with ``ln``.
+
+        :param source: source of link
+        :param dest: link to create
+        """
+        self._run_checked(f'ln -s -- {escape_for_bash(source)} {escape_for_bash(dest)}')
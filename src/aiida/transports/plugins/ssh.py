@@ -8,11 +8,14 @@
 ###########################################################################
 """Plugin for transport over SSH (and SFTP for file transfer)."""
 
+import collections
 import glob
 import io
 import os
 import re
-from stat import S_ISDIR, S_ISREG
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from stat import S_ISDIR, S_ISLNK, S_ISREG
 
 import click
 
@@ -192,6 +195,9 @@ class SshTransport(Transport):
 
     _valid_connect_params = [i[0] for i in _valid_connect_options]
 
+    # Maximum number of SFTP channels opened on the connection to transfer the files of a folder concurrently
+    _DEFAULT_SFTP_CHANNELS = 4
+
     # Valid parameters for the ssh transport
     # For each param, a class method with name
     # _convert_PARAMNAME_fromstring
@@ -368,6 +374,8 @@ class SshTransport(Transport):
            if False, do not load the system host keys
         :param key_policy: (optional, default = paramiko.RejectPolicy())
            the policy to use for unknown keys
+        :param sftp_channels: (optional, default self._DEFAULT_SFTP_CHANNELS)
+           the maximum number of SFTP channels used to transfer the files of a folder concurrently
 
         Other parameters valid for the ssh connect function (see the
         self._valid_connect_params list) are passed to the connect
@@ -383,6 +391,7 @@ class SshTransport(Transport):
         self._proxies = []
 
         self._machine = kwargs.pop('machine')
+        self._sftp_channels = max(1, int(kwargs.pop('sftp_channels', self._DEFAULT_SFTP_CHANNELS)))
 
         self._client = paramiko.SSHClient()
         self._load_system_host_keys = kwargs.pop('load_system_host_keys', False)
@@ -931,24 +940,23 @@ class SshTransport(Transport):
             remotepath = os.path.join(remotepath, os.path.split(localpath)[1])
             self.mkdir(remotepath)  # create a nested folder
 
+        transfers = []
+
         for this_source in os.walk(localpath):
             # Get the relative path
             this_basename = os.path.relpath(path=this_source[0], start=localpath)
 
-            try:
-                self.stat(os.path.join(remotepath, this_basename))
-            except IOError as exc:
-                import errno
-
-                if exc.errno == errno.ENOENT:  # Missing file
-                    self.mkdir(os.path.join(remotepath, this_basename))
-                else:
-                    raise
+            # The destination folder has just been created, so none of its subfolders can exist yet: there is no need
+            # to ``stat`` them first. Since ``os.walk`` is top-down, parents are always created before their children.
+            if this_basename != os.curdir:
+                self.mkdir(os.path.join(remotepath, this_basename))
 
             for this_file in this_source[2]:
                 this_local_file = os.path.join(localpath, this_basename, this_file)
                 this_remote_file = os.path.join(remotepath, this_basename, this_file)
-                self.putfile(this_local_file, this_remote_file)
+                transfers.append((this_remote_file, this_local_file))
+
+        self._transfer_files(transfers, get=False)
 
     def get(self, remotepath, localpath, callback=None, dereference=True, overwrite=True, ignore_nonexisting=False):
         """Get a file or folder from remote to local.
@@ -1032,9 +1040,19 @@ class SshTransport(Transport):
         if not dereference:
             raise NotImplementedError
 
+        return self._sftp_get(self.sftp, remotepath, localpath, callback)
+
+    @staticmethod
+    def _sftp_get(sftp, remotepath, localpath, callback=None):
+        """Get a file from remote to local over the given SFTP channel.
+
+        :param sftp: the ``paramiko.SFTPClient`` to use for the transfer
+        :param remotepath: a remote path
+        :param localpath: an (absolute) local path
+        """
         # Workaround for bug #724 in paramiko -- remove localpath on IOError
         try:
-            return self.sftp.get(remotepath, localpath, callback)
+            return sftp.get(remotepath, localpath, callback)
         except IOError:
             try:
                 os.remove(localpath)
@@ -1082,16 +1100,88 @@ class SshTransport(Transport):
             localpath = os.path.join(localpath, os.path.split(remotepath)[1])
             os.mkdir(localpath)  # create a nested folder
 
-        item_list = self.listdir(remotepath)
-        dest = str(localpath)
+        transfers = []
+        folders = [(remotepath, str(localpath))]
 
-        for item in item_list:
-            item = str(item)  # noqa: PLW2901
+        while folders:
+            remote_folder, local_folder = folders.pop()
 
-            if self.isdir(os.path.join(remotepath, item)):
-                self.gettree(os.path.join(remotepath, item), os.path.join(dest, item))
-            else:
-                self.getfile(os.path.join(remotepath, item), os.path.join(dest, item))
+            # A single request returns the names together with the attributes of all entries, but since the attributes
+            # are those of ``lstat``, only symbolic links require an additional ``stat`` to be resolved.
+            for attributes in self.sftp.listdir_attr(remote_folder):
+                remote_item = os.path.join(remote_folder, attributes.filename)
+                local_item = os.path.join(local_folder, attributes.filename)
+
+                if S_ISLNK(attributes.st_mode):
+                    is_dir = self.isdir(remote_item)
+                else:
+                    is_dir = S_ISDIR(attributes.st_mode)
+
+                if is_dir:
+                    os.mkdir(local_item)
+                    folders.append((remote_item, local_item))
+                else:
+                    transfers.append((remote_item, local_item))
+
+        self._transfer_files(transfers, get=True)
+
+    def _transfer_files(self, transfers, get):
+        """Transfer files concurrently over several SFTP channels of the open connection.
+
+        Each channel is served by its own thread, which takes the next file to transfer from a shared queue. Within a
+        single file, paramiko already keeps multiple requests in flight: reads are prefetched and writes are pipelined.
+        Additional channels are closed once all files are transferred. If the server refuses to open them, for example
+        because its ``MaxSessions`` limit is reached, the files are transferred over the channels opened so far, which
+        at least includes the main SFTP channel of the transport.
+
+        :param transfers: list of tuples with the remote and the local path of each file
+        :param get: if True, copy the remote files to the local paths, otherwise the local files to the remote paths
+        """
+        from paramiko.ssh_exception import SSHException
+
+        queue = collections.deque(transfers)
+        failed = threading.Event()
+        channels = [self.sftp]
+        cwd = self.getcwd()
+
+        def _transfer(sftp):
+            while not failed.is_set():
+                try:
+                    remotepath, localpath = queue.popleft()
+                except IndexError:
+                    return
+                try:
+                    if get:
+                        self._sftp_get(sftp, remotepath, localpath)
+                    else:
+                        sftp.put(localpath, remotepath)
+                except Exception:
+                    failed.set()
+                    raise
+
+        try:
+            while len(channels) < min(self._sftp_channels, len(transfers)):
+                try:
+                    channel = self._client.open_sftp()
+                except SSHException:
+                    break
+                channels.append(channel)
+                if cwd is not None:
+                    # Paths relative to the working directory of the transport should resolve the same on all channels
+                    channel.chdir(cwd)
+
+            if len(channels) == 1:
+                _transfer(self.sftp)
+                return
+
+            with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+                futures = [executor.submit(_transfer, channel) for channel in channels]
+
+            for future in futures:
+                future.result()
+        finally:
+            for channel in channels[1:]:
+                channel.close()
 
     def get_attribute(self, path):
         """Returns the object Fileattribute, specified in aiida.transports
@@ -0,0 +1,40 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for the import time of ``aiida`` and the ``verdi`` command line interface.
+
+The purpose of these tests is to benchmark the time it takes to start a fresh interpreter that imports ``aiida`` or
+performs the tab-completion of ``verdi``, since this determines the responsiveness of the command line interface.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+GROUP_NAME = 'imports'
+
+COMPLETION = {'_VERDI_COMPLETE': 'bash_complete', 'COMP_WORDS': 'verdi pro', 'COMP_CWORD': '1'}
+
+
+@pytest.mark.parametrize(
+    'code, env',
+    (
+        ('import aiida', {}),
+        ('from aiida.cmdline.commands.cmd_verdi import verdi; verdi(prog_name="verdi")', COMPLETION),
+    ),
+    ids=('import', 'completion'),
+)
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=5)
+def test_import_time(benchmark, code, env):
+    """Benchmark the time of starting an interpreter that runs ``code``."""
+    env = {**os.environ, **env}
+
+    result = benchmark(subprocess.run, [sys.executable, '-c', code], capture_output=True, env=env, check=True)
+    assert result.returncode == 0
@@ -0,0 +1,86 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for the query builder.
+
+The purpose of these tests is to benchmark and compare the construction and execution
+of many small queries, that only differ in the values of their filters.
+"""
+
+import pytest
+from aiida.orm import Data, QueryBuilder
+
+GROUP_NAME = 'querybuilder'
+
+
+@pytest.fixture
+def data_nodes(aiida_profile_clean):
+    """Return a list of stored data nodes with an attribute."""
+    nodes = []
+    for index in range(100):
+        data = Data()
+        data.base.attributes.set('index', index)
+        nodes.append(data.store())
+    return nodes
+
+
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=10)
+def test_first_by_pk(benchmark, data_nodes):
+    """Benchmark for retrieving a projection of each node by its primary key."""
+
+    def _run():
+        return [QueryBuilder().append(Data, filters={'id': node.pk}, project='uuid').first() for node in data_nodes]
+
+    result = benchmark(_run)
+    assert result == [[node.uuid] for node in data_nodes]
+
+
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=10)
+def test_first_by_attribute(benchmark, data_nodes):
+    """Benchmark for retrieving each node by the value of an attribute."""
+
+    def _run():
+        return [
+            QueryBuilder().append(Data, filters={'attributes.index': node.base.attributes.get('index')}).first()
+            for node in data_nodes
+        ]
+
+    result = benchmark(_run)
+    assert [row[0].pk for row in result] == [node.pk for node in data_nodes]
+
+
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=10)
+def test_count_in(benchmark, data_nodes):
+    """Benchmark for counting nodes in lists of primary keys of different length."""
+
+    def _run():
+        return [
+            QueryBuilder().append(Data, filters={'id': {'in': [node.pk for node in data_nodes[:length]]}}).count()
+            for length in range(1, len(data_nodes) + 1)
+        ]
+
+    result = benchmark(_run)
+    assert result == list(range(1, len(data_nodes) + 1))
+
+
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=10)
+def test_all_attributes(benchmark, data_nodes):
+    """Benchmark for retrieving the identifier and an attribute of all nodes as rows."""
+    builder = QueryBuilder().append(Data, project=['id', 'attributes.index'])
+
+    result = benchmark(builder.all)
+    assert len(result) == len(data_nodes)
+
+
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=10)
+def test_as_numpy_attributes(benchmark, data_nodes):
+    """Benchmark for retrieving the identifier and an attribute of all nodes as columns."""
+    builder = QueryBuilder().append(Data, project=['id', 'attributes.index'])
+
+    result = benchmark(builder.as_numpy)
+    assert len(result['attributes.index']) == len(data_nodes)
@@ -0,0 +1,131 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for parsing the job list output of schedulers.
+
+The purpose of these tests is to benchmark the parsing of the output of the command that lists the jobs of a scheduler,
+for synthetic outputs of a large number of jobs, since this is done for every update of the job list by the engine.
+"""
+
+import pytest
+from aiida.schedulers.plugins.lsf import LsfScheduler
+from aiida.schedulers.plugins.pbspro import PbsproScheduler
+from aiida.schedulers.plugins.sge import SgeScheduler
+from aiida.schedulers.plugins.slurm import SlurmScheduler
+
+GROUP_NAME = 'schedulers'
+NUM_JOBS = 10000
+
+
+def get_squeue_output(num_jobs):
+    """Return a synthetic output of ``squeue`` for the given number of jobs."""
+    lines = []
+
+    for index in range(num_jobs):
+        if index % 2:
+            fields = ['R', 'None', 'nid00001', 'nid0[0001-0002]', '1:32:10', f'2024-05-23T11:{index % 60:02d}:30']
+        else:
+            fields = ['PD', 'Priority', 'n/a', '(Priority)', '0:00', 'N/A']
+
+        state, annotation, host, machines, used, dispatch = fields
+        submission = f'2024-05-23T03:{index % 60:02d}:21'
+        lines.append(
+            f'{index}^^^{state}^^^{annotation}^^^{host}^^^user^^^2^^^64^^^{machines}^^^normal^^^1-00:00:00^^^{used}'
+            f'^^^{dispatch}^^^aiida-{index}^^^{submission}'
+        )
+
+    return '\n'.join(lines)
+
+
+def get_qstat_output(num_jobs):
+    """Return a synthetic output of ``qstat -f`` of PBS Pro for the given number of jobs."""
+    stanzas = []
+
+    for index in range(num_jobs):
+        state = 'R' if index % 2 else 'Q'
+        stanzas.append(
+            f'Job Id: {index}.cluster\n'
+            f'    Job_Name = aiida-{index}\n'
+            '    Job_Owner = user@cluster\n'
+            f'    job_state = {state}\n'
+            '    queue = normal\n'
+            f'    ctime = Tue Apr  9 15:{index % 60:02d}:47 2024\n'
+            f'    stime = Tue Apr  9 16:{index % 60:02d}:47 2024\n'
+            '    exec_host = node001/0*16+node002/0*16\n'
+            '    Resource_List.mpiprocs = 32\n'
+            '    Resource_List.ncpus = 32\n'
+            '    Resource_List.nodect = 2\n'
+            '    Resource_List.walltime = 01:00:00\n'
+            '    resources_used.cput = 00:12:21\n'
+            '    resources_used.walltime = 00:02:34\n'
+            '    Variable_List = PBS_O_SYSTEM=Linux,PBS_O_SHELL=/bin/bash,\n'
+            '\tPBS_O_HOME=/home/user,PBS_O_LOGNAME=user\n'
+        )
+
+    return '\n'.join(stanzas)
+
+
+def get_bjobs_output(num_jobs):
+    """Return a synthetic output of ``bjobs`` of LSF for the given number of jobs."""
+    lines = []
+
+    for index in range(num_jobs):
+        minute = f'{index % 60:02d}'
+        if index % 2:
+            lines.append(
+                f'{index}|RUN|-|node001|user|1|-|node001|normal|Feb  2 08:{minute}|Feb  2 07:{minute}|25.00%'
+                f'|Feb  2 07:{minute}|aiida-{index}'
+            )
+        else:
+            lines.append(f'{index}|PEND|-|-|user|-|-|-|normal|-|-|-|Feb  2 07:{minute}|aiida-{index}')
+
+    return '\n'.join(lines)
+
+
+def get_qstat_xml_output(num_jobs):
+    """Return a synthetic output of ``qstat -xml -ext -urg`` of SGE for the given number of jobs."""
+    jobs = []
+
+    for index in range(num_jobs):
+        if index % 2:
+            state, time_tag, queue = 'running', 'JAT_start_time', '<queue_name>serial.q@node001</queue_name>'
+        else:
+            state, time_tag, queue = 'pending', 'JB_submission_time', ''
+
+        jobs.append(
+            f'<job_list state="{state}"><JB_job_number>{index}</JB_job_number><JB_name>aiida-{index}</JB_name>'
+            f'<JB_owner>user</JB_owner><state>{"r" if index % 2 else "qw"}</state>'
+            f'<{time_tag}>2024-06-18T12:{index % 60:02d}:23</{time_tag}>{queue}<slots>1</slots></job_list>'
+        )
+
+    return (
+        "<?xml version='1.0'?><job_info><queue_info>"
+        + ''.join(jobs[1::2])
+        + '</queue_info><job_info>'
+        + ''.join(jobs[::2])
+        + '</job_info></job_info>'
+    )
+
+
+@pytest.mark.parametrize(
+    'scheduler_class, get_output',
+    (
+        (SlurmScheduler, get_squeue_output),
+        (PbsproScheduler, get_qstat_output),
+        (LsfScheduler, get_bjobs_output),
+        (SgeScheduler, get_qstat_xml_output),
+    ),
+)
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=3)
+def test_parse_joblist_output(benchmark, scheduler_class, get_output):
+    """Benchmark parsing the job list output of a scheduler with many jobs."""
+    scheduler = scheduler_class()
+    stdout = get_output(NUM_JOBS)
+
+    jobs = benchmark(scheduler._parse_joblist_output, 0, stdout, '')
+    assert len(jobs) == NUM_JOBS
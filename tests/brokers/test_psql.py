@@ -0,0 +1,357 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the `aiida.brokers.psql` module."""
+
+import time
+import uuid
+
+import kiwipy
+import pytest
+from aiida.brokers.psql import PsqlBroker
+from aiida.brokers.psql.communicator import PsqlCommunicator
+from aiida.orm.utils import serialize
+
+TIMEOUT = 10
+
+
+@pytest.fixture
+def create_communicator(aiida_profile):
+    """Return a factory for communicators that share a queue that is unique to the test."""
+    connection_params = PsqlBroker(aiida_profile).get_connection_params()
+    prefix = f'test-{uuid.uuid4().hex}'
+    communicators = []
+
+    def factory(**kwargs):
+        kwargs.setdefault('poll_interval', 0.5)
+        communicator = PsqlCommunicator(
+            connection_params,
+            encoder=serialize.serialize,
+            decoder=serialize.deserialize_unsafe,
+            prefix=prefix,
+            **kwargs,
+        )
+        communicators.append(communicator)
+        return communicator
+
+    yield factory
+
+    for communicator in communicators:
+        communicator.close()
+
+
+def test_broker_requires_psql_dos(aiida_profile, monkeypatch):
+    """Test that the broker raises if the storage backend of the profile is not ``core.psql_dos``."""
+    from aiida.common.exceptions import ConfigurationError
+
+    monkeypatch.setattr(type(aiida_profile), 'storage_backend', property(lambda _: 'core.sqlite_dos'))
+
+    with pytest.raises(ConfigurationError, match=r'requires the `core.psql_dos` storage backend'):
+        PsqlBroker(aiida_profile)
+
+
+def test_broker_recreates_closed_communicator(aiida_profile):
+    """Test that the broker creates a new communicator if its communicator closed itself."""
+    broker = PsqlBroker(aiida_profile)
+
+    try:
+        communicator = broker.get_communicator()
+        assert broker.get_communicator() is communicator
+        communicator.close()
+        assert broker.get_communicator() is not communicator
+        assert not broker.get_communicator().is_closed()
+    finally:
+        broker.close()
+
+
+def test_task_send(create_communicator):
+    """Test that a task is processed by a subscriber of another communicator and the result is sent back."""
+    sender = create_communicator()
+    receiver = create_communicator()
+    receiver.add_task_subscriber(lambda _, task: task * 2)
+
+    assert sender.task_send(21).result(timeout=TIMEOUT) == 42
+
+
+def test_task_send_future(create_communicator):
+    """Test that a task is only finished once the chain of futures returned by the subscriber resolves."""
+    sender = create_communicator()
+    receiver = create_communicator()
+    outer, inner = kiwipy.Future(), kiwipy.Future()
+    receiver.add_task_subscriber(lambda _, task: outer)
+
+    future = sender.task_send('task')
+    outer.set_result(inner)
+
+    with pytest.raises(TimeoutError):
+        future.result(timeout=1)
+
+    inner.set_result('done')
+    assert future.result(timeout=TIMEOUT) == 'done'
+    assert list(sender.iterate_tasks()) == []
+
+
+def test_task_send_exception(create_communicator):
+    """Test that an exception raised by the subscriber is sent back."""
+    sender = create_communicator()
+    receiver = create_communicator()
+
+    def subscriber(_, task):
+        raise RuntimeError('failure')
+
+    receiver.add_task_subscriber(subscriber)
+
+    with pytest.raises(kiwipy.RemoteException, match='failure'):
+        sender.task_send('task').result(timeout=TIMEOUT)
+
+
+def test_task_persistent(create_communicator):
+    """Test that a task that is sent before there are subscribers is processed once a subscriber is added."""
+    sender = create_communicator()
+    sender.task_send('task', no_reply=True)
+    sender.close()
+
+    future = kiwipy.Future()
+    receiver = create_communicator()
+    receiver.add_task_subscriber(lambda _, task: future.set_result(task))
+
+    assert future.result(timeout=TIMEOUT) == 'task'
+
+
+def test_task_released_on_close(create_communicator):
+    """Test that a task that is being processed is picked up by another communicator if the first one is closed."""
+    sender = create_communicator()
+    first, second = kiwipy.Future(), kiwipy.Future()
+
+    receiver = create_communicator()
+    receiver.add_task_subscriber(lambda _, task: first.set_result(task) or kiwipy.Future())
+    future = sender.task_send('task')
+    assert first.result(timeout=TIMEOUT) == 'task'
+
+    other = create_communicator()
+    other.add_task_subscriber(lambda _, task: second.set_result(task) or 'result')
+    receiver.close()
+
+    assert second.result(timeout=TIMEOUT) == 'task'
+    assert future.result(timeout=TIMEOUT) == 'result'
+
+
+def test_task_rejected(create_communicator):
+    """Test that a task that is rejected by all subscribers of a communicator is processed by another."""
+    sender = create_communicator()
+
+    def reject(_, task):
+        raise kiwipy.TaskRejected()
+
+    rejecting = create_communicator()
+    rejecting.add_task_subscriber(reject)
+    future = sender.task_send('task')
+
+    accepting = create_communicator()
+    accepting.add_task_subscriber(lambda _, task: 'accepted')
+
+    assert future.result(timeout=TIMEOUT) == 'accepted'
+
+
+def test_task_rejected_expires(create_communicator):
+    """Test that a rejected task is offered to the subscribers of the communicator again after the poll interval."""
+    sender = create_communicator()
+    receiver = create_communicator()
+    rejected = []
+
+    def subscriber(_, task):
+        if not rejected:
+            rejected.append(task)
+            raise kiwipy.TaskRejected()
+        return 'accepted'
+
+    receiver.add_task_subscriber(subscriber)
+
+    assert sender.task_send('task').result(timeout=TIMEOUT) == 'accepted'
+    assert rejected == ['task']
+    assert receiver._rejected == {}
+
+
+def test_task_prefetch_count(create_communicator):
+    """Test that a communicator does not process more tasks concurrently than the prefetch count."""
+    sender = create_communicator()
+    receiver = create_communicator(task_prefetch_count=2)
+    received = []
+    futures = [kiwipy.Future() for _ in range(3)]
+    receiver.add_task_subscriber(lambda _, task: received.append(task) or futures[task])
+
+    results = [sender.task_send(index) for index in range(3)]
+
+    with pytest.raises(TimeoutError):
+        results[2].result(timeout=1)
+
+    assert received == [0, 1]
+    futures[0].set_result(0)
+    futures[2].set_result(2)
+    assert results[2].result(timeout=TIMEOUT) == 2
+
+
+def test_iterate_tasks(create_communicator):
+    """Test iterating over the pending tasks and acknowledging one of them."""
+    communicator = create_communicator()
+
+    for index in range(3):
+        communicator.task_send(index, no_reply=True)
+
+    for task in communicator.iterate_tasks():
+        if task.body == 1:
+            with task.processing() as outcome:
+                outcome.set_result(True)
+
+    assert [task.body for task in communicator.iterate_tasks()] == [0, 2]
+
+
+def test_rpc_send(create_communicator):
+    """Test sending an RPC message and receiving the response."""
+    sender = create_communicator()
+    receiver = create_communicator()
+    receiver.add_rpc_subscriber(lambda _, msg: f'{msg} received', identifier=1)
+
+    assert sender.rpc_send(1, 'message').result(timeout=TIMEOUT) == 'message received'
+
+    receiver.remove_rpc_subscriber(1)
+
+    with pytest.raises(kiwipy.UnroutableError):
+        sender.rpc_send(1, 'message')
+
+
+def test_rpc_send_closed(create_communicator):
+    """Test that an RPC message can not be sent to a subscriber of a communicator that is no longer alive."""
+    sender = create_communicator()
+    receiver = create_communicator()
+    receiver.add_rpc_subscriber(lambda _, msg: msg, identifier='recipient')
+    receiver._connection.close()
+
+    # The backend of the connection terminates asynchronously after the connection is closed
+    while sender._execute('SELECT 1 FROM pg_stat_activity WHERE pid = %s', (receiver._pid,), fetch=True):
+        time.sleep(0.05)
+
+    with pytest.raises(kiwipy.UnroutableError):
+        sender.rpc_send('recipient', 'message')
+
+
+def test_broadcast_send(create_communicator):
+    """Test that a broadcast is received by the subscribers of all communicators."""
+    sender = create_communicator()
+    futures = [kiwipy.Future(), kiwipy.Future()]
+
+    for future in futures:
+        receiver = create_communicator()
+        receiver.add_broadcast_subscriber(lambda _, *args, future=future: future.set_result(args))
+
+    assert sender.broadcast_send('body', sender='sender', subject='subject') is True
+
+    for future in futures:
+        assert future.result(timeout=TIMEOUT) == ('body', 'sender', 'subject', None)
+
+
+def terminate_sessions(sender, communicator):
+    """Terminate the sessions of both connections of the communicator, as happens for example on a database restart."""
+    pids = [communicator._pid, communicator._listen_connection.get_backend_pid()]
+    sender._execute('SELECT pg_terminate_backend(pid) FROM unnest(%s) AS pid', (pids,))
+
+
+def test_reconnect(create_communicator):
+    """Test that a communicator whose connections are lost reconnects and restores its state in the database."""
+    sender = create_communicator()
+    receiver = create_communicator()
+    outcome = kiwipy.Future()
+    receiver.add_task_subscriber(lambda _, task: outcome if task == 'pending' else task)
+    receiver.add_rpc_subscriber(lambda _, msg: f'{msg} received', identifier='recipient')
+
+    future = sender.task_send('pending')
+
+    while not receiver._in_flight:
+        time.sleep(0.05)
+
+    pid, listen_connection = receiver._pid, receiver._listen_connection
+    terminate_sessions(sender, receiver)
+
+    # The task is processed after the communicator has reconnected and restored its state
+    assert sender.task_send('task').result(timeout=TIMEOUT) == 'task'
+    assert receiver._pid != pid
+
+    # Notifications that are sent before the communicator listens again with its new connection are lost
+    while receiver._listen_connection is listen_connection:
+        time.sleep(0.05)
+
+    assert sender.rpc_send('recipient', 'message').result(timeout=TIMEOUT) == 'message received'
+
+    # The task that was being processed is claimed again with the new session and the result is sent once it finishes
+    query = 'SELECT claimed_pid FROM aiida_broker_task WHERE id = ANY(%s)'
+    rows = sender._execute(query, (list(receiver._in_flight),), fetch=True)
+    assert rows == [(receiver._pid,)]
+    outcome.set_result('done')
+    assert future.result(timeout=TIMEOUT) == 'done'
+
+
+def test_reconnect_failure(create_communicator, monkeypatch):
+    """Test that a communicator that cannot reconnect after losing its connections closes itself."""
+    sender = create_communicator()
+    receiver = create_communicator(reconnect_attempts=2, poll_interval=0.05)
+
+    def connect(_):
+        raise ConnectionError('database is unreachable')
+
+    monkeypatch.setattr(receiver, '_connect', connect)
+    terminate_sessions(sender, receiver)
+
+    deadline = time.monotonic() + TIMEOUT
+    while not receiver.is_closed() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert receiver.is_closed()
+
+
+@pytest.fixture
+def daemon_runner(aiida_profile_clean, manager, monkeypatch):
+    """Return a daemon runner that uses a ``PsqlBroker`` and is set as the runner of the manager."""
+    broker = PsqlBroker(aiida_profile_clean)
+    monkeypatch.setattr(broker, '_prefix', f'test-{uuid.uuid4().hex}')
+    manager.reset_broker()
+    monkeypatch.setattr(manager, '_broker', broker)
+
+    runner = manager.create_daemon_runner()
+    manager.set_runner(runner)
+
+    yield runner
+
+    manager.reset_runner()
+    manager.reset_broker()
+
+
+def test_submit(daemon_runner):
+    """Test that a submitted process is run by a daemon runner and can be killed through an RPC message."""
+    import asyncio
+
+    from aiida.engine import ProcessState, submit
+    from aiida.orm import Int
+
+    from tests.utils.processes import AddProcess, WaitProcess
+
+    async def wait_until(condition):
+        while not condition():
+            await asyncio.sleep(0.05)
+
+    node = submit(AddProcess, a=Int(1), b=Int(2))
+    daemon_runner.loop.run_until_complete(asyncio.wait_for(wait_until(lambda: node.is_terminated), TIMEOUT))
+    assert node.is_finished_ok
+    assert node.outputs.result == 3
+
+    node = submit(WaitProcess)
+    daemon_runner.loop.run_until_complete(
+        asyncio.wait_for(wait_until(lambda: node.process_state == ProcessState.WAITING), TIMEOUT)
+    )
+    daemon_runner.controller.kill_process(node.pk)
+    daemon_runner.loop.run_until_complete(asyncio.wait_for(wait_until(lambda: node.is_terminated), TIMEOUT))
+    assert node.is_killed
@@ -54,7 +54,7 @@ def test_verbosity_options():
     def recursively_check_leaf_commands(ctx, command, leaf_commands):
         """Recursively return the leaf commands of the given command."""
         try:
-            for subcommand in command.commands:
+            for subcommand in {*command.commands, *getattr(command, 'lazy_commands', {})}:
                 # We need to fetch the subcommand through the ``get_command``, because that is what the ``verdi``
                 # command does when a subcommand is invoked on the command line.
                 recursively_check_leaf_commands(ctx, command.get_command(ctx, subcommand), leaf_commands)
@@ -65,3 +65,46 @@ def test_verbosity_options():
     leaf_commands = []
     ctx = click.Context(cmd_verdi.verdi)
     recursively_check_leaf_commands(ctx, cmd_verdi.verdi, leaf_commands)
+
+
+def test_lazy_commands():
+    """Test that the subcommands of ``verdi`` are listed without importing them and are loaded when requested."""
+    ctx = click.Context(cmd_verdi.verdi)
+    commands = cmd_verdi.verdi.list_commands(ctx)
+
+    assert set(cmd_verdi.VERDI_COMMANDS).issubset(commands)
+
+    for name in cmd_verdi.VERDI_COMMANDS:
+        assert isinstance(cmd_verdi.verdi.get_command(ctx, name), click.Command), name
+
+
+COMPLETION = {'_VERDI_COMPLETE': 'bash_complete', 'COMP_WORDS': 'verdi pro', 'COMP_CWORD': '1'}
+
+
+@pytest.mark.parametrize(
+    'code, env',
+    (
+        ('import aiida', {}),
+        ('from aiida.cmdline.commands.cmd_verdi import verdi; verdi(["--help"], prog_name="verdi")', {}),
+        ('from aiida.cmdline.commands.cmd_verdi import verdi; verdi(prog_name="verdi")', COMPLETION),
+    ),
+    ids=('import', 'help', 'completion'),
+)
+def test_undesired_imports(code, env):
+    """Test that importing ``aiida`` and invoking ``verdi`` without a subcommand do not import expensive modules.
+
+    NOTE: This is analogous to `verdi devel check-undesired-imports` but runs in a clean interpreter.
+    """
+    import os
+    import subprocess
+    import sys
+
+    modules = ('alembic', 'disk_objectstore', 'kiwipy', 'numpy', 'paramiko', 'plumpy', 'sqlalchemy')
+    script = f'import sys\ntry:\n    {code}\nfinally:\n    print(*sys.modules)'
+    result = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True, env={**os.environ, **env}, check=False
+    )
+    loaded = result.stdout.strip().splitlines()[-1].split()
+
+    assert 'aiida' in loaded
+    assert not [module for module in modules if module in loaded]
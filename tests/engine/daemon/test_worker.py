@@ -8,8 +8,11 @@
 ###########################################################################
 """Unit tests for the :mod:`aiida.engine.daemon.worker` module."""
 
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
-from aiida.engine.daemon.worker import shutdown_worker
+from aiida.engine.daemon.worker import check_communicator, shutdown_worker
 
 
 @pytest.mark.requires_rmq
@@ -24,3 +27,18 @@ async def test_shutdown_worker(manager):
     finally:
         # Reset the runner of the manager, because once closed it cannot be reused by other tests.
         manager._runner = None
+
+
+def test_check_communicator():
+    """Test that ``check_communicator`` shuts down the worker once the communicator is closed."""
+    runner = MagicMock()
+    runner.communicator.is_closed.side_effect = [False, False, True]
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(check_communicator(runner, interval=0))
+    finally:
+        loop.close()
+
+    assert runner.communicator.is_closed.call_count == 3
+    runner.close.assert_called_once()
@@ -14,8 +14,11 @@ from aiida.engine.processes.calcjobs.monitors import (
     CalcJobMonitorAction,
     CalcJobMonitorResult,
     CalcJobMonitors,
+    MonitorTransport,
+    read_remote_files,
 )
 from aiida.orm import Dict, Int, Str
+from aiida.transports.plugins.local import LocalTransport
 
 
 class StoreMessageCalculation(ArithmeticAddCalculation):
@@ -104,6 +107,12 @@ def test_calc_job_monitor_constructor_invalid():
     with pytest.raises(TypeError, match=r'Got object of type .*'):
         CalcJobMonitor(entry_point='core.always_kill', minimum_poll_interval='one')
 
+    with pytest.raises(TypeError, match=r'Got object of type .*'):
+        CalcJobMonitor(entry_point='core.always_kill', files='_aiidasubmit.sh')
+
+    with pytest.raises(TypeError, match=r'The `files` should be a list of strings.'):
+        CalcJobMonitor(entry_point='core.always_kill', files=[1])
+
     with pytest.raises(ValueError, match=r'The `minimum_poll_interval` must be a positive integer greater than zero.'):
         CalcJobMonitor(entry_point='core.always_kill', minimum_poll_interval=-1)
 
@@ -123,6 +132,7 @@ def test_calc_job_monitor_constructor_valid():
     assert monitor.priority == 0
     assert monitor.minimum_poll_interval is None
     assert monitor.call_timestamp is None
+    assert monitor.files == []
 
 
 def test_calc_job_monitor_load_entry_point():
@@ -181,6 +191,95 @@ def test_calc_job_monitors_process_poll_interval(monkeypatch):
     assert result.message == 'always_kill called'
 
 
+def test_calc_job_monitors_get_requested_files():
+    """Test the :meth:`aiida.engine.processes.calcjobs.monitors.CalcJobMonitors.get_requested_files` method."""
+    monitors = CalcJobMonitors(
+        {
+            'a': Dict({'entry_point': 'core.always_kill', 'files': ['_aiidasubmit.sh', 'aiida.out']}),
+            'b': Dict({'entry_point': 'core.always_kill', 'files': ['aiida.out', 'aiida.err']}),
+            'c': Dict({'entry_point': 'core.always_kill', 'files': ['disabled.out'], 'disabled': True}),
+        }
+    )
+    assert monitors.get_requested_files() == {'_aiidasubmit.sh', 'aiida.out', 'aiida.err'}
+
+
+def test_read_remote_files(tmp_path, monkeypatch):
+    """Test :func:`aiida.engine.processes.calcjobs.monitors.read_remote_files`."""
+    monkeypatch.setattr('aiida.engine.processes.calcjobs.monitors.READ_FILES_BATCH_SIZE', 2)
+    contents = {'a.out': b'line\n', 'no_newline.out': b'content', 'empty.out': b'', "quote's.out": b'\xff\x00binary'}
+
+    for filename, content in contents.items():
+        (tmp_path / filename).write_bytes(content)
+
+    (tmp_path / 'directory').mkdir()
+    filepaths = [str(tmp_path / filename) for filename in [*contents, 'non_existent.out', 'directory']]
+
+    with LocalTransport() as transport:
+        result = read_remote_files(transport, filepaths)
+
+    assert result == {str(tmp_path / filename): content for filename, content in contents.items()}
+
+
+def test_read_remote_files_size_limits(tmp_path):
+    """Test that :func:`aiida.engine.processes.calcjobs.monitors.read_remote_files` skips files beyond the limits."""
+    for filename, size in (('a.out', 4), ('b.out', 8), ('c.out', 4), ('d.out', 2)):
+        (tmp_path / filename).write_bytes(b'x' * size)
+
+    filepaths = [str(tmp_path / filename) for filename in ('a.out', 'b.out', 'c.out', 'd.out')]
+
+    with LocalTransport() as transport:
+        assert set(read_remote_files(transport, filepaths, max_size=4)) == {
+            str(tmp_path / filename) for filename in ('a.out', 'c.out', 'd.out')
+        }
+        assert set(read_remote_files(transport, filepaths, max_size=4, max_total_size=9)) == {
+            str(tmp_path / filename) for filename in ('a.out', 'c.out')
+        }
+
+
+def test_monitor_transport(tmp_path):
+    """Test that :class:`aiida.engine.processes.calcjobs.monitors.MonitorTransport` serves reads of known files."""
+    (tmp_path / 'remote.out').write_text('remote')
+    (tmp_path / 'local').mkdir()
+
+    with LocalTransport() as transport:
+        transport.chdir(str(tmp_path))
+        monitor_transport = MonitorTransport(transport, {'known.out': b'known'}, str(tmp_path))
+
+        monitor_transport.getfile('known.out', str(tmp_path / 'local' / 'known.out'))
+        monitor_transport.getfile('remote.out', str(tmp_path / 'local' / 'remote.out'))
+        assert monitor_transport.getcwd() == str(tmp_path)
+
+    assert (tmp_path / 'local' / 'known.out').read_text() == 'known'
+    assert (tmp_path / 'local' / 'remote.out').read_text() == 'remote'
+
+
+def test_monitor_transport_symlinked_workdir(tmp_path):
+    """Test that :class:`aiida.engine.processes.calcjobs.monitors.MonitorTransport` serves reads of known files if the
+    working directory of the transport is resolved, which differs from the symlinked remote working directory."""
+    (tmp_path / 'scratch').mkdir()
+    (tmp_path / 'link').symlink_to(tmp_path / 'scratch')
+
+    with LocalTransport() as transport:
+        transport.chdir(str(tmp_path / 'scratch'))
+        monitor_transport = MonitorTransport(transport, {'sub/known.out': b'known'}, str(tmp_path / 'link'))
+
+        for index, remotepath in enumerate(
+            (
+                'sub/known.out',
+                './sub/../sub/known.out',
+                str(tmp_path / 'link' / 'sub' / 'known.out'),
+                str(tmp_path / 'scratch' / 'sub' / 'known.out'),
+            )
+        ):
+            monitor_transport.getfile(remotepath, str(tmp_path / f'known_{index}.out'))
+            assert (tmp_path / f'known_{index}.out').read_text() == 'known'
+
+        # Relative paths no longer refer to the working directory of the job once the transport changed directory
+        transport.chdir(str(tmp_path))
+        with pytest.raises(OSError):
+            monitor_transport.getfile('sub/known.out', str(tmp_path / 'other.out'))
+
+
 def monitor_emit_warning(node, transport, **kwargs):
     """Test monitor that logs a warning when called."""
     from aiida.common.log import AIIDA_LOGGER
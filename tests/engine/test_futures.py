@@ -9,14 +9,66 @@
 """Module to test process futures."""
 
 import asyncio
+import gc
 
 import pytest
-from aiida.engine import processes, run
+from aiida import orm
+from aiida.engine import ProcessState, processes, run
 from aiida.manage import get_manager
 
 from tests.utils import processes as test_processes
 
 
+def test_get_terminated_pks(monkeypatch):
+    """Test :func:`aiida.engine.processes.futures.get_terminated_pks` queries the states in batches."""
+    monkeypatch.setattr(processes.futures, 'QUERY_BATCH_SIZE', 2)
+    nodes = [orm.WorkflowNode().store() for _ in ProcessState]
+
+    for node, state in zip(nodes, ProcessState):
+        node.set_process_state(state)
+
+    terminated = {node.pk for node in nodes if node.is_terminated}
+    assert len(terminated) == 3
+    assert processes.futures.get_terminated_pks([node.pk for node in nodes]) == terminated
+    assert processes.futures.get_terminated_pks([]) == set()
+
+
+def test_process_poller_released():
+    """Test that the :class:`aiida.engine.processes.futures.ProcessPoller` of an event loop is released with it."""
+    loop = asyncio.new_event_loop()
+    poller = processes.futures.ProcessPoller.get(loop, 1)
+    assert processes.futures.ProcessPoller.get(loop, 1) is poller
+    assert loop in processes.futures.ProcessPoller._pollers
+
+    loop.close()
+    del loop
+    gc.collect()
+
+    assert not any(pollers.get(1) is poller for pollers in processes.futures.ProcessPoller._pollers.values())
+
+
+def test_process_poller(monkeypatch):
+    """Test that the :class:`aiida.engine.processes.futures.ProcessPoller` calls the callbacks of terminated nodes."""
+    terminated = set()
+    monkeypatch.setattr(processes.futures, 'get_terminated_pks', terminated.intersection)
+    loop = asyncio.new_event_loop()
+    called = []
+
+    try:
+        poller = processes.futures.ProcessPoller(loop, 0)
+        poller.add(1, lambda: called.append(1))
+        poller.add(2, lambda: called.append(2))
+        terminated.add(2)
+        loop.run_until_complete(asyncio.sleep(0.01))
+        assert called == [2]
+
+        terminated.add(1)
+        loop.run_until_complete(asyncio.sleep(0.01))
+        assert called == [2, 1]
+    finally:
+        loop.close()
+
+
 @pytest.mark.requires_rmq
 class TestWf:
     """Test process futures."""
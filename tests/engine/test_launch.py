@@ -10,11 +10,13 @@
 
 import os
 import shutil
+import threading
+import time
 
 import pytest
 from aiida import orm
 from aiida.common import exceptions
-from aiida.engine import CalcJob, Process, WorkChain, calcfunction, launch
+from aiida.engine import CalcJob, Process, ProcessState, WorkChain, calcfunction, launch
 from aiida.plugins import CalculationFactory
 
 ArithmeticAddCalculation = CalculationFactory('core.arithmetic.add')
@@ -93,6 +95,85 @@ def test_await_processes_invalid():
         launch.await_processes(orm.ProcessNode())
 
 
+def test_as_completed_invalid():
+    """Test :func:`aiida.engine.launch.as_completed` for invalid inputs."""
+    with pytest.raises(TypeError):
+        launch.as_completed(None)
+
+    with pytest.raises(TypeError):
+        launch.as_completed([orm.Data()])
+
+
+def test_as_completed():
+    """Test :func:`aiida.engine.launch.as_completed` yields nodes in the order in which they terminate."""
+    nodes = [orm.WorkflowNode().store() for _ in range(3)]
+    nodes[0].set_process_state(ProcessState.RUNNING)
+    nodes[1].set_process_state(ProcessState.FINISHED)
+    nodes[2].set_process_state(ProcessState.KILLED)
+
+    iterator = launch.as_completed(nodes, wait_interval=0.1)
+    assert [node.pk for node in (next(iterator), next(iterator))] == [nodes[1].pk, nodes[2].pk]
+
+    nodes[0].set_process_state(ProcessState.EXCEPTED)
+    assert next(iterator).pk == nodes[0].pk
+
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+
+def test_as_completed_timeout():
+    """Test :func:`aiida.engine.launch.as_completed` raises if the processes do not terminate within the timeout."""
+    node = orm.WorkflowNode().store()
+    node.set_process_state(ProcessState.RUNNING)
+
+    with pytest.raises(TimeoutError, match='1 out of 1 processes did not terminate'):
+        list(launch.as_completed([node], wait_interval=0.1, timeout=0.2))
+
+
+def test_as_completed_missed_broadcast(monkeypatch):
+    """Test :func:`aiida.engine.launch.as_completed` checks all processes every ``wait_interval`` seconds.
+
+    Processes whose termination broadcast is missed should be found by that check, even if the broadcasts of other
+    processes keep coming in.
+    """
+    nodes = [orm.WorkflowNode().store() for _ in range(2)]
+    nodes[0].set_process_state(ProcessState.RUNNING)
+    nodes[1].set_process_state(ProcessState.RUNNING)
+    stop = threading.Event()
+    pk = nodes[0].pk
+
+    class Communicator:
+        def remove_broadcast_subscriber(self, identifier):
+            stop.set()
+
+    def subscribe_terminated(pks, terminated):
+        def broadcast():
+            while not stop.is_set():
+                terminated.put(pk)
+                time.sleep(0.01)
+
+        threading.Thread(target=broadcast, daemon=True).start()
+        return Communicator(), 'identifier'
+
+    monkeypatch.setattr(launch, '_subscribe_terminated', subscribe_terminated)
+    iterator = launch._iterate_terminated(nodes, wait_interval=0.1)
+
+    try:
+        assert next(iterator) == []
+        nodes[1].set_process_state(ProcessState.FINISHED)
+        deadline = time.monotonic() + 5
+
+        while time.monotonic() < deadline:
+            if [node.pk for node in next(iterator)] == [nodes[1].pk]:
+                break
+        else:
+            pytest.fail('process whose broadcast was missed was not found by the periodic check')
+    finally:
+        iterator.close()
+
+    assert stop.is_set()
+
+
 @pytest.mark.usefixtures('started_daemon_client')
 def test_await_processes(aiida_code_installed, caplog):
     """Test :func:`aiida.engine.launch.await_processes`."""
@@ -188,6 +269,46 @@ class TestLaunchers:
         with pytest.raises(exceptions.InvalidOperation):
             launch.submit(AddWorkChain, term_a=self.term_a, term_b=self.term_b, metadata={'store_provenance': False})
 
+    def test_submit_many(self, monkeypatch):
+        """Test :func:`aiida.engine.launch.submit_many` creates the nodes and sends a continue task for each."""
+        from plumpy.process_comms import RemoteProcessThreadController
+
+        pids = []
+        monkeypatch.setattr(
+            RemoteProcessThreadController, 'continue_process', lambda _, pid, **kwargs: pids.append(pid)
+        )
+
+        inputs = [{'term_a': orm.Int(index), 'term_b': self.term_b} for index in range(5)]
+        nodes = launch.submit_many(AddWorkChain, inputs, batch_size=2)
+
+        assert sorted(pids) == sorted(node.pk for node in nodes)
+        for index, node in enumerate(nodes):
+            assert node.is_stored
+            assert node.checkpoint is not None
+            assert node.process_state == ProcessState.CREATED
+            assert node.inputs.term_a.value == index
+
+        builder = AddWorkChain.get_builder()
+        builder.term_b = self.term_b
+        nodes = launch.submit_many(builder, [{'term_a': self.term_a}, {'term_a': self.term_b}])
+        assert [node.inputs.term_a.pk for node in nodes] == [self.term_a.pk, self.term_b.pk]
+
+    def test_submit_many_invalid(self, monkeypatch):
+        """Test that :func:`aiida.engine.launch.submit_many` submits nothing if any of the inputs are invalid."""
+        from plumpy.process_comms import RemoteProcessThreadController
+
+        monkeypatch.setattr(RemoteProcessThreadController, 'continue_process', lambda *args, **kwargs: None)
+        count = orm.QueryBuilder().append(orm.WorkChainNode).count()
+        inputs = [{'term_a': self.term_a, 'term_b': self.term_b}, {'term_a': self.term_a}]
+
+        with pytest.raises(ValueError, match='the inputs at index 1 are invalid'):
+            launch.submit_many(AddWorkChain, inputs)
+
+        with pytest.raises(exceptions.InvalidOperation):
+            launch.submit_many(AddWorkChain, [{**inputs[0], 'metadata': {'store_provenance': False}}])
+
+        assert orm.QueryBuilder().append(orm.WorkChainNode).count() == count
+
 
 @pytest.mark.requires_rmq
 class TestLaunchersDryRun:
@@ -9,12 +9,25 @@
 """Tests for the classes in `aiida.engine.processes.calcjobs.manager`."""
 
 import asyncio
+import contextlib
+import os
+import tempfile
 import time
 
 import pytest
-from aiida.engine.processes.calcjobs.manager import JobManager, JobsList
+from aiida.engine.processes.calcjobs.manager import INCREMENTAL_UPDATE_MARGIN, JobManager, JobsList, MonitorsList
+from aiida.engine.processes.calcjobs.monitors import CalcJobMonitors
 from aiida.engine.transports import TransportQueue
-from aiida.orm import User
+from aiida.orm import CalcJobNode, Computer, Dict, User
+from aiida.schedulers.datastructures import JobInfo, JobState
+from aiida.transports.plugins.local import LocalTransport
+
+
+def monitor_read_output(node, transport):
+    """Test monitor that returns the content of the ``aiida.out`` file."""
+    with tempfile.NamedTemporaryFile('w+') as handle:
+        transport.getfile('aiida.out', handle.name)
+        return handle.read()
 
 
 class TestJobManager:
@@ -43,6 +56,70 @@ class TestJobManager:
         with self.manager.request_job_info_update(self.auth_info, job_id=1) as request:
             assert isinstance(request, asyncio.Future)
 
+    def test_get_monitors_list(self):
+        """Test the `JobManager.get_monitors_list` method."""
+        monitors_list = self.manager.get_monitors_list(self.auth_info)
+        assert isinstance(monitors_list, MonitorsList)
+        assert self.manager.get_monitors_list(self.auth_info) is monitors_list
+
+    def test_request_monitors_processing(self, entry_points, tmp_path, monkeypatch):
+        """Test that the monitors of jobs with the same authinfo are processed reading their files in one command."""
+        entry_points.add(monitor_read_output, 'aiida.calculations.monitors:core.read_output')
+
+        commands = []
+        getfiles = []
+        exec_command_wait_bytes = LocalTransport.exec_command_wait_bytes
+        getfile = LocalTransport.getfile
+        getcwd = LocalTransport.getcwd
+
+        def exec_command_wait_bytes_counted(transport, command, **kwargs):
+            commands.append(command)
+            return exec_command_wait_bytes(transport, command, **kwargs)
+
+        def getfile_counted(transport, remotepath, *args, **kwargs):
+            getfiles.append(remotepath)
+            return getfile(transport, remotepath, *args, **kwargs)
+
+        monkeypatch.setattr(LocalTransport, 'exec_command_wait_bytes', exec_command_wait_bytes_counted)
+        monkeypatch.setattr(LocalTransport, 'getfile', getfile_counted)
+        # Resolve the working directory like the ``SshTransport`` does, which differs from the symlinked workdirs
+        monkeypatch.setattr(LocalTransport, 'getcwd', lambda transport: os.path.realpath(getcwd(transport)))
+
+        jobs = []
+        for index in range(3):
+            workdir = tmp_path / str(index)
+            workdir.mkdir()
+            (workdir / 'aiida.out').write_text(f'output {index}')
+            (tmp_path / f'link_{index}').symlink_to(workdir)
+            node = CalcJobNode(computer=self.computer)
+            node.set_remote_workdir(str(tmp_path / f'link_{index}'))
+            node.store()
+            monitors = CalcJobMonitors({'read': Dict({'entry_point': 'core.read_output', 'files': ['aiida.out']})})
+            jobs.append((node, monitors))
+
+        async def process_monitors():
+            with contextlib.ExitStack() as stack:
+                requests = [
+                    stack.enter_context(self.manager.request_monitors_processing(self.auth_info, node, monitors))
+                    for node, monitors in jobs
+                ]
+                return await asyncio.gather(*requests, return_exceptions=True)
+
+        results = self.loop.run_until_complete(process_monitors())
+        assert [result.message for result in results] == ['output 0', 'output 1', 'output 2']
+        assert len(commands) == 1
+        assert not getfiles
+
+        # A monitor that fails for one job should only fail the request of that job
+        (tmp_path / '1' / 'aiida.out').unlink()
+        for _, monitors in jobs:
+            monitors.monitors['read'].call_timestamp = None
+
+        results = self.loop.run_until_complete(process_monitors())
+        assert results[0].message == 'output 0'
+        assert isinstance(results[1], OSError)
+        assert results[2].message == 'output 2'
+
 
 class TestJobsList:
     """Test the `aiida.engine.processes.calcjobs.manager.JobsList` class."""
@@ -70,3 +147,77 @@ class TestJobsList:
         last_updated = time.time()
         jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=last_updated)
         assert jobs_list.last_updated == last_updated
+
+    def test_query_by_user(self, monkeypatch):
+        """Test that the tracked jobs are passed along when the jobs are queried by user."""
+        scheduler = self.computer.get_scheduler()
+        monkeypatch.setattr(scheduler, '_features', {'can_query_by_user': True})
+        monkeypatch.setattr(Computer, 'get_scheduler', lambda _: scheduler)
+
+        calls = []
+
+        def get_jobs(user, jobs, as_dict):
+            calls.append((user, jobs))
+            return {}
+
+        monkeypatch.setattr(scheduler, 'get_jobs', get_jobs)
+
+        with self.jobs_list.request_job_info_update(self.auth_info, '1') as request:
+            assert self.loop.run_until_complete(request) is None
+
+        assert calls == [('$USER', ['1'])]
+
+    def test_incremental_update(self, monkeypatch):
+        """Test that the list is updated incrementally in between full updates if the computer defines an interval."""
+        scheduler = self.computer.get_scheduler()
+        monkeypatch.setattr(scheduler, '_features', {'can_query_by_user': False, 'can_query_changes': True})
+        monkeypatch.setattr(Computer, 'get_scheduler', lambda _: scheduler)
+
+        calls = []
+        changes = {}
+
+        def get_job_info(job_id, job_state):
+            job_info = JobInfo()
+            job_info.job_id = job_id
+            job_info.job_state = job_state
+            return job_info
+
+        def get_jobs(jobs, as_dict):
+            calls.append(('get_jobs', jobs))
+            return {job_id: get_job_info(job_id, JobState.RUNNING) for job_id in jobs}
+
+        def get_job_changes(interval, jobs, as_dict):
+            calls.append(('get_job_changes', jobs))
+            assert interval >= INCREMENTAL_UPDATE_MARGIN
+            return changes
+
+        monkeypatch.setattr(scheduler, 'get_jobs', get_jobs)
+        monkeypatch.setattr(scheduler, 'get_job_changes', get_job_changes)
+
+        def request_job_info(job_id):
+            with self.jobs_list.request_job_info_update(self.auth_info, job_id) as request:
+                return self.loop.run_until_complete(request)
+
+        # Without a full job poll interval, the jobs list is always fully updated
+        assert request_job_info('1').job_state == JobState.RUNNING
+        assert request_job_info('1').job_state == JobState.RUNNING
+        assert calls == [('get_jobs', ['1']), ('get_jobs', ['1'])]
+
+        # Jobs that did not change keep their last known state, jobs that did are updated
+        self.computer.set_full_job_poll_interval(3600)
+        calls.clear()
+        assert request_job_info('1').job_state == JobState.RUNNING
+        changes['1'] = get_job_info('1', JobState.DONE)
+        assert request_job_info('1').job_state == JobState.DONE
+        assert calls == [('get_job_changes', ['1']), ('get_job_changes', ['1'])]
+
+        # A job that is not yet known requires a full update
+        calls.clear()
+        assert request_job_info('2').job_state == JobState.RUNNING
+        assert calls == [('get_jobs', ['2'])]
+
+        # Once the full job poll interval has passed, the jobs list is fully updated again
+        calls.clear()
+        self.computer.set_full_job_poll_interval(0)
+        request_job_info('2')
+        assert calls == [('get_jobs', ['2'])]
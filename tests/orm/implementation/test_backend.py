@@ -133,6 +133,67 @@ class TestBackend:
         for i, user in enumerate(users):
             assert user.email == f'{prefix}-{i}'
 
+    def test_bulk_match(self):
+        """Test that bulk match returns the primary keys of the stored entities with matching unique fields."""
+        nodes = [orm.Data().store() for _ in range(3)]
+        missing = str(uuid.uuid4())
+        matched = self.backend.bulk_match(EntityTypes.NODE, 'uuid', [node.uuid for node in nodes] + [missing])
+        assert matched == {node.uuid: node.pk for node in nodes}
+
+        prefix = uuid.uuid4().hex
+        users = [orm.User(f'{prefix}-{i}').store() for i in range(3)]
+        matched = self.backend.bulk_match(EntityTypes.USER, 'email', [user.email for user in users], filter_size=2)
+        assert matched == {user.email: user.pk for user in users}
+
+        assert self.backend.bulk_match(EntityTypes.NODE, 'uuid', []) == {}
+
+    def test_bulk_match_failure(self, monkeypatch):
+        """Test that bulk match drops its temporary table when matching the values fails."""
+        import sqlalchemy
+
+        node = orm.Data().store()
+        name = uuid.uuid4()
+        monkeypatch.setattr(uuid, 'uuid4', lambda: name)
+
+        def select(*args, **kwargs):
+            raise RuntimeError
+
+        with self.backend.transaction():
+            with monkeypatch.context() as context:
+                context.setattr(sqlalchemy, 'select', select)
+                with pytest.raises(RuntimeError):
+                    self.backend.bulk_match(EntityTypes.NODE, 'uuid', [node.uuid])
+
+            # The temporary table has the same name, so creating it would fail if it had not been dropped
+            assert self.backend.bulk_match(EntityTypes.NODE, 'uuid', [node.uuid]) == {node.uuid: node.pk}
+
+    @pytest.mark.parametrize('default', (False, True), ids=('backend', 'default'))
+    def test_bulk_set_extras(self, default):
+        """Test that bulk set extras only sets the given keys of the extras of the entities."""
+        from aiida.orm.implementation import StorageBackend
+
+        bulk_set_extras = StorageBackend.bulk_set_extras if default else type(self.backend).bulk_set_extras
+        nodes = [orm.Data().store() for _ in range(3)]
+        for index, node in enumerate(nodes):
+            node.base.extras.set_many({'index': index, 'flag': False})
+
+        bulk_set_extras(
+            self.backend, EntityTypes.NODE, [node.pk for node in nodes[:2]], {'flag': True, 'nested': {'a': [1]}}, 1
+        )
+
+        query = orm.QueryBuilder().append(orm.Data, filters={'id': {'in': [node.pk for node in nodes]}}, project='*')
+        extras = {
+            node.pk: {k: v for k, v in node.base.extras.all.items() if k != '_aiida_hash'} for (node,) in query.all()
+        }
+        assert extras[nodes[0].pk] == {'index': 0, 'flag': True, 'nested': {'a': [1]}}
+        assert extras[nodes[1].pk] == {'index': 1, 'flag': True, 'nested': {'a': [1]}}
+        assert extras[nodes[2].pk] == {'index': 2, 'flag': False}
+
+        group = orm.Group(uuid.uuid4().hex).store()
+        group.base.extras.set('index', 0)
+        bulk_set_extras(self.backend, EntityTypes.GROUP, [group.pk], {'flag': True})
+        assert orm.load_group(group.pk).base.extras.all == {'index': 0, 'flag': True}
+
     def test_delete_nodes_and_connections(self):
         """Delete all nodes and connections."""
         # create node, link and add to group
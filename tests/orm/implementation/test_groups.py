@@ -8,6 +8,7 @@
 ###########################################################################
 """Unit tests for the BackendGroup and BackendGroupCollection classes."""
 
+import pytest
 from aiida import orm
 
 
@@ -61,6 +62,23 @@ def test_add_nodes_skip_orm_batch():
         assert set(_.pk for _ in nodes) == set(_.pk for _ in group.nodes)
 
 
+def test_add_nodes_duplicates_in_transaction(backend):
+    """Test that `SqlaGroup.add_nodes` skips existing memberships without aborting the enclosing transaction."""
+    group = orm.Group(label='test_add_nodes_duplicates').store().backend_entity
+    nodes = [orm.Data().store().backend_entity for _ in range(5)]
+
+    group.add_nodes(nodes[:2])
+
+    with backend.transaction():
+        group.add_nodes(nodes + nodes[:1], batch_size=2)
+        orm.Data().store()
+
+    assert sorted(node.pk for node in group.nodes) == sorted(node.pk for node in nodes)
+
+    with pytest.raises(ValueError, match='batch_size should be a positive integer'):
+        group.add_nodes(nodes, batch_size=0)
+
+
 def test_remove_nodes_bulk():
     """Test node removal with `skip_orm=True`."""
     group = orm.Group(label='test_removing_nodes').store().backend_entity
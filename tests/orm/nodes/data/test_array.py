@@ -8,6 +8,8 @@
 ###########################################################################
 """Tests for the :mod:`aiida.orm.nodes.data.array.array` module."""
 
+import pathlib
+
 import numpy
 import pytest
 from aiida.orm import ArrayData, load_node
@@ -60,3 +62,51 @@ def test_get_array():
 
     node = ArrayData(numpy.array([1, 2]))
     assert (node.get_array() == numpy.array([1, 2])).all()
+
+
+@pytest.mark.parametrize('store', (False, True))
+def test_get_array_mmap(store):
+    """Test :meth:`aiida.orm.nodes.data.array.array.ArrayData:get_array` with ``mmap=True``."""
+    array = numpy.arange(24, dtype=float).reshape((2, 3, 4))
+    node = ArrayData({'a': array, 'empty': numpy.array([])})
+
+    if store:
+        node.store()
+
+    mapped = node.get_array('a', mmap=True)
+    assert isinstance(mapped, numpy.memmap)
+    assert not mapped.flags.writeable
+    assert numpy.array_equal(mapped, array)
+    assert numpy.array_equal(mapped[1, :, 2], array[1, :, 2])
+    assert node.get_array('empty', mmap=True).shape == (0,)
+
+    with pytest.raises(KeyError):
+        node.get_array('non_existent', mmap=True)
+
+    if store:
+        assert node.get_array('a', mmap=True) is mapped
+        assert not node._cached_arrays
+        node.clear_internal_cache()
+        assert node.get_array('a', mmap=True) is not mapped
+
+
+@pytest.mark.parametrize('compress', (False, True))
+def test_get_array_mmap_packed(compress):
+    """Test that ``get_array`` with ``mmap=True`` maps the pack file of packed objects that are not compressed."""
+    # the content differs per parametrization, since an object that is already packed is not packed again
+    array = numpy.arange(24, dtype=float).reshape((2, 3, 4), order='F') + compress
+    node = ArrayData({'a': array}).store()
+    repository = node.backend.get_repository()
+
+    with repository._container as container:
+        container.pack_all_loose(compress=compress)
+        container.clean_storage()
+
+    region = node.base.repository.get_object_region('a.npy')
+    mapped = node.get_array('a', mmap=True)
+    assert numpy.array_equal(mapped, array)
+
+    if compress:
+        assert region is None
+    else:
+        assert pathlib.Path(mapped.filename) == region[0]
@@ -9,6 +9,7 @@
 """Tests for cif related functions."""
 
 import pytest
+from aiida.orm import CifData, SinglefileData
 from aiida.orm.nodes.data.cif import parse_formula
 
 
@@ -50,3 +51,31 @@ def test_parse_formula():
     for test_formula in ('H0.5.2 O', 'Fe2.05Ni0.05.4', 'Na1.28[NH]0.28.3{NH2}0.72'):
         with pytest.raises(ValueError):
             parse_formula(test_formula)
+
+
+def test_get_or_create_many(tmp_path):
+    """Test the ``from_md5s`` and ``get_or_create_many`` class methods of ``CifData``."""
+    existing = tmp_path / 'existing.cif'
+    existing.write_text('data_test _cell_length_a 11(1)')
+    new = tmp_path / 'new.cif'
+    new.write_text('data_test _cell_length_b 12(1)')
+    new_copy = tmp_path / 'new_copy.cif'
+    new_copy.write_text('data_test _cell_length_b 12(1)')
+
+    node = CifData(file=str(existing)).store()
+    md5 = node.base.attributes.get('md5')
+    assert CifData.from_md5s([md5, 'unknown']) == {md5: [node], 'unknown': []}
+
+    results = CifData.get_or_create_many([str(existing), str(new), str(new_copy)], store=False)
+    assert [created for _, created in results] == [False, True, False]
+    assert results[0][0].uuid == node.uuid
+    assert results[1][0] is results[2][0]
+    assert not results[1][0].is_stored
+
+    results = CifData.get_or_create_many([str(new), str(new_copy)])
+    assert results[0][0].is_stored
+    assert CifData.get_or_create_many([str(new)]) == [(results[0][0], False)]
+
+    # The base class does not store the md5 of its file, so it cannot be looked up by it
+    assert not hasattr(SinglefileData, 'from_md5s')
+    assert not hasattr(SinglefileData, 'get_or_create_many')
@@ -9,7 +9,7 @@
 """Tests for StructureData-related functions."""
 
 import pytest
-from aiida.orm.nodes.data.structure import StructureData, get_formula
+from aiida.orm.nodes.data.structure import StructureData, get_formula, has_ase
 
 
 def test_get_formula_hill():
@@ -46,3 +46,68 @@ def test_get_composition(mode, expected):
         structure.append_atom(name=symbol, symbols=[symbol], position=[0, 0, 0])
 
     assert structure.get_composition(mode=mode) == expected
+
+
+def test_set_sites():
+    """Test ``StructureData.set_sites`` and the array accessors of the sites."""
+    import numpy as np
+    from aiida.orm.nodes.data.structure import Kind
+
+    structure = StructureData(cell=np.eye(3) * 4.0)
+    structure.append_kind(Kind(symbols='Fe', name='Fe1'))
+    structure.append_kind(Kind(symbols='Fe', name='Fe2'))
+    structure.append_kind(Kind(symbols='O', name='O'))
+
+    positions = np.random.default_rng(0).random((6, 3))
+    kind_names = ['Fe1', 'Fe2', 'O', 'O', 'O', 'Fe1']
+    structure.set_sites(positions, kind_names)
+
+    assert structure.get_site_kindnames() == kind_names
+    assert np.array_equal(structure.get_site_positions(), positions)
+    assert [site.kind_name for site in structure.sites] == kind_names
+    assert [site.position for site in structure.sites] == [tuple(position) for position in positions.tolist()]
+    assert structure.get_composition() == {'Fe': 3, 'O': 3}
+
+    with pytest.raises(ValueError, match='No kind with name'):
+        structure.set_sites(positions, kind_names[:-1] + ['Mn'])
+
+    with pytest.raises(ValueError, match='kind names for'):
+        structure.set_sites(positions, kind_names[:-1])
+
+    with pytest.raises(ValueError, match='Wrong format for positions'):
+        structure.set_sites(positions[:, :2], kind_names)
+
+    structure.store()
+    assert structure.get_site_kindnames() == kind_names
+    assert np.allclose(structure.get_site_positions(), positions)
+
+
+@pytest.mark.skipif(not has_ase(), reason='Unable to import ase')
+def test_get_ase_bulk():
+    """Test that the bulk ASE conversion gives the same result as the conversion of the individual sites."""
+    import ase
+    import numpy as np
+    from aiida.orm.nodes.data.structure import Kind
+
+    structure = StructureData(cell=np.eye(3) * 4.0)
+    structure.append_kind(Kind(symbols='Fe', name='Fe1'))
+    structure.append_kind(Kind(symbols='Fe', name='Fe'))
+    structure.append_kind(Kind(symbols='Fe', name='FeX'))
+    structure.append_kind(Kind(symbols='O', name='O', mass=17.0))
+    structure.set_sites(np.random.default_rng(0).random((5, 3)), ['Fe1', 'O', 'FeX', 'Fe', 'O'])
+
+    expected = ase.Atoms(cell=structure.cell, pbc=structure.pbc)
+    for site in structure.sites:
+        expected.append(site.get_ase(kinds=structure.kinds))
+
+    atoms = structure.get_ase()
+    assert atoms == expected
+    assert atoms.get_tags().tolist() == expected.get_tags().tolist() == [1, 0, 2, 0, 0]
+    assert np.array_equal(atoms.get_masses(), expected.get_masses())
+
+    structure = StructureData(cell=np.eye(3) * 4.0)
+    structure.append_kind(Kind(symbols=['Fe', 'O'], weights=[0.5, 0.5], name='FeO'))
+    structure.set_sites([[0, 0, 0]], ['FeO'])
+
+    with pytest.raises(ValueError, match='alloy'):
+        structure.get_ase()
@@ -111,6 +111,22 @@ class TestTrajectory:
         np.array_equal(positions, trajectory_data['positions'][-2, :, :])
         np.array_equal(velocities, trajectory_data['velocities'][-2, :, :])
 
+    def test_trajectory_get_step_data_stored(self, trajectory_data):
+        """Test that ``get_step_data`` of a stored trajectory only reads the requested step."""
+        trajectory = TrajectoryData()
+        trajectory.set_trajectory(**trajectory_data)
+        trajectory.store()
+
+        trajectory = load_node(trajectory.pk)
+        stepid, time, cell, _, positions, velocities = trajectory.get_step_data(7)
+        assert stepid == trajectory_data['stepids'][7]
+        assert time == trajectory_data['times'][7]
+        assert np.array_equal(cell, trajectory_data['cells'][7])
+        assert np.array_equal(positions, trajectory_data['positions'][7])
+        assert np.array_equal(velocities, trajectory_data['velocities'][7])
+        assert not isinstance(positions, np.memmap)
+        assert not trajectory._cached_arrays
+
     def test_trajectory_get_step_data_empty(self, trajectory_data):
         """Test the `get_step_data` method when some arrays are not defined."""
         trajectory = TrajectoryData()
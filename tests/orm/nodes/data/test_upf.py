@@ -16,6 +16,7 @@ import numpy
 import pytest
 from aiida import orm
 from aiida.common.exceptions import ParsingError
+from aiida.common.warnings import AiidaDeprecationWarning
 from aiida.orm.nodes.data.upf import parse_upf
 from numpy import array, isclose
 
@@ -145,6 +146,51 @@ class TestUpfParser:
         groups = {group.label for group in orm.UpfData.get_upf_groups(filter_elements='Ba', user=user.email)}
         assert groups == set([])
 
+    def test_get_or_create_many(self):
+        """Test the `UpfData.from_md5s` and `UpfData.get_or_create_many` class methods."""
+        from aiida.orm.nodes.data.upf import upload_upf_family
+
+        filepaths = []
+        tokens = [uuid.uuid4().hex, uuid.uuid4().hex]
+        for basename, element, token in (
+            ('Ti.existing.UPF', 'Ti', tokens[0]),
+            ('Fe.new.UPF', 'Fe', tokens[1]),
+            ('Fe.new_copy.UPF', 'Fe', tokens[1]),
+        ):
+            filepath = os.path.join(self.temp_dir, basename)
+            with open(filepath, 'w') as handle:
+                handle.write(f'<UPF version="2.0.1">\n<PP_INFO>{token}</PP_INFO>\n<PP_HEADER element="{element}"/>\n')
+            filepaths.append(filepath)
+
+        existing = orm.UpfData(file=filepaths[0]).store()
+        assert orm.UpfData.from_md5s([existing.md5sum, 'unknown']) == {existing.md5sum: [existing], 'unknown': []}
+
+        results = orm.UpfData.get_or_create_many(filepaths)
+        assert [created for _, created in results] == [False, True, False]
+        assert results[0][0].uuid == existing.uuid
+        assert results[1][0] is results[2][0]
+        assert results[1][0].is_stored
+        assert results[1][0].element == 'Fe'
+
+        # A second copy of the first file makes the lookup ambiguous
+        orm.UpfData(file=filepaths[0]).store()
+        with pytest.raises(ValueError, match='More than one copy'):
+            orm.UpfData.get_or_create_many(filepaths)
+        assert all(not created for _, created in orm.UpfData.get_or_create_many(filepaths, use_first=True))
+
+        with pytest.raises(ValueError, match='cannot be added with stop_if_existing'):
+            upload_upf_family(self.temp_dir, 'family_many', '')
+
+        assert upload_upf_family(self.temp_dir, 'family_many', '', stop_if_existing=False) == (3, 0)
+        group = orm.UpfFamily.collection.get(label='family_many')
+        assert {node.uuid for node in group.nodes} == {node.uuid for node, _ in results}
+
+    def test_get_or_create_many_deprecation(self, monkeypatch):
+        """Test that `UpfData.get_or_create_many` emits the deprecation warning of the module."""
+        monkeypatch.setenv('AIIDA_WARN_v3', 'true')
+        with pytest.warns(AiidaDeprecationWarning):
+            orm.UpfData.get_or_create_many([])
+
     def test_upf_version_one(self):
         """Check if parsing for regular UPF file (version 1) succeeds."""
         upf_filename = 'O.test_file_v1.UPF'
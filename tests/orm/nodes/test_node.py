@@ -629,6 +629,78 @@ class TestNodeLinks:
         target.base.links.validate_incoming(source_one, LinkType.RETURN, 'other_label')
         target.base.links.validate_incoming(source_two, LinkType.RETURN, 'link_label')
 
+    def test_add_incoming_many(self):
+        """Test that ``add_incoming_many`` validates all links, also with respect to each other, before adding any."""
+        source_one = Data().store()
+        source_two = Data()
+        target = CalculationNode()
+
+        target.base.links.add_incoming(source_one, LinkType.INPUT_CALC, 'link_one')
+
+        # The second link would be a duplicate of the first
+        link_triples = [LinkTriple(source_two, LinkType.INPUT_CALC, 'link_two')] * 2
+        with pytest.raises(ValueError, match='already has an outgoing'):
+            target.base.links.add_incoming_many(link_triples)
+
+        # The link pair would be a duplicate of an existing link
+        with pytest.raises(ValueError, match='already has an incoming'):
+            target.base.links.add_incoming_many([LinkTriple(source_two, LinkType.INPUT_CALC, 'link_one')])
+
+        assert len(target.base.links.get_incoming().all()) == 1
+
+        target.base.links.add_incoming_many(
+            [LinkTriple(source_one, LinkType.INPUT_CALC, 'link_two'), LinkTriple(source_two, LinkType.INPUT_CALC, 'x')]
+        )
+        target.store_all()
+        assert sorted(target.base.links.get_incoming().all_link_labels()) == ['link_one', 'link_two', 'x']
+
+        # Input links cannot be added to a stored process node
+        with pytest.raises(ValueError, match='after the process node was already stored'):
+            target.base.links.add_incoming_many([LinkTriple(Data().store(), LinkType.INPUT_CALC, 'link_three')])
+
+    def test_add_outgoing_many(self):
+        """Test that ``add_outgoing_many`` validates all links, also with respect to each other, before adding any."""
+        source = CalculationNode().store()
+        stored = Data()
+        stored.base.links.add_incoming(source, LinkType.CREATE, 'stored')
+        stored.store()
+
+        # A stored node cannot have a second incoming CREATE link and the link labels of a source have to be unique
+        for link_triples in (
+            [LinkTriple(Data(), LinkType.CREATE, 'one'), LinkTriple(stored, LinkType.CREATE, 'two')],
+            [LinkTriple(Data(), LinkType.CREATE, 'one'), LinkTriple(Data(), LinkType.CREATE, 'one')],
+            [LinkTriple(Data(), LinkType.CREATE, 'stored')],
+        ):
+            with pytest.raises(ValueError, match='already has an'):
+                source.base.links.add_outgoing_many(link_triples)
+            assert not any(target.base.links.incoming_cache for target, _, _ in link_triples if not target.is_stored)
+
+        targets = [Data(), Data()]
+        source.base.links.add_outgoing_many(
+            [LinkTriple(target, LinkType.CREATE, f'out_{i}') for i, target in enumerate(targets)]
+        )
+        for target in targets:
+            target.store()
+
+        assert sorted(source.base.links.get_outgoing().all_link_labels()) == ['out_0', 'out_1', 'stored']
+
+    def test_add_outgoing_many_return(self):
+        """Test that ``add_outgoing_many`` calls ``validate_outgoing`` of the source for each link."""
+        source = WorkflowNode().store()
+        target = Data().store()
+
+        source.base.links.add_outgoing_many([LinkTriple(target, LinkType.RETURN, 'one')])
+
+        with pytest.raises(ValueError, match='already has an outgoing'):
+            source.base.links.add_outgoing_many([LinkTriple(Data().store(), LinkType.RETURN, 'one')])
+
+        with pytest.raises(ValueError, match='unstored `Data` node'):
+            source.base.links.add_outgoing_many([LinkTriple(Data(), LinkType.RETURN, 'two')])
+
+        # The same target can be returned by the same source with another label
+        source.base.links.add_outgoing_many([LinkTriple(target, LinkType.RETURN, 'two')])
+        assert sorted(source.base.links.get_outgoing().all_link_labels()) == ['one', 'two']
+
     def test_validate_outgoing_workflow(self):
         """Verify that attaching an unstored `Data` node with `RETURN` link from a `WorkflowNode` raises.
 
@@ -1,6 +1,7 @@
 """Tests for the :mod:`aiida.orm.nodes.repository` module."""
 
 import pathlib
+import stat
 
 import pytest
 from aiida.common import exceptions
@@ -259,3 +260,28 @@ def test_as_path():
     with node.base.repository.as_path('relative/path.dat') as filepath:
         assert filepath.read_bytes() == b'content_relative'
     assert not filepath.exists()
+
+
+@pytest.mark.parametrize('store', (False, True))
+def test_as_path_zero_copy(store):
+    """Test the ``NodeRepository.as_path`` method with ``zero_copy=True``."""
+    node = Data()
+    node.base.repository.put_object_from_bytes(b'content_some_file', 'some_file.txt')
+    node.base.repository.put_object_from_bytes(b'content_relative', 'relative/path.dat')
+
+    if store:
+        node.store()
+
+    with node.base.repository.as_path(zero_copy=True) as dirpath:
+        assert sorted([p.name for p in dirpath.iterdir()]) == ['relative', 'some_file.txt']
+        assert (dirpath / 'some_file.txt').read_bytes() == b'content_some_file'
+        assert (dirpath / 'relative' / 'path.dat').read_bytes() == b'content_relative'
+    assert not dirpath.exists()
+
+    with node.base.repository.as_path('relative/path.dat', zero_copy=True) as filepath:
+        assert filepath.name == 'path.dat'
+        assert filepath.read_bytes() == b'content_relative'
+        assert not filepath.stat().st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    assert not filepath.exists()
+
+    assert node.base.repository.get_object_content('relative/path.dat', mode='rb') == b'content_relative'
@@ -106,3 +106,36 @@ def test_get_or_create_invalid_prefix(backend):
     assert (
         group.label == expected_label
     ), f"The auto-group should be labelled '{expected_label}', it is instead '{group.label}'"
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_buffered_memberships(backend, monkeypatch):
+    """Test that memberships of nodes stored in a transaction are added when the outermost transaction exits."""
+    from aiida.orm import Data
+
+    autogroup = backend.autogroup
+    autogroup.enable()
+    monkeypatch.setattr(autogroup, 'BUFFER_SIZE', 3)
+
+    try:
+        with backend.transaction():
+            first = Data().store()
+            assert not QueryBuilder(backend).append(AutoGroup).count()
+
+            try:
+                with backend.transaction():
+                    for _ in range(3):
+                        Data().store()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+            second = Data().store()
+
+        group = autogroup.get_or_create_group()
+        assert sorted(node.pk for node in group.nodes) == sorted([first.pk, second.pk])
+
+        third = Data().store()
+        assert third.pk in [node.pk for node in group.nodes]
+    finally:
+        autogroup.disable()
@@ -15,6 +15,7 @@ from collections import defaultdict
 from datetime import date, datetime, timedelta
 from itertools import chain
 
+import numpy
 import pytest
 from aiida import orm, plugins
 from aiida.common.links import LinkType
@@ -667,6 +668,71 @@ class TestBasic:
         query = orm.QueryBuilder().append(orm.Data, project=['id', 'uuid'], filters={'id': node.pk})
         assert query.first(flat=True) == [node.pk, node.uuid]
 
+    @staticmethod
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_itercolumns():
+        """Test the columnar results of ``QueryBuilder.itercolumns`` and ``QueryBuilder.as_numpy``."""
+        nodes = []
+        for index in range(5):
+            node = orm.Data()
+            node.base.attributes.set_many({'energy': index + 0.5, 'index': index, 'name': f'node_{index}'})
+            nodes.append(node.store())
+
+        builder = orm.QueryBuilder().append(
+            orm.Data, project=['id', 'uuid', 'attributes.energy', 'attributes.index', 'attributes.name']
+        )
+        builder.order_by({orm.Data: 'id'})
+        assert len(list(builder.itercolumns(batch_size=2))) == 3
+
+        columns = builder.as_numpy(batch_size=2)
+        assert list(columns) == ['id', 'uuid', 'attributes.energy', 'attributes.index', 'attributes.name']
+        assert columns['id'].tolist() == [node.pk for node in nodes]
+        assert columns['uuid'].tolist() == [node.uuid for node in nodes]
+        assert columns['attributes.energy'].dtype.kind == 'f'
+        assert columns['attributes.energy'].tolist() == [0.5, 1.5, 2.5, 3.5, 4.5]
+        assert columns['attributes.index'].dtype.kind == 'i'
+        assert columns['attributes.name'].dtype == object
+        assert columns['attributes.name'].tolist() == [f'node_{index}' for index in range(5)]
+
+        # The same projection for multiple tags is prefixed by the tag
+        builder = orm.QueryBuilder().append(orm.Data, tag='data', project='id', filters={'id': nodes[0].pk})
+        builder.append(orm.User, tag='user', with_node='data', project=['id', 'email'])
+        assert list(builder.as_numpy()) == ['data.id', 'user.id', 'email']
+
+        # The columns are known for a query without results
+        columns = orm.QueryBuilder().append(orm.Data, project='id', filters={'id': -1}).as_numpy()
+        assert list(columns) == ['id']
+        assert len(columns['id']) == 0
+
+        with pytest.raises(ValueError, match='project their fields instead'):
+            orm.QueryBuilder().append(orm.Data).as_numpy()
+
+    @staticmethod
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_as_dataframe():
+        """Test the ``QueryBuilder.as_dataframe`` method."""
+        pytest.importorskip('pandas')
+        nodes = [orm.Int(value).store() for value in range(3)]
+
+        builder = orm.QueryBuilder().append(orm.Int, project=['id', 'attributes.value']).order_by({orm.Int: 'id'})
+        dataframe = builder.as_dataframe()
+        assert list(dataframe.columns) == ['id', 'attributes.value']
+        assert dataframe['id'].tolist() == [node.pk for node in nodes]
+        numpy.testing.assert_array_equal(dataframe['attributes.value'], [0, 1, 2])
+
+    @staticmethod
+    @pytest.mark.usefixtures('aiida_profile_clean')
+    def test_as_arrow():
+        """Test the ``QueryBuilder.as_arrow`` method."""
+        pytest.importorskip('pyarrow')
+        nodes = [orm.Int(value).store() for value in range(3)]
+
+        builder = orm.QueryBuilder().append(orm.Int, project=['uuid', 'attributes.value']).order_by({orm.Int: 'id'})
+        table = builder.as_arrow(batch_size=2)
+        assert table.column_names == ['uuid', 'attributes.value']
+        assert table.column('uuid').to_pylist() == [node.uuid for node in nodes]
+        assert table.column('attributes.value').to_pylist() == [0, 1, 2]
+
     @pytest.mark.usefixtures('aiida_profile_clean')
     def test_query_links(self):
         """Test querying for links"""
@@ -912,6 +978,29 @@ class TestAttributes:
         res = [str(_) for (_,) in qb.all()]
         assert set(res) == set((n_arr.uuid,))
 
+    def test_attribute_string_negation(self):
+        """Test that negated string filters match nodes where the attribute is missing or of another type."""
+        key = 'value_test_attr_negation'
+        n_str, n_int, n_missing = [orm.Data() for _ in range(3)]
+        n_str.base.attributes.set(key, '1')
+        n_int.base.attributes.set(key, 1)
+
+        for n in (n_str, n_int, n_missing):
+            n.store()
+
+        uuids = {n_str.uuid, n_int.uuid, n_missing.uuid}
+
+        for filters in ({'==': '1'}, {'in': ['1', 'one']}):
+            qb = orm.QueryBuilder().append(orm.Data, filters={f'attributes.{key}': filters}, project='uuid')
+            assert {str(_) for (_,) in qb.all()} & uuids == {n_str.uuid}
+
+            negated = {f'!{operator}': value for operator, value in filters.items()}
+            qb = orm.QueryBuilder().append(orm.Data, filters={f'attributes.{key}': negated}, project='uuid')
+            assert {str(_) for (_,) in qb.all()} & uuids == {n_int.uuid, n_missing.uuid}
+
+            qb = orm.QueryBuilder().append(orm.Data, filters={'!and': [{f'attributes.{key}': filters}]}, project='uuid')
+            assert {str(_) for (_,) in qb.all()} & uuids == {n_int.uuid, n_missing.uuid}
+
 
 class TestQueryBuilderLimitOffsets:
     @pytest.mark.usefixtures('aiida_profile_clean')
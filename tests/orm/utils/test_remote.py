@@ -0,0 +1,108 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the remote utils."""
+
+import os
+
+import pytest
+from aiida.orm import QueryBuilder, RemoteData, load_node
+from aiida.orm.entities import EntityTypes
+from aiida.orm.utils.remote import clean_mapping_remote_paths, clean_remote_paths
+from aiida.transports.plugins.local import LocalTransport
+
+
+def test_clean_remote_paths(tmp_path):
+    """Test that ``clean_remote_paths`` removes all folders, also when they are split over several commands."""
+    paths = []
+    for index in range(10):
+        path = tmp_path / f"work dir '{index}'"
+        (path / 'sub').mkdir(parents=True)
+        (path / 'sub' / 'file.txt').write_text('content')
+        paths.append(str(path))
+    paths.append(str(tmp_path / 'non-existent'))
+
+    with LocalTransport() as transport:
+        assert clean_remote_paths(transport, paths, max_command_length=100) == paths
+
+    assert list(tmp_path.iterdir()) == []
+
+    with LocalTransport() as transport:
+        with pytest.raises(ValueError, match='should be absolute'):
+            clean_remote_paths(transport, ['relative'])
+
+        with pytest.raises(ValueError, match='root directory'):
+            clean_remote_paths(transport, ['/'])
+
+
+@pytest.fixture
+def read_only_folder(tmp_path):
+    """Return a folder with a file whose parent folder is read only, such that the folder cannot be removed."""
+    if os.geteuid() == 0:
+        pytest.skip('the permissions of the parent folder do not apply to the root user')
+
+    path = tmp_path / 'read_only' / 'work'
+    path.mkdir(parents=True)
+    (path / 'file.txt').write_text('content')
+    (tmp_path / 'read_only').chmod(0o555)
+    yield path
+    (tmp_path / 'read_only').chmod(0o755)
+
+
+def test_clean_remote_paths_failure(tmp_path, read_only_folder):
+    """Test that ``clean_remote_paths`` only returns the paths that were removed if the batched command fails."""
+    path = tmp_path / 'work'
+    path.mkdir()
+    paths = [str(read_only_folder), str(path)]
+
+    with LocalTransport() as transport:
+        assert clean_remote_paths(transport, paths) == [str(path)]
+
+    assert read_only_folder.exists()
+    assert not path.exists()
+
+
+def test_clean_mapping_remote_paths(tmp_path, aiida_localhost):
+    """Test that ``clean_mapping_remote_paths`` removes the folders and marks all nodes as cleaned."""
+    nodes = []
+    for index in range(3):
+        path = tmp_path / str(index)
+        path.mkdir()
+        (path / 'file.txt').write_text('content')
+        node = RemoteData(remote_path=str(path), computer=aiida_localhost)
+        node.base.extras.set('key', index)
+        nodes.append(node.store())
+
+    # Extras that are changed in the database after the nodes were loaded should not be overwritten
+    aiida_localhost.backend.bulk_update(EntityTypes.NODE, [{'id': nodes[0].pk, 'extras': {'key': 0, 'other': 1}}])
+
+    assert clean_mapping_remote_paths({aiida_localhost.uuid: nodes}) == {aiida_localhost.label: 3}
+    assert list(tmp_path.iterdir()) == []
+
+    for index, node in enumerate(nodes):
+        loaded = load_node(node.pk)
+        assert loaded.is_cleaned
+        assert loaded.base.extras.get('key') == index
+
+    extras = QueryBuilder().append(RemoteData, filters={'id': nodes[0].pk}, project='extras').one()[0]
+    assert extras == {'key': 0, 'other': 1, RemoteData.KEY_EXTRA_CLEANED: True}
+
+    assert clean_mapping_remote_paths({}) == {}
+
+
+def test_clean_mapping_remote_paths_failure(tmp_path, aiida_localhost, read_only_folder):
+    """Test that ``clean_mapping_remote_paths`` only marks the nodes whose folder was removed as cleaned."""
+    path = tmp_path / 'work'
+    path.mkdir()
+    nodes = [
+        RemoteData(remote_path=str(folder), computer=aiida_localhost).store() for folder in (read_only_folder, path)
+    ]
+
+    assert clean_mapping_remote_paths({aiida_localhost.uuid: nodes}) == {aiida_localhost.label: 1}
+    assert not load_node(nodes[0].pk).is_cleaned
+    assert load_node(nodes[1].pk).is_cleaned
@@ -2,6 +2,7 @@
 
 import io
 import pathlib
+import stat
 
 import pytest
 from aiida.repository.backend.disk_object_store import DiskObjectStoreRepositoryBackend
@@ -136,6 +137,64 @@ def test_open(repository, generate_directory):
         assert handle.read() == b'content_b'
 
 
+@pytest.mark.parametrize('compress', (None, False, True))
+def test_link_object(repository, tmp_path_factory, compress):
+    """Test the ``link_object`` method for loose objects and for packed objects with and without compression."""
+    repository.initialise()
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
+    dirpath = tmp_path_factory.mktemp('target')
+
+    if compress is not None:
+        with repository._container as container:
+            container.pack_all_loose(compress=compress)
+            container.clean_storage()
+
+    repository.link_object(key, dirpath / 'file')
+    assert (dirpath / 'file').read_bytes() == b'content'
+    assert not (dirpath / 'file').stat().st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+    with pytest.raises(FileExistsError):
+        repository.link_object(key, dirpath / 'file')
+
+    with pytest.raises(FileNotFoundError):
+        repository.link_object('non_existent', dirpath / 'other')
+
+
+@pytest.mark.parametrize('compress', (None, False, True))
+def test_get_object_region(repository, compress):
+    """Test the ``get_object_region`` method for loose objects and for packed objects with and without compression."""
+    repository.initialise()
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
+
+    if compress is not None:
+        with repository._container as container:
+            container.pack_all_loose(compress=compress)
+            container.clean_storage()
+
+    region = repository.get_object_region(key)
+
+    if compress:
+        assert region is None
+    else:
+        filepath, offset, size = region
+        assert filepath.read_bytes()[offset : offset + size] == b'content'
+
+    with pytest.raises(FileNotFoundError):
+        repository.get_object_region('non_existent')
+
+
+def test_link_object_loose(repository, tmp_path_factory):
+    """Test that ``link_object`` does not copy loose objects."""
+    repository.initialise()
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
+    filepath = tmp_path_factory.mktemp('target') / 'file'
+
+    repository.link_object(key, filepath)
+
+    with repository._container as container:
+        assert filepath.samefile(container._get_loose_path_from_hashkey(key))
+
+
 def test_iter_object_streams(repository):
     """Test the ``Repository.iter_object_streams`` method."""
     repository.initialise()
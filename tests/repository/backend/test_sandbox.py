@@ -1,7 +1,9 @@
 """Tests for the :mod:`aiida.repository.backend.sandbox` module."""
 
 import io
+import os
 import pathlib
+import stat
 
 import pytest
 from aiida.repository.backend.sandbox import SandboxRepositoryBackend
@@ -96,6 +98,19 @@ def test_open(repository, generate_directory):
         assert handle.read() == b'content_b'
 
 
+def test_link_object(repository, tmp_path):
+    """Test the ``link_object`` method."""
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
+
+    repository.link_object(key, tmp_path / 'file')
+    assert (tmp_path / 'file').samefile(os.path.join(repository.sandbox.abspath, key))
+    assert (tmp_path / 'file').read_bytes() == b'content'
+    assert not (tmp_path / 'file').stat().st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+    with pytest.raises(FileNotFoundError):
+        repository.link_object('non_existent', tmp_path / 'other')
+
+
 def test_iter_object_streams(repository):
     """Test the ``Repository.iter_object_streams`` method."""
     key = repository.put_object_from_filelike(io.BytesIO(b'content'))
@@ -181,3 +196,14 @@ def test_key_format(repository):
     """Test the ``key_format`` property."""
     repository.initialise()
     assert repository.key_format == 'uuid4'
+
+
+def test_get_object_region(repository):
+    """Test the ``get_object_region`` method."""
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
+
+    filepath, offset, size = repository.get_object_region(key)
+    assert filepath.read_bytes()[offset : offset + size] == b'content'
+
+    with pytest.raises(FileNotFoundError):
+        repository.get_object_region('non_existent')
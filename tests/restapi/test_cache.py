@@ -0,0 +1,45 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the in-process response cache of the REST API."""
+
+from aiida.restapi.common.cache import ResponseCache
+
+
+def test_response_cache_lru():
+    """Test that the least recently used entry is evicted first."""
+    cache = ResponseCache(maxsize=2, timeout=60)
+    cache.set('a', 0, 'value-a')
+    cache.set('b', 0, 'value-b')
+    assert cache.get('a', 0) == 'value-a'
+
+    cache.set('c', 0, 'value-c')
+    assert len(cache) == 2
+    assert cache.get('b', 0) is None
+    assert cache.get('a', 0) == 'value-a'
+    assert cache.get('c', 0) == 'value-c'
+
+
+def test_response_cache_invalidation():
+    """Test that entries are discarded when the token changes or when they time out."""
+    cache = ResponseCache(maxsize=2, timeout=10)
+    cache.set('a', 0, 'value-a')
+    assert cache.get('a', 1) is None
+    assert len(cache) == 0
+
+    cache = ResponseCache(maxsize=2, timeout=-1)
+    cache.set('a', 0, 'value-a')
+    assert cache.get('a', 0) is None
+
+
+def test_response_cache_disabled():
+    """Test that nothing is stored if the maximum size is zero."""
+    cache = ResponseCache(maxsize=0)
+    cache.set('a', 0, 'value-a')
+    assert not cache.enabled
+    assert cache.get('a', 0) is None
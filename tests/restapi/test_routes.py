@@ -10,6 +10,7 @@
 
 import io
 import json
+import uuid
 from datetime import date
 
 import numpy as np
@@ -441,6 +442,102 @@ class TestRestApi:
         expected_error = 'Non existent page requested. The page range is [1 : ' '3]'
         self.process_test('computers', '/computers/page/4?perpage=2&orderby=+id', expected_errormsg=expected_error)
 
+    def test_computers_list_cursor(self):
+        """Get the list of computers page by page using the cursor returned in the header of the previous page."""
+        computers = self.get_dummy_data()['computers']
+
+        with self.app.test_client() as client:
+            response = client.get(f'{self.get_url_prefix()}/computers?limit=2&orderby=+id')
+            assert [comp['uuid'] for comp in response.json['data']['computers']] == [c['uuid'] for c in computers[:2]]
+            assert int(response.headers['X-Total-Count']) == len(computers)
+            cursor = response.headers['X-Next-Cursor']
+            assert int(cursor) == computers[1]['id']
+
+            response = client.get(f'{self.get_url_prefix()}/computers?limit=2&orderby=+id&cursor={cursor}')
+            assert [comp['uuid'] for comp in response.json['data']['computers']] == [c['uuid'] for c in computers[2:4]]
+            assert int(response.headers['X-Total-Count']) == len(computers)
+
+            response = client.get(f'{self.get_url_prefix()}/computers?limit=2&orderby=-id&cursor={cursor}')
+            assert [comp['uuid'] for comp in response.json['data']['computers']] == [computers[0]['uuid']]
+            assert 'X-Next-Cursor' not in response.headers
+
+    def test_computers_list_cursor_invalid(self):
+        """Cursor pagination is incompatible with offsets and requires the results to be ordered by id only."""
+        self.process_test(
+            'computers',
+            '/computers?cursor=1&offset=2&orderby=+id',
+            expected_errormsg='cursor key is incompatible with offset and page',
+        )
+        for url in (
+            '/computers?cursor=1&orderby=+label',
+            '/computers?cursor=1&orderby=+id,-label',
+            '/computers?cursor=1',
+        ):
+            self.process_test(
+                'computers',
+                url,
+                expected_errormsg='cursor pagination requires the results to be ordered by id only, i.e. orderby=+id '
+                'or orderby=-id',
+            )
+        self.process_test(
+            'nodes',
+            '/nodes/statistics?cursor=1&orderby=+id',
+            expected_errormsg='cursor key is not supported for statistics requests',
+        )
+
+    ############### response cache ########################
+    def test_response_etag(self):
+        """Test that a request with the ``ETag`` of the cached response returns 304 until the nodes are modified."""
+        url = f'{self.get_url_prefix()}/nodes?orderby=+id'
+
+        with self.app.test_client() as client:
+            response = client.get(url)
+            etag = response.headers['ETag']
+            assert response.status_code == 200
+
+            response = client.get(url, headers={'If-None-Match': etag})
+            assert response.status_code == 304
+            assert not response.data
+
+            # the default user is detached from the session closed after the request, see the ``init_profile`` fixture
+            get_manager().get_profile_storage().get_session().add(self.user.backend_entity.bare_model)
+            node_uuid = orm.Data().store().uuid
+            response = client.get(url, headers={'If-None-Match': etag})
+            assert response.status_code == 200
+            assert response.headers['ETag'] != etag
+            assert response.json['data']['nodes'][-1]['uuid'] == node_uuid
+
+    def test_response_cache_other_entities(self):
+        """Test that the responses about entities other than nodes are not cached, since their changes are not captured
+        by the validity token of the cache."""
+        with self.app.test_client() as client:
+            counts = {}
+            for resource in ('computers', 'groups', 'users'):
+                response = client.get(f'{self.get_url_prefix()}/{resource}')
+                counts[resource] = len(response.json['data'][resource])
+
+            response = client.get(
+                f'{self.get_url_prefix()}/nodes/{self.get_dummy_data()["calculations"][0]["uuid"]}/contents/comments'
+            )
+            assert response.json['data']['comments'] == []
+
+            get_manager().get_profile_storage().get_session().add(self.user.backend_entity.bare_model)
+            orm.Computer(
+                label=uuid.uuid4().hex, hostname='localhost', transport_type='core.local', scheduler_type='core.direct'
+            ).store()
+            orm.Group(label=uuid.uuid4().hex).store()
+            orm.User(email=f'{uuid.uuid4().hex}@aiida.net').store()
+            orm.load_node(self.get_dummy_data()['calculations'][0]['uuid']).base.comments.add('comment')
+
+            for resource in ('computers', 'groups', 'users'):
+                response = client.get(f'{self.get_url_prefix()}/{resource}')
+                assert len(response.json['data'][resource]) == counts[resource] + 1
+
+            response = client.get(
+                f'{self.get_url_prefix()}/nodes/{self.get_dummy_data()["calculations"][0]["uuid"]}/contents/comments'
+            )
+            assert [comment['message'] for comment in response.json['data']['comments']] == ['comment']
+
     ############### list filters ########################
     def test_computers_filter_id1(self):
         """Add filter on the id of computer and get the filtered computer
@@ -726,6 +823,72 @@ class TestRestApi:
                 assert attr in received_attr
             self.compare_extra_response_data('nodes', url, response, uuid=node_uuid)
 
+    def test_calculation_provenance(self):
+        """Get the provenance graph around a calculation."""
+        calc = orm.load_node(self.get_dummy_data()['calculations'][1]['uuid'])
+        calc_pk, calc_uuid = calc.pk, calc.uuid
+        inputs = {link.node.pk for link in calc.base.links.get_incoming().all()}
+        outputs = {link.node.pk for link in calc.base.links.get_outgoing().all()}
+
+        url = f'{self.get_url_prefix()}/nodes/{calc_uuid}/links/provenance?depth=2'
+        with self.app.test_client() as client:
+            response = client.get(url).json
+            self.compare_extra_response_data('nodes', url, response, uuid=calc_uuid)
+
+        data = response['data']
+        depths = {node['id']: node['depth'] for node in data['nodes']}
+        assert depths[calc_pk] == 0
+        assert {pk for pk, depth in depths.items() if depth == -1} == inputs
+        assert {pk for pk, depth in depths.items() if depth == 1} == outputs
+        assert {(link['source'], link['target']) for link in data['links']} >= {(pk, calc_pk) for pk in inputs} | {
+            (calc_pk, pk) for pk in outputs
+        }
+        assert data['metadata'] == {'depth': 2, 'in_limit': 100, 'out_limit': 100, 'truncated': False}
+        assert 'attributes' not in data['nodes'][0]
+
+        with self.app.test_client() as client:
+            data = client.get(f'{url}&in_limit=1&out_limit=1').json['data']
+        assert len([node for node in data['nodes'] if node['depth'] == -1]) == 1
+        assert len([node for node in data['nodes'] if node['depth'] == 1]) == 1
+        assert data['metadata']['truncated']
+
+    def test_calculation_provenance_fan_out_per_node(self):
+        """The fan-out of the provenance graph is capped per node, such that high-degree nodes do not hide others."""
+        source = orm.Data().store()
+        calculations = []
+
+        for num_outputs in (10, 1):
+            calculation = orm.CalculationNode()
+            calculation.base.links.add_incoming(source, link_type=LinkType.INPUT_CALC, link_label='source')
+            calculation.store()
+            for index in range(num_outputs):
+                output = orm.Data()
+                output.base.links.add_incoming(calculation, link_type=LinkType.CREATE, link_label=f'output_{index}')
+                output.store()
+            calculations.append(calculation.pk)
+
+        source_pk = source.pk
+        url = f'{self.get_url_prefix()}/nodes/{source.uuid}/links/provenance?depth=2&out_limit=2'
+        with self.app.test_client() as client:
+            data = client.get(url).json['data']
+
+        targets = {}
+        for link in data['links']:
+            targets.setdefault(link['source'], set()).add(link['target'])
+
+        assert targets[source_pk] == set(calculations)
+        assert len(targets[calculations[0]]) == 2
+        assert len(targets[calculations[1]]) == 1
+        assert data['metadata']['truncated']
+
+    def test_calculation_provenance_limits(self):
+        """The depth and fan-out of the provenance graph are bounded by the server."""
+        node_uuid = self.get_dummy_data()['calculations'][1]['uuid']
+        url = f'{self.get_url_prefix()}/nodes/{node_uuid}/links/provenance'
+        with self.app.test_client() as client:
+            assert client.get(f'{url}?depth=6').json['message'] == 'depth cannot be bigger than 5'
+            assert client.get(f'{url}?in_limit=101').json['message'] == 'in_limit cannot be bigger than 100'
+
     ############### calculation attributes #############
     def test_calculation_attributes(self):
         """Get list of calculation attributes"""
@@ -1087,6 +1250,42 @@ class TestRestApi:
                 # hence `full_type` should not be present.
                 assert 'full_type' not in entity
 
+    def test_querybuilder_stream(self):
+        """Test POSTing a QueryBuilder dictionary and streaming the results as newline delimited JSON."""
+        query_dict = (
+            orm.QueryBuilder()
+            .append(orm.CalculationNode, tag='calc', project=['id', 'uuid'])
+            .append(orm.Data, with_incoming='calc', tag='data', project=['uuid'])
+            .order_by({'calc': [{'id': {'order': 'desc'}}]})
+            .as_dict()
+        )
+        expected = orm.QueryBuilder.from_dict(query_dict).dict()
+
+        with self.app.test_client() as client:
+            response = client.post(
+                f'{self.get_url_prefix()}/querybuilder', json=query_dict, headers={'Accept': 'application/x-ndjson'}
+            )
+
+        assert response.mimetype == 'application/x-ndjson'
+        rows = [json.loads(line) for line in response.data.decode('utf-8').splitlines()]
+        assert len(rows) == len(expected) > 0
+        assert sorted((row['calc']['uuid'], row['data']['uuid']) for row in rows) == sorted(
+            (row['calc']['uuid'], row['data']['uuid']) for row in expected
+        )
+        for row in rows:
+            assert 'full_type' not in row['calc']
+
+    def test_nodes_stream(self):
+        """Test streaming the list of nodes as newline delimited JSON."""
+        url = f'{self.get_url_prefix()}/nodes?orderby=+id&attributes=true&attributes_filter=pbc1'
+        with self.app.test_client() as client:
+            expected = client.get(url).json['data']['nodes']
+            response = client.get(url, headers={'Accept': 'application/x-ndjson'})
+
+        assert response.mimetype == 'application/x-ndjson'
+        rows = [json.loads(line) for line in response.data.decode('utf-8').splitlines()]
+        assert [row['nodes'] for row in rows] == expected
+
     def test_get_querybuilder(self):
         """Test GETting the /querybuilder endpoint
 
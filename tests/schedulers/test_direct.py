@@ -8,10 +8,12 @@
 ###########################################################################
 """Tests for the ``DirectScheduler`` plugin."""
 
+from unittest.mock import MagicMock
+
 import pytest
 from aiida.common.datastructures import CodeRunMode
 from aiida.schedulers import SchedulerError
-from aiida.schedulers.datastructures import JobTemplate, JobTemplateCodeInfo
+from aiida.schedulers.datastructures import JobState, JobTemplate, JobTemplateCodeInfo
 from aiida.schedulers.plugins.direct import DirectScheduler
 
 
@@ -48,6 +50,19 @@ def test_parse_joblist_output(scheduler, stdout):
     assert '87619' in [job.job_id for job in result]
 
 
+def test_get_jobs_user_and_jobs(scheduler):
+    """Test that ``get_jobs`` queries by user and only returns the given jobs if both are specified."""
+    stdout = """11354 Ss   aiida    00:00:00\n87619 R+   aiida    00:00:00\n11384 S+   aiida    00:00:00"""
+    transport = MagicMock()
+    transport.exec_command_wait.return_value = (0, stdout, '')
+    scheduler.set_transport(transport)
+
+    result = scheduler.get_jobs(jobs=['87619', '11384', '12345'], user='$USER', as_dict=True)
+    assert sorted(result) == ['11384', '12345', '87619']
+    assert result['12345'].job_state == JobState.DONE
+    assert transport.exec_command_wait.call_args[0][0] == scheduler._get_joblist_command(user='$USER')
+
+
 def test_parse_joblist_output_incorrect(scheduler):
     """Test the ``_parse_joblist_output`` for invalid output."""
     with pytest.raises(SchedulerError):
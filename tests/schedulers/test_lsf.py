@@ -112,6 +112,37 @@ def test_parse_common_joblist_output():
     logging.disable(logging.NOTSET)
 
 
+def test_parse_joblist_output_for_jobs(monkeypatch):
+    """Test that ``_parse_joblist_output_for_jobs`` only parses the fields of the given jobs."""
+    scheduler = LsfScheduler()
+    parsed = []
+    parse_time_string = scheduler._parse_time_string
+
+    def parse_time_string_tracked(string, fmt='%b %d %H:%M'):
+        parsed.append(string)
+        return parse_time_string(string, fmt)
+
+    monkeypatch.setattr(scheduler, '_parse_time_string', parse_time_string_tracked)
+
+    job_list = scheduler._parse_joblist_output_for_jobs(0, BJOBS_STDOUT_TO_TEST, '', {'764220165', '123'})
+    assert [job.job_id for job in job_list] == ['764220165']
+    assert job_list[0].job_state == JobState.QUEUED
+    assert set(parsed) == {'-', 'Feb  2 01:46'}
+
+
+def test_parse_joblist_output_unavailable_values(caplog):
+    """Test that values that are not available for pending jobs are not reported as parsing errors."""
+    scheduler = LsfScheduler()
+    stdout = '764220165|PEND|-|-|inewton|-|-|-|8nm|-|-|-|Feb  2 01:46|aiida-1033444\n'
+
+    with caplog.at_level(logging.WARNING):
+        (job,) = scheduler._parse_joblist_output(0, stdout, '')
+
+    assert job.num_machines is None
+    assert job.num_mpiprocs is None
+    assert not caplog.records
+
+
 def test_submit_script():
     """Test the creation of a simple submission script"""
     from aiida.common.datastructures import CodeRunMode
@@ -804,6 +804,16 @@ class TestParserQstat(unittest.TestCase):
                 self.assertTrue(j.num_machines == num_machines)
                 self.assertTrue(j.num_cpus == num_cpus)
 
+    def test_parse_joblist_output_for_jobs(self):
+        """Test whether _parse_joblist_output_for_jobs only returns the given jobs of the qstat -f output"""
+        scheduler = PbsproScheduler()
+
+        job_list = scheduler._parse_joblist_output_for_jobs(
+            0, text_qstat_f_to_test, '', {'69301.mycluster', '74165.mycluster', '12345.mycluster'}
+        )
+        self.assertEqual([j.job_id for j in job_list], ['69301.mycluster', '74165.mycluster'])
+        self.assertEqual(job_list[0].job_state, JobState.RUNNING)
+
     def test_parse_with_unexpected_newlines(self):
         """Test whether _parse_joblist can parse the qstat -f output
         also when there are unexpected newlines
@@ -233,6 +233,14 @@ class TestCommand(unittest.TestCase):
             sge_parse_submit_output = sge._parse_submit_output(1, '', '')
         logging.disable(logging.NOTSET)
 
+    def test_parse_joblist_output_for_jobs(self):
+        """Test that `_parse_joblist_output_for_jobs` only returns the given jobs."""
+        sge = SgeScheduler()
+
+        job_list = sge._parse_joblist_output_for_jobs(0, text_qstat_ext_urg_xml_test, '', {'1212263', '123'})
+        self.assertEqual([job.job_id for job in job_list], ['1212263'])
+        self.assertIn('<JB_job_number>1212263</JB_job_number>', job_list[0].raw_data)
+
     def test_parse_joblist_output(self):
         """Test the `parse_joblist_command`."""
         sge = SgeScheduler()
@@ -175,6 +175,28 @@ def test_time_conversion(value, expected):
     assert scheduler._convert_time(value) == expected
 
 
+@pytest.mark.parametrize(
+    'value, fmt, expected',
+    [
+        ('2013-05-23T11:44:11', '%Y-%m-%dT%H:%M:%S', datetime.datetime(2013, 5, 23, 11, 44, 11)),
+        ('2013-05-23 11:44:11', '%Y-%m-%d %H:%M:%S', datetime.datetime(2013, 5, 23, 11, 44, 11)),
+    ],
+)
+def test_parse_time_string(value, fmt, expected):
+    """Test parsing of (absolute) times, with and without the fast path for the standard format."""
+    scheduler = SlurmScheduler()
+    assert scheduler._parse_time_string(value, fmt=fmt) == expected
+
+
+def test_parse_time_string_errors():
+    """Test parsing of (absolute) times for bad inputs."""
+    scheduler = SlurmScheduler()
+
+    for value in ['N/A', '2013-05-23T11:44:1x', '2013-05-23T11:44:11.000']:
+        with pytest.raises(ValueError, match='Problem parsing the time string.'):
+            scheduler._parse_time_string(value)
+
+
 def test_time_conversion_errors(caplog):
     """Test conversion of (relative) times for bad inputs."""
     scheduler = SlurmScheduler()
@@ -408,6 +430,48 @@ class TestJoblistCommand:
         assert '456,456' not in command
 
 
+def test_joblist_changes_command():
+    """Test the ``sacct`` command to get the jobs whose state may have changed."""
+    scheduler = SlurmScheduler()
+
+    command = scheduler._get_joblist_changes_command(90.5, jobs=['123'])
+    assert command.startswith("SLURM_TIME_FORMAT='standard' sacct --noheader --parsable2 --allocations")
+    assert '--starttime=now-91 ' in command
+    assert command.endswith('--jobs=123')
+    assert '--user' not in command
+
+    command = scheduler._get_joblist_changes_command(60, user='$USER')
+    assert command.endswith('--user=$USER')
+
+
+def test_parse_joblist_changes_output():
+    """Test parsing the ``sacct`` output of the jobs whose state may have changed, including terminated jobs."""
+    scheduler = SlurmScheduler()
+    stdout = (
+        '1001|PENDING|user1|1|32|None assigned|normal|1-00:00:00|00:00:00|Unknown|2024-05-22T01:41:11|job|with|pipes\n'
+        '1002|RUNNING|user1|2|64|nid00[471-472]|debug|30:00|10:12|2024-05-22T02:00:00|2024-05-22T01:42:11|aiida-2\n'
+        '1003|CANCELLED by 1000|user1|1|32|nid00471|normal|30:00|00:01:00|2024-05-22T02:00:00|2024-05-22T01:43:11|aiida-3\n'
+        '1004|TIMEOUT|user1|1|32|nid00471|normal|30:00|00:30:00|2024-05-22T02:00:00|2024-05-22T01:44:11|aiida-4\n'
+    )
+
+    jobs = scheduler._parse_joblist_changes_output(0, stdout, '')
+
+    assert [job.job_id for job in jobs] == ['1001', '1002', '1003', '1004']
+    assert [job.job_state for job in jobs] == [JobState.QUEUED, JobState.RUNNING, JobState.DONE, JobState.DONE]
+    assert jobs[0].title == 'job|with|pipes'
+    assert jobs[1].num_machines == 2
+    assert jobs[1].num_mpiprocs == 64
+    assert jobs[1].allocated_machines_raw == 'nid00[471-472]'
+    assert jobs[1].queue_name == 'debug'
+    assert jobs[1].requested_wallclock_time_seconds == 30 * 60
+    assert jobs[1].wallclock_time_seconds == 10 * 60 + 12
+    assert jobs[1].dispatch_time == datetime.datetime(2024, 5, 22, 2, 0, 0)
+    assert jobs[1].submission_time == datetime.datetime(2024, 5, 22, 1, 42, 11)
+
+    with pytest.raises(SchedulerError, match='sacct returned exit code 1'):
+        scheduler._parse_joblist_changes_output(1, '', 'sacct: error: Problem talking to the database')
+
+
 def test_parse_out_of_memory():
     """Test that for job that failed due to OOM `parse_output` return the `ERROR_SCHEDULER_OUT_OF_MEMORY` code."""
     scheduler = SlurmScheduler()
@@ -0,0 +1,34 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Test ``main_0005_broker_tables.py``."""
+
+from aiida.storage.psql_dos.migrator import PsqlDosMigrator
+from aiida.storage.psql_dos.models import broker
+from sqlalchemy import inspect
+
+
+def test_migration(perform_migrations: PsqlDosMigrator):
+    """Test the migration creates the tables of the broker as they are defined by the models, and drops them again."""
+    tables = ('aiida_broker_task', 'aiida_broker_rpc')
+
+    perform_migrations.migrate_up('main@main_0004')
+    assert not any(inspect(perform_migrations.connection).has_table(table) for table in tables)
+
+    perform_migrations.migrate_up('main@main_0005')
+    inspector = inspect(perform_migrations.connection)
+
+    for table in tables:
+        model = broker.metadata.tables[table]
+        assert [column['name'] for column in inspector.get_columns(table)] == [column.name for column in model.columns]
+        assert inspector.get_pk_constraint(table)['name'] == model.primary_key.name
+
+    assert [index['name'] for index in inspector.get_indexes('aiida_broker_task')] == ['aiida_broker_task_queue_id']
+
+    perform_migrations.migrate_down('main@main_0004')
+    assert not any(inspect(perform_migrations.connection).has_table(table) for table in tables)
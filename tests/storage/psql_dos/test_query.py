@@ -45,3 +45,51 @@ def test_qb_ordering_limits_offsets_sqla():
     q_b.limit(3)
     res = next(zip(*q_b.all()))
     assert res == tuple(range(5, 8))
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_qb_statement_cache():
+    """Test that queries that only differ in the values of their filters share a built query."""
+    from aiida.storage.psql_dos.orm.querybuilder.main import SqlaQueryBuilder
+
+    nodes = []
+    for value in (1, 2, 'a', None, True):
+        node = Data()
+        node.base.attributes.set('foo', value)
+        nodes.append(node.store())
+
+    cache = SqlaQueryBuilder._statement_cache
+    cache.clear()
+
+    def query(filters):
+        return QueryBuilder().append(Data, filters=filters, project='id').all(flat=True)
+
+    assert query({'id': nodes[0].pk}) == [nodes[0].pk]
+    assert query({'id': nodes[1].pk}) == [nodes[1].pk]
+    assert query({'id': {'in': [nodes[0].pk]}}) == [nodes[0].pk]
+    assert sorted(query({'id': {'in': [nodes[0].pk, nodes[1].pk]}})) == [nodes[0].pk, nodes[1].pk]
+    assert len(cache) == 2
+
+    # The type of the value determines the comparison, so it is part of the structure of the query
+    assert query({'attributes.foo': 1}) == [nodes[0].pk]
+    assert query({'attributes.foo': 2}) == [nodes[1].pk]
+    assert query({'attributes.foo': 'a'}) == [nodes[2].pk]
+    assert len(cache) == 4
+
+    # ``None`` and booleans are not bound as parameters
+    assert query({'attributes.foo': True}) == [nodes[4].pk]
+    assert query({'attributes.foo': False}) == []
+    assert len(cache) == 6
+
+    # The cached queries do not keep the values of the filters alive
+    for built in cache._entries.values():
+        params = built.query.statement.compile().params
+        values = [params[name] for name in params if name.startswith('filter_')]
+        assert values
+        assert all(value is None for value in values)
+
+    # Invalid filters are raised for each query and are not cached
+    for _ in range(2):
+        with pytest.raises(ValueError, match='more than one type'):
+            query({'id': {'in': [nodes[0].pk, 'a']}})
+    assert len(cache) == 6
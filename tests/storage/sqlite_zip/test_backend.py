@@ -1,8 +1,12 @@
 """Tests for :mod:`aiida.storage.sqlite_zip.backend`."""
 
 import pathlib
+import sqlite3
+import zipfile
 
 import pytest
+import sqlalchemy
+from aiida.common.exceptions import CorruptStorage
 from aiida.storage.sqlite_zip.backend import SqliteZipBackend
 from aiida.storage.sqlite_zip.migrator import validate_storage
 from pydantic_core import ValidationError
@@ -62,3 +66,75 @@ def test_model():
 
     model = SqliteZipBackend.Model(filepath=filepath.name)
     assert pathlib.Path(model.filepath).is_absolute()
+
+
+def test_get_session_in_place(tmp_path):
+    """Test that the database of a zip file is read in place if it is stored uncompressed."""
+    from aiida.storage.sqlite_zip.utils import DB_FILENAME, get_zip_stored_region
+
+    filepath_compressed = tmp_path / 'compressed.zip'
+    SqliteZipBackend.initialise(SqliteZipBackend.create_profile(filepath_compressed))
+
+    # rewrite the archive with all files stored without compression
+    filepath_archive = tmp_path / 'archive.zip'
+    with zipfile.ZipFile(filepath_compressed) as source, zipfile.ZipFile(filepath_archive, 'w') as target:
+        for info in source.infolist():
+            target.writestr(info.filename, source.read(info), compress_type=zipfile.ZIP_STORED)
+    assert get_zip_stored_region(filepath_archive, DB_FILENAME) is not None
+
+    backend = SqliteZipBackend(SqliteZipBackend.create_profile(filepath_archive))
+    session = backend.get_session()
+    if hasattr(sqlite3.Connection, 'deserialize'):
+        assert backend._db_file is None
+    assert session.execute(sqlalchemy.text('SELECT COUNT(*) FROM db_dbnode')).scalar() == 0
+    backend.close()
+
+
+def test_get_session_compressed(tmp_path):
+    """Test that the database of a zip file is extracted if it is compressed."""
+    from aiida.storage.sqlite_zip.utils import DB_FILENAME, get_zip_stored_region
+
+    filepath_archive = tmp_path / 'archive.zip'
+    profile = SqliteZipBackend.create_profile(filepath_archive)
+    SqliteZipBackend.initialise(profile)
+    assert get_zip_stored_region(filepath_archive, DB_FILENAME) is None
+
+    backend = SqliteZipBackend(profile)
+    session = backend.get_session()
+    assert backend._db_file is not None
+    assert session.execute(sqlalchemy.text('SELECT COUNT(*) FROM db_dbnode')).scalar() == 0
+    backend.close()
+
+
+@pytest.mark.parametrize('compression, stored', ((0, True), (6, False)))
+def test_put_database_in_zip(tmp_path, compression, stored):
+    """Test that the database is only stored without compression if the compression level is zero."""
+    from aiida.storage.sqlite_zip.utils import DB_FILENAME, get_zip_stored_region, put_database_in_zip
+    from archive_path import ZipPath
+
+    filepath_database = tmp_path / DB_FILENAME
+    filepath_database.write_bytes(b'database content')
+    filepath_archive = tmp_path / 'archive.zip'
+    with ZipPath(filepath_archive, mode='w', compresslevel=compression) as zip_handle:
+        put_database_in_zip(zip_handle, filepath_database, compression)
+
+    assert (get_zip_stored_region(filepath_archive, DB_FILENAME) is not None) is stored
+    with zipfile.ZipFile(filepath_archive) as handle:
+        assert handle.read(DB_FILENAME) == b'database content'
+
+
+def test_get_zip_stored_region_central_directory(tmp_path):
+    """Test that the region of a file is found wherever its record is in the central directory of the zip file."""
+    from aiida.storage.sqlite_zip.utils import get_zip_stored_region
+
+    filepath = tmp_path / 'archive.zip'
+    with zipfile.ZipFile(filepath, 'w') as handle:
+        for index in range(10):
+            handle.writestr(f'file_{index}', b'content')
+        handle.writestr('target', b'target content')
+
+    offset, size = get_zip_stored_region(filepath, 'target')
+    assert filepath.read_bytes()[offset : offset + size] == b'target content'
+
+    with pytest.raises(CorruptStorage):
+        get_zip_stored_region(filepath, 'target', search_limit=4)
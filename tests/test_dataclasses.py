@@ -3802,3 +3802,54 @@ class TestBandsData:
                 for file in files_created:
                     if os.path.exists(file):
                         os.remove(file)
+
+    @staticmethod
+    def test_find_bandgap():
+        """Test ``find_bandgap`` for an insulator and a metal, with the occupations, electrons or Fermi energy."""
+        from aiida.orm import find_bandgap
+
+        kpoints = KpointsData()
+        kpoints.set_cell(np.eye(3) * 4.0)
+        kpoints.set_kpoints(np.linspace(0, 0.5, 10)[:, None] * np.ones(3))
+
+        bands = BandsData()
+        bands.set_kpointsdata(kpoints)
+        # Two dispersive valence bands below 1 and two conduction bands above 3
+        energies = np.linspace(0, 1, 10)[:, None] + np.array([-2.0, 0.0, 3.0, 5.0])
+        occupations = np.array([[2.0, 2.0, 0.0, 0.0]] * 10)
+        bands.set_bands(energies[:, ::-1], occupations=occupations[:, ::-1], units='eV')
+
+        assert find_bandgap(bands) == (True, 2.0)
+        assert find_bandgap(bands, number_electrons=4) == (True, 2.0)
+        assert find_bandgap(bands, fermi_energy=2.0) == (True, 2.0)
+        assert find_bandgap(bands, fermi_energy=0.5) == (False, None)
+        assert find_bandgap(bands, number_electrons=3) == (False, None)
+
+        with pytest.raises(ValueError, match='need more bands'):
+            find_bandgap(bands, number_electrons=8)
+
+    @staticmethod
+    def test_export_many():
+        """Test ``BandsData.export_many``."""
+        nodes = []
+        for shift in range(3):
+            kpoints = KpointsData()
+            kpoints.set_cell(np.eye(3) * 4.0)
+            kpoints.set_kpoints([[0.0, 0.0, 0.0], [0.1, 0.1, 0.1], [0.2, 0.2, 0.2]])
+            kpoints.labels = [(0, 'G'), (2, 'X')]
+            bands = BandsData()
+            bands.set_kpointsdata(kpoints)
+            bands.set_bands(np.arange(6.0).reshape(3, 2) + shift, units='eV')
+            nodes.append(bands)
+
+        results = list(BandsData.export_many(nodes, 'dat_multicolumn', comments=False))
+        assert [node for node, _, _ in results] == nodes
+        for node, content, extra_files in results:
+            assert (content, extra_files) == node._exportcontent('dat_multicolumn', comments=False)
+
+        lines = results[1][1].decode('utf-8').splitlines()
+        assert lines[0] == '0.00000000\t1.00000000\t2.00000000'
+        assert len(lines) == 3
+
+        with pytest.raises(ValueError, match='not implemented'):
+            BandsData.export_many(nodes, 'invalid')
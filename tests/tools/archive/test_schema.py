@@ -60,6 +60,17 @@ def test_psql_sync_migrate(tmp_path):
             raise AssertionError(f'Schema is not in-sync with the psql backend:\n{yaml.safe_dump(diffs)}')
 
 
+def is_psql_specific_index(index: dict) -> bool:
+    """Return whether the reflected index is specific to PostgreSQL and so has no counterpart in the sqlite schema.
+
+    These are the indexes using ``varchar_pattern_ops``, which are prefixed with ``ix_pat_``, and partial indexes on
+    expressions, e.g. on a key of the JSONB attributes of nodes.
+    """
+    if index['name'] is not None and index['name'].startswith('ix_pat_'):
+        return True
+    return bool(index.get('expressions')) and 'postgresql_where' in index.get('dialect_options', {})
+
+
 def diff_schemas(psql_insp: Inspector, sqlite_insp: Inspector):
     """Compare the reflected schemas of the two databases."""
     diffs: dict = {}
@@ -132,11 +143,12 @@ def diff_schemas(psql_insp: Inspector, sqlite_insp: Inspector):
             if fk_constraint not in psql_fk_constraints:
                 diffs.setdefault(table_name, {}).setdefault('fk_constraints', {})[fk_constraint] = 'additional'
 
-        # compare indexes (discarding any postgresql specific ones, e.g. varchar_pattern_ops)
+        # compare indexes (discarding any postgresql specific ones, e.g. varchar_pattern_ops or partial indexes on
+        # expressions of the JSONB columns)
         psql_indexes = [
             idx['name']
             for idx in psql_insp.get_indexes(table_name)
-            if not idx['unique'] and not (idx['name'] is not None and idx['name'].startswith('ix_pat_'))
+            if not idx['unique'] and not is_psql_specific_index(idx)
         ]
         sqlite_indexes = [idx['name'] for idx in sqlite_insp.get_indexes(table_name) if not idx['unique']]
         for index in psql_indexes:
@@ -0,0 +1,83 @@
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Test :mod:`aiida.transports.plugins.openssh`."""
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aiida.transports.plugins.openssh import OpenSshTransport
+from aiida.transports.transport import TransportInternalError
+
+
+def test_closed_connection():
+    """Test calling commands on a closed transport."""
+    transport = OpenSshTransport(machine='localhost')
+
+    with pytest.raises(TransportInternalError):
+        transport._exec_command_internal('ls')
+
+    with pytest.raises(TransportInternalError):
+        transport.listdir()
+
+
+def test_ssh_command():
+    """Test that the connection parameters are translated into options of the ``ssh`` client."""
+    transport = OpenSshTransport(
+        machine='localhost', username='user', port=2222, key_filename='/path/to/key', timeout=10, proxy_jump='jump'
+    )
+    command = transport._get_ssh_command()
+
+    assert command[0] == 'ssh'
+    assert f'ControlPath={transport._control_path}' in command
+    assert ' '.join(command).endswith('-l user -p 2222 -i /path/to/key -o ConnectTimeout=10 -J jump')
+
+    # Parameters that are not specified are left to the SSH config
+    assert OpenSshTransport(machine='localhost', username='', port=None)._get_ssh_command()[-2:] == [
+        '-o',
+        'BatchMode=yes',
+    ]
+
+
+def test_control_path():
+    """Test that transports connecting in the same way share the master connection."""
+    control_path = OpenSshTransport(machine='localhost', username='user')._control_path
+
+    assert OpenSshTransport(machine='localhost', username='user')._control_path == control_path
+    assert OpenSshTransport(machine='localhost', username='other')._control_path != control_path
+    assert OpenSshTransport(machine='remote', username='user')._control_path != control_path
+
+
+def test_proxy_jump_and_command():
+    """Test that the proxy jump and proxy command can not be used together."""
+    transport = OpenSshTransport(machine='localhost', proxy_jump='localhost', proxy_command='ssh -W localhost:22 jump')
+
+    with pytest.raises(ValueError, match='can not be used together'):
+        transport.open()
+
+
+def test_reuse_master_connection():
+    """Test that a transport that is opened again reuses the master connection."""
+    with OpenSshTransport(machine='localhost', timeout=30) as transport:
+        assert transport.exec_command_wait('echo first')[1] == 'first\n'
+
+    with OpenSshTransport(machine='localhost', timeout=30) as transport:
+        check = transport._get_ssh_command() + ['-O', 'check', 'localhost']
+        assert transport.exec_command_wait('echo second')[1] == 'second\n'
+
+    assert subprocess.run(check, capture_output=True, check=False).returncode == 0
+
+
+def test_concurrent_commands():
+    """Test that commands can be executed concurrently over the same transport."""
+    with OpenSshTransport(machine='localhost', timeout=30) as transport:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda index: transport.exec_command_wait(f'echo {index}'), range(8)))
+
+    assert [result[1] for result in results] == [f'{index}\n' for index in range(8)]
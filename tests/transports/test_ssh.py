@@ -130,3 +130,35 @@ def test_gotocomputer_proxyjump():
             """echo '  ** /remote_dir/' ; echo '  ** seems to have been deleted, I logout...' ; fi" """
         )
         assert cmd_str == expected_str
+
+
+@pytest.mark.parametrize('sftp_channels', (1, 4))
+def test_puttree_gettree_sftp_channels(tmp_path, sftp_channels):
+    """Test that ``puttree`` and ``gettree`` transfer a nested folder over one or several SFTP channels."""
+    source = tmp_path / 'source'
+    (source / 'sub' / 'nested').mkdir(parents=True)
+    for index in range(10):
+        for folder in (source, source / 'sub', source / 'sub' / 'nested'):
+            (folder / f'file_{index}').write_text(str(index) * (index + 1))
+
+    with SshTransport(
+        machine='localhost',
+        timeout=30,
+        load_system_host_keys=True,
+        key_policy='AutoAddPolicy',
+        sftp_channels=sftp_channels,
+    ) as transport:
+        transport.puttree(str(source), str(tmp_path / 'remote'))
+        # Symbolic links to folders on the remote are followed
+        (tmp_path / 'remote' / 'link').symlink_to(tmp_path / 'remote' / 'sub')
+        transport.gettree(str(tmp_path / 'remote'), str(tmp_path / 'retrieved'))
+
+    def get_contents(path):
+        return {
+            str(filepath.relative_to(path)): filepath.read_text() for filepath in path.rglob('*') if filepath.is_file()
+        }
+
+    assert get_contents(tmp_path / 'remote') == get_contents(source)
+    assert get_contents(tmp_path / 'retrieved' / 'sub') == get_contents(source / 'sub')
+    assert get_contents(tmp_path / 'retrieved' / 'link') == get_contents(source / 'sub')
+    assert not (tmp_path / 'retrieved' / 'link').is_symlink()
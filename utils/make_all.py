@@ -155,8 +155,8 @@ if __name__ == '__main__':
         'cmdline/params': ['arguments', 'options'],
         # skipped since this is for testing only not general use
         'manage': ['tests'],
-        # skipped since we don't want to expose the implementation at the top-level
-        'storage': ['psql_dos', 'sqlite_zip', 'sqlite_temp'],
+        # skip all since the implementations are imported lazily, as they import heavy dependencies
+        'storage': ['*'],
         'orm': ['implementation'],
         # skip all since the module requires extra requirements
         'restapi': ['*'],
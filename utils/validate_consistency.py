@@ -98,6 +98,8 @@ def cli():
 @cli.command('verdi-autodocs')
 def validate_verdi_documentation():
     """Auto-generate the documentation for `verdi` through `click`."""
+    import importlib
+
     from aiida.cmdline.commands.cmd_verdi import verdi
     from click import Context
 
@@ -118,6 +120,10 @@ def validate_verdi_documentation():
     message = 'Below is a list with all available subcommands.'
     block = [f"{header}\n{'=' * len(header)}\n{message}\n\n"]
 
+    # The sub commands are loaded lazily, so import all their modules such that they are registered with ``verdi``
+    for module in verdi.lazy_commands.values():
+        importlib.import_module(module)
+
     for name, command in sorted(verdi.commands.items()):
         ctx = click.Context(command, terminal_width=width)
 